@@ -0,0 +1,12 @@
+-- Keyset paging seeks on (sort column, id), see PGQueryBuilder.build_cursor_seek_sql.
+-- created_at is the default sort, so every table gets a (created_at, id) index.
+
+CREATE INDEX IF NOT EXISTS idx_fantasy_leagues_created_at_id ON public.fantasy_leagues(created_at, id);
+CREATE INDEX IF NOT EXISTS idx_venues_created_at_id ON public.venues(created_at, id);
+CREATE INDEX IF NOT EXISTS idx_league_teams_created_at_id ON public.league_teams(created_at, id);
+CREATE INDEX IF NOT EXISTS idx_league_players_created_at_id ON public.league_players(created_at, id);
+CREATE INDEX IF NOT EXISTS idx_users_created_at_id ON public.users(created_at, id);
+CREATE INDEX IF NOT EXISTS idx_fantasy_teams_created_at_id ON public.fantasy_teams(created_at, id);
+CREATE INDEX IF NOT EXISTS idx_seasons_created_at_id ON public.seasons(created_at, id);
+CREATE INDEX IF NOT EXISTS idx_fantasy_team_season_links_created_at_id ON public.fantasy_team_season_links(created_at, id);
+CREATE INDEX IF NOT EXISTS idx_league_player_fantasy_team_season_links_created_at_id ON public.league_player_fantasy_team_season_links(created_at, id);
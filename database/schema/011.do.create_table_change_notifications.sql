@@ -0,0 +1,35 @@
+-- Tables the service caches in process NOTIFY table_changes with "table:id" for every
+-- written row. Postgres delivers notifications on commit to every listening instance,
+-- see util/table_change_listener.py, which evicts the row from its caches.
+
+CREATE OR REPLACE FUNCTION public.notify_table_change() RETURNS trigger AS $$
+BEGIN
+  IF TG_OP = 'DELETE' THEN
+    PERFORM pg_notify('table_changes', TG_TABLE_NAME || ':' || OLD.id::text);
+  ELSE
+    PERFORM pg_notify('table_changes', TG_TABLE_NAME || ':' || NEW.id::text);
+  END IF;
+
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_fantasy_leagues_notify_table_change ON public.fantasy_leagues;
+CREATE TRIGGER trg_fantasy_leagues_notify_table_change
+  AFTER INSERT OR UPDATE OR DELETE ON public.fantasy_leagues
+  FOR EACH ROW EXECUTE FUNCTION public.notify_table_change();
+
+DROP TRIGGER IF EXISTS trg_venues_notify_table_change ON public.venues;
+CREATE TRIGGER trg_venues_notify_table_change
+  AFTER INSERT OR UPDATE OR DELETE ON public.venues
+  FOR EACH ROW EXECUTE FUNCTION public.notify_table_change();
+
+DROP TRIGGER IF EXISTS trg_league_teams_notify_table_change ON public.league_teams;
+CREATE TRIGGER trg_league_teams_notify_table_change
+  AFTER INSERT OR UPDATE OR DELETE ON public.league_teams
+  FOR EACH ROW EXECUTE FUNCTION public.notify_table_change();
+
+DROP TRIGGER IF EXISTS trg_seasons_notify_table_change ON public.seasons;
+CREATE TRIGGER trg_seasons_notify_table_change
+  AFTER INSERT OR UPDATE OR DELETE ON public.seasons
+  FOR EACH ROW EXECUTE FUNCTION public.notify_table_change();
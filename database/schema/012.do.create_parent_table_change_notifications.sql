@@ -0,0 +1,18 @@
+-- Parent tables validated on create NOTIFY table_changes like the cached tables in 011,
+-- so every instance's existence cache forgets missing ids written elsewhere, see
+-- util/existence_cache.py.
+
+DROP TRIGGER IF EXISTS trg_league_players_notify_table_change ON public.league_players;
+CREATE TRIGGER trg_league_players_notify_table_change
+  AFTER INSERT OR UPDATE OR DELETE ON public.league_players
+  FOR EACH ROW EXECUTE FUNCTION public.notify_table_change();
+
+DROP TRIGGER IF EXISTS trg_fantasy_teams_notify_table_change ON public.fantasy_teams;
+CREATE TRIGGER trg_fantasy_teams_notify_table_change
+  AFTER INSERT OR UPDATE OR DELETE ON public.fantasy_teams
+  FOR EACH ROW EXECUTE FUNCTION public.notify_table_change();
+
+DROP TRIGGER IF EXISTS trg_fantasy_team_season_links_notify_table_change ON public.fantasy_team_season_links;
+CREATE TRIGGER trg_fantasy_team_season_links_notify_table_change
+  AFTER INSERT OR UPDATE OR DELETE ON public.fantasy_team_season_links
+  FOR EACH ROW EXECUTE FUNCTION public.notify_table_change();
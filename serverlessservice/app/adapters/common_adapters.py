@@ -1,15 +1,22 @@
+from typing import Any
+
+from fastapi import HTTPException
 from fastapi.datastructures import Headers
 
 from models.common_model import (
     CommonInboundPagedModel,
+    ItemList,
     OutboundResultantPagingModel,
 )
-from util.database import PagingModel, ResultantPagingModel
+from util.database import CountModes, PagingCursor, PagingModel, ResultantPagingModel
 from util.common import RequestOperators
+from util.field_selection import FieldSelection
 
 
 class CommonAdapters:
-    def convert_from_headers_to_operators(self, headers: Headers) -> RequestOperators:
+    def convert_from_headers_to_operators(
+        self, headers: Headers, inbound_model: CommonInboundPagedModel | None = None
+    ) -> RequestOperators:
         requestOperators = RequestOperators()
 
         mnfp_hydration = headers.get("MNFP-Hydration")
@@ -17,8 +24,59 @@ class CommonAdapters:
         if mnfp_hydration is not None:
             requestOperators.hydration = mnfp_hydration.split(",")
 
+        mnfp_count_mode = headers.get("MNFP-Count-Mode")
+
+        if mnfp_count_mode is not None:
+            try:
+                requestOperators.count_mode = CountModes(mnfp_count_mode.lower())
+            except ValueError:
+                raise HTTPException(
+                    status_code=400,
+                    detail="MNFP-Count-Mode must be one of exact, estimate or none.",
+                )
+
+        # The fields query parameter wins over the MNFP-Fields header.
+        mnfp_fields = (
+            inbound_model.fields
+            if inbound_model is not None and inbound_model.fields is not None
+            else headers.get("MNFP-Fields")
+        )
+
+        if mnfp_fields is not None:
+            requestOperators.fields = FieldSelection.parse(mnfp_fields)
+
+            implied_hydration = [
+                path
+                for path in requestOperators.fields.get_hydration()
+                if path not in (requestOperators.hydration or [])
+            ]
+
+            if len(implied_hydration) > 0:
+                requestOperators.hydration = (
+                    requestOperators.hydration or []
+                ) + implied_hydration
+
         return requestOperators
 
+    def convert_from_model_to_sparse_response(
+        self, fields: FieldSelection, model: Any
+    ) -> dict[str, Any]:
+        # Skips the adapters, the selection is already shaped like the outbound model
+        # and routes render it as it is.
+        return fields.project(model)
+
+    def convert_from_item_list_to_sparse_response(
+        self, fields: FieldSelection, results: ItemList[Any]
+    ) -> dict[str, Any]:
+        outbound_paging = self.convert_from_paging_model_to_outbound_paging_model(
+            results.paging
+        )
+
+        return {
+            "items": [fields.project(item) for item in results.items],
+            "paging": outbound_paging,
+        }
+
     def convert_from_paged_inbound_model_to_paging_model(
         self, inbound_model: CommonInboundPagedModel
     ) -> PagingModel:
@@ -27,6 +85,17 @@ class CommonAdapters:
             page_length=inbound_model.page_length,
             sort_by=inbound_model.sort_by,
             is_sort_descending=inbound_model.is_sort_descending,
+            use_cursor=inbound_model.paging_mode == "cursor",
+            cursor=(
+                PagingCursor.decode(inbound_model.cursor)
+                if inbound_model.cursor is not None
+                else None
+            ),
+            count_mode=(
+                CountModes(inbound_model.count_mode)
+                if inbound_model.count_mode is not None
+                else None
+            ),
         )
 
         return model
@@ -40,6 +109,8 @@ class CommonAdapters:
             sort_by=model.sort_by,
             is_sort_descending=model.is_sort_descending,
             total_record_count=model.total_record_count,
+            next_cursor=model.next_cursor,
+            count_mode=model.count_mode.value,
         )
 
         return outbound_model
@@ -71,6 +71,7 @@ class FantasyLeagueAdapter:
                 InListSearchTerm(
                     "id",
                     self.common_utilities.convert_uuid_list_to_string_list(model.ids),
+                    array_type="uuid",
                 )
             )
 
@@ -107,9 +108,9 @@ class FantasyLeagueAdapter:
     ) -> FantasyLeagueModel:
         model = FantasyLeagueModel(
             id=UUID(database_model["id"]),
-            name=database_model["name"],
+            name=database_model.get("name"),
             created_at=database_model["created_at"],
-            updated_at=database_model["updated_at"],
+            updated_at=database_model.get("updated_at"),
         )
 
         return model
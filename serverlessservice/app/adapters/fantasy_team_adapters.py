@@ -95,6 +95,7 @@ class FantasyTeamAdapter:
                 InListSearchTerm(
                     "id",
                     self.common_utilities.convert_uuid_list_to_string_list(model.ids),
+                    array_type="uuid",
                 )
             )
         if model.owner_ids is not None:
@@ -104,6 +105,7 @@ class FantasyTeamAdapter:
                     self.common_utilities.convert_uuid_list_to_string_list(
                         model.owner_ids
                     ),
+                    array_type="uuid",
                 )
             )
         if model.fantasy_league_ids is not None:
@@ -113,6 +115,7 @@ class FantasyTeamAdapter:
                     self.common_utilities.convert_uuid_list_to_string_list(
                         model.fantasy_league_ids
                     ),
+                    array_type="uuid",
                 )
             )
 
@@ -152,11 +155,15 @@ class FantasyTeamAdapter:
     ) -> FantasyTeamModel:
         model = FantasyTeamModel(
             id=UUID(database_model["id"]),
-            fantasy_league_id=UUID(database_model["fantasy_league_id"]),
-            owner_id=UUID(database_model["owner_id"]),
-            name=database_model["name"],
+            fantasy_league_id=UUID(database_model["fantasy_league_id"])
+            if database_model.get("fantasy_league_id") is not None
+            else None,
+            owner_id=UUID(database_model["owner_id"])
+            if database_model.get("owner_id") is not None
+            else None,
+            name=database_model.get("name"),
             created_at=database_model["created_at"],
-            updated_at=database_model["updated_at"],
+            updated_at=database_model.get("updated_at"),
         )
 
         return model
@@ -12,6 +12,7 @@ from adapters.fantasy_team_adapters import FantasyTeamAdapter
 from adapters.season_adapters import SeasonAdapter
 from adapters.user_adapters import UserAdapter
 from adapters.fantasy_league_adapters import FantasyLeagueAdapter
+from adapters.league_player_adapters import LeaguePlayerAdapter
 from util.common import CommonUtilities
 from util.database import (
     InListSearchTerm,
@@ -26,12 +27,14 @@ class FantasyTeamSeasonLinkAdapter:
         season_adapter: SeasonAdapter = SeasonAdapter(),
         user_adapter: UserAdapter = UserAdapter(),
         fantasy_league_adapter: FantasyLeagueAdapter = FantasyLeagueAdapter(),
+        league_player_adapter: LeaguePlayerAdapter = LeaguePlayerAdapter(),
         common_utilities: CommonUtilities = CommonUtilities(),
     ) -> None:
         self.fantasy_team_adapter = fantasy_team_adapter
         self.season_adapter = season_adapter
         self.user_adapter = user_adapter
         self.fantasy_league_adapter = fantasy_league_adapter
+        self.league_player_adapter = league_player_adapter
         self.common_utilities = common_utilities
 
     def convert_from_inbound_create_model_to_create_model(
@@ -95,6 +98,7 @@ class FantasyTeamSeasonLinkAdapter:
                 InListSearchTerm(
                     "id",
                     self.common_utilities.convert_uuid_list_to_string_list(model.ids),
+                    array_type="uuid",
                 )
             )
         if model.season_ids is not None:
@@ -104,6 +108,7 @@ class FantasyTeamSeasonLinkAdapter:
                     self.common_utilities.convert_uuid_list_to_string_list(
                         model.season_ids
                     ),
+                    array_type="uuid",
                 )
             )
         if model.fantasy_team_ids is not None:
@@ -113,6 +118,7 @@ class FantasyTeamSeasonLinkAdapter:
                     self.common_utilities.convert_uuid_list_to_string_list(
                         model.fantasy_team_ids
                     ),
+                    array_type="uuid",
                 )
             )
         if model.fantasy_team_owner_ids is not None:
@@ -122,6 +128,7 @@ class FantasyTeamSeasonLinkAdapter:
                     self.common_utilities.convert_uuid_list_to_string_list(
                         model.fantasy_team_owner_ids
                     ),
+                    array_type="uuid",
                 )
             )
         if model.fantasy_league_ids is not None:
@@ -131,6 +138,7 @@ class FantasyTeamSeasonLinkAdapter:
                     self.common_utilities.convert_uuid_list_to_string_list(
                         model.fantasy_league_ids
                     ),
+                    array_type="uuid",
                 )
             )
 
@@ -152,12 +160,20 @@ class FantasyTeamSeasonLinkAdapter:
     ) -> FantasyTeamSeasonLinkModel:
         model = FantasyTeamSeasonLinkModel(
             id=UUID(database_model["id"]),
-            season_id=UUID(database_model["season_id"]),
-            fantasy_team_id=UUID(database_model["fantasy_team_id"]),
-            fantasy_team_owner_id=UUID(database_model["fantasy_team_owner_id_dn"]),
-            fantasy_league_id=UUID(database_model["fantasy_league_id_dn"]),
+            season_id=UUID(database_model["season_id"])
+            if database_model.get("season_id") is not None
+            else None,
+            fantasy_team_id=UUID(database_model["fantasy_team_id"])
+            if database_model.get("fantasy_team_id") is not None
+            else None,
+            fantasy_team_owner_id=UUID(database_model["fantasy_team_owner_id_dn"])
+            if database_model.get("fantasy_team_owner_id_dn") is not None
+            else None,
+            fantasy_league_id=UUID(database_model["fantasy_league_id_dn"])
+            if database_model.get("fantasy_league_id_dn") is not None
+            else None,
             created_at=database_model["created_at"],
-            updated_at=database_model["updated_at"],
+            updated_at=database_model.get("updated_at"),
         )
         return model
 
@@ -190,6 +206,12 @@ class FantasyTeamSeasonLinkAdapter:
             )
             if model.fantasy_league is not None
             else None,
+            league_players=[
+                self.league_player_adapter.convert_from_model_to_outbound_model(x)
+                for x in model.league_players
+            ]
+            if model.league_players is not None
+            else None,
             created_at=model.created_at.isoformat(timespec="milliseconds").replace(
                 "+00:00", "Z"
             ),
@@ -0,0 +1,75 @@
+from datetime import datetime
+from typing import Any
+from adapters.fantasy_league_adapters import FantasyLeagueAdapter
+from adapters.fantasy_team_adapters import FantasyTeamAdapter
+from adapters.fantasy_team_season_link_adapters import FantasyTeamSeasonLinkAdapter
+from adapters.league_player_adapters import LeaguePlayerAdapter
+from adapters.league_team_adapters import LeagueTeamAdapter
+from adapters.season_adapters import SeasonAdapter
+from adapters.user_adapters import UserAdapter
+from adapters.venue_adapters import VenueAdapter
+from models.common_model import CommonModel
+from util.hydration_planner import HydrationPlanner
+
+
+class HydrationAdapter:
+    """
+    Converts the jsonb columns a hydrated select returns into child models and hangs
+    them off their parent, marking each target so Hydrator does not fetch it again.
+    """
+
+    def __init__(
+        self,
+        hydration_planner: HydrationPlanner = HydrationPlanner(),
+        adapters: dict[str, Any] | None = None,
+    ) -> None:
+        self.hydration_planner = hydration_planner
+        self.adapters = adapters or {
+            "fantasy_leagues": FantasyLeagueAdapter(),
+            "fantasy_teams": FantasyTeamAdapter(),
+            "fantasy_team_season_links": FantasyTeamSeasonLinkAdapter(),
+            "league_players": LeaguePlayerAdapter(),
+            "league_teams": LeagueTeamAdapter(),
+            "seasons": SeasonAdapter(),
+            "users": UserAdapter(),
+            "venues": VenueAdapter(),
+        }
+
+    def convert_from_json_to_database_model(
+        self, json_model: dict[str, Any]
+    ) -> dict[str, Any]:
+        # jsonb carries timestamps as ISO strings, the adapters expect datetimes.
+        database_model = dict(json_model)
+
+        for key in ["created_at", "updated_at"]:
+            if isinstance(database_model.get(key), str):
+                database_model[key] = datetime.fromisoformat(database_model[key])
+
+        return database_model
+
+    def attach_hydrated_targets(
+        self, table_name: str, model: CommonModel, database_model: dict[str, Any]
+    ) -> None:
+        for relation in self.hydration_planner.relations.get(table_name, []):
+            column = self.hydration_planner.column_prefix + relation.target_name
+
+            if column not in database_model:
+                continue
+
+            child_model = None
+
+            if database_model[column] is not None:
+                child_database_model = self.convert_from_json_to_database_model(
+                    database_model[column]
+                )
+
+                child_model = self.adapters[
+                    relation.table_name
+                ].convert_from_database_model_to_model(child_database_model)
+
+                self.attach_hydrated_targets(
+                    relation.table_name, child_model, child_database_model
+                )
+
+            model.__dict__[relation.target_name] = child_model
+            model.hydrated_targets.add(relation.target_name)
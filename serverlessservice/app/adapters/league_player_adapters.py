@@ -92,6 +92,7 @@ class LeaguePlayerAdapter:
                 InListSearchTerm(
                     "id",
                     self.common_utilities.convert_uuid_list_to_string_list(model.ids),
+                    array_type="uuid",
                 )
             )
 
@@ -102,6 +103,7 @@ class LeaguePlayerAdapter:
                     self.common_utilities.convert_uuid_list_to_string_list(
                         model.league_team_ids
                     ),
+                    array_type="uuid",
                 )
             )
 
@@ -112,6 +114,7 @@ class LeaguePlayerAdapter:
                     self.common_utilities.convert_uuid_list_to_string_list(
                         model.global_mnp_ids
                     ),
+                    array_type="uuid",
                 )
             )
 
@@ -158,10 +161,12 @@ class LeaguePlayerAdapter:
             league_team_id=UUID(database_model["league_team_id"])
             if database_model.get("league_team_id") is not None
             else None,
-            global_mnp_id=UUID(database_model["global_mnp_id"]),
-            name=database_model["name"],
+            global_mnp_id=UUID(database_model["global_mnp_id"])
+            if database_model.get("global_mnp_id") is not None
+            else None,
+            name=database_model.get("name"),
             created_at=database_model["created_at"],
-            updated_at=database_model["updated_at"],
+            updated_at=database_model.get("updated_at"),
         )
 
         return model
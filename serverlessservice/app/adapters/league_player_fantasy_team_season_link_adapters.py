@@ -126,6 +126,7 @@ class LeaguePlayerFantasyTeamSeasonLinkAdapter:
                 InListSearchTerm(
                     "id",
                     self.common_utilities.convert_uuid_list_to_string_list(model.ids),
+                    array_type="uuid",
                 )
             )
         if model.league_player_ids is not None:
@@ -135,6 +136,7 @@ class LeaguePlayerFantasyTeamSeasonLinkAdapter:
                     self.common_utilities.convert_uuid_list_to_string_list(
                         model.league_player_ids
                     ),
+                    array_type="uuid",
                 )
             )
         if model.league_team_ids is not None:
@@ -144,6 +146,7 @@ class LeaguePlayerFantasyTeamSeasonLinkAdapter:
                     self.common_utilities.convert_uuid_list_to_string_list(
                         model.league_team_ids
                     ),
+                    array_type="uuid",
                 )
             )
 
@@ -154,6 +157,7 @@ class LeaguePlayerFantasyTeamSeasonLinkAdapter:
                     self.common_utilities.convert_uuid_list_to_string_list(
                         model.fantasy_team_season_link_ids
                     ),
+                    array_type="uuid",
                 )
             )
 
@@ -164,6 +168,7 @@ class LeaguePlayerFantasyTeamSeasonLinkAdapter:
                     self.common_utilities.convert_uuid_list_to_string_list(
                         model.season_ids
                     ),
+                    array_type="uuid",
                 )
             )
 
@@ -174,6 +179,7 @@ class LeaguePlayerFantasyTeamSeasonLinkAdapter:
                     self.common_utilities.convert_uuid_list_to_string_list(
                         model.fantasy_team_ids
                     ),
+                    array_type="uuid",
                 )
             )
 
@@ -184,6 +190,7 @@ class LeaguePlayerFantasyTeamSeasonLinkAdapter:
                     self.common_utilities.convert_uuid_list_to_string_list(
                         model.fantasy_team_owner_ids
                     ),
+                    array_type="uuid",
                 )
             )
 
@@ -194,6 +201,7 @@ class LeaguePlayerFantasyTeamSeasonLinkAdapter:
                     self.common_utilities.convert_uuid_list_to_string_list(
                         model.fantasy_league_ids
                     ),
+                    array_type="uuid",
                 )
             )
 
@@ -230,19 +238,29 @@ class LeaguePlayerFantasyTeamSeasonLinkAdapter:
     ) -> LeaguePlayerFantasyTeamSeasonLinkModel:
         model = LeaguePlayerFantasyTeamSeasonLinkModel(
             id=UUID(database_model["id"]),
-            league_player_id=UUID(database_model["league_player_id"]),
+            league_player_id=UUID(database_model["league_player_id"])
+            if database_model.get("league_player_id") is not None
+            else None,
             league_team_id=UUID(database_model["league_team_id_dn"])
             if database_model.get("league_team_id_dn") is not None
             else None,
-            fantasy_team_season_link_id=UUID(
-                database_model["fantasy_team_season_link_id"]
-            ),
-            season_id=UUID(database_model["season_id_dn"]),
-            fantasy_team_id=UUID(database_model["fantasy_team_id_dn"]),
-            fantasy_team_owner_id=UUID(database_model["fantasy_team_owner_id_dn"]),
-            fantasy_league_id=UUID(database_model["fantasy_league_id_dn"]),
+            fantasy_team_season_link_id=UUID(database_model["fantasy_team_season_link_id"])
+            if database_model.get("fantasy_team_season_link_id") is not None
+            else None,
+            season_id=UUID(database_model["season_id_dn"])
+            if database_model.get("season_id_dn") is not None
+            else None,
+            fantasy_team_id=UUID(database_model["fantasy_team_id_dn"])
+            if database_model.get("fantasy_team_id_dn") is not None
+            else None,
+            fantasy_team_owner_id=UUID(database_model["fantasy_team_owner_id_dn"])
+            if database_model.get("fantasy_team_owner_id_dn") is not None
+            else None,
+            fantasy_league_id=UUID(database_model["fantasy_league_id_dn"])
+            if database_model.get("fantasy_league_id_dn") is not None
+            else None,
             created_at=database_model["created_at"],
-            updated_at=database_model["updated_at"],
+            updated_at=database_model.get("updated_at"),
         )
         return model
 
@@ -95,6 +95,7 @@ class LeagueTeamAdapter:
                 InListSearchTerm(
                     "id",
                     self.common_utilities.convert_uuid_list_to_string_list(model.ids),
+                    array_type="uuid",
                 )
             )
 
@@ -105,6 +106,7 @@ class LeagueTeamAdapter:
                     self.common_utilities.convert_uuid_list_to_string_list(
                         model.home_venue_ids
                     ),
+                    array_type="uuid",
                 )
             )
 
@@ -115,6 +117,7 @@ class LeagueTeamAdapter:
                     self.common_utilities.convert_uuid_list_to_string_list(
                         model.global_mnp_ids
                     ),
+                    array_type="uuid",
                 )
             )
 
@@ -167,12 +170,16 @@ class LeagueTeamAdapter:
     ) -> LeagueTeamModel:
         model = LeagueTeamModel(
             id=UUID(database_model["id"]),
-            home_venue_id=UUID(database_model["home_venue_id"]),
-            global_mnp_id=UUID(database_model["global_mnp_id"]),
-            name=database_model["name"],
-            short_name=database_model["short_name"],
+            home_venue_id=UUID(database_model["home_venue_id"])
+            if database_model.get("home_venue_id") is not None
+            else None,
+            global_mnp_id=UUID(database_model["global_mnp_id"])
+            if database_model.get("global_mnp_id") is not None
+            else None,
+            name=database_model.get("name"),
+            short_name=database_model.get("short_name"),
             created_at=database_model["created_at"],
-            updated_at=database_model["updated_at"],
+            updated_at=database_model.get("updated_at"),
         )
 
         return model
@@ -180,6 +187,18 @@ class LeagueTeamAdapter:
     def convert_from_model_to_outbound_model(
         self, model: LeagueTeamModel
     ) -> LeagueTeamOutboundModel:
+        league_players = None
+
+        if model.league_players is not None:
+            # Imported here, the league player adapter converts its team through this one.
+            from adapters.league_player_adapters import LeaguePlayerAdapter
+
+            league_player_adapter = LeaguePlayerAdapter()
+            league_players = [
+                league_player_adapter.convert_from_model_to_outbound_model(x)
+                for x in model.league_players
+            ]
+
         outbound_model = LeagueTeamOutboundModel(
             id=model.id,
             home_venue_id=model.home_venue_id,
@@ -189,6 +208,7 @@ class LeagueTeamAdapter:
             )
             if model.home_venue is not None
             else None,
+            league_players=league_players,
             name=model.name,
             short_name=model.short_name,
             created_at=model.created_at.isoformat(timespec="milliseconds").replace(
@@ -70,6 +70,7 @@ class SeasonAdapter:
                 InListSearchTerm(
                     "id",
                     self.common_utilities.convert_uuid_list_to_string_list(model.ids),
+                    array_type="uuid",
                 )
             )
 
@@ -114,10 +115,10 @@ class SeasonAdapter:
     ) -> SeasonModel:
         model = SeasonModel(
             id=UUID(database_model["id"]),
-            name=database_model["name"],
-            season_number=database_model["season_number"],
+            name=database_model.get("name"),
+            season_number=database_model.get("season_number"),
             created_at=database_model["created_at"],
-            updated_at=database_model["updated_at"],
+            updated_at=database_model.get("updated_at"),
         )
         return model
 
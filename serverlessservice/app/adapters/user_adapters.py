@@ -88,6 +88,7 @@ class UserAdapter:
                 InListSearchTerm(
                     "id",
                     self.common_utilities.convert_uuid_list_to_string_list(model.ids),
+                    array_type="uuid",
                 )
             )
 
@@ -98,6 +99,7 @@ class UserAdapter:
                     self.common_utilities.convert_uuid_list_to_string_list(
                         model.league_player_ids
                     ),
+                    array_type="uuid",
                 )
             )
 
@@ -151,10 +153,10 @@ class UserAdapter:
             league_player_id=UUID(database_model["league_player_id"])
             if database_model.get("league_player_id") is not None
             else None,
-            name=database_model["name"],
-            username=database_model["username"],
+            name=database_model.get("name"),
+            username=database_model.get("username"),
             created_at=database_model["created_at"],
-            updated_at=database_model["updated_at"],
+            updated_at=database_model.get("updated_at"),
         )
 
         return model
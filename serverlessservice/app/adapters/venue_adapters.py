@@ -70,6 +70,7 @@ class VenueAdapter:
                 InListSearchTerm(
                     "id",
                     self.common_utilities.convert_uuid_list_to_string_list(model.ids),
+                    array_type="uuid",
                 )
             )
 
@@ -105,9 +106,9 @@ class VenueAdapter:
     ) -> VenueModel:
         model = VenueModel(
             id=UUID(database_model["id"]),
-            name=database_model["name"],
+            name=database_model.get("name"),
             created_at=database_model["created_at"],
-            updated_at=database_model["updated_at"],
+            updated_at=database_model.get("updated_at"),
         )
 
         return model
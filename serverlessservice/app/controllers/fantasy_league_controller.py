@@ -20,6 +20,7 @@ from models.common_model import (
     OutboundResultantPagingModel,
 )
 from util.database import PagingModel
+from util.etag import build_etag
 
 
 class FantasyLeagueController:
@@ -33,7 +34,7 @@ class FantasyLeagueController:
         self.common_adapter = common_adapter
         self.manager = manager
 
-    def create(
+    async def create(
         self, inbound_model: FantasyLeagueInboundCreateModel, headers: dict[str, str]
     ) -> FantasyLeagueOutboundModel | None:
         request_operators = self.common_adapter.convert_from_headers_to_operators(
@@ -46,7 +47,7 @@ class FantasyLeagueController:
             )
         )
 
-        result = self.manager.create_fantasy_league(model, request_operators)
+        result = await self.manager.create_fantasy_league(model, request_operators)
 
         if result is None:
             raise Exception("Received no model from create operation.")
@@ -57,31 +58,70 @@ class FantasyLeagueController:
 
         return response_model
 
-    def get_by_id(
+    async def get_etag_by_id(self, id: UUID, headers: dict[str, str]) -> str | None:
+        request_operators = self.common_adapter.convert_from_headers_to_operators(
+            headers
+        )
+
+        version = await self.manager.get_fantasy_league_version_by_id(
+            id, request_operators
+        )
+
+        # Missing rows get no ETag, the read itself answers 404.
+        if version[0] == 0:
+            return None
+
+        return build_etag(version, headers, id)
+
+    async def get_by_id(
         self, id: UUID, headers: dict[str, str]
     ) -> FantasyLeagueOutboundModel | None:
         request_operators = self.common_adapter.convert_from_headers_to_operators(
             headers
         )
 
-        result = self.manager.get_fantasy_league_by_id(id, request_operators)
+        result = await self.manager.get_fantasy_league_by_id(id, request_operators)
 
         if result is None:
             raise HTTPException(
                 status_code=404, detail=f"FantasyLeague with id {id} not found."
             )
 
+        if request_operators.fields is not None:
+            return self.common_adapter.convert_from_model_to_sparse_response(
+                request_operators.fields, result
+            )
+
         response_model: FantasyLeagueOutboundModel = (
             self.adapter.convert_from_model_to_outbound_model(result)
         )
 
         return response_model
 
-    def search(
+    async def get_search_etag(
+        self, inbound_model: FantasyLeagueInboundSearchModel, headers: dict[str, str]
+    ) -> str:
+        request_operators = self.common_adapter.convert_from_headers_to_operators(
+            headers, inbound_model
+        )
+
+        search_model: FantasyLeagueSearchModel = (
+            self.adapter.convert_from_inbound_search_model_to_search_model(
+                inbound_model
+            )
+        )
+
+        version = await self.manager.get_fantasy_leagues_version(
+            search_model, request_operators
+        )
+
+        return build_etag(version, headers, inbound_model.model_dump())
+
+    async def search(
         self, inbound_model: FantasyLeagueInboundSearchModel, headers: dict[str, str]
     ) -> OutboundItemListResponse[FantasyLeagueOutboundModel]:
         request_operators = self.common_adapter.convert_from_headers_to_operators(
-            headers
+            headers, inbound_model
         )
 
         paging_model: PagingModel = (
@@ -96,10 +136,17 @@ class FantasyLeagueController:
             )
         )
 
-        results: ItemList[FantasyLeagueModel] = self.manager.search_fantasy_leagues(
-            search_model, paging_model, request_operators
+        results: ItemList[FantasyLeagueModel] = (
+            await self.manager.search_fantasy_leagues(
+                search_model, paging_model, request_operators
+            )
         )
 
+        if request_operators.fields is not None:
+            return self.common_adapter.convert_from_item_list_to_sparse_response(
+                request_operators.fields, results
+            )
+
         return_result_list = list(
             map(
                 lambda x: self.adapter.convert_from_model_to_outbound_model(x),
@@ -119,7 +166,7 @@ class FantasyLeagueController:
 
         return return_result
 
-    def update(
+    async def update(
         self,
         id: UUID,
         inbound_model: FantasyLeagueInboundUpdateModel,
@@ -135,7 +182,7 @@ class FantasyLeagueController:
             )
         )
 
-        result: None | FantasyLeagueModel = self.manager.update_league_player(
+        result: None | FantasyLeagueModel = await self.manager.update_league_player(
             id, model, request_operators
         )
 
@@ -151,14 +198,14 @@ class FantasyLeagueController:
 
         return response_model
 
-    def delete(
+    async def delete(
         self, id: UUID, headers: dict[str, str]
     ) -> FantasyLeagueOutboundModel | None:
         request_operators = self.common_adapter.convert_from_headers_to_operators(
             headers
         )
 
-        result = self.manager.delete_fantasy_league(id, request_operators)
+        result = await self.manager.delete_fantasy_league(id, request_operators)
 
         if result is None:
             raise HTTPException(
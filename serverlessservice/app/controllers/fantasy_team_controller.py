@@ -20,6 +20,7 @@ from models.common_model import (
     OutboundResultantPagingModel,
 )
 from util.database import PagingModel
+from util.etag import build_etag
 
 
 class FantasyTeamController:
@@ -33,7 +34,7 @@ class FantasyTeamController:
         self.common_adapter = common_adapter
         self.manager = manager
 
-    def create(
+    async def create(
         self, inbound_model: FantasyTeamInboundCreateModel, headers: dict[str, str]
     ) -> FantasyTeamOutboundModel | None:
         request_operators = self.common_adapter.convert_from_headers_to_operators(
@@ -46,7 +47,7 @@ class FantasyTeamController:
             )
         )
 
-        result = self.manager.create_fantasy_team(model, request_operators)
+        result = await self.manager.create_fantasy_team(model, request_operators)
 
         if result is None:
             raise Exception("Received no model from create operation.")
@@ -57,31 +58,70 @@ class FantasyTeamController:
 
         return response_model
 
-    def get_by_id(
+    async def get_etag_by_id(self, id: UUID, headers: dict[str, str]) -> str | None:
+        request_operators = self.common_adapter.convert_from_headers_to_operators(
+            headers
+        )
+
+        version = await self.manager.get_fantasy_team_version_by_id(
+            id, request_operators
+        )
+
+        # Missing rows get no ETag, the read itself answers 404.
+        if version[0] == 0:
+            return None
+
+        return build_etag(version, headers, id)
+
+    async def get_by_id(
         self, id: UUID, headers: dict[str, str]
     ) -> FantasyTeamOutboundModel | None:
         request_operators = self.common_adapter.convert_from_headers_to_operators(
             headers
         )
 
-        result = self.manager.get_fantasy_team_by_id(id, request_operators)
+        result = await self.manager.get_fantasy_team_by_id(id, request_operators)
 
         if result is None:
             raise HTTPException(
                 status_code=404, detail=f"FantasyTeam with id {id} not found."
             )
 
+        if request_operators.fields is not None:
+            return self.common_adapter.convert_from_model_to_sparse_response(
+                request_operators.fields, result
+            )
+
         response_model: FantasyTeamOutboundModel = (
             self.adapter.convert_from_model_to_outbound_model(result)
         )
 
         return response_model
 
-    def search(
+    async def get_search_etag(
+        self, inbound_model: FantasyTeamInboundSearchModel, headers: dict[str, str]
+    ) -> str:
+        request_operators = self.common_adapter.convert_from_headers_to_operators(
+            headers, inbound_model
+        )
+
+        search_model: FantasyTeamSearchModel = (
+            self.adapter.convert_from_inbound_search_model_to_search_model(
+                inbound_model
+            )
+        )
+
+        version = await self.manager.get_fantasy_teams_version(
+            search_model, request_operators
+        )
+
+        return build_etag(version, headers, inbound_model.model_dump())
+
+    async def search(
         self, inbound_model: FantasyTeamInboundSearchModel, headers: dict[str, str]
     ) -> OutboundItemListResponse[FantasyTeamOutboundModel]:
         request_operators = self.common_adapter.convert_from_headers_to_operators(
-            headers
+            headers, inbound_model
         )
 
         paging_model: PagingModel = (
@@ -96,10 +136,15 @@ class FantasyTeamController:
             )
         )
 
-        results: ItemList[FantasyTeamModel] = self.manager.search_fantasy_teams(
+        results: ItemList[FantasyTeamModel] = await self.manager.search_fantasy_teams(
             search_model, paging_model, request_operators
         )
 
+        if request_operators.fields is not None:
+            return self.common_adapter.convert_from_item_list_to_sparse_response(
+                request_operators.fields, results
+            )
+
         return_result_list = list(
             map(
                 lambda x: self.adapter.convert_from_model_to_outbound_model(x),
@@ -119,7 +164,7 @@ class FantasyTeamController:
 
         return return_result
 
-    def update(
+    async def update(
         self,
         id: UUID,
         inbound_model: FantasyTeamInboundUpdateModel,
@@ -135,7 +180,7 @@ class FantasyTeamController:
             )
         )
 
-        result: None | FantasyTeamModel = self.manager.update_league_player(
+        result: None | FantasyTeamModel = await self.manager.update_league_player(
             id, model, request_operators
         )
 
@@ -151,14 +196,14 @@ class FantasyTeamController:
 
         return response_model
 
-    def delete(
+    async def delete(
         self, id: UUID, headers: dict[str, str]
     ) -> FantasyTeamOutboundModel | None:
         request_operators = self.common_adapter.convert_from_headers_to_operators(
             headers
         )
 
-        result = self.manager.delete_fantasy_team(id, request_operators)
+        result = await self.manager.delete_fantasy_team(id, request_operators)
 
         if result is None:
             raise HTTPException(
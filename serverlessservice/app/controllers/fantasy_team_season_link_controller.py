@@ -18,6 +18,7 @@ from models.common_model import (
     OutboundResultantPagingModel,
 )
 from util.database import PagingModel
+from util.etag import build_etag
 
 
 class FantasyTeamSeasonLinkController:
@@ -31,7 +32,7 @@ class FantasyTeamSeasonLinkController:
         self.common_adapter = common_adapter
         self.manager = manager
 
-    def create(
+    async def create(
         self,
         inbound_model: FantasyTeamSeasonLinkInboundCreateModel,
         headers: dict[str, str],
@@ -46,7 +47,9 @@ class FantasyTeamSeasonLinkController:
             )
         )
 
-        result = self.manager.create_fantasy_team_season_link(model, request_operators)
+        result = await self.manager.create_fantasy_team_season_link(
+            model, request_operators
+        )
 
         if result is None:
             raise Exception("Received no model from create operation.")
@@ -57,33 +60,76 @@ class FantasyTeamSeasonLinkController:
 
         return response_model
 
-    def get_by_id(
+    async def get_etag_by_id(self, id: UUID, headers: dict[str, str]) -> str | None:
+        request_operators = self.common_adapter.convert_from_headers_to_operators(
+            headers
+        )
+
+        version = await self.manager.get_fantasy_team_season_link_version_by_id(
+            id, request_operators
+        )
+
+        # Missing rows get no ETag, the read itself answers 404.
+        if version[0] == 0:
+            return None
+
+        return build_etag(version, headers, id)
+
+    async def get_by_id(
         self, id: UUID, headers: dict[str, str]
     ) -> FantasyTeamSeasonLinkOutboundModel | None:
         request_operators = self.common_adapter.convert_from_headers_to_operators(
             headers
         )
 
-        result = self.manager.get_fantasy_team_season_link_by_id(id, request_operators)
+        result = await self.manager.get_fantasy_team_season_link_by_id(
+            id, request_operators
+        )
 
         if result is None:
             raise HTTPException(
                 status_code=404, detail=f"FantasyTeamSeasonLink with id {id} not found."
             )
 
+        if request_operators.fields is not None:
+            return self.common_adapter.convert_from_model_to_sparse_response(
+                request_operators.fields, result
+            )
+
         response_model: FantasyTeamSeasonLinkOutboundModel = (
             self.adapter.convert_from_model_to_outbound_model(result)
         )
 
         return response_model
 
-    def search(
+    async def get_search_etag(
+        self,
+        inbound_model: FantasyTeamSeasonLinkInboundSearchModel,
+        headers: dict[str, str],
+    ) -> str:
+        request_operators = self.common_adapter.convert_from_headers_to_operators(
+            headers, inbound_model
+        )
+
+        search_model: FantasyTeamSeasonLinkSearchModel = (
+            self.adapter.convert_from_inbound_search_model_to_search_model(
+                inbound_model
+            )
+        )
+
+        version = await self.manager.get_fantasy_team_season_links_version(
+            search_model, request_operators
+        )
+
+        return build_etag(version, headers, inbound_model.model_dump())
+
+    async def search(
         self,
         inbound_model: FantasyTeamSeasonLinkInboundSearchModel,
         headers: dict[str, str],
     ) -> OutboundItemListResponse[FantasyTeamSeasonLinkOutboundModel]:
         request_operators = self.common_adapter.convert_from_headers_to_operators(
-            headers
+            headers, inbound_model
         )
 
         paging_model: PagingModel = (
@@ -99,11 +145,16 @@ class FantasyTeamSeasonLinkController:
         )
 
         results: ItemList[FantasyTeamSeasonLinkModel] = (
-            self.manager.search_fantasy_team_season_links(
+            await self.manager.search_fantasy_team_season_links(
                 search_model, paging_model, request_operators
             )
         )
 
+        if request_operators.fields is not None:
+            return self.common_adapter.convert_from_item_list_to_sparse_response(
+                request_operators.fields, results
+            )
+
         return_result_list = list(
             map(
                 lambda x: self.adapter.convert_from_model_to_outbound_model(x),
@@ -123,14 +174,16 @@ class FantasyTeamSeasonLinkController:
 
         return return_result
 
-    def delete(
+    async def delete(
         self, id: UUID, headers: dict[str, str]
     ) -> FantasyTeamSeasonLinkOutboundModel | None:
         request_operators = self.common_adapter.convert_from_headers_to_operators(
             headers
         )
 
-        result = self.manager.delete_fantasy_team_season_link(id, request_operators)
+        result = await self.manager.delete_fantasy_team_season_link(
+            id, request_operators
+        )
 
         if result is None:
             raise HTTPException(
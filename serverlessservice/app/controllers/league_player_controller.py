@@ -22,6 +22,7 @@ from models.common_model import (
 
 from fastapi.datastructures import Headers
 from util.database import PagingModel
+from util.etag import build_etag
 
 
 class LeaguePlayerController:
@@ -35,7 +36,7 @@ class LeaguePlayerController:
         self.common_adapter = common_adapter
         self.manager = manager
 
-    def create(
+    async def create(
         self, inbound_model: LeaguePlayerInboundCreateModel, headers: Headers
     ) -> LeaguePlayerOutboundModel | None:
         request_operators = self.common_adapter.convert_from_headers_to_operators(
@@ -48,7 +49,7 @@ class LeaguePlayerController:
             )
         )
 
-        result = self.manager.create_league_player(model, request_operators)
+        result = await self.manager.create_league_player(model, request_operators)
 
         if result is None:
             raise Exception("Received no model from create operation.")
@@ -59,12 +60,52 @@ class LeaguePlayerController:
 
         return response_model
 
-    def get_by_id(self, id: UUID, headers: Headers) -> LeaguePlayerOutboundModel | None:
+    async def upsert(
+        self, inbound_models: list[LeaguePlayerInboundCreateModel], headers: Headers
+    ) -> list[LeaguePlayerOutboundModel]:
         request_operators = self.common_adapter.convert_from_headers_to_operators(
             headers
         )
 
-        result = self.manager.get_league_player_by_id(id, request_operators)
+        models: list[LeaguePlayerCreateModel] = [
+            self.adapter.convert_from_inbound_create_model_to_create_model(
+                inbound_model
+            )
+            for inbound_model in inbound_models
+        ]
+
+        results = await self.manager.upsert_league_players(models, request_operators)
+
+        response_models: list[LeaguePlayerOutboundModel] = [
+            self.adapter.convert_from_model_to_outbound_model(result)
+            for result in results
+        ]
+
+        return response_models
+
+    async def get_etag_by_id(self, id: UUID, headers: Headers) -> str | None:
+        request_operators = self.common_adapter.convert_from_headers_to_operators(
+            headers
+        )
+
+        version = await self.manager.get_league_player_version_by_id(
+            id, request_operators
+        )
+
+        # Missing rows get no ETag, the read itself answers 404.
+        if version[0] == 0:
+            return None
+
+        return build_etag(version, headers, id)
+
+    async def get_by_id(
+        self, id: UUID, headers: Headers
+    ) -> LeaguePlayerOutboundModel | None:
+        request_operators = self.common_adapter.convert_from_headers_to_operators(
+            headers
+        )
+
+        result = await self.manager.get_league_player_by_id(id, request_operators)
 
         if result is None:
             raise HTTPException(
@@ -72,17 +113,41 @@ class LeaguePlayerController:
                 detail=f"LeaguePlayer with id {id} not found.",
             )
 
+        if request_operators.fields is not None:
+            return self.common_adapter.convert_from_model_to_sparse_response(
+                request_operators.fields, result
+            )
+
         response_model: LeaguePlayerOutboundModel = (
             self.adapter.convert_from_model_to_outbound_model(result)
         )
 
         return response_model
 
-    def search(
+    async def get_search_etag(
+        self, inbound_model: LeaguePlayerInboundSearchModel, headers: Headers
+    ) -> str:
+        request_operators = self.common_adapter.convert_from_headers_to_operators(
+            headers, inbound_model
+        )
+
+        search_model: LeaguePlayerSearchModel = (
+            self.adapter.convert_from_inbound_search_model_to_search_model(
+                inbound_model
+            )
+        )
+
+        version = await self.manager.get_league_players_version(
+            search_model, request_operators
+        )
+
+        return build_etag(version, headers, inbound_model.model_dump())
+
+    async def search(
         self, inbound_model: LeaguePlayerInboundSearchModel, headers: Headers
     ) -> OutboundItemListResponse[LeaguePlayerOutboundModel]:
         request_operators = self.common_adapter.convert_from_headers_to_operators(
-            headers
+            headers, inbound_model
         )
 
         paging_model: PagingModel = (
@@ -97,10 +162,15 @@ class LeaguePlayerController:
             )
         )
 
-        results: ItemList[LeaguePlayerModel] = self.manager.search_league_players(
+        results: ItemList[LeaguePlayerModel] = await self.manager.search_league_players(
             search_model, paging_model, request_operators
         )
 
+        if request_operators.fields is not None:
+            return self.common_adapter.convert_from_item_list_to_sparse_response(
+                request_operators.fields, results
+            )
+
         return_result_list = list(
             map(
                 lambda x: self.adapter.convert_from_model_to_outbound_model(x),
@@ -120,7 +190,7 @@ class LeaguePlayerController:
 
         return return_result
 
-    def update(
+    async def update(
         self,
         id: UUID,
         inbound_model: LeaguePlayerInboundUpdateModel,
@@ -136,7 +206,7 @@ class LeaguePlayerController:
             )
         )
 
-        result: None | LeaguePlayerModel = self.manager.update_league_player(
+        result: None | LeaguePlayerModel = await self.manager.update_league_player(
             id, model, request_operators
         )
 
@@ -152,12 +222,14 @@ class LeaguePlayerController:
 
         return response_model
 
-    def delete(self, id: UUID, headers: Headers) -> LeaguePlayerOutboundModel | None:
+    async def delete(
+        self, id: UUID, headers: Headers
+    ) -> LeaguePlayerOutboundModel | None:
         request_operators = self.common_adapter.convert_from_headers_to_operators(
             headers
         )
 
-        result = self.manager.delete_league_player(id, request_operators)
+        result = await self.manager.delete_league_player(id, request_operators)
 
         if result is None:
             raise HTTPException(
@@ -21,6 +21,7 @@ from models.league_player_fantasy_team_season_link_model import (
     LeaguePlayerFantasyTeamSeasonLinkSearchModel,
 )
 from util.database import PagingModel
+from util.etag import build_etag
 
 
 class LeaguePlayerFantasyTeamSeasonLinkController:
@@ -34,7 +35,7 @@ class LeaguePlayerFantasyTeamSeasonLinkController:
         self.common_adapter = common_adapter
         self.manager = manager
 
-    def create(
+    async def create(
         self,
         inbound_model: LeaguePlayerFantasyTeamSeasonLinkInboundCreateModel,
         headers: dict[str, str],
@@ -49,7 +50,7 @@ class LeaguePlayerFantasyTeamSeasonLinkController:
             )
         )
 
-        result = self.manager.create_league_player_fantasy_team_season_link(
+        result = await self.manager.create_league_player_fantasy_team_season_link(
             model, request_operators
         )
 
@@ -62,14 +63,31 @@ class LeaguePlayerFantasyTeamSeasonLinkController:
 
         return response_model
 
-    def get_by_id(
+    async def get_etag_by_id(self, id: UUID, headers: dict[str, str]) -> str | None:
+        request_operators = self.common_adapter.convert_from_headers_to_operators(
+            headers
+        )
+
+        version = (
+            await self.manager.get_league_player_fantasy_team_season_link_version_by_id(
+                id, request_operators
+            )
+        )
+
+        # Missing rows get no ETag, the read itself answers 404.
+        if version[0] == 0:
+            return None
+
+        return build_etag(version, headers, id)
+
+    async def get_by_id(
         self, id: UUID, headers: dict[str, str]
     ) -> LeaguePlayerFantasyTeamSeasonLinkOutboundModel | None:
         request_operators = self.common_adapter.convert_from_headers_to_operators(
             headers
         )
 
-        result = self.manager.get_league_player_fantasy_team_season_link_by_id(
+        result = await self.manager.get_league_player_fantasy_team_season_link_by_id(
             id, request_operators
         )
 
@@ -79,19 +97,47 @@ class LeaguePlayerFantasyTeamSeasonLinkController:
                 detail=f"LeaguePlayerFantasyTeamSeasonLink with id {id} not found.",
             )
 
+        if request_operators.fields is not None:
+            return self.common_adapter.convert_from_model_to_sparse_response(
+                request_operators.fields, result
+            )
+
         response_model: LeaguePlayerFantasyTeamSeasonLinkOutboundModel = (
             self.adapter.convert_from_model_to_outbound_model(result)
         )
 
         return response_model
 
-    def search(
+    async def get_search_etag(
+        self,
+        inbound_model: LeaguePlayerFantasyTeamSeasonLinkInboundSearchModel,
+        headers: dict[str, str],
+    ) -> str:
+        request_operators = self.common_adapter.convert_from_headers_to_operators(
+            headers, inbound_model
+        )
+
+        search_model: LeaguePlayerFantasyTeamSeasonLinkSearchModel = (
+            self.adapter.convert_from_inbound_search_model_to_search_model(
+                inbound_model
+            )
+        )
+
+        version = (
+            await self.manager.get_league_player_fantasy_team_season_links_version(
+                search_model, request_operators
+            )
+        )
+
+        return build_etag(version, headers, inbound_model.model_dump())
+
+    async def search(
         self,
         inbound_model: LeaguePlayerFantasyTeamSeasonLinkInboundSearchModel,
         headers: dict[str, str],
     ) -> OutboundItemListResponse[LeaguePlayerFantasyTeamSeasonLinkOutboundModel]:
         request_operators = self.common_adapter.convert_from_headers_to_operators(
-            headers
+            headers, inbound_model
         )
 
         paging_model: PagingModel = (
@@ -107,11 +153,16 @@ class LeaguePlayerFantasyTeamSeasonLinkController:
         )
 
         results: ItemList[LeaguePlayerFantasyTeamSeasonLinkModel] = (
-            self.manager.search_league_player_fantasy_team_season_links(
+            await self.manager.search_league_player_fantasy_team_season_links(
                 search_model, paging_model, request_operators
             )
         )
 
+        if request_operators.fields is not None:
+            return self.common_adapter.convert_from_item_list_to_sparse_response(
+                request_operators.fields, results
+            )
+
         return_result_list = list(
             map(
                 lambda x: self.adapter.convert_from_model_to_outbound_model(x),
@@ -131,14 +182,14 @@ class LeaguePlayerFantasyTeamSeasonLinkController:
 
         return return_result
 
-    def delete(
+    async def delete(
         self, id: UUID, headers: dict[str, str]
     ) -> LeaguePlayerFantasyTeamSeasonLinkOutboundModel | None:
         request_operators = self.common_adapter.convert_from_headers_to_operators(
             headers
         )
 
-        result = self.manager.delete_league_player_fantasy_team_season_link(
+        result = await self.manager.delete_league_player_fantasy_team_season_link(
             id, request_operators
         )
 
@@ -22,6 +22,7 @@ from models.common_model import (
 
 from fastapi.datastructures import Headers
 from util.database import PagingModel
+from util.etag import build_etag
 
 
 class LeagueTeamController:
@@ -35,7 +36,7 @@ class LeagueTeamController:
         self.common_adapter = common_adapter
         self.manager = manager
 
-    def create(
+    async def create(
         self, inbound_model: LeagueTeamInboundCreateModel, headers: Headers
     ) -> LeagueTeamOutboundModel | None:
         request_operators = self.common_adapter.convert_from_headers_to_operators(
@@ -48,7 +49,7 @@ class LeagueTeamController:
             )
         )
 
-        result = self.manager.create_league_team(model, request_operators)
+        result = await self.manager.create_league_team(model, request_operators)
 
         if result is None:
             raise Exception("Received no model from create operation.")
@@ -59,12 +60,52 @@ class LeagueTeamController:
 
         return response_model
 
-    def get_by_id(self, id: UUID, headers: Headers) -> LeagueTeamOutboundModel | None:
+    async def upsert(
+        self, inbound_models: list[LeagueTeamInboundCreateModel], headers: Headers
+    ) -> list[LeagueTeamOutboundModel]:
         request_operators = self.common_adapter.convert_from_headers_to_operators(
             headers
         )
 
-        result = self.manager.get_league_team_by_id(id, request_operators)
+        models: list[LeagueTeamCreateModel] = [
+            self.adapter.convert_from_inbound_create_model_to_create_model(
+                inbound_model
+            )
+            for inbound_model in inbound_models
+        ]
+
+        results = await self.manager.upsert_league_teams(models, request_operators)
+
+        response_models: list[LeagueTeamOutboundModel] = [
+            self.adapter.convert_from_model_to_outbound_model(result)
+            for result in results
+        ]
+
+        return response_models
+
+    async def get_etag_by_id(self, id: UUID, headers: Headers) -> str | None:
+        request_operators = self.common_adapter.convert_from_headers_to_operators(
+            headers
+        )
+
+        version = await self.manager.get_league_team_version_by_id(
+            id, request_operators
+        )
+
+        # Missing rows get no ETag, the read itself answers 404.
+        if version[0] == 0:
+            return None
+
+        return build_etag(version, headers, id)
+
+    async def get_by_id(
+        self, id: UUID, headers: Headers
+    ) -> LeagueTeamOutboundModel | None:
+        request_operators = self.common_adapter.convert_from_headers_to_operators(
+            headers
+        )
+
+        result = await self.manager.get_league_team_by_id(id, request_operators)
 
         if result is None:
             raise HTTPException(
@@ -72,17 +113,41 @@ class LeagueTeamController:
                 detail=f"LeagueTeam with id {id} not found.",
             )
 
+        if request_operators.fields is not None:
+            return self.common_adapter.convert_from_model_to_sparse_response(
+                request_operators.fields, result
+            )
+
         response_model: LeagueTeamOutboundModel = (
             self.adapter.convert_from_model_to_outbound_model(result)
         )
 
         return response_model
 
-    def search(
+    async def get_search_etag(
+        self, inbound_model: LeagueTeamInboundSearchModel, headers: Headers
+    ) -> str:
+        request_operators = self.common_adapter.convert_from_headers_to_operators(
+            headers, inbound_model
+        )
+
+        search_model: LeagueTeamSearchModel = (
+            self.adapter.convert_from_inbound_search_model_to_search_model(
+                inbound_model
+            )
+        )
+
+        version = await self.manager.get_league_teams_version(
+            search_model, request_operators
+        )
+
+        return build_etag(version, headers, inbound_model.model_dump())
+
+    async def search(
         self, inbound_model: LeagueTeamInboundSearchModel, headers: Headers
     ) -> OutboundItemListResponse[LeagueTeamOutboundModel]:
         request_operators = self.common_adapter.convert_from_headers_to_operators(
-            headers
+            headers, inbound_model
         )
 
         paging_model: PagingModel = (
@@ -97,10 +162,15 @@ class LeagueTeamController:
             )
         )
 
-        results: ItemList[LeagueTeamModel] = self.manager.search_league_teams(
+        results: ItemList[LeagueTeamModel] = await self.manager.search_league_teams(
             search_model, paging_model, request_operators
         )
 
+        if request_operators.fields is not None:
+            return self.common_adapter.convert_from_item_list_to_sparse_response(
+                request_operators.fields, results
+            )
+
         return_result_list = list(
             map(
                 lambda x: self.adapter.convert_from_model_to_outbound_model(x),
@@ -120,7 +190,7 @@ class LeagueTeamController:
 
         return return_result
 
-    def update(
+    async def update(
         self,
         id: UUID,
         inbound_model: LeagueTeamInboundUpdateModel,
@@ -136,7 +206,7 @@ class LeagueTeamController:
             )
         )
 
-        result: None | LeagueTeamModel = self.manager.update_league_team(
+        result: None | LeagueTeamModel = await self.manager.update_league_team(
             id, model, request_operators
         )
 
@@ -152,12 +222,14 @@ class LeagueTeamController:
 
         return response_model
 
-    def delete(self, id: UUID, headers: Headers) -> LeagueTeamOutboundModel | None:
+    async def delete(
+        self, id: UUID, headers: Headers
+    ) -> LeagueTeamOutboundModel | None:
         request_operators = self.common_adapter.convert_from_headers_to_operators(
             headers
         )
 
-        result = self.manager.delete_league_team(id, request_operators)
+        result = await self.manager.delete_league_team(id, request_operators)
 
         if result is None:
             raise HTTPException(
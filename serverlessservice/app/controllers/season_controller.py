@@ -18,6 +18,7 @@ from models.common_model import (
     OutboundResultantPagingModel,
 )
 from util.database import PagingModel
+from util.etag import build_etag
 
 
 class SeasonController:
@@ -31,7 +32,7 @@ class SeasonController:
         self.common_adapter = common_adapter
         self.manager = manager
 
-    def create(
+    async def create(
         self, inbound_model: SeasonInboundCreateModel, headers: dict[str, str]
     ) -> SeasonOutboundModel | None:
         request_operators = self.common_adapter.convert_from_headers_to_operators(
@@ -44,7 +45,7 @@ class SeasonController:
             )
         )
 
-        result = self.manager.create_season(model, request_operators)
+        result = await self.manager.create_season(model, request_operators)
 
         if result is None:
             raise Exception("Received no model from create operation.")
@@ -55,31 +56,68 @@ class SeasonController:
 
         return response_model
 
-    def get_by_id(
+    async def get_etag_by_id(self, id: UUID, headers: dict[str, str]) -> str | None:
+        request_operators = self.common_adapter.convert_from_headers_to_operators(
+            headers
+        )
+
+        version = await self.manager.get_season_version_by_id(id, request_operators)
+
+        # Missing rows get no ETag, the read itself answers 404.
+        if version[0] == 0:
+            return None
+
+        return build_etag(version, headers, id)
+
+    async def get_by_id(
         self, id: UUID, headers: dict[str, str]
     ) -> SeasonOutboundModel | None:
         request_operators = self.common_adapter.convert_from_headers_to_operators(
             headers
         )
 
-        result = self.manager.get_season_by_id(id, request_operators)
+        result = await self.manager.get_season_by_id(id, request_operators)
 
         if result is None:
             raise HTTPException(
                 status_code=404, detail=f"Season with id {id} not found."
             )
 
+        if request_operators.fields is not None:
+            return self.common_adapter.convert_from_model_to_sparse_response(
+                request_operators.fields, result
+            )
+
         response_model: SeasonOutboundModel = (
             self.adapter.convert_from_model_to_outbound_model(result)
         )
 
         return response_model
 
-    def search(
+    async def get_search_etag(
+        self, inbound_model: SeasonInboundSearchModel, headers: dict[str, str]
+    ) -> str:
+        request_operators = self.common_adapter.convert_from_headers_to_operators(
+            headers, inbound_model
+        )
+
+        search_model: SeasonSearchModel = (
+            self.adapter.convert_from_inbound_search_model_to_search_model(
+                inbound_model
+            )
+        )
+
+        version = await self.manager.get_seasons_version(
+            search_model, request_operators
+        )
+
+        return build_etag(version, headers, inbound_model.model_dump())
+
+    async def search(
         self, inbound_model: SeasonInboundSearchModel, headers: dict[str, str]
     ) -> OutboundItemListResponse[SeasonOutboundModel]:
         request_operators = self.common_adapter.convert_from_headers_to_operators(
-            headers
+            headers, inbound_model
         )
 
         paging_model: PagingModel = (
@@ -94,10 +132,15 @@ class SeasonController:
             )
         )
 
-        results: ItemList[SeasonModel] = self.manager.search_seasons(
+        results: ItemList[SeasonModel] = await self.manager.search_seasons(
             search_model, paging_model, request_operators
         )
 
+        if request_operators.fields is not None:
+            return self.common_adapter.convert_from_item_list_to_sparse_response(
+                request_operators.fields, results
+            )
+
         return_result_list = list(
             map(
                 lambda x: self.adapter.convert_from_model_to_outbound_model(x),
@@ -117,7 +160,7 @@ class SeasonController:
 
         return return_result
 
-    def update(
+    async def update(
         self,
         id: UUID,
         inbound_model: SeasonInboundUpdateModel,
@@ -133,7 +176,7 @@ class SeasonController:
             )
         )
 
-        result = self.manager.update_season(id, model, request_operators)
+        result = await self.manager.update_season(id, model, request_operators)
 
         if result is None:
             raise HTTPException(
@@ -146,12 +189,14 @@ class SeasonController:
 
         return response_model
 
-    def delete(self, id: UUID, headers: dict[str, str]) -> SeasonOutboundModel | None:
+    async def delete(
+        self, id: UUID, headers: dict[str, str]
+    ) -> SeasonOutboundModel | None:
         request_operators = self.common_adapter.convert_from_headers_to_operators(
             headers
         )
 
-        result = self.manager.delete_season(id, request_operators)
+        result = await self.manager.delete_season(id, request_operators)
 
         if result is None:
             raise HTTPException(
@@ -22,6 +22,7 @@ from models.common_model import (
 
 from fastapi.datastructures import Headers
 from util.database import PagingModel
+from util.etag import build_etag
 
 
 class UserController:
@@ -35,7 +36,7 @@ class UserController:
         self.common_adapter = common_adapter
         self.manager = manager
 
-    def create(
+    async def create(
         self, inbound_model: UserInboundCreateModel, headers: Headers
     ) -> UserOutboundModel | None:
         request_operators = self.common_adapter.convert_from_headers_to_operators(
@@ -48,7 +49,7 @@ class UserController:
             )
         )
 
-        result = self.manager.create_user(model, request_operators)
+        result = await self.manager.create_user(model, request_operators)
 
         if result is None:
             raise Exception("Received no model from create operation.")
@@ -59,12 +60,25 @@ class UserController:
 
         return response_model
 
-    def get_by_id(self, id: UUID, headers: Headers) -> UserOutboundModel | None:
+    async def get_etag_by_id(self, id: UUID, headers: Headers) -> str | None:
         request_operators = self.common_adapter.convert_from_headers_to_operators(
             headers
         )
 
-        result = self.manager.get_user_by_id(id, request_operators)
+        version = await self.manager.get_user_version_by_id(id, request_operators)
+
+        # Missing rows get no ETag, the read itself answers 404.
+        if version[0] == 0:
+            return None
+
+        return build_etag(version, headers, id)
+
+    async def get_by_id(self, id: UUID, headers: Headers) -> UserOutboundModel | None:
+        request_operators = self.common_adapter.convert_from_headers_to_operators(
+            headers
+        )
+
+        result = await self.manager.get_user_by_id(id, request_operators)
 
         if result is None:
             raise HTTPException(
@@ -72,17 +86,39 @@ class UserController:
                 detail=f"User with id {id} not found.",
             )
 
+        if request_operators.fields is not None:
+            return self.common_adapter.convert_from_model_to_sparse_response(
+                request_operators.fields, result
+            )
+
         response_model: UserOutboundModel = (
             self.adapter.convert_from_model_to_outbound_model(result)
         )
 
         return response_model
 
-    def search(
+    async def get_search_etag(
+        self, inbound_model: UserInboundSearchModel, headers: Headers
+    ) -> str:
+        request_operators = self.common_adapter.convert_from_headers_to_operators(
+            headers, inbound_model
+        )
+
+        search_model: UserSearchModel = (
+            self.adapter.convert_from_inbound_search_model_to_search_model(
+                inbound_model
+            )
+        )
+
+        version = await self.manager.get_users_version(search_model, request_operators)
+
+        return build_etag(version, headers, inbound_model.model_dump())
+
+    async def search(
         self, inbound_model: UserInboundSearchModel, headers: Headers
     ) -> OutboundItemListResponse[UserOutboundModel]:
         request_operators = self.common_adapter.convert_from_headers_to_operators(
-            headers
+            headers, inbound_model
         )
 
         paging_model: PagingModel = (
@@ -97,10 +133,15 @@ class UserController:
             )
         )
 
-        results: ItemList[UserModel] = self.manager.search_users(
+        results: ItemList[UserModel] = await self.manager.search_users(
             search_model, paging_model, request_operators
         )
 
+        if request_operators.fields is not None:
+            return self.common_adapter.convert_from_item_list_to_sparse_response(
+                request_operators.fields, results
+            )
+
         return_result_list = list(
             map(
                 lambda x: self.adapter.convert_from_model_to_outbound_model(x),
@@ -120,7 +161,7 @@ class UserController:
 
         return return_result
 
-    def update(
+    async def update(
         self,
         id: UUID,
         inbound_model: UserInboundUpdateModel,
@@ -136,7 +177,7 @@ class UserController:
             )
         )
 
-        result: None | UserModel = self.manager.update_user(
+        result: None | UserModel = await self.manager.update_user(
             id, model, request_operators
         )
 
@@ -152,12 +193,12 @@ class UserController:
 
         return response_model
 
-    def delete(self, id: UUID, headers: Headers) -> UserOutboundModel | None:
+    async def delete(self, id: UUID, headers: Headers) -> UserOutboundModel | None:
         request_operators = self.common_adapter.convert_from_headers_to_operators(
             headers
         )
 
-        result = self.manager.delete_user(id, request_operators)
+        result = await self.manager.delete_user(id, request_operators)
 
         if result is None:
             raise HTTPException(
@@ -18,6 +18,7 @@ from models.common_model import (
     OutboundResultantPagingModel,
 )
 from util.database import PagingModel
+from util.etag import build_etag
 
 
 class VenueController:
@@ -31,7 +32,7 @@ class VenueController:
         self.common_adapter = common_adapter
         self.manager = manager
 
-    def create(
+    async def create(
         self, inbound_model: VenueInboundCreateModel, headers: dict[str, str]
     ) -> VenueOutboundModel | None:
         request_operators = self.common_adapter.convert_from_headers_to_operators(
@@ -44,7 +45,7 @@ class VenueController:
             )
         )
 
-        result = self.manager.create_venue(model, request_operators)
+        result = await self.manager.create_venue(model, request_operators)
 
         if result is None:
             raise Exception("Received no model from create operation.")
@@ -55,25 +56,45 @@ class VenueController:
 
         return response_model
 
-    def get_by_id(self, id: UUID, headers: dict[str, str]) -> VenueOutboundModel | None:
+    async def get_etag_by_id(self, id: UUID, headers: dict[str, str]) -> str | None:
         request_operators = self.common_adapter.convert_from_headers_to_operators(
             headers
         )
 
-        result = self.manager.get_venue_by_id(id, request_operators)
+        version = await self.manager.get_venue_version_by_id(id, request_operators)
+
+        # Missing rows get no ETag, the read itself answers 404.
+        if version[0] == 0:
+            return None
+
+        return build_etag(version, headers, id)
+
+    async def get_by_id(
+        self, id: UUID, headers: dict[str, str]
+    ) -> VenueOutboundModel | None:
+        request_operators = self.common_adapter.convert_from_headers_to_operators(
+            headers
+        )
+
+        result = await self.manager.get_venue_by_id(id, request_operators)
 
         if result is None:
             raise HTTPException(
                 status_code=404, detail=f"Venue with id {id} not found."
             )
 
+        if request_operators.fields is not None:
+            return self.common_adapter.convert_from_model_to_sparse_response(
+                request_operators.fields, result
+            )
+
         response_model: VenueOutboundModel = (
             self.adapter.convert_from_model_to_outbound_model(result)
         )
 
         return response_model
 
-    def update(
+    async def update(
         self,
         id: UUID,
         inbound_model: VenueInboundUpdateModel,
@@ -89,7 +110,7 @@ class VenueController:
             )
         )
 
-        result = self.manager.update_venue(id, model, request_operators)
+        result = await self.manager.update_venue(id, model, request_operators)
 
         if result is None:
             raise HTTPException(
@@ -102,11 +123,28 @@ class VenueController:
 
         return response_model
 
-    def search(
+    async def get_search_etag(
+        self, inbound_model: VenueInboundSearchModel, headers: dict[str, str]
+    ) -> str:
+        request_operators = self.common_adapter.convert_from_headers_to_operators(
+            headers, inbound_model
+        )
+
+        search_model: VenueSearchModel = (
+            self.adapter.convert_from_inbound_search_model_to_search_model(
+                inbound_model
+            )
+        )
+
+        version = await self.manager.get_venues_version(search_model, request_operators)
+
+        return build_etag(version, headers, inbound_model.model_dump())
+
+    async def search(
         self, inbound_model: VenueInboundSearchModel, headers: dict[str, str]
     ) -> OutboundItemListResponse[VenueOutboundModel]:
         request_operators = self.common_adapter.convert_from_headers_to_operators(
-            headers
+            headers, inbound_model
         )
 
         paging_model: PagingModel = (
@@ -121,10 +159,15 @@ class VenueController:
             )
         )
 
-        results: ItemList[VenueModel] = self.manager.search_venues(
+        results: ItemList[VenueModel] = await self.manager.search_venues(
             search_model, paging_model, request_operators
         )
 
+        if request_operators.fields is not None:
+            return self.common_adapter.convert_from_item_list_to_sparse_response(
+                request_operators.fields, results
+            )
+
         return_result_list = list(
             map(
                 lambda x: self.adapter.convert_from_model_to_outbound_model(x),
@@ -144,12 +187,14 @@ class VenueController:
 
         return return_result
 
-    def delete(self, id: UUID, headers: dict[str, str]) -> VenueOutboundModel | None:
+    async def delete(
+        self, id: UUID, headers: dict[str, str]
+    ) -> VenueOutboundModel | None:
         request_operators = self.common_adapter.convert_from_headers_to_operators(
             headers
         )
 
-        result = self.manager.delete_venue(id, request_operators)
+        result = await self.manager.delete_venue(id, request_operators)
 
         if result is None:
             raise HTTPException(
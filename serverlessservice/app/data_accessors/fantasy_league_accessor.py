@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, AsyncIterator
 from uuid import UUID
 from adapters.fantasy_league_adapters import FantasyLeagueAdapter
 from models.fantasy_league_model import (
@@ -18,7 +18,7 @@ class FantasyLeagueAccessor:
     def __init__(self, adapter: FantasyLeagueAdapter = FantasyLeagueAdapter()) -> None:
         self.adapter = adapter
 
-    def insert(
+    async def insert(
         self,
         model: FantasyLeagueCreateModel,
         request_operators: RequestOperators | None = None,
@@ -29,7 +29,7 @@ class FantasyLeagueAccessor:
             self.adapter.convert_from_create_model_to_database_model(model)
         )
 
-        db_result: dict[str, Any] = connection.insert(
+        db_result: dict[str, Any] = await connection.insert(
             "fantasy_leagues", db_model, request_operators
         )
 
@@ -37,12 +37,37 @@ class FantasyLeagueAccessor:
 
         return result_model
 
-    def select_by_id(
+    async def insert_many(
+        self,
+        models: list[FantasyLeagueCreateModel],
+        request_operators: RequestOperators | None = None,
+    ) -> list[FantasyLeagueModel]:
+        connection = get_global_configuration().pg_connection
+
+        db_models: list[dict[str, Any]] = [
+            self.adapter.convert_from_create_model_to_database_model(model)
+            for model in models
+        ]
+
+        db_results: list[dict[str, Any]] = await connection.insert_many(
+            "fantasy_leagues", db_models, request_operators
+        )
+
+        result_models = [
+            self.adapter.convert_from_database_model_to_model(db_result)
+            for db_result in db_results
+        ]
+
+        return result_models
+
+    async def select_by_id(
         self, id: UUID, request_operators: RequestOperators | None = None
     ) -> FantasyLeagueModel:
         connection = get_global_configuration().pg_connection
 
-        db_result = connection.select_by_id("fantasy_leagues", id, request_operators)
+        db_result = await connection.select_by_id(
+            "fantasy_leagues", id, request_operators
+        )
 
         if db_result is None:
             return None
@@ -51,7 +76,7 @@ class FantasyLeagueAccessor:
 
         return result_model
 
-    def select(
+    async def select(
         self,
         model: FantasyLeagueSearchModel,
         paging_model: PagingModel | None = None,
@@ -63,7 +88,7 @@ class FantasyLeagueAccessor:
             self.adapter.convert_from_search_model_to_search_terms(model)
         )
 
-        db_result: SelectQueryResults = connection.select(
+        db_result: SelectQueryResults = await connection.select(
             "fantasy_leagues", search_terms, paging_model, request_operators
         )
 
@@ -80,7 +105,48 @@ class FantasyLeagueAccessor:
 
         return results
 
-    def update(
+    async def select_version(
+        self,
+        model: FantasyLeagueSearchModel,
+        request_operators: RequestOperators | None = None,
+    ) -> tuple[Any, ...]:
+        connection = get_global_configuration().pg_connection
+
+        search_terms: list[SearchTerm] = (
+            self.adapter.convert_from_search_model_to_search_terms(model)
+        )
+
+        return await connection.select_version(
+            "fantasy_leagues", search_terms, request_operators
+        )
+
+    async def select_version_by_id(
+        self, id: UUID, request_operators: RequestOperators | None = None
+    ) -> tuple[Any, ...]:
+        connection = get_global_configuration().pg_connection
+
+        return await connection.select_version_by_id(
+            "fantasy_leagues", id, request_operators
+        )
+
+    async def select_stream(
+        self,
+        model: FantasyLeagueSearchModel,
+        paging_model: PagingModel | None = None,
+        request_operators: RequestOperators | None = None,
+    ) -> AsyncIterator[FantasyLeagueModel]:
+        connection = get_global_configuration().pg_connection
+
+        search_terms: list[SearchTerm] = (
+            self.adapter.convert_from_search_model_to_search_terms(model)
+        )
+
+        async for item in connection.select_stream(
+            "fantasy_leagues", search_terms, paging_model, request_operators
+        ):
+            yield self.adapter.convert_from_database_model_to_model(item)
+
+    async def update(
         self,
         id: UUID,
         model: FantasyLeagueUpdateModel,
@@ -92,7 +158,7 @@ class FantasyLeagueAccessor:
             self.adapter.convert_from_update_model_to_database_model(model)
         )
 
-        db_result = connection.update(
+        db_result = await connection.update(
             "fantasy_leagues", id, db_model, request_operators
         )
 
@@ -103,12 +169,12 @@ class FantasyLeagueAccessor:
 
         return result_model
 
-    def delete(
+    async def delete(
         self, id: UUID, request_operators: RequestOperators | None = None
     ) -> FantasyLeagueModel:
         connection = get_global_configuration().pg_connection
 
-        db_result = connection.delete("fantasy_leagues", id, request_operators)
+        db_result = await connection.delete("fantasy_leagues", id, request_operators)
 
         if db_result is None:
             return None
@@ -1,6 +1,7 @@
-from typing import Any
+from typing import Any, AsyncIterator
 from uuid import UUID
 from adapters.fantasy_team_adapters import FantasyTeamAdapter
+from adapters.hydration_adapters import HydrationAdapter
 from models.fantasy_team_model import (
     FantasyTeamCreateModel,
     FantasyTeamModel,
@@ -15,10 +16,15 @@ from util.db_connection import SelectQueryResults
 
 
 class FantasyTeamAccessor:
-    def __init__(self, adapter: FantasyTeamAdapter = FantasyTeamAdapter()) -> None:
+    def __init__(
+        self,
+        adapter: FantasyTeamAdapter = FantasyTeamAdapter(),
+        hydration_adapter: HydrationAdapter = HydrationAdapter(),
+    ) -> None:
         self.adapter = adapter
+        self.hydration_adapter = hydration_adapter
 
-    def insert(
+    async def insert(
         self,
         model: FantasyTeamCreateModel,
         request_operators: RequestOperators | None = None,
@@ -29,7 +35,7 @@ class FantasyTeamAccessor:
             self.adapter.convert_from_create_model_to_database_model(model)
         )
 
-        db_result: dict[str, Any] = connection.insert(
+        db_result: dict[str, Any] = await connection.insert(
             "fantasy_teams", db_model, request_operators
         )
 
@@ -37,12 +43,37 @@ class FantasyTeamAccessor:
 
         return result_model
 
-    def select_by_id(
+    async def insert_many(
+        self,
+        models: list[FantasyTeamCreateModel],
+        request_operators: RequestOperators | None = None,
+    ) -> list[FantasyTeamModel]:
+        connection = get_global_configuration().pg_connection
+
+        db_models: list[dict[str, Any]] = [
+            self.adapter.convert_from_create_model_to_database_model(model)
+            for model in models
+        ]
+
+        db_results: list[dict[str, Any]] = await connection.insert_many(
+            "fantasy_teams", db_models, request_operators
+        )
+
+        result_models = [
+            self.adapter.convert_from_database_model_to_model(db_result)
+            for db_result in db_results
+        ]
+
+        return result_models
+
+    async def select_by_id(
         self, id: UUID, request_operators: RequestOperators | None = None
     ) -> FantasyTeamModel:
         connection = get_global_configuration().pg_connection
 
-        db_result = connection.select_by_id("fantasy_teams", id, request_operators)
+        db_result = await connection.select_by_id(
+            "fantasy_teams", id, request_operators
+        )
 
         if db_result is None:
             return None
@@ -51,7 +82,7 @@ class FantasyTeamAccessor:
 
         return result_model
 
-    def select(
+    async def select(
         self,
         model: FantasyTeamSearchModel,
         paging_model: PagingModel | None = None,
@@ -63,7 +94,7 @@ class FantasyTeamAccessor:
             self.adapter.convert_from_search_model_to_search_terms(model)
         )
 
-        db_result: SelectQueryResults = connection.select(
+        db_result: SelectQueryResults = await connection.select(
             "fantasy_teams", search_terms, paging_model, request_operators
         )
 
@@ -76,11 +107,59 @@ class FantasyTeamAccessor:
 
         for item in db_result.items:
             result_model = self.adapter.convert_from_database_model_to_model(item)
+            self.hydration_adapter.attach_hydrated_targets(
+                "fantasy_teams", result_model, item
+            )
             results.items.append(result_model)
 
         return results
 
-    def update(
+    async def select_version(
+        self,
+        model: FantasyTeamSearchModel,
+        request_operators: RequestOperators | None = None,
+    ) -> tuple[Any, ...]:
+        connection = get_global_configuration().pg_connection
+
+        search_terms: list[SearchTerm] = (
+            self.adapter.convert_from_search_model_to_search_terms(model)
+        )
+
+        return await connection.select_version(
+            "fantasy_teams", search_terms, request_operators
+        )
+
+    async def select_version_by_id(
+        self, id: UUID, request_operators: RequestOperators | None = None
+    ) -> tuple[Any, ...]:
+        connection = get_global_configuration().pg_connection
+
+        return await connection.select_version_by_id(
+            "fantasy_teams", id, request_operators
+        )
+
+    async def select_stream(
+        self,
+        model: FantasyTeamSearchModel,
+        paging_model: PagingModel | None = None,
+        request_operators: RequestOperators | None = None,
+    ) -> AsyncIterator[FantasyTeamModel]:
+        connection = get_global_configuration().pg_connection
+
+        search_terms: list[SearchTerm] = (
+            self.adapter.convert_from_search_model_to_search_terms(model)
+        )
+
+        async for item in connection.select_stream(
+            "fantasy_teams", search_terms, paging_model, request_operators
+        ):
+            result_model = self.adapter.convert_from_database_model_to_model(item)
+            self.hydration_adapter.attach_hydrated_targets(
+                "fantasy_teams", result_model, item
+            )
+            yield result_model
+
+    async def update(
         self,
         id: UUID,
         model: FantasyTeamUpdateModel,
@@ -92,7 +171,9 @@ class FantasyTeamAccessor:
             self.adapter.convert_from_update_model_to_database_model(model)
         )
 
-        db_result = connection.update("fantasy_teams", id, db_model, request_operators)
+        db_result = await connection.update(
+            "fantasy_teams", id, db_model, request_operators
+        )
 
         if db_result is None:
             return None
@@ -101,12 +182,12 @@ class FantasyTeamAccessor:
 
         return result_model
 
-    def delete(
+    async def delete(
         self, id: UUID, request_operators: RequestOperators | None = None
     ) -> FantasyTeamModel:
         connection = get_global_configuration().pg_connection
 
-        db_result = connection.delete("fantasy_teams", id, request_operators)
+        db_result = await connection.delete("fantasy_teams", id, request_operators)
 
         if db_result is None:
             return None
@@ -1,6 +1,7 @@
-from typing import Any
+from typing import Any, AsyncIterator
 from uuid import UUID
 from adapters.fantasy_team_season_link_adapters import FantasyTeamSeasonLinkAdapter
+from adapters.hydration_adapters import HydrationAdapter
 from models.fantasy_team_season_link_model import (
     FantasyTeamSeasonLinkCreateModel,
     FantasyTeamSeasonLinkModel,
@@ -15,11 +16,14 @@ from util.db_connection import SelectQueryResults
 
 class FantasyTeamSeasonLinkAccessor:
     def __init__(
-        self, adapter: FantasyTeamSeasonLinkAdapter = FantasyTeamSeasonLinkAdapter()
+        self,
+        adapter: FantasyTeamSeasonLinkAdapter = FantasyTeamSeasonLinkAdapter(),
+        hydration_adapter: HydrationAdapter = HydrationAdapter(),
     ) -> None:
         self.adapter = adapter
+        self.hydration_adapter = hydration_adapter
 
-    def insert(
+    async def insert(
         self,
         model: FantasyTeamSeasonLinkCreateModel,
         request_operators: RequestOperators | None = None,
@@ -30,7 +34,7 @@ class FantasyTeamSeasonLinkAccessor:
             self.adapter.convert_from_create_model_to_database_model(model)
         )
 
-        db_result: dict[str, Any] = connection.insert(
+        db_result: dict[str, Any] = await connection.insert(
             "fantasy_team_season_links", db_model, request_operators
         )
 
@@ -38,12 +42,35 @@ class FantasyTeamSeasonLinkAccessor:
 
         return result_model
 
-    def select_by_id(
+    async def insert_many(
+        self,
+        models: list[FantasyTeamSeasonLinkCreateModel],
+        request_operators: RequestOperators | None = None,
+    ) -> list[FantasyTeamSeasonLinkModel]:
+        connection = get_global_configuration().pg_connection
+
+        db_models: list[dict[str, Any]] = [
+            self.adapter.convert_from_create_model_to_database_model(model)
+            for model in models
+        ]
+
+        db_results: list[dict[str, Any]] = await connection.insert_many(
+            "fantasy_team_season_links", db_models, request_operators
+        )
+
+        result_models = [
+            self.adapter.convert_from_database_model_to_model(db_result)
+            for db_result in db_results
+        ]
+
+        return result_models
+
+    async def select_by_id(
         self, id: UUID, request_operators: RequestOperators | None = None
     ) -> FantasyTeamSeasonLinkModel:
         connection = get_global_configuration().pg_connection
 
-        db_result = connection.select_by_id(
+        db_result = await connection.select_by_id(
             "fantasy_team_season_links", id, request_operators
         )
 
@@ -54,7 +81,7 @@ class FantasyTeamSeasonLinkAccessor:
 
         return result_model
 
-    def select(
+    async def select(
         self,
         model: FantasyTeamSeasonLinkSearchModel,
         paging_model: PagingModel | None = None,
@@ -66,7 +93,7 @@ class FantasyTeamSeasonLinkAccessor:
             self.adapter.convert_from_search_model_to_search_terms(model)
         )
 
-        db_result: SelectQueryResults = connection.select(
+        db_result: SelectQueryResults = await connection.select(
             "fantasy_team_season_links", search_terms, paging_model, request_operators
         )
 
@@ -79,16 +106,64 @@ class FantasyTeamSeasonLinkAccessor:
 
         for item in db_result.items:
             result_model = self.adapter.convert_from_database_model_to_model(item)
+            self.hydration_adapter.attach_hydrated_targets(
+                "fantasy_team_season_links", result_model, item
+            )
             results.items.append(result_model)
 
         return results
 
-    def delete(
+    async def select_version(
+        self,
+        model: FantasyTeamSeasonLinkSearchModel,
+        request_operators: RequestOperators | None = None,
+    ) -> tuple[Any, ...]:
+        connection = get_global_configuration().pg_connection
+
+        search_terms: list[SearchTerm] = (
+            self.adapter.convert_from_search_model_to_search_terms(model)
+        )
+
+        return await connection.select_version(
+            "fantasy_team_season_links", search_terms, request_operators
+        )
+
+    async def select_version_by_id(
+        self, id: UUID, request_operators: RequestOperators | None = None
+    ) -> tuple[Any, ...]:
+        connection = get_global_configuration().pg_connection
+
+        return await connection.select_version_by_id(
+            "fantasy_team_season_links", id, request_operators
+        )
+
+    async def select_stream(
+        self,
+        model: FantasyTeamSeasonLinkSearchModel,
+        paging_model: PagingModel | None = None,
+        request_operators: RequestOperators | None = None,
+    ) -> AsyncIterator[FantasyTeamSeasonLinkModel]:
+        connection = get_global_configuration().pg_connection
+
+        search_terms: list[SearchTerm] = (
+            self.adapter.convert_from_search_model_to_search_terms(model)
+        )
+
+        async for item in connection.select_stream(
+            "fantasy_team_season_links", search_terms, paging_model, request_operators
+        ):
+            result_model = self.adapter.convert_from_database_model_to_model(item)
+            self.hydration_adapter.attach_hydrated_targets(
+                "fantasy_team_season_links", result_model, item
+            )
+            yield result_model
+
+    async def delete(
         self, id: UUID, request_operators: RequestOperators | None = None
     ) -> FantasyTeamSeasonLinkModel:
         connection = get_global_configuration().pg_connection
 
-        db_result = connection.delete(
+        db_result = await connection.delete(
             "fantasy_team_season_links", id, request_operators
         )
 
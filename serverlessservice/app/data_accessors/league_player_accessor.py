@@ -1,6 +1,7 @@
-from typing import Any
+from typing import Any, AsyncIterator
 from uuid import UUID
 from adapters.league_player_adapters import LeaguePlayerAdapter, LeaguePlayerAdapter
+from adapters.hydration_adapters import HydrationAdapter
 from models.league_player_model import (
     LeaguePlayerCreateModel,
     LeaguePlayerModel,
@@ -18,10 +19,12 @@ class LeaguePlayerAccessor:
     def __init__(
         self,
         adapter: LeaguePlayerAdapter = LeaguePlayerAdapter(),
+        hydration_adapter: HydrationAdapter = HydrationAdapter(),
     ) -> None:
         self.adapter = adapter
+        self.hydration_adapter = hydration_adapter
 
-    def insert(
+    async def insert(
         self,
         model: LeaguePlayerCreateModel,
         request_operators: RequestOperators | None = None,
@@ -32,7 +35,7 @@ class LeaguePlayerAccessor:
             self.adapter.convert_from_create_model_to_database_model(model)
         )
 
-        db_result: dict[str, Any] = connection.insert(
+        db_result: dict[str, Any] = await connection.insert(
             "league_players", db_model, request_operators
         )
 
@@ -40,12 +43,60 @@ class LeaguePlayerAccessor:
 
         return result_model
 
-    def select_by_id(
+    async def insert_many(
+        self,
+        models: list[LeaguePlayerCreateModel],
+        request_operators: RequestOperators | None = None,
+    ) -> list[LeaguePlayerModel]:
+        connection = get_global_configuration().pg_connection
+
+        db_models: list[dict[str, Any]] = [
+            self.adapter.convert_from_create_model_to_database_model(model)
+            for model in models
+        ]
+
+        db_results: list[dict[str, Any]] = await connection.insert_many(
+            "league_players", db_models, request_operators
+        )
+
+        result_models = [
+            self.adapter.convert_from_database_model_to_model(db_result)
+            for db_result in db_results
+        ]
+
+        return result_models
+
+    async def upsert_many(
+        self,
+        models: list[LeaguePlayerCreateModel],
+        request_operators: RequestOperators | None = None,
+    ) -> list[LeaguePlayerModel]:
+        connection = get_global_configuration().pg_connection
+
+        db_models: list[dict[str, Any]] = [
+            self.adapter.convert_from_create_model_to_database_model(model)
+            for model in models
+        ]
+
+        db_results: list[dict[str, Any]] = await connection.upsert_many(
+            "league_players", db_models, ["global_mnp_id"], None, request_operators
+        )
+
+        result_models = [
+            self.adapter.convert_from_database_model_to_model(db_result)
+            for db_result in db_results
+        ]
+
+        return result_models
+
+    async def select_by_id(
         self, id: UUID, request_operators: RequestOperators | None = None
     ) -> LeaguePlayerModel:
         connection = get_global_configuration().pg_connection
 
-        db_result = connection.select_by_id("league_players", id, request_operators)
+        db_result = await connection.select_by_id(
+            "league_players", id, request_operators
+        )
 
         if db_result is None:
             return None
@@ -54,7 +105,7 @@ class LeaguePlayerAccessor:
 
         return result_model
 
-    def select(
+    async def select(
         self,
         model: LeaguePlayerSearchModel,
         paging_model: PagingModel | None = None,
@@ -66,7 +117,7 @@ class LeaguePlayerAccessor:
             self.adapter.convert_from_search_model_to_search_terms(model)
         )
 
-        db_result: SelectQueryResults = connection.select(
+        db_result: SelectQueryResults = await connection.select(
             "league_players", search_terms, paging_model, request_operators
         )
 
@@ -79,11 +130,59 @@ class LeaguePlayerAccessor:
 
         for item in db_result.items:
             result_model = self.adapter.convert_from_database_model_to_model(item)
+            self.hydration_adapter.attach_hydrated_targets(
+                "league_players", result_model, item
+            )
             results.items.append(result_model)
 
         return results
 
-    def update(
+    async def select_version(
+        self,
+        model: LeaguePlayerSearchModel,
+        request_operators: RequestOperators | None = None,
+    ) -> tuple[Any, ...]:
+        connection = get_global_configuration().pg_connection
+
+        search_terms: list[SearchTerm] = (
+            self.adapter.convert_from_search_model_to_search_terms(model)
+        )
+
+        return await connection.select_version(
+            "league_players", search_terms, request_operators
+        )
+
+    async def select_version_by_id(
+        self, id: UUID, request_operators: RequestOperators | None = None
+    ) -> tuple[Any, ...]:
+        connection = get_global_configuration().pg_connection
+
+        return await connection.select_version_by_id(
+            "league_players", id, request_operators
+        )
+
+    async def select_stream(
+        self,
+        model: LeaguePlayerSearchModel,
+        paging_model: PagingModel | None = None,
+        request_operators: RequestOperators | None = None,
+    ) -> AsyncIterator[LeaguePlayerModel]:
+        connection = get_global_configuration().pg_connection
+
+        search_terms: list[SearchTerm] = (
+            self.adapter.convert_from_search_model_to_search_terms(model)
+        )
+
+        async for item in connection.select_stream(
+            "league_players", search_terms, paging_model, request_operators
+        ):
+            result_model = self.adapter.convert_from_database_model_to_model(item)
+            self.hydration_adapter.attach_hydrated_targets(
+                "league_players", result_model, item
+            )
+            yield result_model
+
+    async def update(
         self,
         id: UUID,
         model: LeaguePlayerUpdateModel,
@@ -95,7 +194,9 @@ class LeaguePlayerAccessor:
             self.adapter.convert_from_update_model_to_database_model(model)
         )
 
-        db_result = connection.update("league_players", id, db_model, request_operators)
+        db_result = await connection.update(
+            "league_players", id, db_model, request_operators
+        )
 
         if db_result is None:
             return None
@@ -104,12 +205,12 @@ class LeaguePlayerAccessor:
 
         return result_model
 
-    def delete(
+    async def delete(
         self, id: UUID, request_operators: RequestOperators | None = None
     ) -> LeaguePlayerModel:
         connection = get_global_configuration().pg_connection
 
-        db_result = connection.delete("league_players", id, request_operators)
+        db_result = await connection.delete("league_players", id, request_operators)
 
         if db_result is None:
             return None
@@ -1,8 +1,9 @@
-from typing import Any
+from typing import Any, AsyncIterator
 from uuid import UUID
 from adapters.league_player_fantasy_team_season_link_adapters import (
     LeaguePlayerFantasyTeamSeasonLinkAdapter,
 )
+from adapters.hydration_adapters import HydrationAdapter
 from models.league_player_fantasy_team_season_link_model import (
     LeaguePlayerFantasyTeamSeasonLinkCreateModel,
     LeaguePlayerFantasyTeamSeasonLinkModel,
@@ -19,10 +20,12 @@ class LeaguePlayerFantasyTeamSeasonLinkAccessor:
     def __init__(
         self,
         adapter: LeaguePlayerFantasyTeamSeasonLinkAdapter = LeaguePlayerFantasyTeamSeasonLinkAdapter(),
+        hydration_adapter: HydrationAdapter = HydrationAdapter(),
     ) -> None:
         self.adapter = adapter
+        self.hydration_adapter = hydration_adapter
 
-    def insert(
+    async def insert(
         self,
         model: LeaguePlayerFantasyTeamSeasonLinkCreateModel,
         request_operators: RequestOperators | None = None,
@@ -33,7 +36,7 @@ class LeaguePlayerFantasyTeamSeasonLinkAccessor:
             self.adapter.convert_from_create_model_to_database_model(model)
         )
 
-        db_result: dict[str, Any] = connection.insert(
+        db_result: dict[str, Any] = await connection.insert(
             "league_player_fantasy_team_season_links", db_model, request_operators
         )
 
@@ -41,12 +44,35 @@ class LeaguePlayerFantasyTeamSeasonLinkAccessor:
 
         return result_model
 
-    def select_by_id(
+    async def insert_many(
+        self,
+        models: list[LeaguePlayerFantasyTeamSeasonLinkCreateModel],
+        request_operators: RequestOperators | None = None,
+    ) -> list[LeaguePlayerFantasyTeamSeasonLinkModel]:
+        connection = get_global_configuration().pg_connection
+
+        db_models: list[dict[str, Any]] = [
+            self.adapter.convert_from_create_model_to_database_model(model)
+            for model in models
+        ]
+
+        db_results: list[dict[str, Any]] = await connection.insert_many(
+            "league_player_fantasy_team_season_links", db_models, request_operators
+        )
+
+        result_models = [
+            self.adapter.convert_from_database_model_to_model(db_result)
+            for db_result in db_results
+        ]
+
+        return result_models
+
+    async def select_by_id(
         self, id: UUID, request_operators: RequestOperators | None = None
     ) -> LeaguePlayerFantasyTeamSeasonLinkModel:
         connection = get_global_configuration().pg_connection
 
-        db_result = connection.select_by_id(
+        db_result = await connection.select_by_id(
             "league_player_fantasy_team_season_links", id, request_operators
         )
 
@@ -57,7 +83,7 @@ class LeaguePlayerFantasyTeamSeasonLinkAccessor:
 
         return result_model
 
-    def select(
+    async def select(
         self,
         model: LeaguePlayerFantasyTeamSeasonLinkSearchModel,
         paging_model: PagingModel | None = None,
@@ -69,7 +95,7 @@ class LeaguePlayerFantasyTeamSeasonLinkAccessor:
             self.adapter.convert_from_search_model_to_search_terms(model)
         )
 
-        db_result: SelectQueryResults = connection.select(
+        db_result: SelectQueryResults = await connection.select(
             "league_player_fantasy_team_season_links",
             search_terms,
             paging_model,
@@ -85,16 +111,67 @@ class LeaguePlayerFantasyTeamSeasonLinkAccessor:
 
         for item in db_result.items:
             result_model = self.adapter.convert_from_database_model_to_model(item)
+            self.hydration_adapter.attach_hydrated_targets(
+                "league_player_fantasy_team_season_links", result_model, item
+            )
             results.items.append(result_model)
 
         return results
 
-    def delete(
+    async def select_version(
+        self,
+        model: LeaguePlayerFantasyTeamSeasonLinkSearchModel,
+        request_operators: RequestOperators | None = None,
+    ) -> tuple[Any, ...]:
+        connection = get_global_configuration().pg_connection
+
+        search_terms: list[SearchTerm] = (
+            self.adapter.convert_from_search_model_to_search_terms(model)
+        )
+
+        return await connection.select_version(
+            "league_player_fantasy_team_season_links", search_terms, request_operators
+        )
+
+    async def select_version_by_id(
+        self, id: UUID, request_operators: RequestOperators | None = None
+    ) -> tuple[Any, ...]:
+        connection = get_global_configuration().pg_connection
+
+        return await connection.select_version_by_id(
+            "league_player_fantasy_team_season_links", id, request_operators
+        )
+
+    async def select_stream(
+        self,
+        model: LeaguePlayerFantasyTeamSeasonLinkSearchModel,
+        paging_model: PagingModel | None = None,
+        request_operators: RequestOperators | None = None,
+    ) -> AsyncIterator[LeaguePlayerFantasyTeamSeasonLinkModel]:
+        connection = get_global_configuration().pg_connection
+
+        search_terms: list[SearchTerm] = (
+            self.adapter.convert_from_search_model_to_search_terms(model)
+        )
+
+        async for item in connection.select_stream(
+            "league_player_fantasy_team_season_links",
+            search_terms,
+            paging_model,
+            request_operators,
+        ):
+            result_model = self.adapter.convert_from_database_model_to_model(item)
+            self.hydration_adapter.attach_hydrated_targets(
+                "league_player_fantasy_team_season_links", result_model, item
+            )
+            yield result_model
+
+    async def delete(
         self, id: UUID, request_operators: RequestOperators | None = None
     ) -> LeaguePlayerFantasyTeamSeasonLinkModel:
         connection = get_global_configuration().pg_connection
 
-        db_result = connection.delete(
+        db_result = await connection.delete(
             "league_player_fantasy_team_season_links", id, request_operators
         )
 
@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, AsyncIterator
 from uuid import UUID
 from adapters.season_adapters import SeasonAdapter
 from models.season_model import (
@@ -18,7 +18,7 @@ class SeasonAccessor:
     def __init__(self, adapter: SeasonAdapter = SeasonAdapter()) -> None:
         self.adapter = adapter
 
-    def insert(
+    async def insert(
         self,
         model: SeasonCreateModel,
         request_operators: RequestOperators | None = None,
@@ -29,7 +29,7 @@ class SeasonAccessor:
             self.adapter.convert_from_create_model_to_database_model(model)
         )
 
-        db_result: dict[str, Any] = connection.insert(
+        db_result: dict[str, Any] = await connection.insert(
             "seasons", db_model, request_operators
         )
 
@@ -37,12 +37,35 @@ class SeasonAccessor:
 
         return result_model
 
-    def select_by_id(
+    async def insert_many(
+        self,
+        models: list[SeasonCreateModel],
+        request_operators: RequestOperators | None = None,
+    ) -> list[SeasonModel]:
+        connection = get_global_configuration().pg_connection
+
+        db_models: list[dict[str, Any]] = [
+            self.adapter.convert_from_create_model_to_database_model(model)
+            for model in models
+        ]
+
+        db_results: list[dict[str, Any]] = await connection.insert_many(
+            "seasons", db_models, request_operators
+        )
+
+        result_models = [
+            self.adapter.convert_from_database_model_to_model(db_result)
+            for db_result in db_results
+        ]
+
+        return result_models
+
+    async def select_by_id(
         self, id: UUID, request_operators: RequestOperators | None = None
     ) -> SeasonModel:
         connection = get_global_configuration().pg_connection
 
-        db_result = connection.select_by_id("seasons", id, request_operators)
+        db_result = await connection.select_by_id("seasons", id, request_operators)
 
         if db_result is None:
             return None
@@ -51,7 +74,7 @@ class SeasonAccessor:
 
         return result_model
 
-    def select(
+    async def select(
         self,
         model: SeasonSearchModel,
         paging_model: PagingModel | None = None,
@@ -63,7 +86,7 @@ class SeasonAccessor:
             self.adapter.convert_from_search_model_to_search_terms(model)
         )
 
-        db_result: SelectQueryResults = connection.select(
+        db_result: SelectQueryResults = await connection.select(
             "seasons", search_terms, paging_model, request_operators
         )
 
@@ -78,7 +101,46 @@ class SeasonAccessor:
 
         return results
 
-    def update(
+    async def select_version(
+        self,
+        model: SeasonSearchModel,
+        request_operators: RequestOperators | None = None,
+    ) -> tuple[Any, ...]:
+        connection = get_global_configuration().pg_connection
+
+        search_terms: list[SearchTerm] = (
+            self.adapter.convert_from_search_model_to_search_terms(model)
+        )
+
+        return await connection.select_version(
+            "seasons", search_terms, request_operators
+        )
+
+    async def select_version_by_id(
+        self, id: UUID, request_operators: RequestOperators | None = None
+    ) -> tuple[Any, ...]:
+        connection = get_global_configuration().pg_connection
+
+        return await connection.select_version_by_id("seasons", id, request_operators)
+
+    async def select_stream(
+        self,
+        model: SeasonSearchModel,
+        paging_model: PagingModel | None = None,
+        request_operators: RequestOperators | None = None,
+    ) -> AsyncIterator[SeasonModel]:
+        connection = get_global_configuration().pg_connection
+
+        search_terms: list[SearchTerm] = (
+            self.adapter.convert_from_search_model_to_search_terms(model)
+        )
+
+        async for item in connection.select_stream(
+            "seasons", search_terms, paging_model, request_operators
+        ):
+            yield self.adapter.convert_from_database_model_to_model(item)
+
+    async def update(
         self,
         id: UUID,
         model: SeasonUpdateModel,
@@ -90,7 +152,7 @@ class SeasonAccessor:
             self.adapter.convert_from_update_model_to_database_model(model)
         )
 
-        db_result: dict[str, Any] = connection.update(
+        db_result: dict[str, Any] = await connection.update(
             "seasons", id, db_model, request_operators
         )
 
@@ -98,12 +160,12 @@ class SeasonAccessor:
 
         return result_model
 
-    def delete(
+    async def delete(
         self, id: UUID, request_operators: RequestOperators | None = None
     ) -> SeasonModel:
         connection = get_global_configuration().pg_connection
 
-        db_result = connection.delete("seasons", id, request_operators)
+        db_result = await connection.delete("seasons", id, request_operators)
 
         if db_result is None:
             return None
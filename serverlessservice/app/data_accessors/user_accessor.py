@@ -1,6 +1,7 @@
-from typing import Any
+from typing import Any, AsyncIterator
 from uuid import UUID
 from adapters.user_adapters import UserAdapter
+from adapters.hydration_adapters import HydrationAdapter
 from models.user_model import (
     UserCreateModel,
     UserModel,
@@ -18,10 +19,12 @@ class UserAccessor:
     def __init__(
         self,
         adapter: UserAdapter = UserAdapter(),
+        hydration_adapter: HydrationAdapter = HydrationAdapter(),
     ) -> None:
         self.adapter = adapter
+        self.hydration_adapter = hydration_adapter
 
-    def insert(
+    async def insert(
         self,
         model: UserCreateModel,
         request_operators: RequestOperators | None = None,
@@ -32,7 +35,7 @@ class UserAccessor:
             self.adapter.convert_from_create_model_to_database_model(model)
         )
 
-        db_result: dict[str, Any] = connection.insert(
+        db_result: dict[str, Any] = await connection.insert(
             "users", db_model, request_operators
         )
 
@@ -40,12 +43,35 @@ class UserAccessor:
 
         return result_model
 
-    def select_by_id(
+    async def insert_many(
+        self,
+        models: list[UserCreateModel],
+        request_operators: RequestOperators | None = None,
+    ) -> list[UserModel]:
+        connection = get_global_configuration().pg_connection
+
+        db_models: list[dict[str, Any]] = [
+            self.adapter.convert_from_create_model_to_database_model(model)
+            for model in models
+        ]
+
+        db_results: list[dict[str, Any]] = await connection.insert_many(
+            "users", db_models, request_operators
+        )
+
+        result_models = [
+            self.adapter.convert_from_database_model_to_model(db_result)
+            for db_result in db_results
+        ]
+
+        return result_models
+
+    async def select_by_id(
         self, id: UUID, request_operators: RequestOperators | None = None
     ) -> UserModel:
         connection = get_global_configuration().pg_connection
 
-        db_result = connection.select_by_id("users", id, request_operators)
+        db_result = await connection.select_by_id("users", id, request_operators)
 
         if db_result is None:
             return None
@@ -54,7 +80,7 @@ class UserAccessor:
 
         return result_model
 
-    def select(
+    async def select(
         self,
         model: UserSearchModel,
         paging_model: PagingModel | None = None,
@@ -66,7 +92,7 @@ class UserAccessor:
             self.adapter.convert_from_search_model_to_search_terms(model)
         )
 
-        db_result: SelectQueryResults = connection.select(
+        db_result: SelectQueryResults = await connection.select(
             "users", search_terms, paging_model, request_operators
         )
 
@@ -77,11 +103,51 @@ class UserAccessor:
 
         for item in db_result.items:
             result_model = self.adapter.convert_from_database_model_to_model(item)
+            self.hydration_adapter.attach_hydrated_targets("users", result_model, item)
             results.items.append(result_model)
 
         return results
 
-    def update(
+    async def select_version(
+        self,
+        model: UserSearchModel,
+        request_operators: RequestOperators | None = None,
+    ) -> tuple[Any, ...]:
+        connection = get_global_configuration().pg_connection
+
+        search_terms: list[SearchTerm] = (
+            self.adapter.convert_from_search_model_to_search_terms(model)
+        )
+
+        return await connection.select_version("users", search_terms, request_operators)
+
+    async def select_version_by_id(
+        self, id: UUID, request_operators: RequestOperators | None = None
+    ) -> tuple[Any, ...]:
+        connection = get_global_configuration().pg_connection
+
+        return await connection.select_version_by_id("users", id, request_operators)
+
+    async def select_stream(
+        self,
+        model: UserSearchModel,
+        paging_model: PagingModel | None = None,
+        request_operators: RequestOperators | None = None,
+    ) -> AsyncIterator[UserModel]:
+        connection = get_global_configuration().pg_connection
+
+        search_terms: list[SearchTerm] = (
+            self.adapter.convert_from_search_model_to_search_terms(model)
+        )
+
+        async for item in connection.select_stream(
+            "users", search_terms, paging_model, request_operators
+        ):
+            result_model = self.adapter.convert_from_database_model_to_model(item)
+            self.hydration_adapter.attach_hydrated_targets("users", result_model, item)
+            yield result_model
+
+    async def update(
         self,
         id: UUID,
         model: UserUpdateModel,
@@ -93,7 +159,7 @@ class UserAccessor:
             self.adapter.convert_from_update_model_to_database_model(model)
         )
 
-        db_result = connection.update("users", id, db_model, request_operators)
+        db_result = await connection.update("users", id, db_model, request_operators)
 
         if db_result is None:
             return None
@@ -102,12 +168,12 @@ class UserAccessor:
 
         return result_model
 
-    def delete(
+    async def delete(
         self, id: UUID, request_operators: RequestOperators | None = None
     ) -> UserModel:
         connection = get_global_configuration().pg_connection
 
-        db_result = connection.delete("users", id, request_operators)
+        db_result = await connection.delete("users", id, request_operators)
 
         if db_result is None:
             return None
@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, AsyncIterator
 from uuid import UUID
 from adapters.venue_adapters import VenueAdapter
 from models.venue_model import (
@@ -18,7 +18,7 @@ class VenueAccessor:
     def __init__(self, adapter: VenueAdapter = VenueAdapter()) -> None:
         self.adapter = adapter
 
-    def insert(
+    async def insert(
         self,
         model: VenueCreateModel,
         request_operators: RequestOperators | None = None,
@@ -29,7 +29,7 @@ class VenueAccessor:
             self.adapter.convert_from_create_model_to_database_model(model)
         )
 
-        db_result: dict[str, Any] = connection.insert(
+        db_result: dict[str, Any] = await connection.insert(
             "venues", db_model, request_operators
         )
 
@@ -37,12 +37,35 @@ class VenueAccessor:
 
         return result_model
 
-    def select_by_id(
+    async def insert_many(
+        self,
+        models: list[VenueCreateModel],
+        request_operators: RequestOperators | None = None,
+    ) -> list[VenueModel]:
+        connection = get_global_configuration().pg_connection
+
+        db_models: list[dict[str, Any]] = [
+            self.adapter.convert_from_create_model_to_database_model(model)
+            for model in models
+        ]
+
+        db_results: list[dict[str, Any]] = await connection.insert_many(
+            "venues", db_models, request_operators
+        )
+
+        result_models = [
+            self.adapter.convert_from_database_model_to_model(db_result)
+            for db_result in db_results
+        ]
+
+        return result_models
+
+    async def select_by_id(
         self, id: UUID, request_operators: RequestOperators | None = None
     ) -> VenueModel:
         connection = get_global_configuration().pg_connection
 
-        db_result = connection.select_by_id("venues", id, request_operators)
+        db_result = await connection.select_by_id("venues", id, request_operators)
 
         if db_result is None:
             return None
@@ -51,7 +74,7 @@ class VenueAccessor:
 
         return result_model
 
-    def select(
+    async def select(
         self,
         model: VenueSearchModel,
         paging_model: PagingModel | None = None,
@@ -63,7 +86,7 @@ class VenueAccessor:
             self.adapter.convert_from_search_model_to_search_terms(model)
         )
 
-        db_result: SelectQueryResults = connection.select(
+        db_result: SelectQueryResults = await connection.select(
             "venues", search_terms, paging_model, request_operators
         )
 
@@ -78,7 +101,46 @@ class VenueAccessor:
 
         return results
 
-    def update(
+    async def select_version(
+        self,
+        model: VenueSearchModel,
+        request_operators: RequestOperators | None = None,
+    ) -> tuple[Any, ...]:
+        connection = get_global_configuration().pg_connection
+
+        search_terms: list[SearchTerm] = (
+            self.adapter.convert_from_search_model_to_search_terms(model)
+        )
+
+        return await connection.select_version(
+            "venues", search_terms, request_operators
+        )
+
+    async def select_version_by_id(
+        self, id: UUID, request_operators: RequestOperators | None = None
+    ) -> tuple[Any, ...]:
+        connection = get_global_configuration().pg_connection
+
+        return await connection.select_version_by_id("venues", id, request_operators)
+
+    async def select_stream(
+        self,
+        model: VenueSearchModel,
+        paging_model: PagingModel | None = None,
+        request_operators: RequestOperators | None = None,
+    ) -> AsyncIterator[VenueModel]:
+        connection = get_global_configuration().pg_connection
+
+        search_terms: list[SearchTerm] = (
+            self.adapter.convert_from_search_model_to_search_terms(model)
+        )
+
+        async for item in connection.select_stream(
+            "venues", search_terms, paging_model, request_operators
+        ):
+            yield self.adapter.convert_from_database_model_to_model(item)
+
+    async def update(
         self,
         id: UUID,
         model: VenueUpdateModel,
@@ -90,7 +152,7 @@ class VenueAccessor:
             self.adapter.convert_from_update_model_to_database_model(model)
         )
 
-        db_result: dict[str, Any] = connection.update(
+        db_result: dict[str, Any] = await connection.update(
             "venues", id, db_model, request_operators
         )
 
@@ -98,12 +160,12 @@ class VenueAccessor:
 
         return result_model
 
-    def delete(
+    async def delete(
         self, id: UUID, request_operators: RequestOperators | None = None
     ) -> VenueModel:
         connection = get_global_configuration().pg_connection
 
-        db_result = connection.delete("venues", id, request_operators)
+        db_result = await connection.delete("venues", id, request_operators)
 
         if db_result is None:
             return None
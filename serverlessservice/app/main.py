@@ -21,7 +21,9 @@ from routes.season_routes import set_season_routes
 from routes.user_routes import set_user_routes
 from routes.utility_routes import set_utility_routes
 
+from util.compression import CompressionMiddleware
 from util.environment import Environment
+from util.middleware import set_unit_of_work_middleware
 
 enviroment: Environment = Environment()
 
@@ -45,6 +47,16 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+set_unit_of_work_middleware(app)
+
+# Outermost, bodies are compressed after the request's connection is released.
+app.add_middleware(
+    CompressionMiddleware,
+    encodings=enviroment.configuration.COMPRESSION_ENCODINGS,
+    minimum_size=enviroment.configuration.COMPRESSION_MINIMUM_SIZE,
+    gzip_level=enviroment.configuration.COMPRESSION_GZIP_LEVEL,
+    brotli_quality=enviroment.configuration.COMPRESSION_BROTLI_QUALITY,
+)
 
 if enviroment.configuration.STAGE != "local":
     app.root_path = "/prod"
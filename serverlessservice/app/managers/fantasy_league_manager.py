@@ -1,3 +1,4 @@
+from typing import Any, AsyncIterator
 from uuid import UUID
 from data_accessors.fantasy_league_accessor import FantasyLeagueAccessor
 from models.common_model import ItemList
@@ -9,9 +10,14 @@ from models.fantasy_league_model import (
 )
 from util.common import CommonUtilities, RequestOperators
 from util.database import PagingModel
+from util.entity_cache import EntityCache, get_entity_cache
+from util.response_cache import response_cache
 
 
 class FantasyLeagueManager:
+    # Read through for by id and id list reads, shared by every FantasyLeagueManager.
+    fantasy_league_cache: EntityCache = get_entity_cache("fantasy_leagues")
+
     def __init__(
         self,
         fantasy_league_accessor: FantasyLeagueAccessor = FantasyLeagueAccessor(),
@@ -20,53 +26,106 @@ class FantasyLeagueManager:
         self.fantasy_league_accessor = fantasy_league_accessor
         self.common_utilities = common_utilities
 
-    def create_fantasy_league(
+    async def create_fantasy_league(
         self,
         inbound_model: FantasyLeagueCreateModel,
         request_operators: RequestOperators | None = None,
     ) -> FantasyLeagueModel | None:
-        result = self.fantasy_league_accessor.insert(
+        result = await self.fantasy_league_accessor.insert(
             model=inbound_model, request_operators=request_operators
         )
 
+        await response_cache.invalidate("fantasy_leagues")
+
+        self.fantasy_league_cache.invalidate(result.id)
+
         return result
 
-    def get_fantasy_league_by_id(
+    async def get_fantasy_league_by_id(
         self, id: UUID, request_operators: RequestOperators | None = None
     ) -> FantasyLeagueModel | None:
-        result = self.fantasy_league_accessor.select_by_id(
+        result = self.fantasy_league_cache.get(id)
+
+        if result is None:
+            result = await self.fantasy_league_accessor.select_by_id(
+                id=id, request_operators=request_operators
+            )
+            self.fantasy_league_cache.fill(result, request_operators)
+
+        return result
+
+    async def get_fantasy_league_version_by_id(
+        self, id: UUID, request_operators: RequestOperators | None = None
+    ) -> tuple[Any, ...]:
+        # Unhydrated, a cached fantasy league is all the response shows.
+        if request_operators is None or request_operators.hydration is None:
+            version = self.fantasy_league_cache.get_version(id)
+
+            if version is not None:
+                return version
+
+        return await self.fantasy_league_accessor.select_version_by_id(
             id=id, request_operators=request_operators
         )
 
-        return result
+    async def get_fantasy_leagues_version(
+        self,
+        model: FantasyLeagueSearchModel,
+        request_operators: RequestOperators | None = None,
+    ) -> tuple[Any, ...]:
+        return await self.fantasy_league_accessor.select_version(
+            model=model, request_operators=request_operators
+        )
 
-    def search_fantasy_leagues(
+    async def search_fantasy_leagues(
         self,
         model: FantasyLeagueSearchModel,
         paging_model: PagingModel | None = None,
         request_operators: RequestOperators | None = None,
     ) -> ItemList[FantasyLeagueModel]:
-        result = self.fantasy_league_accessor.select(
+        result = await self.fantasy_league_accessor.select(
             model=model, paging_model=paging_model, request_operators=request_operators
         )
 
         return result
 
-    def update_league_player(
+    async def stream_fantasy_leagues(
+        self,
+        model: FantasyLeagueSearchModel,
+        paging_model: PagingModel | None = None,
+        request_operators: RequestOperators | None = None,
+    ) -> AsyncIterator[FantasyLeagueModel]:
+        async for result in self.fantasy_league_cache.stream_through(
+            model,
+            paging_model,
+            request_operators,
+            self.fantasy_league_accessor.select_stream,
+        ):
+            yield result
+
+    async def update_league_player(
         self,
         id: UUID,
         model: FantasyLeagueUpdateModel,
         request_operators: RequestOperators | None = None,
     ) -> FantasyLeagueModel | None:
-        result = self.fantasy_league_accessor.update(id, model, request_operators)
+        result = await self.fantasy_league_accessor.update(id, model, request_operators)
+
+        await response_cache.invalidate("fantasy_leagues")
+
+        self.fantasy_league_cache.invalidate(id)
 
         return result
 
-    def delete_fantasy_league(
+    async def delete_fantasy_league(
         self, id: UUID, request_operators: RequestOperators | None = None
     ) -> FantasyLeagueModel | None:
-        result: None | FantasyLeagueModel = self.fantasy_league_accessor.delete(
+        result: None | FantasyLeagueModel = await self.fantasy_league_accessor.delete(
             id=id, request_operators=request_operators
         )
 
+        await response_cache.invalidate("fantasy_leagues")
+
+        self.fantasy_league_cache.invalidate(id)
+
         return result
@@ -1,3 +1,4 @@
+from typing import Any, AsyncIterator
 from uuid import UUID
 from data_accessors.fantasy_team_accessor import FantasyTeamAccessor
 from models.common_model import ItemList
@@ -9,6 +10,8 @@ from models.fantasy_team_model import (
 )
 from util.common import CommonUtilities, RequestOperators
 from util.database import PagingModel
+from util.existence_cache import get_existence_cache
+from util.response_cache import response_cache
 
 
 class FantasyTeamManager:
@@ -20,73 +23,115 @@ class FantasyTeamManager:
         self.fantasy_team_accessor = fantasy_team_accessor
         self.common_utilities = common_utilities
 
-    def create_fantasy_team(
+    async def create_fantasy_team(
         self,
         inbound_model: FantasyTeamCreateModel,
         request_operators: RequestOperators | None = None,
     ) -> FantasyTeamModel | None:
-        result = self.fantasy_team_accessor.insert(
+        result = await self.fantasy_team_accessor.insert(
             model=inbound_model, request_operators=request_operators
         )
 
-        from managers.hydrator import Hydrator
+        await response_cache.invalidate("fantasy_teams")
+        get_existence_cache("fantasy_teams").record_present(result.id)
 
-        hydrator = Hydrator()
-        hydrator.hydrate_fantasy_teams([result], request_operators)
+        from managers.hydrator import get_hydrator
+
+        hydrator = get_hydrator()
+        await hydrator.hydrate_fantasy_teams([result], request_operators)
 
         return result
 
-    def get_fantasy_team_by_id(
+    async def get_fantasy_team_by_id(
         self, id: UUID, request_operators: RequestOperators | None = None
     ) -> FantasyTeamModel | None:
-        result = self.fantasy_team_accessor.select_by_id(
+        result = await self.fantasy_team_accessor.select_by_id(
             id=id, request_operators=request_operators
         )
 
-        from managers.hydrator import Hydrator
+        from managers.hydrator import get_hydrator
 
-        hydrator = Hydrator()
-        hydrator.hydrate_fantasy_teams([result], request_operators)
+        hydrator = get_hydrator()
+        await hydrator.hydrate_fantasy_teams([result], request_operators)
 
         return result
 
-    def search_fantasy_teams(
+    async def get_fantasy_team_version_by_id(
+        self, id: UUID, request_operators: RequestOperators | None = None
+    ) -> tuple[Any, ...]:
+        return await self.fantasy_team_accessor.select_version_by_id(
+            id=id, request_operators=request_operators
+        )
+
+    async def get_fantasy_teams_version(
+        self,
+        model: FantasyTeamSearchModel,
+        request_operators: RequestOperators | None = None,
+    ) -> tuple[Any, ...]:
+        return await self.fantasy_team_accessor.select_version(
+            model=model, request_operators=request_operators
+        )
+
+    async def search_fantasy_teams(
         self,
         model: FantasyTeamSearchModel,
         paging_model: PagingModel | None = None,
         request_operators: RequestOperators | None = None,
     ) -> ItemList[FantasyTeamModel]:
-        result = self.fantasy_team_accessor.select(
+        result = await self.fantasy_team_accessor.select(
             model=model, paging_model=paging_model, request_operators=request_operators
         )
 
-        from managers.hydrator import Hydrator
+        from managers.hydrator import get_hydrator
 
-        hydrator = Hydrator()
-        hydrator.hydrate_fantasy_teams(result.items, request_operators)
+        hydrator = get_hydrator()
+        await hydrator.hydrate_fantasy_teams(result.items, request_operators)
 
         return result
 
-    def update_league_player(
+    async def stream_fantasy_teams(
+        self,
+        model: FantasyTeamSearchModel,
+        paging_model: PagingModel | None = None,
+        request_operators: RequestOperators | None = None,
+    ) -> AsyncIterator[FantasyTeamModel]:
+        results = self.fantasy_team_accessor.select_stream(
+            model=model, paging_model=paging_model, request_operators=request_operators
+        )
+
+        from managers.hydrator import get_hydrator
+
+        hydrator = get_hydrator()
+
+        async for result in hydrator.hydration_util.hydrate_in_batches(
+            results, hydrator.hydrate_fantasy_teams, request_operators
+        ):
+            yield result
+
+    async def update_league_player(
         self,
         id: UUID,
         model: FantasyTeamUpdateModel,
         request_operators: RequestOperators | None = None,
     ) -> FantasyTeamModel | None:
-        result = self.fantasy_team_accessor.update(id, model, request_operators)
+        result = await self.fantasy_team_accessor.update(id, model, request_operators)
 
-        from managers.hydrator import Hydrator
+        await response_cache.invalidate("fantasy_teams")
 
-        hydrator = Hydrator()
-        hydrator.hydrate_fantasy_teams([result], request_operators)
+        from managers.hydrator import get_hydrator
+
+        hydrator = get_hydrator()
+        await hydrator.hydrate_fantasy_teams([result], request_operators)
 
         return result
 
-    def delete_fantasy_team(
+    async def delete_fantasy_team(
         self, id: UUID, request_operators: RequestOperators | None = None
     ) -> FantasyTeamModel | None:
-        result: None | FantasyTeamModel = self.fantasy_team_accessor.delete(
+        result: None | FantasyTeamModel = await self.fantasy_team_accessor.delete(
             id=id, request_operators=request_operators
         )
 
+        await response_cache.invalidate("fantasy_teams")
+
         return result
@@ -1,3 +1,4 @@
+from typing import Any, AsyncIterator
 from uuid import UUID
 from data_accessors.fantasy_team_accessor import FantasyTeamAccessor
 from data_accessors.fantasy_team_season_link_accessor import (
@@ -11,6 +12,8 @@ from models.fantasy_team_season_link_model import (
 )
 from util.common import CommonUtilities, RequestOperators
 from util.database import PagingModel
+from util.existence_cache import get_existence_cache
+from util.response_cache import response_cache
 
 
 class FantasyTeamSeasonLinkManager:
@@ -24,14 +27,15 @@ class FantasyTeamSeasonLinkManager:
         self.fantasy_team_accessor = fantasy_team_accessor
         self.common_utilities = common_utilities
 
-    def create_fantasy_team_season_link(
+    async def create_fantasy_team_season_link(
         self,
         inbound_model: FantasyTeamSeasonLinkCreateModel,
         request_operators: RequestOperators | None = None,
     ) -> FantasyTeamSeasonLinkModel | None:
         # get fantasy team for parent ids
-        fantasy_team = self.fantasy_team_accessor.select_by_id(
-            inbound_model.fantasy_team_id
+        fantasy_team = await get_existence_cache("fantasy_teams").select_by_id(
+            inbound_model.fantasy_team_id,
+            self.fantasy_team_accessor.select_by_id,
         )
 
         if fantasy_team is None:
@@ -42,55 +46,97 @@ class FantasyTeamSeasonLinkManager:
         inbound_model.fantasy_team_owner_id = fantasy_team.owner_id
         inbound_model.fantasy_league_id = fantasy_team.fantasy_league_id
 
-        result = self.fantasy_team_season_link_accessor.insert(
+        result = await self.fantasy_team_season_link_accessor.insert(
             model=inbound_model, request_operators=request_operators
         )
 
-        from managers.hydrator import Hydrator
+        await response_cache.invalidate("fantasy_team_season_links")
+        get_existence_cache("fantasy_team_season_links").record_present(result.id)
 
-        hydrator = Hydrator()
-        hydrator.hydrate_fantasy_team_season_links([result], request_operators)
+        from managers.hydrator import get_hydrator
+
+        hydrator = get_hydrator()
+        await hydrator.hydrate_fantasy_team_season_links([result], request_operators)
 
         return result
 
-    def get_fantasy_team_season_link_by_id(
+    async def get_fantasy_team_season_link_by_id(
         self, id: UUID, request_operators: RequestOperators | None = None
     ) -> FantasyTeamSeasonLinkModel | None:
-        result = self.fantasy_team_season_link_accessor.select_by_id(
+        result = await self.fantasy_team_season_link_accessor.select_by_id(
             id=id, request_operators=request_operators
         )
 
-        from managers.hydrator import Hydrator
+        from managers.hydrator import get_hydrator
 
-        hydrator = Hydrator()
-        hydrator.hydrate_fantasy_team_season_links([result], request_operators)
+        hydrator = get_hydrator()
+        await hydrator.hydrate_fantasy_team_season_links([result], request_operators)
 
         return result
 
-    def search_fantasy_team_season_links(
+    async def get_fantasy_team_season_link_version_by_id(
+        self, id: UUID, request_operators: RequestOperators | None = None
+    ) -> tuple[Any, ...]:
+        return await self.fantasy_team_season_link_accessor.select_version_by_id(
+            id=id, request_operators=request_operators
+        )
+
+    async def get_fantasy_team_season_links_version(
+        self,
+        model: FantasyTeamSeasonLinkSearchModel,
+        request_operators: RequestOperators | None = None,
+    ) -> tuple[Any, ...]:
+        return await self.fantasy_team_season_link_accessor.select_version(
+            model=model, request_operators=request_operators
+        )
+
+    async def search_fantasy_team_season_links(
         self,
         model: FantasyTeamSeasonLinkSearchModel,
         paging_model: PagingModel | None = None,
         request_operators: RequestOperators | None = None,
     ) -> ItemList[FantasyTeamSeasonLinkModel]:
-        result = self.fantasy_team_season_link_accessor.select(
+        result = await self.fantasy_team_season_link_accessor.select(
             model=model, paging_model=paging_model, request_operators=request_operators
         )
 
-        from managers.hydrator import Hydrator
+        from managers.hydrator import get_hydrator
 
-        hydrator = Hydrator()
-        hydrator.hydrate_fantasy_team_season_links(result.items, request_operators)
+        hydrator = get_hydrator()
+        await hydrator.hydrate_fantasy_team_season_links(
+            result.items, request_operators
+        )
 
         return result
 
-    def delete_fantasy_team_season_link(
+    async def stream_fantasy_team_season_links(
+        self,
+        model: FantasyTeamSeasonLinkSearchModel,
+        paging_model: PagingModel | None = None,
+        request_operators: RequestOperators | None = None,
+    ) -> AsyncIterator[FantasyTeamSeasonLinkModel]:
+        results = self.fantasy_team_season_link_accessor.select_stream(
+            model=model, paging_model=paging_model, request_operators=request_operators
+        )
+
+        from managers.hydrator import get_hydrator
+
+        hydrator = get_hydrator()
+
+        async for result in hydrator.hydration_util.hydrate_in_batches(
+            results, hydrator.hydrate_fantasy_team_season_links, request_operators
+        ):
+            yield result
+
+    async def delete_fantasy_team_season_link(
         self, id: UUID, request_operators: RequestOperators | None = None
     ) -> FantasyTeamSeasonLinkModel | None:
         result: None | FantasyTeamSeasonLinkModel = (
-            self.fantasy_team_season_link_accessor.delete(
+            await self.fantasy_team_season_link_accessor.delete(
                 id=id, request_operators=request_operators
             )
         )
 
+        await response_cache.invalidate("fantasy_team_season_links")
+
         return result
@@ -1,12 +1,17 @@
+import functools
+
 from managers.fantasy_league_manager import FantasyLeagueManager
 from managers.fantasy_team_season_link_manager import FantasyTeamSeasonLinkManager
+from managers.league_player_fantasy_team_season_link_manager import (
+    LeaguePlayerFantasyTeamSeasonLinkManager,
+)
 from managers.league_player_manager import LeaguePlayerManager
 from managers.league_team_manager import LeagueTeamManager
 from managers.user_manager import UserManager
 from managers.venue_manager import VenueManager
 from managers.season_manager import SeasonManager
 from managers.fantasy_team_manager import FantasyTeamManager
-from models.fantasy_league_model import FantasyLeagueSearchModel
+from models.fantasy_league_model import FantasyLeagueModel, FantasyLeagueSearchModel
 from models.fantasy_team_model import FantasyTeamModel, FantasyTeamSearchModel
 from models.fantasy_team_season_link_model import (
     FantasyTeamSeasonLinkModel,
@@ -14,6 +19,7 @@ from models.fantasy_team_season_link_model import (
 )
 from models.league_player_fantasy_team_season_link_model import (
     LeaguePlayerFantasyTeamSeasonLinkModel,
+    LeaguePlayerFantasyTeamSeasonLinkSearchModel,
 )
 from models.league_player_model import LeaguePlayerModel, LeaguePlayerSearchModel
 from models.league_team_model import LeagueTeamModel, LeagueTeamSearchModel
@@ -21,7 +27,7 @@ from models.season_model import SeasonSearchModel
 from models.user_model import UserModel, UserSearchModel
 from models.venue_model import VenueModel, VenueSearchModel
 from util.common import RequestOperators
-from util.hydration import HydrationUtil
+from util.hydration import HydrationPlan, HydrationUtil, get_hydration_plan
 
 
 class Hydrator:
@@ -36,6 +42,7 @@ class Hydrator:
         fantasy_team_season_link_manager: FantasyTeamSeasonLinkManager = FantasyTeamSeasonLinkManager(),
         season_manager: SeasonManager = SeasonManager(),
         user_manager: UserManager = UserManager(),
+        league_player_fantasy_team_season_link_manager: LeaguePlayerFantasyTeamSeasonLinkManager = LeaguePlayerFantasyTeamSeasonLinkManager(),
     ) -> None:
         self.venue_manager = venue_manager
         self.hydration_util = hydration_util
@@ -46,186 +53,297 @@ class Hydrator:
         self.fantasy_team_manager = fantasy_team_manager
         self.season_manager = season_manager
         self.user_manager = user_manager
+        self.league_player_fantasy_team_season_link_manager = (
+            league_player_fantasy_team_season_link_manager
+        )
 
-    def hydrate_venues(
+    async def hydrate_venues(
         self,
         result_list: list[VenueModel],
         request_operators: RequestOperators | None = None,
+        hydration_plan: HydrationPlan | None = None,
     ):
         pass
 
-    def hydrate_seasons(
+    async def hydrate_seasons(
         self,
         result_list: list[VenueModel],
         request_operators: RequestOperators | None = None,
+        hydration_plan: HydrationPlan | None = None,
+    ):
+        pass
+
+    async def hydrate_fantasy_leagues(
+        self,
+        result_list: list[FantasyLeagueModel],
+        request_operators: RequestOperators | None = None,
+        hydration_plan: HydrationPlan | None = None,
     ):
         pass
 
-    def hydrate_league_teams(
+    async def hydrate_league_teams(
         self,
         result_list: list[LeagueTeamModel],
         request_operators: RequestOperators | None = None,
+        hydration_plan: HydrationPlan | None = None,
     ):
-        # Hydrate league team
-        self.hydration_util.hydrate_target(
-            "home_venue",
-            result_list,
-            VenueSearchModel(),
-            self.venue_manager.search_venues,
-            request_operators.hydration if request_operators is not None else None,
+        hydration_plan = hydration_plan or get_hydration_plan(request_operators)
+
+        if hydration_plan.is_empty():
+            return
+
+        await self.hydration_util.hydrate_targets(
+            # Hydrate home venue
+            self.hydration_util.hydrate_target(
+                "home_venue",
+                result_list,
+                VenueSearchModel,
+                self.venue_manager.stream_venues,
+                hydration_plan,
+                entity_type="venues",
+                hydrate_function=self.hydrate_venues,
+            ),
+            # Hydrate the team's league players
+            self.hydration_util.hydrate_collection(
+                "league_players",
+                result_list,
+                LeaguePlayerSearchModel,
+                "league_team_ids",
+                "league_team_id",
+                self.league_player_manager.stream_league_players,
+                hydration_plan,
+            ),
         )
 
-    def hydrate_league_players(
+    async def hydrate_league_players(
         self,
         result_list: list[LeaguePlayerModel],
         request_operators: RequestOperators | None = None,
+        hydration_plan: HydrationPlan | None = None,
     ):
+        hydration_plan = hydration_plan or get_hydration_plan(request_operators)
+
+        if hydration_plan.is_empty():
+            return
+
         # Hydrate league team
-        self.hydration_util.hydrate_target(
+        await self.hydration_util.hydrate_target(
             "league_team",
             result_list,
-            LeagueTeamSearchModel(),
-            self.league_team_manager.search_league_teams,
-            request_operators.hydration if request_operators is not None else None,
+            LeagueTeamSearchModel,
+            self.league_team_manager.stream_league_teams,
+            hydration_plan,
+            entity_type="league_teams",
+            hydrate_function=self.hydrate_league_teams,
         )
 
-    def hydrate_users(
+    async def hydrate_users(
         self,
         result_list: list[UserModel],
         request_operators: RequestOperators | None = None,
+        hydration_plan: HydrationPlan | None = None,
     ):
+        hydration_plan = hydration_plan or get_hydration_plan(request_operators)
+
+        if hydration_plan.is_empty():
+            return
+
         # Hydrate league player
-        self.hydration_util.hydrate_target(
+        await self.hydration_util.hydrate_target(
             "league_player",
             result_list,
-            LeaguePlayerSearchModel(),
-            self.league_player_manager.search_league_players,
-            request_operators.hydration if request_operators is not None else None,
+            LeaguePlayerSearchModel,
+            self.league_player_manager.stream_league_players,
+            hydration_plan,
+            entity_type="league_players",
+            hydrate_function=self.hydrate_league_players,
         )
 
-    def hydrate_fantasy_teams(
+    async def hydrate_fantasy_teams(
         self,
         result_list: list[FantasyTeamModel],
         request_operators: RequestOperators | None = None,
+        hydration_plan: HydrationPlan | None = None,
     ):
-        # Example: Hydrate league data if `league_id` exists in the fantasy team model
-        self.hydration_util.hydrate_target(
-            "fantasy_league",
-            result_list,
-            FantasyLeagueSearchModel(),
-            self.fantasy_league_manager.search_fantasy_leagues,
-            request_operators.hydration if request_operators is not None else None,
-        )
+        hydration_plan = hydration_plan or get_hydration_plan(request_operators)
 
-        # hydrate owner
-        self.hydration_util.hydrate_target(
-            "owner",
-            result_list,
-            UserSearchModel(),
-            self.user_manager.search_users,
-            request_operators.hydration if request_operators is not None else None,
+        if hydration_plan.is_empty():
+            return
+
+        await self.hydration_util.hydrate_targets(
+            # Example: Hydrate league data if `league_id` exists in the fantasy team model
+            self.hydration_util.hydrate_target(
+                "fantasy_league",
+                result_list,
+                FantasyLeagueSearchModel,
+                self.fantasy_league_manager.stream_fantasy_leagues,
+                hydration_plan,
+                entity_type="fantasy_leagues",
+                hydrate_function=self.hydrate_fantasy_leagues,
+            ),
+            # hydrate owner
+            self.hydration_util.hydrate_target(
+                "owner",
+                result_list,
+                UserSearchModel,
+                self.user_manager.stream_users,
+                hydration_plan,
+                entity_type="users",
+                hydrate_function=self.hydrate_users,
+            ),
         )
 
-    def hydrate_fantasy_team_season_links(
+    async def hydrate_fantasy_team_season_links(
         self,
         result_list: list[FantasyTeamSeasonLinkModel],
         request_operators: RequestOperators | None = None,
+        hydration_plan: HydrationPlan | None = None,
     ):
-        # Hydrate season data
-        self.hydration_util.hydrate_target(
-            "season",
-            result_list,
-            SeasonSearchModel(),
-            self.season_manager.search_seasons,
-            request_operators.hydration if request_operators is not None else None,
-        )
-
-        # Hydrate fantasy team data
-        self.hydration_util.hydrate_target(
-            "fantasy_team",
-            result_list,
-            FantasyTeamSearchModel(),
-            self.fantasy_team_manager.search_fantasy_teams,
-            request_operators.hydration if request_operators is not None else None,
-        )
+        hydration_plan = hydration_plan or get_hydration_plan(request_operators)
 
-        # Hydrate fantasy_league data
-        self.hydration_util.hydrate_target(
-            "fantasy_league",
-            result_list,
-            FantasyLeagueSearchModel(),
-            self.fantasy_league_manager.search_fantasy_leagues,
-            request_operators.hydration if request_operators is not None else None,
-        )
+        if hydration_plan.is_empty():
+            return
 
-        # hydrate fantasy_team owner data
-        self.hydration_util.hydrate_target(
-            "fantasy_team_owner",
-            result_list,
-            UserSearchModel(),
-            self.user_manager.search_users,
-            request_operators.hydration if request_operators is not None else None,
+        await self.hydration_util.hydrate_targets(
+            # Hydrate season data
+            self.hydration_util.hydrate_target(
+                "season",
+                result_list,
+                SeasonSearchModel,
+                self.season_manager.stream_seasons,
+                hydration_plan,
+                entity_type="seasons",
+                hydrate_function=self.hydrate_seasons,
+            ),
+            # Hydrate fantasy team data
+            self.hydration_util.hydrate_target(
+                "fantasy_team",
+                result_list,
+                FantasyTeamSearchModel,
+                self.fantasy_team_manager.stream_fantasy_teams,
+                hydration_plan,
+                entity_type="fantasy_teams",
+                hydrate_function=self.hydrate_fantasy_teams,
+            ),
+            # Hydrate fantasy_league data
+            self.hydration_util.hydrate_target(
+                "fantasy_league",
+                result_list,
+                FantasyLeagueSearchModel,
+                self.fantasy_league_manager.stream_fantasy_leagues,
+                hydration_plan,
+                entity_type="fantasy_leagues",
+                hydrate_function=self.hydrate_fantasy_leagues,
+            ),
+            # hydrate fantasy_team owner data
+            self.hydration_util.hydrate_target(
+                "fantasy_team_owner",
+                result_list,
+                UserSearchModel,
+                self.user_manager.stream_users,
+                hydration_plan,
+                entity_type="users",
+                hydrate_function=self.hydrate_users,
+            ),
+            # Hydrate the roster, league players through their links
+            self.hydration_util.hydrate_collection(
+                "league_players",
+                result_list,
+                LeaguePlayerFantasyTeamSeasonLinkSearchModel,
+                "fantasy_team_season_link_ids",
+                "fantasy_team_season_link_id",
+                self.league_player_fantasy_team_season_link_manager.stream_league_player_fantasy_team_season_links,
+                hydration_plan,
+                through="league_player",
+            ),
         )
 
-    def hydrate_league_player_fantasy_team_season_links(
+    async def hydrate_league_player_fantasy_team_season_links(
         self,
         result_list: list[LeaguePlayerFantasyTeamSeasonLinkModel],
         request_operators: RequestOperators | None = None,
+        hydration_plan: HydrationPlan | None = None,
     ):
-        # Hydrate league player data
-        self.hydration_util.hydrate_target(
-            "league_player",
-            result_list,
-            LeaguePlayerSearchModel(),
-            self.league_player_manager.search_league_players,
-            request_operators.hydration if request_operators is not None else None,
-        )
-        # Hydrate league Team data
-        self.hydration_util.hydrate_target(
-            "league_team",
-            result_list,
-            LeagueTeamSearchModel(),
-            self.league_team_manager.search_league_teams,
-            request_operators.hydration if request_operators is not None else None,
-        )
-        # Hydrate fantasy team season link data
-        self.hydration_util.hydrate_target(
-            "fantasy_team_season_link",
-            result_list,
-            FantasyTeamSeasonLinkSearchModel(),
-            self.fantasy_team_season_link_manager.search_fantasy_team_season_links,
-            request_operators.hydration if request_operators is not None else None,
-        )
+        hydration_plan = hydration_plan or get_hydration_plan(request_operators)
 
-        # Hydrate fantasy team data
-        self.hydration_util.hydrate_target(
-            "fantasy_team",
-            result_list,
-            FantasyTeamSearchModel(),
-            self.fantasy_team_manager.search_fantasy_teams,
-            request_operators.hydration if request_operators is not None else None,
-        )
-        # Hydrate fantasy_league data
-        self.hydration_util.hydrate_target(
-            "fantasy_league",
-            result_list,
-            FantasyLeagueSearchModel(),
-            self.fantasy_league_manager.search_fantasy_leagues,
-            request_operators.hydration if request_operators is not None else None,
-        )
-        # hydrate fantasy_team owner data
-        self.hydration_util.hydrate_target(
-            "fantasy_team_owner",
-            result_list,
-            UserSearchModel(),
-            self.user_manager.search_users,
-            request_operators.hydration if request_operators is not None else None,
-        )
-        # Hydrate season data
-        self.hydration_util.hydrate_target(
-            "season",
-            result_list,
-            SeasonSearchModel(),
-            self.season_manager.search_seasons,
-            request_operators.hydration if request_operators is not None else None,
+        if hydration_plan.is_empty():
+            return
+
+        await self.hydration_util.hydrate_targets(
+            # Hydrate league player data
+            self.hydration_util.hydrate_target(
+                "league_player",
+                result_list,
+                LeaguePlayerSearchModel,
+                self.league_player_manager.stream_league_players,
+                hydration_plan,
+                entity_type="league_players",
+                hydrate_function=self.hydrate_league_players,
+            ),
+            # Hydrate league Team data
+            self.hydration_util.hydrate_target(
+                "league_team",
+                result_list,
+                LeagueTeamSearchModel,
+                self.league_team_manager.stream_league_teams,
+                hydration_plan,
+                entity_type="league_teams",
+                hydrate_function=self.hydrate_league_teams,
+            ),
+            # Hydrate fantasy team season link data
+            self.hydration_util.hydrate_target(
+                "fantasy_team_season_link",
+                result_list,
+                FantasyTeamSeasonLinkSearchModel,
+                self.fantasy_team_season_link_manager.stream_fantasy_team_season_links,
+                hydration_plan,
+                entity_type="fantasy_team_season_links",
+                hydrate_function=self.hydrate_fantasy_team_season_links,
+            ),
+            # Hydrate fantasy team data
+            self.hydration_util.hydrate_target(
+                "fantasy_team",
+                result_list,
+                FantasyTeamSearchModel,
+                self.fantasy_team_manager.stream_fantasy_teams,
+                hydration_plan,
+                entity_type="fantasy_teams",
+                hydrate_function=self.hydrate_fantasy_teams,
+            ),
+            # Hydrate fantasy_league data
+            self.hydration_util.hydrate_target(
+                "fantasy_league",
+                result_list,
+                FantasyLeagueSearchModel,
+                self.fantasy_league_manager.stream_fantasy_leagues,
+                hydration_plan,
+                entity_type="fantasy_leagues",
+                hydrate_function=self.hydrate_fantasy_leagues,
+            ),
+            # hydrate fantasy_team owner data
+            self.hydration_util.hydrate_target(
+                "fantasy_team_owner",
+                result_list,
+                UserSearchModel,
+                self.user_manager.stream_users,
+                hydration_plan,
+                entity_type="users",
+                hydrate_function=self.hydrate_users,
+            ),
+            # Hydrate season data
+            self.hydration_util.hydrate_target(
+                "season",
+                result_list,
+                SeasonSearchModel,
+                self.season_manager.stream_seasons,
+                hydration_plan,
+                entity_type="seasons",
+                hydrate_function=self.hydrate_seasons,
+            ),
         )
+
+
+@functools.cache
+def get_hydrator() -> Hydrator:
+    # One Hydrator, and one set of managers behind it, for the life of the process.
+    return Hydrator()
@@ -1,3 +1,4 @@
+from typing import Any, AsyncIterator
 from uuid import UUID
 from data_accessors.fantasy_team_accessor import FantasyTeamAccessor
 from data_accessors.fantasy_team_season_link_accessor import (
@@ -15,6 +16,8 @@ from models.league_player_fantasy_team_season_link_model import (
 )
 from util.common import CommonUtilities, RequestOperators
 from util.database import PagingModel
+from util.existence_cache import get_existence_cache
+from util.response_cache import response_cache
 
 
 class LeaguePlayerFantasyTeamSeasonLinkManager:
@@ -32,14 +35,17 @@ class LeaguePlayerFantasyTeamSeasonLinkManager:
         self.league_player_accessor = league_player_accessor
         self.common_utilities = common_utilities
 
-    def create_league_player_fantasy_team_season_link(
+    async def create_league_player_fantasy_team_season_link(
         self,
         inbound_model: LeaguePlayerFantasyTeamSeasonLinkCreateModel,
         request_operators: RequestOperators | None = None,
     ) -> LeaguePlayerFantasyTeamSeasonLinkModel | None:
         # get fantasy team for parent ids
-        fantasy_team_season_link = self.fantasy_team_season_link_accessor.select_by_id(
-            inbound_model.fantasy_team_season_link_id
+        fantasy_team_season_link = await get_existence_cache(
+            "fantasy_team_season_links"
+        ).select_by_id(
+            inbound_model.fantasy_team_season_link_id,
+            self.fantasy_team_season_link_accessor.select_by_id,
         )
 
         if fantasy_team_season_link is None:
@@ -47,8 +53,9 @@ class LeaguePlayerFantasyTeamSeasonLinkManager:
                 f"Fantasy team season link with id {inbound_model.fantasy_team_season_link_id} does not exist."
             )
 
-        league_player = self.league_player_accessor.select_by_id(
-            inbound_model.league_player_id
+        league_player = await get_existence_cache("league_players").select_by_id(
+            inbound_model.league_player_id,
+            self.league_player_accessor.select_by_id,
         )
         if league_player is None:
             raise ValueError(
@@ -64,61 +71,106 @@ class LeaguePlayerFantasyTeamSeasonLinkManager:
             fantasy_team_season_link.fantasy_team_owner_id
         )
 
-        result = self.league_player_fantasy_team_season_link_accessor.insert(
+        result = await self.league_player_fantasy_team_season_link_accessor.insert(
             model=inbound_model, request_operators=request_operators
         )
 
-        from managers.hydrator import Hydrator
+        await response_cache.invalidate("league_player_fantasy_team_season_links")
 
-        hydrator = Hydrator()
-        hydrator.hydrate_league_player_fantasy_team_season_links(
+        from managers.hydrator import get_hydrator
+
+        hydrator = get_hydrator()
+        await hydrator.hydrate_league_player_fantasy_team_season_links(
             [result], request_operators
         )
 
         return result
 
-    def get_league_player_fantasy_team_season_link_by_id(
+    async def get_league_player_fantasy_team_season_link_by_id(
         self, id: UUID, request_operators: RequestOperators | None = None
     ) -> LeaguePlayerFantasyTeamSeasonLinkModel | None:
-        result = self.league_player_fantasy_team_season_link_accessor.select_by_id(
-            id=id, request_operators=request_operators
+        result = (
+            await self.league_player_fantasy_team_season_link_accessor.select_by_id(
+                id=id, request_operators=request_operators
+            )
         )
 
-        from managers.hydrator import Hydrator
+        from managers.hydrator import get_hydrator
 
-        hydrator = Hydrator()
-        hydrator.hydrate_league_player_fantasy_team_season_links(
+        hydrator = get_hydrator()
+        await hydrator.hydrate_league_player_fantasy_team_season_links(
             [result], request_operators
         )
 
         return result
 
-    def search_league_player_fantasy_team_season_links(
+    async def get_league_player_fantasy_team_season_link_version_by_id(
+        self, id: UUID, request_operators: RequestOperators | None = None
+    ) -> tuple[Any, ...]:
+        return await self.league_player_fantasy_team_season_link_accessor.select_version_by_id(
+            id=id, request_operators=request_operators
+        )
+
+    async def get_league_player_fantasy_team_season_links_version(
+        self,
+        model: LeaguePlayerFantasyTeamSeasonLinkSearchModel,
+        request_operators: RequestOperators | None = None,
+    ) -> tuple[Any, ...]:
+        return (
+            await self.league_player_fantasy_team_season_link_accessor.select_version(
+                model=model, request_operators=request_operators
+            )
+        )
+
+    async def search_league_player_fantasy_team_season_links(
         self,
         model: LeaguePlayerFantasyTeamSeasonLinkSearchModel,
         paging_model: PagingModel | None = None,
         request_operators: RequestOperators | None = None,
     ) -> ItemList[LeaguePlayerFantasyTeamSeasonLinkModel]:
-        result = self.league_player_fantasy_team_season_link_accessor.select(
+        result = await self.league_player_fantasy_team_season_link_accessor.select(
             model=model, paging_model=paging_model, request_operators=request_operators
         )
 
-        from managers.hydrator import Hydrator
+        from managers.hydrator import get_hydrator
 
-        hydrator = Hydrator()
-        hydrator.hydrate_league_player_fantasy_team_season_links(
+        hydrator = get_hydrator()
+        await hydrator.hydrate_league_player_fantasy_team_season_links(
             result.items, request_operators
         )
 
         return result
 
-    def delete_league_player_fantasy_team_season_link(
+    async def stream_league_player_fantasy_team_season_links(
+        self,
+        model: LeaguePlayerFantasyTeamSeasonLinkSearchModel,
+        paging_model: PagingModel | None = None,
+        request_operators: RequestOperators | None = None,
+    ) -> AsyncIterator[LeaguePlayerFantasyTeamSeasonLinkModel]:
+        results = self.league_player_fantasy_team_season_link_accessor.select_stream(
+            model=model, paging_model=paging_model, request_operators=request_operators
+        )
+
+        from managers.hydrator import get_hydrator
+
+        hydrator = get_hydrator()
+
+        async for result in hydrator.hydration_util.hydrate_in_batches(
+            results,
+            hydrator.hydrate_league_player_fantasy_team_season_links,
+            request_operators,
+        ):
+            yield result
+
+    async def delete_league_player_fantasy_team_season_link(
         self, id: UUID, request_operators: RequestOperators | None = None
     ) -> LeaguePlayerFantasyTeamSeasonLinkModel | None:
         result: None | LeaguePlayerFantasyTeamSeasonLinkModel = (
-            self.league_player_fantasy_team_season_link_accessor.delete(
+            await self.league_player_fantasy_team_season_link_accessor.delete(
                 id=id, request_operators=request_operators
             )
         )
 
+        await response_cache.invalidate("league_player_fantasy_team_season_links")
+
         return result
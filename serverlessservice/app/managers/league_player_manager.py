@@ -1,3 +1,4 @@
+from typing import Any, AsyncIterator
 from uuid import UUID
 from data_accessors.league_player_accessor import LeaguePlayerAccessor
 from models.common_model import ItemList
@@ -9,6 +10,8 @@ from models.league_player_model import (
 )
 from util.common import CommonUtilities, RequestOperators
 from util.database import PagingModel
+from util.existence_cache import get_existence_cache
+from util.response_cache import response_cache
 
 
 class LeaguePlayerManager:
@@ -20,73 +23,136 @@ class LeaguePlayerManager:
         self.league_player_accessor = league_player_accessor
         self.common_utilities = common_utilities
 
-    def create_league_player(
+    async def create_league_player(
         self,
         inbound_model: LeaguePlayerCreateModel,
         request_operators: RequestOperators | None = None,
     ) -> LeaguePlayerModel | None:
-        result = self.league_player_accessor.insert(
+        result = await self.league_player_accessor.insert(
             model=inbound_model, request_operators=request_operators
         )
 
-        from managers.hydrator import Hydrator
+        await response_cache.invalidate("league_players")
+        get_existence_cache("league_players").record_present(result.id)
 
-        hydrator = Hydrator()
-        hydrator.hydrate_league_players([result], request_operators)
+        from managers.hydrator import get_hydrator
+
+        hydrator = get_hydrator()
+        await hydrator.hydrate_league_players([result], request_operators)
 
         return result
 
-    def get_league_player_by_id(
+    async def upsert_league_players(
+        self,
+        inbound_models: list[LeaguePlayerCreateModel],
+        request_operators: RequestOperators | None = None,
+    ) -> list[LeaguePlayerModel]:
+        results = await self.league_player_accessor.upsert_many(
+            models=inbound_models, request_operators=request_operators
+        )
+
+        await response_cache.invalidate("league_players")
+
+        for result in results:
+            get_existence_cache("league_players").record_present(result.id)
+
+        from managers.hydrator import get_hydrator
+
+        hydrator = get_hydrator()
+        await hydrator.hydrate_league_players(results, request_operators)
+
+        return results
+
+    async def get_league_player_by_id(
         self, id: UUID, request_operators: RequestOperators | None = None
     ) -> LeaguePlayerModel | None:
-        result = self.league_player_accessor.select_by_id(
+        result = await self.league_player_accessor.select_by_id(
             id=id, request_operators=request_operators
         )
 
-        from managers.hydrator import Hydrator
+        from managers.hydrator import get_hydrator
 
-        hydrator = Hydrator()
-        hydrator.hydrate_league_players([result], request_operators)
+        hydrator = get_hydrator()
+        await hydrator.hydrate_league_players([result], request_operators)
 
         return result
 
-    def search_league_players(
+    async def get_league_player_version_by_id(
+        self, id: UUID, request_operators: RequestOperators | None = None
+    ) -> tuple[Any, ...]:
+        return await self.league_player_accessor.select_version_by_id(
+            id=id, request_operators=request_operators
+        )
+
+    async def get_league_players_version(
+        self,
+        model: LeaguePlayerSearchModel,
+        request_operators: RequestOperators | None = None,
+    ) -> tuple[Any, ...]:
+        return await self.league_player_accessor.select_version(
+            model=model, request_operators=request_operators
+        )
+
+    async def search_league_players(
         self,
         model: LeaguePlayerSearchModel,
         paging_model: PagingModel | None = None,
         request_operators: RequestOperators | None = None,
     ) -> ItemList[LeaguePlayerModel]:
-        result = self.league_player_accessor.select(
+        result = await self.league_player_accessor.select(
             model=model, paging_model=paging_model, request_operators=request_operators
         )
 
-        from managers.hydrator import Hydrator
+        from managers.hydrator import get_hydrator
 
-        hydrator = Hydrator()
-        hydrator.hydrate_league_players(result.items, request_operators)
+        hydrator = get_hydrator()
+        await hydrator.hydrate_league_players(result.items, request_operators)
 
         return result
 
-    def update_league_player(
+    async def stream_league_players(
+        self,
+        model: LeaguePlayerSearchModel,
+        paging_model: PagingModel | None = None,
+        request_operators: RequestOperators | None = None,
+    ) -> AsyncIterator[LeaguePlayerModel]:
+        results = self.league_player_accessor.select_stream(
+            model=model, paging_model=paging_model, request_operators=request_operators
+        )
+
+        from managers.hydrator import get_hydrator
+
+        hydrator = get_hydrator()
+
+        async for result in hydrator.hydration_util.hydrate_in_batches(
+            results, hydrator.hydrate_league_players, request_operators
+        ):
+            yield result
+
+    async def update_league_player(
         self,
         id: UUID,
         model: LeaguePlayerUpdateModel,
         request_operators: RequestOperators | None = None,
     ) -> LeaguePlayerModel | None:
-        result = self.league_player_accessor.update(id, model, request_operators)
+        result = await self.league_player_accessor.update(id, model, request_operators)
+
+        await response_cache.invalidate("league_players")
 
-        from managers.hydrator import Hydrator
+        from managers.hydrator import get_hydrator
 
-        hydrator = Hydrator()
-        hydrator.hydrate_league_players([result], request_operators)
+        hydrator = get_hydrator()
+        await hydrator.hydrate_league_players([result], request_operators)
 
         return result
 
-    def delete_league_player(
+    async def delete_league_player(
         self, id: UUID, request_operators: RequestOperators | None = None
     ) -> LeaguePlayerModel | None:
-        result: None | LeaguePlayerModel = self.league_player_accessor.delete(
+        result: None | LeaguePlayerModel = await self.league_player_accessor.delete(
             id=id, request_operators=request_operators
         )
 
+        await response_cache.invalidate("league_players")
+
         return result
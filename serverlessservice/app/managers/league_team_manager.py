@@ -1,3 +1,4 @@
+from typing import Any, AsyncIterator
 from uuid import UUID
 from data_accessors.league_team_accessor import LeagueTeamAccessor
 from models.common_model import ItemList
@@ -9,9 +10,14 @@ from models.league_team_model import (
 )
 from util.common import CommonUtilities, RequestOperators
 from util.database import PagingModel
+from util.entity_cache import EntityCache, get_entity_cache
+from util.response_cache import response_cache
 
 
 class LeagueTeamManager:
+    # Read through for by id and id list reads, shared by every LeagueTeamManager.
+    league_team_cache: EntityCache = get_entity_cache("league_teams")
+
     def __init__(
         self,
         league_team_accessor: LeagueTeamAccessor = LeagueTeamAccessor(),
@@ -20,73 +26,155 @@ class LeagueTeamManager:
         self.league_team_accessor = league_team_accessor
         self.common_utilities = common_utilities
 
-    def create_league_team(
+    async def create_league_team(
         self,
         inbound_model: LeagueTeamCreateModel,
         request_operators: RequestOperators | None = None,
     ) -> LeagueTeamModel | None:
-        result = self.league_team_accessor.insert(
+        result = await self.league_team_accessor.insert(
             model=inbound_model, request_operators=request_operators
         )
 
-        from managers.hydrator import Hydrator
+        await response_cache.invalidate("league_teams")
+
+        self.league_team_cache.invalidate(result.id)
+
+        from managers.hydrator import get_hydrator
 
-        hydrator = Hydrator()
-        hydrator.hydrate_league_teams([result], request_operators)
+        hydrator = get_hydrator()
+        await hydrator.hydrate_league_teams([result], request_operators)
 
         return result
 
-    def get_league_team_by_id(
+    async def upsert_league_teams(
+        self,
+        inbound_models: list[LeagueTeamCreateModel],
+        request_operators: RequestOperators | None = None,
+    ) -> list[LeagueTeamModel]:
+        results = await self.league_team_accessor.upsert_many(
+            models=inbound_models, request_operators=request_operators
+        )
+
+        await response_cache.invalidate("league_teams")
+
+        for result in results:
+            self.league_team_cache.invalidate(result.id)
+
+        from managers.hydrator import get_hydrator
+
+        hydrator = get_hydrator()
+        await hydrator.hydrate_league_teams(results, request_operators)
+
+        return results
+
+    async def get_league_team_by_id(
         self, id: UUID, request_operators: RequestOperators | None = None
     ) -> LeagueTeamModel | None:
-        result = self.league_team_accessor.select_by_id(
-            id=id, request_operators=request_operators
-        )
+        result = self.league_team_cache.get(id)
+
+        if result is None:
+            result = await self.league_team_accessor.select_by_id(
+                id=id, request_operators=request_operators
+            )
+            self.league_team_cache.fill(result, request_operators)
 
-        from managers.hydrator import Hydrator
+        from managers.hydrator import get_hydrator
 
-        hydrator = Hydrator()
-        hydrator.hydrate_league_teams([result], request_operators)
+        hydrator = get_hydrator()
+        await hydrator.hydrate_league_teams([result], request_operators)
 
         return result
 
-    def search_league_teams(
+    async def get_league_team_version_by_id(
+        self, id: UUID, request_operators: RequestOperators | None = None
+    ) -> tuple[Any, ...]:
+        # Unhydrated, a cached league team is all the response shows.
+        if request_operators is None or request_operators.hydration is None:
+            version = self.league_team_cache.get_version(id)
+
+            if version is not None:
+                return version
+
+        return await self.league_team_accessor.select_version_by_id(
+            id=id, request_operators=request_operators
+        )
+
+    async def get_league_teams_version(
+        self,
+        model: LeagueTeamSearchModel,
+        request_operators: RequestOperators | None = None,
+    ) -> tuple[Any, ...]:
+        return await self.league_team_accessor.select_version(
+            model=model, request_operators=request_operators
+        )
+
+    async def search_league_teams(
         self,
         model: LeagueTeamSearchModel,
         paging_model: PagingModel | None = None,
         request_operators: RequestOperators | None = None,
     ) -> ItemList[LeagueTeamModel]:
-        result = self.league_team_accessor.select(
+        result = await self.league_team_accessor.select(
             model=model, paging_model=paging_model, request_operators=request_operators
         )
 
-        from managers.hydrator import Hydrator
+        from managers.hydrator import get_hydrator
 
-        hydrator = Hydrator()
-        hydrator.hydrate_league_teams(result.items, request_operators)
+        hydrator = get_hydrator()
+        await hydrator.hydrate_league_teams(result.items, request_operators)
 
         return result
 
-    def update_league_team(
+    async def stream_league_teams(
+        self,
+        model: LeagueTeamSearchModel,
+        paging_model: PagingModel | None = None,
+        request_operators: RequestOperators | None = None,
+    ) -> AsyncIterator[LeagueTeamModel]:
+        results = self.league_team_cache.stream_through(
+            model,
+            paging_model,
+            request_operators,
+            self.league_team_accessor.select_stream,
+        )
+
+        from managers.hydrator import get_hydrator
+
+        hydrator = get_hydrator()
+
+        async for result in hydrator.hydration_util.hydrate_in_batches(
+            results, hydrator.hydrate_league_teams, request_operators
+        ):
+            yield result
+
+    async def update_league_team(
         self,
         id: UUID,
         model: LeagueTeamUpdateModel,
         request_operators: RequestOperators | None = None,
     ) -> LeagueTeamModel | None:
-        result = self.league_team_accessor.update(id, model, request_operators)
+        result = await self.league_team_accessor.update(id, model, request_operators)
 
-        from managers.hydrator import Hydrator
+        await response_cache.invalidate("league_teams")
 
-        hydrator = Hydrator()
-        hydrator.hydrate_league_teams([result], request_operators)
+        self.league_team_cache.invalidate(id)
+
+        from managers.hydrator import get_hydrator
+
+        hydrator = get_hydrator()
+        await hydrator.hydrate_league_teams([result], request_operators)
 
         return result
 
-    def delete_league_team(
+    async def delete_league_team(
         self, id: UUID, request_operators: RequestOperators | None = None
     ) -> LeagueTeamModel | None:
-        result: None | LeagueTeamModel = self.league_team_accessor.delete(
+        result: None | LeagueTeamModel = await self.league_team_accessor.delete(
             id=id, request_operators=request_operators
         )
 
+        await response_cache.invalidate("league_teams")
+
+        self.league_team_cache.invalidate(id)
+
         return result
@@ -1,3 +1,4 @@
+from typing import Any, AsyncIterator
 from uuid import UUID
 from data_accessors.season_accessor import SeasonAccessor
 from models.common_model import ItemList
@@ -9,9 +10,14 @@ from models.season_model import (
 )
 from util.common import CommonUtilities, RequestOperators
 from util.database import PagingModel
+from util.entity_cache import EntityCache, get_entity_cache
+from util.response_cache import response_cache
 
 
 class SeasonManager:
+    # Read through for by id and id list reads, shared by every SeasonManager.
+    season_cache: EntityCache = get_entity_cache("seasons")
+
     def __init__(
         self,
         season_accessor: SeasonAccessor = SeasonAccessor(),
@@ -20,75 +26,133 @@ class SeasonManager:
         self.season_accessor = season_accessor
         self.common_utilities = common_utilities
 
-    def create_season(
+    async def create_season(
         self,
         inbound_model: SeasonCreateModel,
         request_operators: RequestOperators | None = None,
     ) -> SeasonModel | None:
-        result = self.season_accessor.insert(
+        result = await self.season_accessor.insert(
             model=inbound_model, request_operators=request_operators
         )
 
-        from managers.hydrator import Hydrator
+        await response_cache.invalidate("seasons")
+
+        self.season_cache.invalidate(result.id)
 
-        hydrator = Hydrator()
-        hydrator.hydrate_seasons([result], request_operators)
+        from managers.hydrator import get_hydrator
+
+        hydrator = get_hydrator()
+        await hydrator.hydrate_seasons([result], request_operators)
 
         return result
 
-    def get_season_by_id(
+    async def get_season_by_id(
         self, id: UUID, request_operators: RequestOperators | None = None
     ) -> SeasonModel | None:
-        result = self.season_accessor.select_by_id(
-            id=id, request_operators=request_operators
-        )
+        result = self.season_cache.get(id)
+
+        if result is None:
+            result = await self.season_accessor.select_by_id(
+                id=id, request_operators=request_operators
+            )
+            self.season_cache.fill(result, request_operators)
 
-        from managers.hydrator import Hydrator
+        from managers.hydrator import get_hydrator
 
-        hydrator = Hydrator()
-        hydrator.hydrate_seasons([result], request_operators)
+        hydrator = get_hydrator()
+        await hydrator.hydrate_seasons([result], request_operators)
 
         return result
 
-    def search_seasons(
+    async def get_season_version_by_id(
+        self, id: UUID, request_operators: RequestOperators | None = None
+    ) -> tuple[Any, ...]:
+        # Unhydrated, a cached season is all the response shows.
+        if request_operators is None or request_operators.hydration is None:
+            version = self.season_cache.get_version(id)
+
+            if version is not None:
+                return version
+
+        return await self.season_accessor.select_version_by_id(
+            id=id, request_operators=request_operators
+        )
+
+    async def get_seasons_version(
+        self,
+        model: SeasonSearchModel,
+        request_operators: RequestOperators | None = None,
+    ) -> tuple[Any, ...]:
+        return await self.season_accessor.select_version(
+            model=model, request_operators=request_operators
+        )
+
+    async def search_seasons(
         self,
         model: SeasonSearchModel,
         paging_model: PagingModel | None = None,
         request_operators: RequestOperators | None = None,
     ) -> ItemList[SeasonModel]:
-        result = self.season_accessor.select(
+        result = await self.season_accessor.select(
             model=model, paging_model=paging_model, request_operators=request_operators
         )
 
-        from managers.hydrator import Hydrator
+        from managers.hydrator import get_hydrator
 
-        hydrator = Hydrator()
-        hydrator.hydrate_seasons(result.items, request_operators)
+        hydrator = get_hydrator()
+        await hydrator.hydrate_seasons(result.items, request_operators)
 
         return result
 
-    def update_season(
+    async def stream_seasons(
+        self,
+        model: SeasonSearchModel,
+        paging_model: PagingModel | None = None,
+        request_operators: RequestOperators | None = None,
+    ) -> AsyncIterator[SeasonModel]:
+        results = self.season_cache.stream_through(
+            model, paging_model, request_operators, self.season_accessor.select_stream
+        )
+
+        from managers.hydrator import get_hydrator
+
+        hydrator = get_hydrator()
+
+        async for result in hydrator.hydration_util.hydrate_in_batches(
+            results, hydrator.hydrate_seasons, request_operators
+        ):
+            yield result
+
+    async def update_season(
         self,
         id: UUID,
         model: SeasonUpdateModel,
         request_operators: RequestOperators | None = None,
     ) -> SeasonModel | None:
-        result = self.season_accessor.update(
+        result = await self.season_accessor.update(
             id=id, model=model, request_operators=request_operators
         )
 
-        from managers.hydrator import Hydrator
+        await response_cache.invalidate("seasons")
+
+        self.season_cache.invalidate(id)
 
-        hydrator = Hydrator()
-        hydrator.hydrate_seasons([result], request_operators)
+        from managers.hydrator import get_hydrator
+
+        hydrator = get_hydrator()
+        await hydrator.hydrate_seasons([result], request_operators)
 
         return result
 
-    def delete_season(
+    async def delete_season(
         self, id: UUID, request_operators: RequestOperators | None = None
     ) -> SeasonModel | None:
-        result: None | SeasonModel = self.season_accessor.delete(
+        result: None | SeasonModel = await self.season_accessor.delete(
             id=id, request_operators=request_operators
         )
 
+        await response_cache.invalidate("seasons")
+
+        self.season_cache.invalidate(id)
+
         return result
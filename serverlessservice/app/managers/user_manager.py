@@ -1,3 +1,4 @@
+from typing import Any, AsyncIterator
 from uuid import UUID
 from data_accessors.user_accessor import UserAccessor
 from models.common_model import ItemList
@@ -9,6 +10,7 @@ from models.user_model import (
 )
 from util.common import CommonUtilities, RequestOperators
 from util.database import PagingModel
+from util.response_cache import response_cache
 
 
 class UserManager:
@@ -20,73 +22,114 @@ class UserManager:
         self.user_accessor = user_accessor
         self.common_utilities = common_utilities
 
-    def create_user(
+    async def create_user(
         self,
         inbound_model: UserCreateModel,
         request_operators: RequestOperators | None = None,
     ) -> UserModel | None:
-        result = self.user_accessor.insert(
+        result = await self.user_accessor.insert(
             model=inbound_model, request_operators=request_operators
         )
 
-        from managers.hydrator import Hydrator
+        await response_cache.invalidate("users")
 
-        hydrator = Hydrator()
-        hydrator.hydrate_users([result], request_operators)
+        from managers.hydrator import get_hydrator
+
+        hydrator = get_hydrator()
+        await hydrator.hydrate_users([result], request_operators)
 
         return result
 
-    def get_user_by_id(
+    async def get_user_by_id(
         self, id: UUID, request_operators: RequestOperators | None = None
     ) -> UserModel | None:
-        result = self.user_accessor.select_by_id(
+        result = await self.user_accessor.select_by_id(
             id=id, request_operators=request_operators
         )
 
-        from managers.hydrator import Hydrator
+        from managers.hydrator import get_hydrator
 
-        hydrator = Hydrator()
-        hydrator.hydrate_users([result], request_operators)
+        hydrator = get_hydrator()
+        await hydrator.hydrate_users([result], request_operators)
 
         return result
 
-    def search_users(
+    async def get_user_version_by_id(
+        self, id: UUID, request_operators: RequestOperators | None = None
+    ) -> tuple[Any, ...]:
+        return await self.user_accessor.select_version_by_id(
+            id=id, request_operators=request_operators
+        )
+
+    async def get_users_version(
+        self,
+        model: UserSearchModel,
+        request_operators: RequestOperators | None = None,
+    ) -> tuple[Any, ...]:
+        return await self.user_accessor.select_version(
+            model=model, request_operators=request_operators
+        )
+
+    async def search_users(
         self,
         model: UserSearchModel,
         paging_model: PagingModel | None = None,
         request_operators: RequestOperators | None = None,
     ) -> ItemList[UserModel]:
-        result = self.user_accessor.select(
+        result = await self.user_accessor.select(
             model=model, paging_model=paging_model, request_operators=request_operators
         )
 
-        from managers.hydrator import Hydrator
+        from managers.hydrator import get_hydrator
 
-        hydrator = Hydrator()
-        hydrator.hydrate_users(result.items, request_operators)
+        hydrator = get_hydrator()
+        await hydrator.hydrate_users(result.items, request_operators)
 
         return result
 
-    def update_user(
+    async def stream_users(
+        self,
+        model: UserSearchModel,
+        paging_model: PagingModel | None = None,
+        request_operators: RequestOperators | None = None,
+    ) -> AsyncIterator[UserModel]:
+        results = self.user_accessor.select_stream(
+            model=model, paging_model=paging_model, request_operators=request_operators
+        )
+
+        from managers.hydrator import get_hydrator
+
+        hydrator = get_hydrator()
+
+        async for result in hydrator.hydration_util.hydrate_in_batches(
+            results, hydrator.hydrate_users, request_operators
+        ):
+            yield result
+
+    async def update_user(
         self,
         id: UUID,
         model: UserUpdateModel,
         request_operators: RequestOperators | None = None,
     ) -> UserModel | None:
-        result = self.user_accessor.update(id, model, request_operators)
+        result = await self.user_accessor.update(id, model, request_operators)
 
-        from managers.hydrator import Hydrator
+        await response_cache.invalidate("users")
 
-        hydrator = Hydrator()
-        hydrator.hydrate_users([result], request_operators)
+        from managers.hydrator import get_hydrator
+
+        hydrator = get_hydrator()
+        await hydrator.hydrate_users([result], request_operators)
 
         return result
 
-    def delete_user(
+    async def delete_user(
         self, id: UUID, request_operators: RequestOperators | None = None
     ) -> UserModel | None:
-        result: None | UserModel = self.user_accessor.delete(
+        result: None | UserModel = await self.user_accessor.delete(
             id=id, request_operators=request_operators
         )
 
+        await response_cache.invalidate("users")
+
         return result
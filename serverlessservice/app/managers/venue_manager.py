@@ -1,3 +1,4 @@
+from typing import Any, AsyncIterator
 from uuid import UUID
 from data_accessors.venue_accessor import VenueAccessor
 from models.common_model import ItemList
@@ -9,9 +10,14 @@ from models.venue_model import (
 )
 from util.common import CommonUtilities, RequestOperators
 from util.database import PagingModel
+from util.entity_cache import EntityCache, get_entity_cache
+from util.response_cache import response_cache
 
 
 class VenueManager:
+    # Read through for by id and id list reads, shared by every VenueManager.
+    venue_cache: EntityCache = get_entity_cache("venues")
+
     def __init__(
         self,
         venue_accessor: VenueAccessor = VenueAccessor(),
@@ -20,75 +26,133 @@ class VenueManager:
         self.venue_accessor = venue_accessor
         self.common_utilities = common_utilities
 
-    def create_venue(
+    async def create_venue(
         self,
         inbound_model: VenueCreateModel,
         request_operators: RequestOperators | None = None,
     ) -> VenueModel | None:
-        result = self.venue_accessor.insert(
+        result = await self.venue_accessor.insert(
             model=inbound_model, request_operators=request_operators
         )
 
-        from managers.hydrator import Hydrator
+        await response_cache.invalidate("venues")
+
+        self.venue_cache.invalidate(result.id)
 
-        hydrator = Hydrator()
-        hydrator.hydrate_venues([result], request_operators)
+        from managers.hydrator import get_hydrator
+
+        hydrator = get_hydrator()
+        await hydrator.hydrate_venues([result], request_operators)
 
         return result
 
-    def get_venue_by_id(
+    async def get_venue_by_id(
         self, id: UUID, request_operators: RequestOperators | None = None
     ) -> VenueModel | None:
-        result = self.venue_accessor.select_by_id(
-            id=id, request_operators=request_operators
-        )
+        result = self.venue_cache.get(id)
+
+        if result is None:
+            result = await self.venue_accessor.select_by_id(
+                id=id, request_operators=request_operators
+            )
+            self.venue_cache.fill(result, request_operators)
 
-        from managers.hydrator import Hydrator
+        from managers.hydrator import get_hydrator
 
-        hydrator = Hydrator()
-        hydrator.hydrate_venues([result], request_operators)
+        hydrator = get_hydrator()
+        await hydrator.hydrate_venues([result], request_operators)
 
         return result
 
-    def search_venues(
+    async def get_venue_version_by_id(
+        self, id: UUID, request_operators: RequestOperators | None = None
+    ) -> tuple[Any, ...]:
+        # Unhydrated, a cached venue is all the response shows.
+        if request_operators is None or request_operators.hydration is None:
+            version = self.venue_cache.get_version(id)
+
+            if version is not None:
+                return version
+
+        return await self.venue_accessor.select_version_by_id(
+            id=id, request_operators=request_operators
+        )
+
+    async def get_venues_version(
+        self,
+        model: VenueSearchModel,
+        request_operators: RequestOperators | None = None,
+    ) -> tuple[Any, ...]:
+        return await self.venue_accessor.select_version(
+            model=model, request_operators=request_operators
+        )
+
+    async def search_venues(
         self,
         model: VenueSearchModel,
         paging_model: PagingModel | None = None,
         request_operators: RequestOperators | None = None,
     ) -> ItemList[VenueModel]:
-        result = self.venue_accessor.select(
+        result = await self.venue_accessor.select(
             model=model, paging_model=paging_model, request_operators=request_operators
         )
 
-        from managers.hydrator import Hydrator
+        from managers.hydrator import get_hydrator
 
-        hydrator = Hydrator()
-        hydrator.hydrate_venues(result.items, request_operators)
+        hydrator = get_hydrator()
+        await hydrator.hydrate_venues(result.items, request_operators)
 
         return result
 
-    def update_venue(
+    async def stream_venues(
+        self,
+        model: VenueSearchModel,
+        paging_model: PagingModel | None = None,
+        request_operators: RequestOperators | None = None,
+    ) -> AsyncIterator[VenueModel]:
+        results = self.venue_cache.stream_through(
+            model, paging_model, request_operators, self.venue_accessor.select_stream
+        )
+
+        from managers.hydrator import get_hydrator
+
+        hydrator = get_hydrator()
+
+        async for result in hydrator.hydration_util.hydrate_in_batches(
+            results, hydrator.hydrate_venues, request_operators
+        ):
+            yield result
+
+    async def update_venue(
         self,
         id: UUID,
         model: VenueUpdateModel,
         request_operators: RequestOperators | None = None,
     ) -> VenueModel | None:
-        result = self.venue_accessor.update(
+        result = await self.venue_accessor.update(
             id=id, model=model, request_operators=request_operators
         )
 
-        from managers.hydrator import Hydrator
+        await response_cache.invalidate("venues")
+
+        self.venue_cache.invalidate(id)
 
-        hydrator = Hydrator()
-        hydrator.hydrate_seasons([result], request_operators)
+        from managers.hydrator import get_hydrator
+
+        hydrator = get_hydrator()
+        await hydrator.hydrate_seasons([result], request_operators)
 
         return result
 
-    def delete_venue(
+    async def delete_venue(
         self, id: UUID, request_operators: RequestOperators | None = None
     ) -> VenueModel | None:
-        result: None | VenueModel = self.venue_accessor.delete(
+        result: None | VenueModel = await self.venue_accessor.delete(
             id=id, request_operators=request_operators
         )
 
+        await response_cache.invalidate("venues")
+
+        self.venue_cache.invalidate(id)
+
         return result
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Annotated, Generic, Optional, TypeVar
+from typing import Annotated, Generic, Literal, Optional, TypeVar
 from uuid import UUID
 
 from fastapi import Query
@@ -7,7 +7,7 @@ from pydantic import BaseModel, BeforeValidator
 from pydantic_core import PydanticCustomError
 
 from util.common import CommonUtilities
-from util.database import ResultantPagingModel
+from util.database import PagingCursor, ResultantPagingModel
 
 from pydantic_extra_types.phone_numbers import PhoneNumber
 
@@ -36,6 +36,19 @@ def validate_ids(value: str | list[str] | None):
         return value
 
 
+def validate_cursor(value: str | None):
+    if value is not None:
+        try:
+            PagingCursor.decode(value)
+        except ValueError:
+            raise PydanticCustomError(
+                "invalid_cursor",
+                "Property must be a next_cursor value returned by a previous page.",
+            )
+
+    return value
+
+
 class CommonOutboundResponseModel(BaseModel):
     id: UUID
     created_at: str
@@ -63,6 +76,8 @@ class CommonModel:
         self.id = id
         self.created_at = created_at
         self.updated_at = updated_at
+        # Targets already filled in by a hydrated select, Hydrator skips these.
+        self.hydrated_targets: set[str] = set()
 
 
 T = TypeVar("T")
@@ -75,6 +90,18 @@ class CommonInboundPagedModel(BaseModel):
     page_length: Optional[int] = Query(default=None)
     sort_by: Optional[str] = Query(default=None)
     is_sort_descending: Optional[bool] = Query(default=None)
+    # "cursor" pages with next_cursor instead of page numbers, passing a cursor
+    # implies it.
+    paging_mode: Optional[Literal["offset", "cursor"]] = Query(default=None)
+    cursor: Annotated[Optional[str], BeforeValidator(validate_cursor)] = Query(
+        default=None
+    )
+    # "exact", "estimate" (planner row estimate) or "none", overrides the
+    # MNFP-Count-Mode header.
+    count_mode: Optional[Literal["exact", "estimate", "none"]] = Query(default=None)
+    # Comma delimited, dotted paths reach into hydrated children. Overrides the
+    # MNFP-Fields header.
+    fields: Optional[str] = Query(default=None)
 
 
 # Pydantic causes these class variables to safely be instance variables.
@@ -98,6 +125,8 @@ class OutboundResultantPagingModel(BaseModel):
     sort_by: Optional[str] = None
     is_sort_descending: Optional[bool] = None
     total_record_count: Optional[int] = None
+    next_cursor: Optional[str] = None
+    count_mode: Optional[str] = None
 
 
 class OutboundItemListResponse(BaseModel, Generic[TResponse]):
@@ -17,6 +17,7 @@ from models.fantasy_league_model import (
     FantasyLeagueOutboundModel,
 )
 from models.fantasy_team_model import FantasyTeamModel, FantasyTeamOutboundModel
+from models.league_player_model import LeaguePlayerModel, LeaguePlayerOutboundModel
 from models.season_model import SeasonModel, SeasonOutboundModel
 from models.user_model import UserModel, UserOutboundModel
 
@@ -86,6 +87,7 @@ class FantasyTeamSeasonLinkModel(CommonModel):
         fantasy_team: FantasyTeamModel | None = None,
         fantasy_team_owner: UserModel | None = None,
         fantasy_league: FantasyLeagueModel | None = None,
+        league_players: list[LeaguePlayerModel] | None = None,
         updated_at: datetime | None = None,
     ):
         super().__init__(id, created_at, updated_at)
@@ -98,6 +100,7 @@ class FantasyTeamSeasonLinkModel(CommonModel):
         self.fantasy_team_owner = fantasy_team_owner
         self.fantasy_league_id = fantasy_league_id
         self.fantasy_league = fantasy_league
+        self.league_players = league_players
 
 
 # Pydantic causes these class variables to safely be instance variables.
@@ -110,3 +113,4 @@ class FantasyTeamSeasonLinkOutboundModel(CommonOutboundResponseModel):
     fantasy_team: FantasyTeamOutboundModel | None = None
     fantasy_team_owner: UserOutboundModel | None = None
     fantasy_league: FantasyLeagueOutboundModel | None = None
+    league_players: list[LeaguePlayerOutboundModel] | None = None
@@ -106,3 +106,9 @@ class LeaguePlayerOutboundModel(CommonOutboundResponseModel):
     global_mnp_id: UUID
     league_team_id: UUID | None
     league_team: LeagueTeamOutboundModel | None = None
+
+
+# League teams list their players, resolved here where both models exist.
+LeagueTeamOutboundModel.model_rebuild(
+    _types_namespace={"LeaguePlayerOutboundModel": LeaguePlayerOutboundModel}
+)
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Annotated, Optional
+from typing import TYPE_CHECKING, Annotated, Optional
 from uuid import UUID
 from fastapi import Query
 from pydantic import UUID4, BaseModel, BeforeValidator, Field, Strict
@@ -17,6 +17,10 @@ from models.venue_model import (
     VenueOutboundModel,
 )
 
+if TYPE_CHECKING:
+    # League players point back at their team, the players module finishes these.
+    from models.league_player_model import LeaguePlayerModel, LeaguePlayerOutboundModel
+
 
 # Pydantic causes these class variables to safely be instance variables.
 class LeagueTeamInboundCreateModel(BaseModel):
@@ -107,6 +111,7 @@ class LeagueTeamModel(CommonModel):
         short_name: str,
         created_at: datetime,
         home_venue: VenueModel | None = None,
+        league_players: "list[LeaguePlayerModel] | None" = None,
         updated_at: datetime | None = None,
     ):
         super().__init__(id, created_at, updated_at)
@@ -115,6 +120,7 @@ class LeagueTeamModel(CommonModel):
         self.short_name = short_name
         self.home_venue_id = home_venue_id
         self.home_venue = home_venue
+        self.league_players = league_players
         self.global_mnp_id = global_mnp_id
 
 
@@ -124,4 +130,5 @@ class LeagueTeamOutboundModel(CommonOutboundResponseModel):
     short_name: str
     home_venue_id: UUID
     home_venue: VenueOutboundModel | None = None
+    league_players: "list[LeaguePlayerOutboundModel] | None" = None
     global_mnp_id: UUID
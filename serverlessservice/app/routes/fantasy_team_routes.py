@@ -8,6 +8,13 @@ from models.fantasy_team_model import (
     FantasyTeamOutboundModel,
 )
 from controllers.fantasy_team_controller import FantasyTeamController
+from util.etag import (
+    build_not_modified_response,
+    etag_matches,
+    respond_with_etag,
+)
+from util.response_cache import response_cache
+from util.responses import respond
 from models.common_model import (
     OutboundItemListResponse,
 )
@@ -19,43 +26,59 @@ def set_fantasy_team_routes(app: FastAPI):
     @app.post(
         "/fantasy_teams", response_model=FantasyTeamOutboundModel, status_code=201
     )
-    def post_fantasy_team(
+    async def post_fantasy_team(
         inbound_create_model: FantasyTeamInboundCreateModel, request: Request
     ):
-        result = controller.create(inbound_create_model, request.headers)
+        result = await controller.create(inbound_create_model, request.headers)
 
-        return result
+        return respond(result, request.headers, status_code=201)
 
     @app.get(
         "/fantasy_teams",
         response_model=OutboundItemListResponse[FantasyTeamOutboundModel],
     )
-    def get_fantasy_teams(
+    async def get_fantasy_teams(
         request: Request,
         inbound_search_model: FantasyTeamInboundSearchModel = Depends(),
     ) -> OutboundItemListResponse[FantasyTeamOutboundModel]:
-        result = controller.search(inbound_search_model, request.headers)
+        etag = await controller.get_search_etag(inbound_search_model, request.headers)
+
+        if etag_matches(request.headers, etag):
+            return build_not_modified_response(etag)
+
+        result = await response_cache.get_or_build(
+            "fantasy_teams",
+            inbound_search_model,
+            request.headers,
+            lambda: controller.search(inbound_search_model, request.headers),
+            etag,
+        )
 
-        return result
+        return respond_with_etag(result, request.headers, etag)
 
     @app.get("/fantasy_teams/{id}", response_model=FantasyTeamOutboundModel)
-    def get_fantasy_team_by_id(id: UUID4, request: Request):
-        result = controller.get_by_id(id, request.headers)
+    async def get_fantasy_team_by_id(id: UUID4, request: Request):
+        etag = await controller.get_etag_by_id(id, request.headers)
+
+        if etag_matches(request.headers, etag):
+            return build_not_modified_response(etag)
+
+        result = await controller.get_by_id(id, request.headers)
 
-        return result
+        return respond_with_etag(result, request.headers, etag)
 
     @app.patch("/fantasy_teams/{id}", response_model=FantasyTeamOutboundModel)
-    def patch_fantasy_team(
+    async def patch_fantasy_team(
         id: UUID4,
         inbound_update_model: FantasyTeamInboundUpdateModel,
         request: Request,
     ) -> FantasyTeamOutboundModel | None:
-        result = controller.update(id, inbound_update_model, request.headers)
+        result = await controller.update(id, inbound_update_model, request.headers)
 
-        return result
+        return respond(result, request.headers)
 
     @app.delete("/fantasy_teams/{id}", response_model=FantasyTeamOutboundModel)
-    def delete_fantasy_team(id: UUID4, request: Request):
-        result = controller.delete(id, request.headers)
+    async def delete_fantasy_team(id: UUID4, request: Request):
+        result = await controller.delete(id, request.headers)
 
-        return result
+        return respond(result, request.headers)
@@ -9,6 +9,13 @@ from models.fantasy_team_season_link_model import (
 from controllers.fantasy_team_season_link_controller import (
     FantasyTeamSeasonLinkController,
 )
+from util.etag import (
+    build_not_modified_response,
+    etag_matches,
+    respond_with_etag,
+)
+from util.response_cache import response_cache
+from util.responses import respond
 from models.common_model import (
     OutboundItemListResponse,
 )
@@ -22,39 +29,55 @@ def set_fantasy_team_season_link_routes(app: FastAPI):
         response_model=FantasyTeamSeasonLinkOutboundModel,
         status_code=201,
     )
-    def post_fantasy_team_season_link(
+    async def post_fantasy_team_season_link(
         inbound_create_model: FantasyTeamSeasonLinkInboundCreateModel, request: Request
     ):
-        result = controller.create(inbound_create_model, request.headers)
+        result = await controller.create(inbound_create_model, request.headers)
 
-        return result
+        return respond(result, request.headers, status_code=201)
 
     @app.get(
         "/fantasy_team_season_links",
         response_model=OutboundItemListResponse[FantasyTeamSeasonLinkOutboundModel],
     )
-    def get_fantasy_team_season_links(
+    async def get_fantasy_team_season_links(
         request: Request,
         inbound_search_model: FantasyTeamSeasonLinkInboundSearchModel = Depends(),
     ) -> OutboundItemListResponse[FantasyTeamSeasonLinkOutboundModel]:
-        result = controller.search(inbound_search_model, request.headers)
+        etag = await controller.get_search_etag(inbound_search_model, request.headers)
+
+        if etag_matches(request.headers, etag):
+            return build_not_modified_response(etag)
+
+        result = await response_cache.get_or_build(
+            "fantasy_team_season_links",
+            inbound_search_model,
+            request.headers,
+            lambda: controller.search(inbound_search_model, request.headers),
+            etag,
+        )
 
-        return result
+        return respond_with_etag(result, request.headers, etag)
 
     @app.get(
         "/fantasy_team_season_links/{id}",
         response_model=FantasyTeamSeasonLinkOutboundModel,
     )
-    def get_fantasy_team_season_link_by_id(id: UUID4, request: Request):
-        result = controller.get_by_id(id, request.headers)
+    async def get_fantasy_team_season_link_by_id(id: UUID4, request: Request):
+        etag = await controller.get_etag_by_id(id, request.headers)
+
+        if etag_matches(request.headers, etag):
+            return build_not_modified_response(etag)
+
+        result = await controller.get_by_id(id, request.headers)
 
-        return result
+        return respond_with_etag(result, request.headers, etag)
 
     @app.delete(
         "/fantasy_team_season_links/{id}",
         response_model=FantasyTeamSeasonLinkOutboundModel,
     )
-    def delete_fantasy_team_season_link(id: UUID4, request: Request):
-        result = controller.delete(id, request.headers)
+    async def delete_fantasy_team_season_link(id: UUID4, request: Request):
+        result = await controller.delete(id, request.headers)
 
-        return result
+        return respond(result, request.headers)
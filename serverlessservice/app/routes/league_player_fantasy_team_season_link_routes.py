@@ -9,6 +9,13 @@ from models.league_player_fantasy_team_season_link_model import (
 from controllers.league_player_fantasy_team_season_link_controller import (
     LeaguePlayerFantasyTeamSeasonLinkController,
 )
+from util.etag import (
+    build_not_modified_response,
+    etag_matches,
+    respond_with_etag,
+)
+from util.response_cache import response_cache
+from util.responses import respond
 from models.common_model import (
     OutboundItemListResponse,
 )
@@ -24,13 +31,13 @@ def set_league_player_fantasy_team_season_link_routes(app: FastAPI):
         response_model=LeaguePlayerFantasyTeamSeasonLinkOutboundModel,
         status_code=201,
     )
-    def post_league_player_fantasy_team_season_link(
+    async def post_league_player_fantasy_team_season_link(
         inbound_create_model: LeaguePlayerFantasyTeamSeasonLinkInboundCreateModel,
         request: Request,
     ):
-        result = controller.create(inbound_create_model, request.headers)
+        result = await controller.create(inbound_create_model, request.headers)
 
-        return result
+        return respond(result, request.headers, status_code=201)
 
     @app.get(
         "/league_player_fantasy_team_season_links",
@@ -38,28 +45,48 @@ def set_league_player_fantasy_team_season_link_routes(app: FastAPI):
             LeaguePlayerFantasyTeamSeasonLinkOutboundModel
         ],
     )
-    def get_league_player_fantasy_team_season_links(
+    async def get_league_player_fantasy_team_season_links(
         request: Request,
         inbound_search_model: LeaguePlayerFantasyTeamSeasonLinkInboundSearchModel = Depends(),
     ) -> OutboundItemListResponse[LeaguePlayerFantasyTeamSeasonLinkOutboundModel]:
-        result = controller.search(inbound_search_model, request.headers)
+        etag = await controller.get_search_etag(inbound_search_model, request.headers)
+
+        if etag_matches(request.headers, etag):
+            return build_not_modified_response(etag)
 
-        return result
+        result = await response_cache.get_or_build(
+            "league_player_fantasy_team_season_links",
+            inbound_search_model,
+            request.headers,
+            lambda: controller.search(inbound_search_model, request.headers),
+            etag,
+        )
+
+        return respond_with_etag(result, request.headers, etag)
 
     @app.get(
         "/league_player_fantasy_team_season_links/{id}",
         response_model=LeaguePlayerFantasyTeamSeasonLinkOutboundModel,
     )
-    def get_league_player_fantasy_team_season_link_by_id(id: UUID4, request: Request):
-        result = controller.get_by_id(id, request.headers)
+    async def get_league_player_fantasy_team_season_link_by_id(
+        id: UUID4, request: Request
+    ):
+        etag = await controller.get_etag_by_id(id, request.headers)
 
-        return result
+        if etag_matches(request.headers, etag):
+            return build_not_modified_response(etag)
+
+        result = await controller.get_by_id(id, request.headers)
+
+        return respond_with_etag(result, request.headers, etag)
 
     @app.delete(
         "/league_player_fantasy_team_season_links/{id}",
         response_model=LeaguePlayerFantasyTeamSeasonLinkOutboundModel,
     )
-    def delete_league_player_fantasy_team_season_link(id: UUID4, request: Request):
-        result = controller.delete(id, request.headers)
+    async def delete_league_player_fantasy_team_season_link(
+        id: UUID4, request: Request
+    ):
+        result = await controller.delete(id, request.headers)
 
-        return result
+        return respond(result, request.headers)
@@ -8,6 +8,13 @@ from models.league_player_model import (
     LeaguePlayerOutboundModel,
 )
 from controllers.league_player_controller import LeaguePlayerController
+from util.etag import (
+    build_not_modified_response,
+    etag_matches,
+    respond_with_etag,
+)
+from util.response_cache import response_cache
+from util.responses import respond
 from models.common_model import (
     OutboundItemListResponse,
 )
@@ -19,43 +26,68 @@ def set_league_player_routes(app: FastAPI):
     @app.post(
         "/league_players", response_model=LeaguePlayerOutboundModel, status_code=201
     )
-    def post_league_player(
+    async def post_league_player(
         inbound_create_model: LeaguePlayerInboundCreateModel, request: Request
     ):
-        result = controller.create(inbound_create_model, request.headers)
+        result = await controller.create(inbound_create_model, request.headers)
+
+        return respond(result, request.headers, status_code=201)
+
+    @app.put("/league_players", response_model=list[LeaguePlayerOutboundModel])
+    async def put_league_players(
+        inbound_create_models: list[LeaguePlayerInboundCreateModel], request: Request
+    ):
+        # Creates or updates by global_mnp_id in one statement, for MNP syncs.
+        result = await controller.upsert(inbound_create_models, request.headers)
 
-        return result
+        return respond(result, request.headers)
 
     @app.get(
         "/league_players",
         response_model=OutboundItemListResponse[LeaguePlayerOutboundModel],
     )
-    def get_league_players(
+    async def get_league_players(
         request: Request,
         inbound_search_model: LeaguePlayerInboundSearchModel = Depends(),
     ) -> OutboundItemListResponse[LeaguePlayerOutboundModel]:
-        result = controller.search(inbound_search_model, request.headers)
+        etag = await controller.get_search_etag(inbound_search_model, request.headers)
 
-        return result
+        if etag_matches(request.headers, etag):
+            return build_not_modified_response(etag)
+
+        result = await response_cache.get_or_build(
+            "league_players",
+            inbound_search_model,
+            request.headers,
+            lambda: controller.search(inbound_search_model, request.headers),
+            etag,
+        )
+
+        return respond_with_etag(result, request.headers, etag)
 
     @app.get("/league_players/{id}", response_model=LeaguePlayerOutboundModel)
-    def get_league_player_by_id(id: UUID4, request: Request):
-        result = controller.get_by_id(id, request.headers)
+    async def get_league_player_by_id(id: UUID4, request: Request):
+        etag = await controller.get_etag_by_id(id, request.headers)
+
+        if etag_matches(request.headers, etag):
+            return build_not_modified_response(etag)
+
+        result = await controller.get_by_id(id, request.headers)
 
-        return result
+        return respond_with_etag(result, request.headers, etag)
 
     @app.patch("/league_players/{id}", response_model=LeaguePlayerOutboundModel)
-    def patch_league_player(
+    async def patch_league_player(
         id: UUID4,
         inbound_update_model: LeaguePlayerInboundUpdateModel,
         request: Request,
     ) -> LeaguePlayerOutboundModel | None:
-        result = controller.update(id, inbound_update_model, request.headers)
+        result = await controller.update(id, inbound_update_model, request.headers)
 
-        return result
+        return respond(result, request.headers)
 
     @app.delete("/league_players/{id}", response_model=LeaguePlayerOutboundModel)
-    def delete_league_player(id: UUID4, request: Request):
-        result = controller.delete(id, request.headers)
+    async def delete_league_player(id: UUID4, request: Request):
+        result = await controller.delete(id, request.headers)
 
-        return result
+        return respond(result, request.headers)
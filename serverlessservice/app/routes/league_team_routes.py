@@ -8,6 +8,13 @@ from models.league_team_model import (
     LeagueTeamOutboundModel,
 )
 from controllers.league_team_controller import LeagueTeamController
+from util.etag import (
+    build_not_modified_response,
+    etag_matches,
+    respond_with_etag,
+)
+from util.response_cache import response_cache
+from util.responses import respond
 from models.common_model import (
     OutboundItemListResponse,
 )
@@ -17,41 +24,66 @@ controller: LeagueTeamController = LeagueTeamController()
 
 def set_league_team_routes(app: FastAPI):
     @app.post("/league_teams", response_model=LeagueTeamOutboundModel, status_code=201)
-    def post_league_team(
+    async def post_league_team(
         inbound_create_model: LeagueTeamInboundCreateModel, request: Request
     ):
-        result = controller.create(inbound_create_model, request.headers)
+        result = await controller.create(inbound_create_model, request.headers)
+
+        return respond(result, request.headers, status_code=201)
+
+    @app.put("/league_teams", response_model=list[LeagueTeamOutboundModel])
+    async def put_league_teams(
+        inbound_create_models: list[LeagueTeamInboundCreateModel], request: Request
+    ):
+        # Creates or updates by global_mnp_id in one statement, for MNP syncs.
+        result = await controller.upsert(inbound_create_models, request.headers)
 
-        return result
+        return respond(result, request.headers)
 
     @app.get(
         "/league_teams",
         response_model=OutboundItemListResponse[LeagueTeamOutboundModel],
     )
-    def get_league_teams(
+    async def get_league_teams(
         request: Request,
         inbound_search_model: LeagueTeamInboundSearchModel = Depends(),
     ) -> OutboundItemListResponse[LeagueTeamOutboundModel]:
-        result = controller.search(inbound_search_model, request.headers)
+        etag = await controller.get_search_etag(inbound_search_model, request.headers)
 
-        return result
+        if etag_matches(request.headers, etag):
+            return build_not_modified_response(etag)
+
+        result = await response_cache.get_or_build(
+            "league_teams",
+            inbound_search_model,
+            request.headers,
+            lambda: controller.search(inbound_search_model, request.headers),
+            etag,
+        )
+
+        return respond_with_etag(result, request.headers, etag)
 
     @app.get("/league_teams/{id}", response_model=LeagueTeamOutboundModel)
-    def get_league_team_by_id(id: UUID4, request: Request):
-        result = controller.get_by_id(id, request.headers)
+    async def get_league_team_by_id(id: UUID4, request: Request):
+        etag = await controller.get_etag_by_id(id, request.headers)
+
+        if etag_matches(request.headers, etag):
+            return build_not_modified_response(etag)
+
+        result = await controller.get_by_id(id, request.headers)
 
-        return result
+        return respond_with_etag(result, request.headers, etag)
 
     @app.patch("/league_teams/{id}", response_model=LeagueTeamOutboundModel)
-    def patch_league_team(
+    async def patch_league_team(
         id: UUID4, inbound_update_model: LeagueTeamInboundUpdateModel, request: Request
     ) -> LeagueTeamOutboundModel | None:
-        result = controller.update(id, inbound_update_model, request.headers)
+        result = await controller.update(id, inbound_update_model, request.headers)
 
-        return result
+        return respond(result, request.headers)
 
     @app.delete("/league_teams/{id}", response_model=LeagueTeamOutboundModel)
-    def delete_league_team(id: UUID4, request: Request):
-        result = controller.delete(id, request.headers)
+    async def delete_league_team(id: UUID4, request: Request):
+        result = await controller.delete(id, request.headers)
 
-        return result
+        return respond(result, request.headers)
@@ -8,6 +8,13 @@ from models.season_model import (
     SeasonOutboundModel,
 )
 from controllers.season_controller import SeasonController
+from util.etag import (
+    build_not_modified_response,
+    etag_matches,
+    respond_with_etag,
+)
+from util.response_cache import response_cache
+from util.responses import respond
 from models.common_model import (
     OutboundItemListResponse,
 )
@@ -17,44 +24,62 @@ controller: SeasonController = SeasonController()
 
 def set_season_routes(app: FastAPI):
     @app.post("/seasons", response_model=SeasonOutboundModel, status_code=201)
-    def post_season(inbound_create_model: SeasonInboundCreateModel, request: Request):
-        result = controller.create(inbound_create_model, request.headers)
+    async def post_season(
+        inbound_create_model: SeasonInboundCreateModel, request: Request
+    ):
+        result = await controller.create(inbound_create_model, request.headers)
 
-        return result
+        return respond(result, request.headers, status_code=201)
 
     @app.get(
         "/seasons",
         response_model=OutboundItemListResponse[SeasonOutboundModel],
     )
-    def get_seasons(
+    async def get_seasons(
         request: Request,
         inbound_search_model: SeasonInboundSearchModel = Depends(),
     ) -> OutboundItemListResponse[SeasonOutboundModel]:
-        result = controller.search(inbound_search_model, request.headers)
+        etag = await controller.get_search_etag(inbound_search_model, request.headers)
+
+        if etag_matches(request.headers, etag):
+            return build_not_modified_response(etag)
 
-        return result
+        result = await response_cache.get_or_build(
+            "seasons",
+            inbound_search_model,
+            request.headers,
+            lambda: controller.search(inbound_search_model, request.headers),
+            etag,
+        )
+
+        return respond_with_etag(result, request.headers, etag)
 
     @app.get("/seasons/{id}", response_model=SeasonOutboundModel)
-    def get_season_by_id(id: UUID4, request: Request):
-        result = controller.get_by_id(id, request.headers)
+    async def get_season_by_id(id: UUID4, request: Request):
+        etag = await controller.get_etag_by_id(id, request.headers)
+
+        if etag_matches(request.headers, etag):
+            return build_not_modified_response(etag)
+
+        result = await controller.get_by_id(id, request.headers)
 
-        return result
+        return respond_with_etag(result, request.headers, etag)
 
     @app.patch(
         "/seasons/{id}",
         response_model=SeasonOutboundModel,
     )
-    def patch_season(
+    async def patch_season(
         id: UUID4,
         inbound_update_model: SeasonInboundUpdateModel,
         request: Request,
     ):
-        result = controller.update(id, inbound_update_model, request.headers)
+        result = await controller.update(id, inbound_update_model, request.headers)
 
-        return result
+        return respond(result, request.headers)
 
     @app.delete("/seasons/{id}", response_model=SeasonOutboundModel)
-    def delete_season(id: UUID4, request: Request):
-        result = controller.delete(id, request.headers)
+    async def delete_season(id: UUID4, request: Request):
+        result = await controller.delete(id, request.headers)
 
-        return result
+        return respond(result, request.headers)
@@ -8,6 +8,13 @@ from models.user_model import (
     UserOutboundModel,
 )
 from controllers.user_controller import UserController
+from util.etag import (
+    build_not_modified_response,
+    etag_matches,
+    respond_with_etag,
+)
+from util.response_cache import response_cache
+from util.responses import respond
 from models.common_model import (
     OutboundItemListResponse,
 )
@@ -17,39 +24,55 @@ controller: UserController = UserController()
 
 def set_user_routes(app: FastAPI):
     @app.post("/users", response_model=UserOutboundModel, status_code=201)
-    def post_user(inbound_create_model: UserInboundCreateModel, request: Request):
-        result = controller.create(inbound_create_model, request.headers)
+    async def post_user(inbound_create_model: UserInboundCreateModel, request: Request):
+        result = await controller.create(inbound_create_model, request.headers)
 
-        return result
+        return respond(result, request.headers, status_code=201)
 
     @app.get(
         "/users",
         response_model=OutboundItemListResponse[UserOutboundModel],
     )
-    def get_users(
+    async def get_users(
         request: Request,
         inbound_search_model: UserInboundSearchModel = Depends(),
     ) -> OutboundItemListResponse[UserOutboundModel]:
-        result = controller.search(inbound_search_model, request.headers)
+        etag = await controller.get_search_etag(inbound_search_model, request.headers)
+
+        if etag_matches(request.headers, etag):
+            return build_not_modified_response(etag)
+
+        result = await response_cache.get_or_build(
+            "users",
+            inbound_search_model,
+            request.headers,
+            lambda: controller.search(inbound_search_model, request.headers),
+            etag,
+        )
 
-        return result
+        return respond_with_etag(result, request.headers, etag)
 
     @app.get("/users/{id}", response_model=UserOutboundModel)
-    def get_user_by_id(id: UUID4, request: Request):
-        result = controller.get_by_id(id, request.headers)
+    async def get_user_by_id(id: UUID4, request: Request):
+        etag = await controller.get_etag_by_id(id, request.headers)
+
+        if etag_matches(request.headers, etag):
+            return build_not_modified_response(etag)
+
+        result = await controller.get_by_id(id, request.headers)
 
-        return result
+        return respond_with_etag(result, request.headers, etag)
 
     @app.patch("/users/{id}", response_model=UserOutboundModel)
-    def patch_user(
+    async def patch_user(
         id: UUID4, inbound_update_model: UserInboundUpdateModel, request: Request
     ) -> UserOutboundModel | None:
-        result = controller.update(id, inbound_update_model, request.headers)
+        result = await controller.update(id, inbound_update_model, request.headers)
 
-        return result
+        return respond(result, request.headers)
 
     @app.delete("/users/{id}", response_model=UserOutboundModel)
-    def delete_user(id: UUID4, request: Request):
-        result = controller.delete(id, request.headers)
+    async def delete_user(id: UUID4, request: Request):
+        result = await controller.delete(id, request.headers)
 
-        return result
+        return respond(result, request.headers)
@@ -3,6 +3,11 @@
 from mangum import Mangum
 from fastapi import FastAPI
 
+from util.configuration import get_global_configuration
+from util.entity_cache import get_entity_cache_stats
+from util.existence_cache import get_existence_cache_stats
+from util.response_cache import response_cache
+
 
 def set_utility_routes(app: FastAPI):
 
@@ -15,3 +20,37 @@ def set_utility_routes(app: FastAPI):
             'message': 'Hello HELLO hello!'
         }
 
+    @app.get("/pool_stats")
+    def get_pool_stats():
+        """
+        Return the database connection pool counters
+        """
+        return get_global_configuration().pg_connection.get_pool_stats()
+
+    @app.get("/sql_cache_stats")
+    def get_sql_cache_stats():
+        """
+        Return the compiled SQL template cache counters
+        """
+        return get_global_configuration().pg_connection.get_sql_cache_stats()
+
+    @app.get("/entity_cache_stats")
+    def get_entity_cache_stats_route():
+        """
+        Return the reference entity cache counters, by entity type
+        """
+        return get_entity_cache_stats()
+
+    @app.get("/existence_cache_stats")
+    def get_existence_cache_stats_route():
+        """
+        Return the parent id existence cache counters, by table
+        """
+        return get_existence_cache_stats()
+
+    @app.get("/response_cache_stats")
+    def get_response_cache_stats():
+        """
+        Return the search response cache counters
+        """
+        return response_cache.get_stats()
@@ -8,6 +8,13 @@ from models.venue_model import (
     VenueOutboundModel,
 )
 from controllers.venue_controller import VenueController
+from util.etag import (
+    build_not_modified_response,
+    etag_matches,
+    respond_with_etag,
+)
+from util.response_cache import response_cache
+from util.responses import respond
 from models.common_model import (
     OutboundItemListResponse,
 )
@@ -17,39 +24,57 @@ controller: VenueController = VenueController()
 
 def set_venue_routes(app: FastAPI):
     @app.post("/venues", response_model=VenueOutboundModel, status_code=201)
-    def post_venue(inbound_create_model: VenueInboundCreateModel, request: Request):
-        result = controller.create(inbound_create_model, request.headers)
+    async def post_venue(
+        inbound_create_model: VenueInboundCreateModel, request: Request
+    ):
+        result = await controller.create(inbound_create_model, request.headers)
 
-        return result
+        return respond(result, request.headers, status_code=201)
 
     @app.get(
         "/venues",
         response_model=OutboundItemListResponse[VenueOutboundModel],
     )
-    def get_venues(
+    async def get_venues(
         request: Request,
         inbound_search_model: VenueInboundSearchModel = Depends(),
     ) -> OutboundItemListResponse[VenueOutboundModel]:
-        result = controller.search(inbound_search_model, request.headers)
+        etag = await controller.get_search_etag(inbound_search_model, request.headers)
+
+        if etag_matches(request.headers, etag):
+            return build_not_modified_response(etag)
+
+        result = await response_cache.get_or_build(
+            "venues",
+            inbound_search_model,
+            request.headers,
+            lambda: controller.search(inbound_search_model, request.headers),
+            etag,
+        )
 
-        return result
+        return respond_with_etag(result, request.headers, etag)
 
     @app.get("/venues/{id}", response_model=VenueOutboundModel)
-    def get_venue_by_id(id: UUID4, request: Request):
-        result = controller.get_by_id(id, request.headers)
+    async def get_venue_by_id(id: UUID4, request: Request):
+        etag = await controller.get_etag_by_id(id, request.headers)
+
+        if etag_matches(request.headers, etag):
+            return build_not_modified_response(etag)
+
+        result = await controller.get_by_id(id, request.headers)
 
-        return result
+        return respond_with_etag(result, request.headers, etag)
 
     @app.patch("/venues/{id}", response_model=VenueOutboundModel)
-    def patch_user(
+    async def patch_user(
         id: UUID4, inbound_update_model: VenueInboundUpdateModel, request: Request
     ) -> VenueOutboundModel | None:
-        result = controller.update(id, inbound_update_model, request.headers)
+        result = await controller.update(id, inbound_update_model, request.headers)
 
-        return result
+        return respond(result, request.headers)
 
     @app.delete("/venues/{id}", response_model=VenueOutboundModel)
-    def delete_venue(id: UUID4, request: Request):
-        result = controller.delete(id, request.headers)
+    async def delete_venue(id: UUID4, request: Request):
+        result = await controller.delete(id, request.headers)
 
-        return result
+        return respond(result, request.headers)
@@ -0,0 +1,513 @@
+import asyncio
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator
+from uuid import UUID
+
+from psycopg import AsyncConnection, AsyncCursor
+from psycopg.adapt import Loader
+from psycopg.conninfo import make_conninfo
+from psycopg_pool import AsyncConnectionPool, PoolTimeout
+
+from util.common import RequestOperators
+from util.database import ExactMatchSearchTerm, PagingModel, SearchTerm
+from util.db_connection import (
+    PGQueryBuilder,
+    SelectQueryResults,
+    SqlStringAndParameters,
+)
+
+
+class AsyncUnitOfWork:
+    """
+    Async counterpart of UnitOfWork: one pooled psycopg connection and one transaction
+    for the lifetime of a request, checked out lazily on first use.
+    """
+
+    def __init__(self, pool: AsyncConnectionPool) -> None:
+        self.pool = pool
+        self.connection: AsyncConnection | None = None
+        self.rollback_only = False
+
+    async def get_connection(self) -> AsyncConnection:
+        if self.connection is None:
+            self.connection = await self.pool.getconn()
+
+        return self.connection
+
+    async def complete(self, commit: bool = True) -> None:
+        if self.connection is None:
+            return
+
+        conn = self.connection
+        self.connection = None
+
+        try:
+            if commit:
+                await conn.commit()
+            else:
+                await conn.rollback()
+        except Exception as e:
+            await conn.rollback()
+            raise e
+        finally:
+            await self.pool.putconn(conn)
+
+
+current_async_unit_of_work: ContextVar[AsyncUnitOfWork | None] = ContextVar(
+    "current_async_unit_of_work", default=None
+)
+
+
+class UuidAsStringLoader(Loader):
+    # The adapters expect uuid columns as strings, the same way psycopg2 returns them.
+    def load(self, data: Any) -> str:
+        return bytes(data).decode()
+
+
+async def configure_connection(conn: AsyncConnection) -> None:
+    conn.adapters.register_loader("uuid", UuidAsStringLoader)
+
+
+class AsyncPGConnection(PGQueryBuilder):
+    """
+    psycopg 3 engine backed by an AsyncConnectionPool. Exposes the same awaitable
+    surface as ThreadedPGConnection so the accessors do not care which engine is
+    configured.
+    """
+
+    pool: AsyncConnectionPool
+
+    def __init__(self) -> None:
+        self.pool_open_lock = asyncio.Lock()
+        self.pool_is_open = False
+
+    def create_connection_pool(
+        self,
+        host: str,
+        port: str,
+        database: str,
+        username: str,
+        password: str,
+        min_size: int = 2,
+        max_size: int = 50,
+        timeout_seconds: float = 30.0,
+    ) -> None:
+        # The pool is opened lazily inside the running event loop, see open_pool.
+        self.pool = AsyncConnectionPool(
+            conninfo=make_conninfo(
+                host=host,
+                port=port,
+                dbname=database,
+                user=username,
+                password=password,
+            ),
+            min_size=min_size,
+            max_size=max_size,
+            timeout=timeout_seconds,
+            open=False,
+            configure=self.configure_connection,
+            check=AsyncConnectionPool.check_connection,
+        )
+
+    async def configure_connection(self, conn: AsyncConnection) -> None:
+        await configure_connection(conn)
+
+        # psycopg prepares on its own after a few executions, cached templates are
+        # prepared on first use instead, see execute_statement.
+        if self.prepared_statements_max > 0:
+            conn.prepared_max = self.prepared_statements_max
+        else:
+            conn.prepare_threshold = None
+
+    def get_pool_stats(self) -> dict[str, Any]:
+        stats = self.pool.get_stats()
+        stats["pool_in_use"] = stats["pool_size"] - stats["pool_available"]
+
+        return stats
+
+    async def open_pool(self) -> AsyncConnectionPool:
+        if not self.pool_is_open:
+            async with self.pool_open_lock:
+                if not self.pool_is_open:
+                    await self.pool.open()
+                    self.pool_is_open = True
+
+        return self.pool
+
+    @asynccontextmanager
+    async def unit_of_work(self) -> AsyncIterator[AsyncUnitOfWork]:
+        unit_of_work = AsyncUnitOfWork(await self.open_pool())
+        token = current_async_unit_of_work.set(unit_of_work)
+
+        try:
+            yield unit_of_work
+        except Exception as e:
+            await unit_of_work.complete(commit=False)
+            raise e
+        else:
+            await unit_of_work.complete(commit=not unit_of_work.rollback_only)
+        finally:
+            current_async_unit_of_work.reset(token)
+
+    @asynccontextmanager
+    async def borrow_unit_of_work(self) -> AsyncIterator[AsyncUnitOfWork | None]:
+        """
+        A unit of work holding a connection that was free in the pool right now, None
+        when every connection is in use. Never waits for a connection.
+        """
+        pool = await self.open_pool()
+        conn: AsyncConnection | None = None
+
+        try:
+            conn = await pool.getconn(timeout=0)
+        except PoolTimeout:
+            pass
+
+        if conn is None:
+            yield None
+            return
+
+        async with self.unit_of_work() as unit_of_work:
+            unit_of_work.connection = conn
+
+            yield unit_of_work
+
+    @asynccontextmanager
+    async def acquire_connection(self) -> AsyncIterator[AsyncConnection]:
+        unit_of_work = current_async_unit_of_work.get()
+
+        if unit_of_work is not None:
+            yield await unit_of_work.get_connection()
+            return
+
+        pool = await self.open_pool()
+        conn = await pool.getconn()
+
+        try:
+            yield conn
+            await conn.commit()
+        except Exception as e:
+            await conn.rollback()
+            raise e
+        finally:
+            await pool.putconn(conn)
+
+    async def execute_statement(
+        self,
+        cursor: AsyncCursor,
+        sql_string_and_parameters: SqlStringAndParameters,
+    ) -> None:
+        await cursor.execute(
+            sql_string_and_parameters.sql_string,
+            sql_string_and_parameters.parameters,
+            prepare=(
+                True
+                if sql_string_and_parameters.prepare
+                and self.prepared_statements_max > 0
+                else None
+            ),
+        )
+
+    async def execute_command(self, sqlstring: str) -> None:
+        async with self.acquire_connection() as conn:
+            cursor = conn.cursor()
+
+            await cursor.execute(sqlstring)
+
+    async def execute_command_with_results(
+        self, sqlstring: str
+    ) -> list[tuple[Any, ...]]:
+        async with self.acquire_connection() as conn:
+            cursor = conn.cursor()
+
+            await cursor.execute(sqlstring)
+
+            records = await cursor.fetchall()
+
+            return records
+
+    async def insert(
+        self,
+        table_name: str,
+        model: dict[str, Any],
+        request_operators: RequestOperators | None = None,
+    ) -> dict[str, Any]:
+        async with self.acquire_connection() as conn:
+            cursor = conn.cursor()
+
+            sql_string_and_parameters = self.build_insert_query(
+                table_name=table_name, model=model, request_operators=request_operators
+            )
+
+            await self.execute_statement(cursor, sql_string_and_parameters)
+
+            rows = await cursor.fetchall()
+
+            if rows is None or len(rows) != 1:
+                raise
+
+            return self.map_first_row(cursor.description, rows)
+
+    async def insert_many(
+        self,
+        table_name: str,
+        models: list[dict[str, Any]],
+        request_operators: RequestOperators | None = None,
+    ) -> list[dict[str, Any]]:
+        if len(models) == 0:
+            return []
+
+        async with self.acquire_connection() as conn:
+            cursor = conn.cursor()
+
+            results: list[dict[str, Any]] = []
+
+            for sql_string_and_parameters in self.build_insert_many_queries(
+                table_name=table_name,
+                models=models,
+                request_operators=request_operators,
+            ):
+                await cursor.execute(
+                    sql_string_and_parameters.sql_string,
+                    sql_string_and_parameters.parameters,
+                )
+
+                results.extend(
+                    self.map_rows(cursor.description, await cursor.fetchall())
+                )
+
+            return results
+
+    async def upsert(
+        self,
+        table_name: str,
+        model: dict[str, Any],
+        conflict_columns: list[str],
+        update_columns: list[str] | None = None,
+        request_operators: RequestOperators | None = None,
+    ) -> dict[str, Any] | None:
+        results = await self.upsert_many(
+            table_name, [model], conflict_columns, update_columns, request_operators
+        )
+
+        return results[0] if len(results) > 0 else None
+
+    async def upsert_many(
+        self,
+        table_name: str,
+        models: list[dict[str, Any]],
+        conflict_columns: list[str],
+        update_columns: list[str] | None = None,
+        request_operators: RequestOperators | None = None,
+    ) -> list[dict[str, Any]]:
+        if len(models) == 0:
+            return []
+
+        async with self.acquire_connection() as conn:
+            cursor = conn.cursor()
+
+            results: list[dict[str, Any]] = []
+
+            for sql_string_and_parameters in self.build_upsert_many_queries(
+                table_name=table_name,
+                models=models,
+                conflict_columns=conflict_columns,
+                update_columns=update_columns,
+                request_operators=request_operators,
+            ):
+                await cursor.execute(
+                    sql_string_and_parameters.sql_string,
+                    sql_string_and_parameters.parameters,
+                )
+
+                results.extend(
+                    self.map_rows(cursor.description, await cursor.fetchall())
+                )
+
+            return results
+
+    async def select_by_id(
+        self,
+        table_name: str,
+        id: UUID,
+        request_operators: RequestOperators | None = None,
+    ) -> dict[str, Any] | None:
+        async with self.acquire_connection() as conn:
+            cursor = conn.cursor()
+
+            sqlstring = self.build_select_by_id_query(
+                table_name=table_name, id=id, request_operators=request_operators
+            )
+
+            await cursor.execute(sqlstring)
+
+            rows = await cursor.fetchall()
+
+            return self.map_first_row(cursor.description, rows)
+
+    async def select(
+        self,
+        table_name: str,
+        search_terms: list[SearchTerm],
+        paging_model: PagingModel | None = None,
+        request_operators: RequestOperators | None = None,
+    ) -> SelectQueryResults:
+        async with self.acquire_connection() as conn:
+            cursor = conn.cursor()
+
+            build_query_results = self.build_select_query(
+                table_name=table_name,
+                search_terms=search_terms,
+                paging_model=paging_model,
+                request_operators=request_operators,
+            )
+
+            print(
+                f"Executing SQL: {build_query_results.sql_string_and_parameters.sql_string}"
+            )
+
+            await self.execute_statement(
+                cursor, build_query_results.sql_string_and_parameters
+            )
+
+            rows = await cursor.fetchall()
+
+            results = self.map_select_results(
+                table_name, build_query_results, cursor.description, rows
+            )
+
+            estimate_count_query = (
+                build_query_results.estimate_count_sql_string_and_parameters
+            )
+
+            if (
+                estimate_count_query is not None
+                and results.paging.total_record_count is None
+            ):
+                await cursor.execute(
+                    estimate_count_query.sql_string, estimate_count_query.parameters
+                )
+
+                results.paging.total_record_count = self.map_estimated_count(
+                    await cursor.fetchall()
+                )
+
+            return results
+
+    async def select_stream(
+        self,
+        table_name: str,
+        search_terms: list[SearchTerm],
+        paging_model: PagingModel | None = None,
+        request_operators: RequestOperators | None = None,
+        itersize: int | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        itersize = itersize or self.stream_itersize
+
+        build_query_results = self.build_select_query(
+            table_name=table_name,
+            search_terms=search_terms,
+            paging_model=paging_model,
+            request_operators=request_operators,
+        )
+
+        async with self.acquire_connection() as conn:
+            if self.fits_in_one_batch(search_terms, itersize):
+                cursor = conn.cursor()
+            else:
+                cursor = conn.cursor(name=self.generate_stream_cursor_name())
+
+            await cursor.execute(
+                build_query_results.sql_string_and_parameters.sql_string,
+                build_query_results.sql_string_and_parameters.parameters,
+            )
+
+            try:
+                while True:
+                    rows = await cursor.fetchmany(itersize)
+
+                    colnames: list[str] = [desc[0] for desc in cursor.description]
+
+                    for row in rows:
+                        yield self.map_result_columns_to_values(colnames, row)
+
+                    if len(rows) < itersize:
+                        break
+            finally:
+                await cursor.close()
+
+    async def select_version(
+        self,
+        table_name: str,
+        search_terms: list[SearchTerm],
+        request_operators: RequestOperators | None = None,
+    ) -> tuple[Any, ...]:
+        async with self.acquire_connection() as conn:
+            cursor = conn.cursor()
+
+            await self.execute_statement(
+                cursor,
+                self.build_version_query(table_name, search_terms, request_operators),
+            )
+
+            return tuple(await cursor.fetchone())
+
+    async def select_version_by_id(
+        self,
+        table_name: str,
+        id: UUID,
+        request_operators: RequestOperators | None = None,
+    ) -> tuple[Any, ...]:
+        return await self.select_version(
+            table_name, [ExactMatchSearchTerm("id", str(id))], request_operators
+        )
+
+    async def update(
+        self,
+        table_name: str,
+        id: UUID,
+        model: dict[str, Any],
+        request_operators: RequestOperators | None = None,
+    ) -> dict[str, Any] | None:
+        refined_model = self.refine_update_model(model)
+
+        # if nothing to update, just select by id
+        if refined_model is None:
+            returndict = await self.select_by_id(table_name, id)
+            return returndict
+
+        async with self.acquire_connection() as conn:
+            cursor = conn.cursor()
+
+            results = self.build_update_query(
+                table_name=table_name,
+                id=id,
+                model=refined_model,
+                request_operators=request_operators,
+            )
+
+            await self.execute_statement(cursor, results)
+
+            rows = await cursor.fetchall()
+
+            return self.map_first_row(cursor.description, rows)
+
+    async def delete(
+        self,
+        table_name: str,
+        id: UUID,
+        request_operators: RequestOperators | None = None,
+    ) -> dict[str, Any] | None:
+        async with self.acquire_connection() as conn:
+            cursor = conn.cursor()
+
+            sqlstring = self.build_delete_query(
+                table_name=table_name, id=id, request_operators=request_operators
+            )
+
+            await cursor.execute(sqlstring)
+
+            rows = await cursor.fetchall()
+
+            return self.map_first_row(cursor.description, rows)
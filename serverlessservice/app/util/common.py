@@ -7,6 +7,9 @@ from typing import Any, Generic, TypeVar
 from uuid import UUID
 import uuid
 
+from util.database import CountModes
+from util.field_selection import FieldSelection
+
 
 class RequestOperators:
     
@@ -14,10 +17,14 @@ class RequestOperators:
         self, 
         hydration: list[str] | None = None,
         skip_paging: bool = False,
+        count_mode: CountModes | None = None,
+        fields: FieldSelection | None = None,
     ) -> None:
         
         self.hydration = hydration
         self.skip_paging = skip_paging
+        self.count_mode = count_mode
+        self.fields = fields
     
 
 T_in = TypeVar('T_in')
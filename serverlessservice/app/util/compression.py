@@ -0,0 +1,195 @@
+import zlib
+from typing import Any
+
+import brotli
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from util.responses import parse_quality_values
+
+# Content codings this service can produce, in the order it prefers them.
+supported_encodings = ["br", "gzip"]
+
+
+def select_encoding(accept_encoding: str | None, encodings: list[str]) -> str | None:
+    """
+    The coding from encodings the client ranks highest in Accept-Encoding, ties going
+    to the earlier one in encodings. None when it accepts none of them.
+    """
+    qualities = parse_quality_values(accept_encoding)
+
+    selected: str | None = None
+    selected_quality = 0.0
+
+    for encoding in encodings:
+        quality = qualities.get(encoding, qualities.get("*", 0.0))
+
+        if quality > selected_quality:
+            selected = encoding
+            selected_quality = quality
+
+    return selected
+
+
+class CompressionMiddleware:
+    """
+    Compresses response bodies of at least minimum_size bytes with brotli or gzip,
+    whichever the request's Accept-Encoding prefers. Responses that already carry a
+    Content-Encoding pass through untouched.
+
+    A body sent in several messages is compressed as it goes, each message flushed
+    on its own once minimum_size bytes have been seen, so streamed responses still
+    reach the client chunk by chunk. Strong ETags become weak on every response to a
+    request that negotiated a coding, compressed bytes differ from the identity body
+    the ETag was computed for.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        encodings: list[str] = supported_encodings,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ) -> None:
+        unsupported = [
+            encoding for encoding in encodings if encoding not in supported_encodings
+        ]
+
+        if len(unsupported) > 0:
+            raise Exception(
+                f"Unsupported compression encodings {unsupported}, expected any of {supported_encodings}."
+            )
+
+        self.app = app
+        self.encodings = encodings
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or len(self.encodings) == 0:
+            await self.app(scope, receive, send)
+            return
+
+        encoding = select_encoding(
+            Headers(scope=scope).get("Accept-Encoding"), self.encodings
+        )
+
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+
+class CompressionResponder:
+    def __init__(
+        self, middleware: CompressionMiddleware, encoding: str, send: Send
+    ) -> None:
+        self.middleware = middleware
+        self.encoding = encoding
+        self.inner_send = send
+        self.start_message: Message | None = None
+        self.compressor: Any = None
+        self.passthrough = False
+        self.buffer = b""
+
+    def create_compressor(self) -> Any:
+        if self.encoding == "br":
+            return brotli.Compressor(quality=self.middleware.brotli_quality)
+
+        # wbits 16 + MAX_WBITS writes the gzip header and trailer.
+        return zlib.compressobj(self.middleware.gzip_level, zlib.DEFLATED, 31)
+
+    def compress(self, body: bytes, more_body: bool) -> bytes:
+        if self.encoding == "br":
+            compressed = self.compressor.process(body)
+
+            return compressed + (
+                self.compressor.flush() if more_body else self.compressor.finish()
+            )
+
+        compressed = self.compressor.compress(body)
+
+        return compressed + self.compressor.flush(
+            zlib.Z_SYNC_FLUSH if more_body else zlib.Z_FINISH
+        )
+
+    def start_compressing(self) -> None:
+        assert self.start_message is not None
+
+        headers = MutableHeaders(raw=self.start_message["headers"])
+        headers["Content-Encoding"] = self.encoding
+
+        # The compressed length is only known at the end, the body goes out chunked.
+        if "content-length" in headers:
+            del headers["Content-Length"]
+
+        self.compressor = self.create_compressor()
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            # Held back until the first body message shows whether to compress.
+            self.start_message = message
+            headers = MutableHeaders(raw=message["headers"])
+
+            if "content-encoding" in headers:
+                self.passthrough = True
+                return
+
+            # Whether or not this body ends up compressed, the same request may get a
+            # compressed one later. A 304 has to repeat the ETag the 200 carried.
+            headers.add_vary_header("Accept-Encoding")
+            etag = headers.get("ETag")
+
+            if etag is not None and not etag.startswith("W/"):
+                headers["ETag"] = f"W/{etag}"
+
+            self.passthrough = message["status"] in (204, 304)
+            return
+
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.flush_start()
+            await self.inner_send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.compressor is None:
+            # Bodies are buffered until they reach minimum_size, anything smaller goes
+            # out as is in one message.
+            self.buffer += body
+
+            if more_body and len(self.buffer) < self.middleware.minimum_size:
+                return
+
+            body, self.buffer = self.buffer, b""
+
+            if not more_body and len(body) < self.middleware.minimum_size:
+                self.passthrough = True
+
+                await self.flush_start()
+                await self.inner_send(
+                    {"type": "http.response.body", "body": body, "more_body": False}
+                )
+                return
+
+            self.start_compressing()
+
+        await self.flush_start()
+        await self.inner_send(
+            {
+                "type": "http.response.body",
+                "body": self.compress(body, more_body),
+                "more_body": more_body,
+            }
+        )
+
+    async def flush_start(self) -> None:
+        if self.start_message is not None:
+            start_message = self.start_message
+            self.start_message = None
+            await self.inner_send(start_message)
@@ -0,0 +1,87 @@
+import asyncio
+import gzip
+from typing import Any
+
+import brotli
+from starlette.types import Message, Receive, Scope, Send
+
+from util.compression import CompressionMiddleware, select_encoding
+
+
+def build_app(chunks: list[bytes], headers: list[tuple[bytes, bytes]]) -> Any:
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+
+        for index, chunk in enumerate(chunks):
+            await send(
+                {
+                    "type": "http.response.body",
+                    "body": chunk,
+                    "more_body": index < len(chunks) - 1,
+                }
+            )
+
+    return app
+
+
+def run(
+    chunks: list[bytes], accept_encoding: str, headers: list[tuple[bytes, bytes]]
+) -> tuple[dict[str, str], list[bytes]]:
+    middleware = CompressionMiddleware(build_app(chunks, headers), minimum_size=100)
+    messages: list[Message] = []
+
+    async def send(message: Message) -> None:
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "headers": [(b"accept-encoding", accept_encoding.encode())],
+    }
+
+    asyncio.run(middleware(scope, None, send))
+
+    return (
+        {name.decode(): value.decode() for name, value in messages[0]["headers"]},
+        [message["body"] for message in messages[1:]],
+    )
+
+
+def test_selects_the_preferred_accepted_encoding():
+    encodings = ["br", "gzip"]
+
+    assert select_encoding("gzip, deflate, br", encodings) == "br"
+    assert select_encoding("gzip;q=1.0, br;q=0.5", encodings) == "gzip"
+    assert select_encoding("br;q=0, *", encodings) == "gzip"
+    assert select_encoding("deflate", encodings) is None
+    assert select_encoding(None, encodings) is None
+
+
+def test_compresses_buffered_and_streamed_bodies():
+    body = b'{"items": [' + b'{"name": "league player"},' * 50 + b"]}"
+
+    headers, bodies = run(
+        [body], "gzip", [(b"content-length", str(len(body)).encode())]
+    )
+
+    assert headers["content-encoding"] == "gzip"
+    assert "content-length" not in headers
+    assert gzip.decompress(b"".join(bodies)) == body
+
+    chunks = [body[:500], body[500:], b""]
+    headers, bodies = run(chunks, "br", [(b"etag", b'"version"')])
+
+    assert headers["content-encoding"] == "br"
+    assert headers["etag"] == 'W/"version"'
+    assert headers["vary"] == "Accept-Encoding"
+    # Every chunk is flushed as it arrives.
+    assert len(bodies) == 3
+    assert brotli.Decompressor().process(bodies[0]) == chunks[0]
+    assert brotli.decompress(b"".join(bodies)) == body
+
+
+def test_sends_small_bodies_as_they_are():
+    headers, bodies = run([b'{"name": ', b'"venue"}', b""], "gzip", [])
+
+    assert "content-encoding" not in headers
+    assert headers["vary"] == "Accept-Encoding"
+    assert bodies == [b'{"name": "venue"}']
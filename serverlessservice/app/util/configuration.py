@@ -1,8 +1,26 @@
+import asyncio
 import os
 from typing import cast
+from uuid import UUID
 from dotenv import load_dotenv
+import psycopg2
 
-from util.db_connection import PGConnection
+from util.async_db_connection import AsyncPGConnection
+from util.db_connection import ThreadedPGConnection
+from util.entity_cache import (
+    clear_entity_caches,
+    configure_entity_caches,
+    invalidate_entity,
+)
+from util.existence_cache import (
+    clear_existence_caches,
+    configure_existence_caches,
+    record_existing_id,
+)
+from util.hydration import HydrationUtil
+from util.response_cache import InProcessCacheBackend, response_cache
+from util.sql_template_cache import SqlTemplateCache
+from util.table_change_listener import TableChangeListener
 
 
 class ConfigurationIssue:
@@ -14,13 +32,35 @@ class ConfigurationIssue:
 
 
 class Configuration:
-    pg_connection = PGConnection()
+    pg_connection: ThreadedPGConnection | AsyncPGConnection
+    table_change_listener: TableChangeListener | None = None
 
+    DATABASE_ENGINE: str
     DATABASE_HOST: str
     DATABASE_PORT: str
     DATABASE_USERNAME: str
     DATABASE_PASSWORD: str
     DATABASE_NAME: str
+    DATABASE_POOL_MIN_SIZE: int
+    DATABASE_POOL_MAX_SIZE: int
+    DATABASE_POOL_TIMEOUT_SECONDS: float
+    DATABASE_STREAM_ITERSIZE: int
+    DATABASE_SQL_CACHE_SIZE: int
+    DATABASE_PREPARED_STATEMENTS_MAX: int
+    HYDRATION_PARALLEL_CONNECTIONS: int
+    ENTITY_CACHE_MAX_SIZE: int
+    ENTITY_CACHE_TTL_SECONDS: float
+    ENTITY_CACHE_LISTEN: bool
+    EXISTENCE_CACHE_MAX_SIZE: int
+    EXISTENCE_CACHE_TTL_SECONDS: float
+    RESPONSE_CACHE_BACKEND: str
+    RESPONSE_CACHE_MAX_SIZE: int
+    RESPONSE_CACHE_TTL_SECONDS: int
+    RESPONSE_CACHE_REDIS_URL: str
+    COMPRESSION_ENCODINGS: list[str]
+    COMPRESSION_MINIMUM_SIZE: int
+    COMPRESSION_GZIP_LEVEL: int
+    COMPRESSION_BROTLI_QUALITY: int
 
     BASE_URL: str
 
@@ -31,11 +71,44 @@ class Configuration:
             print(f"Loading configuration from file at {config_path}")
             load_dotenv(config_path)
             # Debug: print environment variables
+            print(f"DATABASE_ENGINE={os.getenv('DATABASE_ENGINE')}")
             print(f"DATABASE_HOST={os.getenv('DATABASE_HOST')}")
             print(f"DATABASE_PORT={os.getenv('DATABASE_PORT')}")
             print(f"DATABASE_USERNAME={os.getenv('DATABASE_USERNAME')}")
             print(f"DATABASE_PASSWORD={os.getenv('DATABASE_PASSWORD')}")
             print(f"DATABASE_NAME={os.getenv('DATABASE_NAME')}")
+            print(f"DATABASE_POOL_MIN_SIZE={os.getenv('DATABASE_POOL_MIN_SIZE')}")
+            print(f"DATABASE_POOL_MAX_SIZE={os.getenv('DATABASE_POOL_MAX_SIZE')}")
+            print(
+                f"DATABASE_POOL_TIMEOUT_SECONDS={os.getenv('DATABASE_POOL_TIMEOUT_SECONDS')}"
+            )
+            print(f"DATABASE_STREAM_ITERSIZE={os.getenv('DATABASE_STREAM_ITERSIZE')}")
+            print(f"DATABASE_SQL_CACHE_SIZE={os.getenv('DATABASE_SQL_CACHE_SIZE')}")
+            print(
+                f"DATABASE_PREPARED_STATEMENTS_MAX={os.getenv('DATABASE_PREPARED_STATEMENTS_MAX')}"
+            )
+            print(
+                f"HYDRATION_PARALLEL_CONNECTIONS={os.getenv('HYDRATION_PARALLEL_CONNECTIONS')}"
+            )
+            print(f"ENTITY_CACHE_MAX_SIZE={os.getenv('ENTITY_CACHE_MAX_SIZE')}")
+            print(f"ENTITY_CACHE_TTL_SECONDS={os.getenv('ENTITY_CACHE_TTL_SECONDS')}")
+            print(f"ENTITY_CACHE_LISTEN={os.getenv('ENTITY_CACHE_LISTEN')}")
+            print(f"EXISTENCE_CACHE_MAX_SIZE={os.getenv('EXISTENCE_CACHE_MAX_SIZE')}")
+            print(
+                f"EXISTENCE_CACHE_TTL_SECONDS={os.getenv('EXISTENCE_CACHE_TTL_SECONDS')}"
+            )
+            print(f"RESPONSE_CACHE_BACKEND={os.getenv('RESPONSE_CACHE_BACKEND')}")
+            print(f"RESPONSE_CACHE_MAX_SIZE={os.getenv('RESPONSE_CACHE_MAX_SIZE')}")
+            print(
+                f"RESPONSE_CACHE_TTL_SECONDS={os.getenv('RESPONSE_CACHE_TTL_SECONDS')}"
+            )
+            print(f"RESPONSE_CACHE_REDIS_URL={os.getenv('RESPONSE_CACHE_REDIS_URL')}")
+            print(f"COMPRESSION_ENCODINGS={os.getenv('COMPRESSION_ENCODINGS')}")
+            print(f"COMPRESSION_MINIMUM_SIZE={os.getenv('COMPRESSION_MINIMUM_SIZE')}")
+            print(f"COMPRESSION_GZIP_LEVEL={os.getenv('COMPRESSION_GZIP_LEVEL')}")
+            print(
+                f"COMPRESSION_BROTLI_QUALITY={os.getenv('COMPRESSION_BROTLI_QUALITY')}"
+            )
             print(f"BASE_URL={os.getenv('BASE_URL')}")
 
             print(f"STAGE={os.getenv('STAGE')}")
@@ -90,15 +163,198 @@ class Configuration:
         self.DATABASE_NAME = os.getenv("DATABASE_NAME") or ""
         self.STAGE = os.getenv("STAGE") or ""
 
+        # Optional. "sync" runs psycopg2 on the threadpool, "async" uses psycopg 3.
+        self.DATABASE_ENGINE = os.getenv("DATABASE_ENGINE") or "sync"
+
+        if self.DATABASE_ENGINE not in ["sync", "async"]:
+            raise Exception(
+                f"DATABASE_ENGINE must be 'sync' or 'async', received '{self.DATABASE_ENGINE}'."
+            )
+
+        # Optional. Connection pool bounds and how long a request waits for a free
+        # connection before failing.
+        self.DATABASE_POOL_MIN_SIZE = int(os.getenv("DATABASE_POOL_MIN_SIZE") or 2)
+        self.DATABASE_POOL_MAX_SIZE = int(os.getenv("DATABASE_POOL_MAX_SIZE") or 50)
+        self.DATABASE_POOL_TIMEOUT_SECONDS = float(
+            os.getenv("DATABASE_POOL_TIMEOUT_SECONDS") or 30
+        )
+
+        # Optional. Rows fetched per round trip when streaming unpaged reads.
+        self.DATABASE_STREAM_ITERSIZE = int(
+            os.getenv("DATABASE_STREAM_ITERSIZE") or 2000
+        )
+
+        # Optional. Compiled SQL templates kept in memory, and prepared statements kept
+        # per connection. 0 prepared statements turns preparing off.
+        self.DATABASE_SQL_CACHE_SIZE = int(os.getenv("DATABASE_SQL_CACHE_SIZE") or 512)
+        self.DATABASE_PREPARED_STATEMENTS_MAX = int(
+            os.getenv("DATABASE_PREPARED_STATEMENTS_MAX") or 256
+        )
+
+        # Optional. Pooled connections hydration may borrow at once to load independent
+        # targets in parallel. 0 keeps all hydration on the request's connection.
+        self.HYDRATION_PARALLEL_CONNECTIONS = int(
+            os.getenv("HYDRATION_PARALLEL_CONNECTIONS") or 4
+        )
+
+        # Optional. Venues, seasons, fantasy leagues and league teams cached in memory
+        # per entity type, and how long each is trusted. 0 entries turns caching off.
+        self.ENTITY_CACHE_MAX_SIZE = int(os.getenv("ENTITY_CACHE_MAX_SIZE") or 1024)
+        self.ENTITY_CACHE_TTL_SECONDS = float(
+            os.getenv("ENTITY_CACHE_TTL_SECONDS") or 300
+        )
+
+        # Optional. Evict cached entities written by other instances as the database
+        # notifies their changes. Cached entities are only served while the listener
+        # is current, "false" trusts them for ENTITY_CACHE_TTL_SECONDS instead.
+        self.ENTITY_CACHE_LISTEN = (
+            os.getenv("ENTITY_CACHE_LISTEN") or "true"
+        ).lower() != "false"
+
+        configure_entity_caches(
+            self.ENTITY_CACHE_MAX_SIZE,
+            self.ENTITY_CACHE_TTL_SECONDS,
+            self.is_entity_cache_current,
+        )
+
+        # Optional. Parent ids found missing while validating a create, remembered per
+        # table so repeated requests naming them skip the lookup. 0 entries turns it off.
+        self.EXISTENCE_CACHE_MAX_SIZE = int(
+            os.getenv("EXISTENCE_CACHE_MAX_SIZE") or 4096
+        )
+        self.EXISTENCE_CACHE_TTL_SECONDS = float(
+            os.getenv("EXISTENCE_CACHE_TTL_SECONDS") or 10
+        )
+
+        configure_existence_caches(
+            self.EXISTENCE_CACHE_MAX_SIZE, self.EXISTENCE_CACHE_TTL_SECONDS
+        )
+
+        # Optional. Where rendered search responses are cached: "none", "memory" for
+        # an LRU per instance, or "redis" to share one between instances.
+        self.RESPONSE_CACHE_BACKEND = os.getenv("RESPONSE_CACHE_BACKEND") or "none"
+
+        if self.RESPONSE_CACHE_BACKEND not in ["none", "memory", "redis"]:
+            raise Exception(
+                f"RESPONSE_CACHE_BACKEND must be 'none', 'memory' or 'redis', received '{self.RESPONSE_CACHE_BACKEND}'."
+            )
+
+        self.RESPONSE_CACHE_MAX_SIZE = int(os.getenv("RESPONSE_CACHE_MAX_SIZE") or 1024)
+        self.RESPONSE_CACHE_TTL_SECONDS = int(
+            os.getenv("RESPONSE_CACHE_TTL_SECONDS") or 30
+        )
+        self.RESPONSE_CACHE_REDIS_URL = os.getenv("RESPONSE_CACHE_REDIS_URL") or ""
+
+        self.setup_response_cache()
+
+        # Optional. Comma delimited content codings responses may be compressed with,
+        # most preferred first, "none" turns compression off. Bodies under the minimum
+        # size go out as is.
+        compression_encodings = os.getenv("COMPRESSION_ENCODINGS") or "br,gzip"
+        self.COMPRESSION_ENCODINGS = [
+            encoding.strip()
+            for encoding in compression_encodings.split(",")
+            if encoding.strip() not in ["", "none"]
+        ]
+        self.COMPRESSION_MINIMUM_SIZE = int(
+            os.getenv("COMPRESSION_MINIMUM_SIZE") or 1024
+        )
+        # gzip levels run 1 to 9, brotli qualities 0 to 11.
+        self.COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL") or 6)
+        self.COMPRESSION_BROTLI_QUALITY = int(
+            os.getenv("COMPRESSION_BROTLI_QUALITY") or 4
+        )
+
+    def is_table_change_listener_current(self) -> bool:
+        return (
+            self.table_change_listener is not None
+            and self.table_change_listener.is_current()
+        )
+
+    def is_entity_cache_current(self) -> bool:
+        return not self.ENTITY_CACHE_LISTEN or self.is_table_change_listener_current()
+
+    def handle_table_change(self, table_name: str, id: UUID) -> None:
+        invalidate_entity(table_name, id)
+        record_existing_id(table_name, id)
+
+        # A shared backend was already invalidated by the instance that wrote.
+        if self.RESPONSE_CACHE_BACKEND == "memory":
+            response_cache.invalidate_table_change(table_name)
+
+    def handle_table_change_reset(self) -> None:
+        clear_entity_caches()
+        clear_existence_caches()
+
+    def setup_response_cache(self):
+        if self.RESPONSE_CACHE_BACKEND == "memory":
+            response_cache.configure(
+                InProcessCacheBackend(self.RESPONSE_CACHE_MAX_SIZE),
+                self.RESPONSE_CACHE_TTL_SECONDS,
+            )
+        elif self.RESPONSE_CACHE_BACKEND == "redis":
+            # Only needed when configured, redis is not in requirements.txt.
+            import redis
+
+            response_cache.configure(
+                redis.Redis.from_url(self.RESPONSE_CACHE_REDIS_URL),
+                self.RESPONSE_CACHE_TTL_SECONDS,
+                offload=True,
+            )
+        else:
+            response_cache.configure(None, self.RESPONSE_CACHE_TTL_SECONDS)
+
     def setup_pg_connection_pool(self):
+        if self.DATABASE_ENGINE == "async":
+            self.pg_connection = AsyncPGConnection()
+        else:
+            self.pg_connection = ThreadedPGConnection()
+
         self.pg_connection.create_connection_pool(
             host=self.DATABASE_HOST,
             port=self.DATABASE_PORT,
             database=self.DATABASE_NAME,
             username=self.DATABASE_USERNAME,
             password=self.DATABASE_PASSWORD,
+            min_size=self.DATABASE_POOL_MIN_SIZE,
+            max_size=self.DATABASE_POOL_MAX_SIZE,
+            timeout_seconds=self.DATABASE_POOL_TIMEOUT_SECONDS,
         )
 
+        self.pg_connection.stream_itersize = self.DATABASE_STREAM_ITERSIZE
+        self.pg_connection.sql_template_cache = SqlTemplateCache(
+            self.DATABASE_SQL_CACHE_SIZE
+        )
+        self.pg_connection.prepared_statements_max = (
+            self.DATABASE_PREPARED_STATEMENTS_MAX
+        )
+
+        HydrationUtil.parallel_branches = asyncio.Semaphore(
+            self.HYDRATION_PARALLEL_CONNECTIONS
+        )
+
+        if (
+            self.ENTITY_CACHE_LISTEN
+            and (
+                self.ENTITY_CACHE_MAX_SIZE > 0
+                or self.EXISTENCE_CACHE_MAX_SIZE > 0
+                or self.RESPONSE_CACHE_BACKEND == "memory"
+            )
+            and self.table_change_listener is None
+        ):
+            self.table_change_listener = TableChangeListener(
+                connection_factory=lambda: psycopg2.connect(
+                    user=self.DATABASE_USERNAME,
+                    password=self.DATABASE_PASSWORD,
+                    host=self.DATABASE_HOST,
+                    port=self.DATABASE_PORT,
+                    database=self.DATABASE_NAME,
+                ),
+                on_change=self.handle_table_change,
+                on_reset=self.handle_table_change_reset,
+            )
+            self.table_change_listener.start()
+
 
 def get_global_configuration():
     return cast(Configuration, globals()["configuration"])
@@ -0,0 +1,241 @@
+import threading
+import time
+from collections import deque
+from typing import Any, Callable
+
+import psycopg2
+import psycopg2.extensions
+import psycopg2.pool
+
+
+class PoolTimeoutError(psycopg2.pool.PoolError):
+    pass
+
+
+class InstrumentedConnectionPool:
+    """
+    Thread-safe, bounded psycopg2 connection pool.
+
+    Connections stay open between checkouts and are handed out most recently returned
+    first. A connection that sat idle for longer than health_check_after_seconds is
+    pinged before it is handed out, broken ones are replaced. Callers wait up to
+    timeout_seconds for a free connection when the pool is at max_size.
+    """
+
+    def __init__(
+        self,
+        connection_factory: Callable[[], psycopg2.extensions.connection],
+        min_size: int = 2,
+        max_size: int = 50,
+        timeout_seconds: float = 30.0,
+        health_check_after_seconds: float = 30.0,
+    ) -> None:
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError(
+                f"Invalid pool bounds min_size={min_size} max_size={max_size}."
+            )
+
+        self.connection_factory = connection_factory
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout_seconds = timeout_seconds
+        self.health_check_after_seconds = health_check_after_seconds
+
+        self.condition = threading.Condition()
+        self.idle: deque[tuple[psycopg2.extensions.connection, float]] = deque()
+        self.in_use: dict[int, psycopg2.extensions.connection] = {}
+        self.size = 0
+        self.closed = False
+
+        self.requests_waiting = 0
+        self.requests_num = 0
+        self.requests_errors = 0
+        self.requests_wait_seconds = 0.0
+        self.requests_wait_max_seconds = 0.0
+        self.connections_num = 0
+        self.connections_lost = 0
+
+        for _ in range(min_size):
+            with self.condition:
+                self.size += 1
+
+            self.idle.append((self.connect(), time.monotonic()))
+
+    def connect(self) -> psycopg2.extensions.connection:
+        try:
+            conn = self.connection_factory()
+        except Exception as e:
+            with self.condition:
+                self.size -= 1
+                self.condition.notify()
+            raise e
+
+        with self.condition:
+            self.connections_num += 1
+
+        return conn
+
+    def is_healthy(
+        self, conn: psycopg2.extensions.connection, idle_since: float
+    ) -> bool:
+        if conn.closed:
+            return False
+
+        if time.monotonic() - idle_since < self.health_check_after_seconds:
+            return True
+
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT 1")
+            conn.rollback()
+        except psycopg2.Error:
+            return False
+
+        return True
+
+    def discard(self, conn: psycopg2.extensions.connection) -> None:
+        try:
+            conn.close()
+        except psycopg2.Error:
+            pass
+
+    def getconn(
+        self, timeout_seconds: float | None = None
+    ) -> psycopg2.extensions.connection:
+        timeout_seconds = (
+            self.timeout_seconds if timeout_seconds is None else timeout_seconds
+        )
+
+        started = time.monotonic()
+        deadline = started + timeout_seconds
+        idle_entry: tuple[psycopg2.extensions.connection, float] | None = None
+
+        with self.condition:
+            if self.closed:
+                raise psycopg2.pool.PoolError("connection pool is closed")
+
+            self.requests_waiting += 1
+
+            try:
+                while True:
+                    if len(self.idle) > 0:
+                        idle_entry = self.idle.pop()
+                        break
+
+                    if self.size < self.max_size:
+                        # Reserve the slot now, the handshake happens outside the lock.
+                        self.size += 1
+                        break
+
+                    remaining = deadline - time.monotonic()
+
+                    if remaining <= 0:
+                        # A caller that would not wait has not failed.
+                        if timeout_seconds > 0:
+                            self.requests_errors += 1
+
+                        raise PoolTimeoutError(
+                            f"Could not get a connection within {timeout_seconds}s, "
+                            f"all {self.max_size} connections are in use."
+                        )
+
+                    self.condition.wait(remaining)
+            finally:
+                self.requests_waiting -= 1
+
+            waited = time.monotonic() - started
+            self.requests_num += 1
+            self.requests_wait_seconds += waited
+            self.requests_wait_max_seconds = max(self.requests_wait_max_seconds, waited)
+
+        if idle_entry is None:
+            conn = self.connect()
+        else:
+            conn, idle_since = idle_entry
+
+            if not self.is_healthy(conn, idle_since):
+                self.discard(conn)
+
+                with self.condition:
+                    self.connections_lost += 1
+
+                conn = self.connect()
+
+        with self.condition:
+            self.in_use[id(conn)] = conn
+
+        return conn
+
+    def putconn(
+        self, conn: psycopg2.extensions.connection, close: bool = False
+    ) -> None:
+        with self.condition:
+            if self.in_use.pop(id(conn), None) is None:
+                raise psycopg2.pool.PoolError("trying to put unkeyed connection")
+
+        keep = not (close or self.closed or conn.closed)
+
+        if keep:
+            status = conn.get_transaction_status()
+
+            if status == psycopg2.extensions.TRANSACTION_STATUS_UNKNOWN:
+                keep = False
+            elif status != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+                try:
+                    conn.rollback()
+                except psycopg2.Error:
+                    keep = False
+
+        if not keep:
+            self.discard(conn)
+
+        with self.condition:
+            if keep:
+                self.idle.append((conn, time.monotonic()))
+            else:
+                self.size -= 1
+
+                if not close and not self.closed:
+                    self.connections_lost += 1
+
+            self.condition.notify()
+
+    def closeall(self) -> None:
+        with self.condition:
+            self.closed = True
+            idle = list(self.idle)
+            self.idle.clear()
+            self.size -= len(idle)
+            self.condition.notify_all()
+
+        for conn, _ in idle:
+            self.discard(conn)
+
+    def record_wait(self, seconds: float, timed_out: bool = False) -> None:
+        # For callers that queue for a connection before calling getconn.
+        with self.condition:
+            self.requests_wait_seconds += seconds
+            self.requests_wait_max_seconds = max(
+                self.requests_wait_max_seconds, seconds
+            )
+
+            if timed_out:
+                self.requests_errors += 1
+
+    def get_stats(self) -> dict[str, Any]:
+        # Key names follow psycopg_pool's get_stats so both engines report alike.
+        with self.condition:
+            return {
+                "pool_min": self.min_size,
+                "pool_max": self.max_size,
+                "pool_size": self.size,
+                "pool_available": len(self.idle),
+                "pool_in_use": len(self.in_use),
+                "requests_waiting": self.requests_waiting,
+                "requests_num": self.requests_num,
+                "requests_errors": self.requests_errors,
+                "requests_wait_ms": round(self.requests_wait_seconds * 1000),
+                "requests_wait_max_ms": round(self.requests_wait_max_seconds * 1000),
+                "connections_num": self.connections_num,
+                "connections_lost": self.connections_lost,
+            }
@@ -0,0 +1,147 @@
+import threading
+
+import psycopg2
+import psycopg2.extensions
+import pytest
+
+from util.connection_pool import InstrumentedConnectionPool, PoolTimeoutError
+
+
+class FakeCursor:
+    def __init__(self, connection: "FakeConnection") -> None:
+        self.connection = connection
+
+    def execute(self, sql: str) -> None:
+        if self.connection.broken:
+            raise psycopg2.OperationalError("server closed the connection")
+
+        self.connection.pings += 1
+
+
+class FakeConnection:
+    def __init__(self) -> None:
+        self.closed = 0
+        self.broken = False
+        self.pings = 0
+        self.rollbacks = 0
+        self.transaction_status = psycopg2.extensions.TRANSACTION_STATUS_IDLE
+
+    def cursor(self) -> FakeCursor:
+        return FakeCursor(self)
+
+    def rollback(self) -> None:
+        self.rollbacks += 1
+        self.transaction_status = psycopg2.extensions.TRANSACTION_STATUS_IDLE
+
+    def close(self) -> None:
+        self.closed = 1
+
+    def get_transaction_status(self) -> int:
+        return self.transaction_status
+
+
+def create_pool(**kwargs) -> tuple[InstrumentedConnectionPool, list[FakeConnection]]:
+    created: list[FakeConnection] = []
+
+    def factory() -> FakeConnection:
+        conn = FakeConnection()
+        created.append(conn)
+        return conn
+
+    return InstrumentedConnectionPool(factory, **kwargs), created
+
+
+def test_reuses_returned_connections():
+    pool, created = create_pool(min_size=1, max_size=5)
+
+    for _ in range(10):
+        conn = pool.getconn()
+        pool.putconn(conn)
+
+    stats = pool.get_stats()
+
+    assert len(created) == 1
+    assert created[0].closed == 0
+    assert stats["connections_num"] == 1
+    assert stats["requests_num"] == 10
+    assert stats["pool_in_use"] == 0
+    assert stats["pool_available"] == 1
+
+
+def test_opens_connections_up_to_max_size():
+    pool, created = create_pool(min_size=0, max_size=3)
+
+    conns = [pool.getconn() for _ in range(3)]
+
+    assert len(created) == 3
+    assert pool.get_stats()["pool_in_use"] == 3
+
+    with pytest.raises(PoolTimeoutError):
+        pool.getconn(timeout_seconds=0.05)
+
+    assert pool.get_stats()["requests_errors"] == 1
+
+    for conn in conns:
+        pool.putconn(conn)
+
+
+def test_waiter_gets_returned_connection():
+    pool, _ = create_pool(min_size=1, max_size=1)
+
+    held = pool.getconn()
+    received: list[FakeConnection] = []
+
+    waiter = threading.Thread(target=lambda: received.append(pool.getconn()))
+    waiter.start()
+
+    pool.putconn(held)
+    waiter.join(timeout=5)
+
+    assert received == [held]
+    assert pool.get_stats()["requests_wait_max_ms"] >= 0
+
+
+def test_replaces_broken_connection_on_checkout():
+    pool, created = create_pool(min_size=1, max_size=1, health_check_after_seconds=0)
+
+    created[0].broken = True
+
+    conn = pool.getconn()
+
+    assert conn is created[1]
+    assert created[0].closed == 1
+    assert pool.get_stats()["connections_lost"] == 1
+    assert pool.get_stats()["pool_size"] == 1
+
+
+def test_skips_health_check_for_recently_used_connection():
+    pool, created = create_pool(min_size=1, max_size=1)
+
+    pool.putconn(pool.getconn())
+    pool.getconn()
+
+    assert created[0].pings == 0
+
+
+def test_rolls_back_connection_returned_mid_transaction():
+    pool, created = create_pool(min_size=1, max_size=1)
+
+    conn = pool.getconn()
+    conn.transaction_status = psycopg2.extensions.TRANSACTION_STATUS_INTRANS
+    pool.putconn(conn)
+
+    assert created[0].rollbacks == 1
+    assert pool.get_stats()["pool_available"] == 1
+
+
+def test_drops_closed_connection_on_return():
+    pool, _ = create_pool(min_size=1, max_size=2)
+
+    conn = pool.getconn()
+    conn.close()
+    pool.putconn(conn)
+
+    stats = pool.get_stats()
+
+    assert stats["pool_size"] == 0
+    assert stats["pool_available"] == 0
@@ -1,6 +1,10 @@
 from abc import abstractmethod
+import base64
+import binascii
 from datetime import datetime
 from enum import Enum
+import json
+import re
 from typing import Any, Generic, TypeVar
 from uuid import UUID
 
@@ -9,6 +13,74 @@ TRangeSearchable = TypeVar('TRangeSearchable', str, int, float, datetime)
 TListSearchable = TypeVar('TListSearchable', str, int, float, UUID)
 
 
+class CountModes(Enum):
+    Exact = 'exact'
+    Estimate = 'estimate'
+    NoCount = 'none'
+
+
+class PagingCursor:
+    '''
+    Position of the last row of a keyset page: the sort it was read with, that row's
+    sort column value and its id. Handed to clients as an opaque string.
+    '''
+
+    sort_by_pattern = re.compile(r'^[a-z_][a-z0-9_]*$')
+    timestamp_columns = {'created_at', 'updated_at'}
+
+    def __init__(
+        self,
+        sort_by: str,
+        is_sort_descending: bool,
+        last_value: Any,
+        last_id: str,
+    ) -> None:
+
+        self.sort_by = sort_by
+        self.is_sort_descending = is_sort_descending
+        self.last_value = last_value
+        self.last_id = last_id
+
+    def encode(self) -> str:
+        payload = json.dumps(
+            [self.sort_by, self.is_sort_descending, self.last_value, self.last_id],
+            default=str,
+            separators=(',', ':'),
+        )
+
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+    @staticmethod
+    def decode(value: str) -> 'PagingCursor':
+        try:
+            padded = value + '=' * (-len(value) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            sort_by, is_sort_descending, last_value, last_id = payload
+            UUID(last_id)
+        except (binascii.Error, ValueError, TypeError, AttributeError):
+            raise ValueError('Cursor is malformed.')
+
+        if (not isinstance(sort_by, str)
+                or PagingCursor.sort_by_pattern.match(sort_by) is None
+                or not isinstance(is_sort_descending, bool)):
+            raise ValueError('Cursor is malformed.')
+
+        # The value is bound against the sort column, one Postgres can't cast fails
+        # the query instead of the cursor.
+        if last_value is not None:
+            if (isinstance(last_value, bool)
+                    or not isinstance(last_value, (str, int, float))):
+                raise ValueError('Cursor is malformed.')
+
+            if sort_by in PagingCursor.timestamp_columns:
+                try:
+                    datetime.fromisoformat(last_value)
+                except (ValueError, TypeError):
+                    raise ValueError('Cursor is malformed.')
+
+        return PagingCursor(sort_by, is_sort_descending, last_value, last_id)
+
+
 class PagingModel:
 
     def __init__(
@@ -17,23 +89,33 @@ class PagingModel:
         page_length: int | None = None,
         sort_by: str | None = None,
         is_sort_descending: bool | None = None,
+        use_cursor: bool = False,
+        cursor: PagingCursor | None = None,
+        count_mode: CountModes | None = None,
     ) -> None:
 
         self.page = page
         self.page_length = page_length
         self.sort_by = sort_by
         self.is_sort_descending = is_sort_descending
+        # Keyset paging: seek past the cursor instead of skipping rows with OFFSET.
+        self.use_cursor = use_cursor or cursor is not None
+        self.cursor = cursor
+        # Defaults to exact for offset paging and none for cursor paging.
+        self.count_mode = count_mode
 
 
 class ResultantPagingModel:
 
     def __init__(
         self,
-        page: int,
+        page: int | None,
         page_length: int,
         sort_by: str,
         is_sort_descending: bool,
         total_record_count: int | None = None,
+        next_cursor: str | None = None,
+        count_mode: CountModes = CountModes.Exact,
     ) -> None:
 
         self.page = page
@@ -41,6 +123,8 @@ class ResultantPagingModel:
         self.sort_by = sort_by
         self.is_sort_descending = is_sort_descending
         self.total_record_count = total_record_count
+        self.next_cursor = next_cursor
+        self.count_mode = count_mode
 
 
 class LikeComparatorModes(Enum):
@@ -58,6 +142,19 @@ class SearchTerm:
     ):
         raise NotImplementedError()
 
+    @abstractmethod
+    def get_template_key(self) -> tuple[Any, ...]:
+        # Everything generate_sql's text depends on, none of the bound values.
+        raise NotImplementedError()
+
+    @abstractmethod
+    def bind_parameters(
+        self,
+        parameters: dict[str,Any]
+    ) -> None:
+        # Adds the values generate_sql would have bound, without building the SQL.
+        raise NotImplementedError()
+
     def __init__(self, column_name) -> None:
         self.column_name = column_name
 
@@ -81,10 +178,20 @@ class ExactMatchSearchTerm(SearchTerm, Generic[T]):
         else:
             sqlstring = f"{self.column_name} = %({self.column_name})s"
 
-        parameters[self.column_name] = self.value
+        self.bind_parameters(parameters)
         
         return sqlstring
 
+    def get_template_key(self) -> tuple[Any, ...]:
+        return (
+            'exact', self.column_name, self.ignore_case and isinstance(self.value, str))
+
+    def bind_parameters(
+        self,
+        parameters: dict[str,Any]
+    ) -> None:
+        parameters[self.column_name] = self.value
+
 
 class LikeSearchTerm(SearchTerm):
 
@@ -107,9 +214,27 @@ class LikeSearchTerm(SearchTerm):
     ) -> str:
         
         sqlstring: str = ''
-        sql_value_string = ''
         sql_command_string = ''
 
+        # command
+        sql_command_string = 'ILIKE' if self.ignore_case else 'LIKE'
+
+        sqlstring = (
+            f"{self.column_name} {sql_command_string} %({self.column_name})s")
+
+        self.bind_parameters(parameters)
+        
+        return sqlstring
+
+    def get_template_key(self) -> tuple[Any, ...]:
+        return ('like', self.column_name, self.ignore_case)
+
+    def bind_parameters(
+        self,
+        parameters: dict[str,Any]
+    ) -> None:
+        sql_value_string = ''
+
         # value
         if self.comparator_mode == LikeComparatorModes.Like:
             sql_value_string = f'%{self.value}%'
@@ -120,36 +245,56 @@ class LikeSearchTerm(SearchTerm):
         elif self.comparator_mode == LikeComparatorModes.EndsWith:
             sql_value_string = f'%{self.value}'
 
-        # command
-        sql_command_string = 'ILIKE' if self.ignore_case else 'LIKE'
+        parameters[self.column_name] = sql_value_string
 
-        sqlstring = (
-            f"{self.column_name} {sql_command_string} %({self.column_name})s")
 
-        parameters[self.column_name] = sql_value_string
-        
-        return sqlstring
+def convert_to_array_literal(values: list[Any]) -> str:
+    # Postgres array literal with every element quoted, e.g. {"a","b"}.
+    elements = [
+        '"' + str(value).replace('\\', '\\\\').replace('"', '\\"') + '"'
+        for value in values
+    ]
+
+    return '{' + ','.join(elements) + '}'
 
 
 class InListSearchTerm(SearchTerm, Generic[TListSearchable]):
+    '''
+    Matches any value in value_list. With an array_type (e.g. 'uuid') the whole list
+    is bound as one array parameter, col = ANY(%(col)s::uuid[]), so the SQL is the
+    same for every list length. Without one, each value gets its own placeholder.
+    '''
 
     def __init__(
         self,
         column_name,
         value_list: list[TListSearchable] = [],
         ignore_case=False,
+        array_type: str | None = None,
     ) -> None:
         super().__init__(column_name)
 
         self.value_list = value_list
         self.ignore_case = ignore_case
+        self.array_type = array_type
 
     def generate_sql(
         self,
         parameters: dict[str,Any]
     ):
 
-        if(len(self.value_list) == 0):
+        if self.array_type is not None:
+            # Bound as a literal rather than a list: psycopg2 sends lists as text[],
+            # which a prepared uuid[] parameter will not accept.
+            array_type = 'text' if self.ignore_case else self.array_type
+
+            sqlstring = (
+                f'LOWER({self.column_name})' if self.ignore_case else self.column_name)
+            sqlstring += f' = ANY(%({self.column_name})s::{array_type}[])'
+
+            self.bind_parameters(parameters)
+
+        elif(len(self.value_list) == 0):
             sqlstring = f'{self.column_name} in (NULL)'
         else: 
             
@@ -164,12 +309,29 @@ class InListSearchTerm(SearchTerm, Generic[TListSearchable]):
 
             sqlstring += ')'
 
-            # Parameters
-            for i, value in enumerate(self.value_list):
-                parameters[self.column_name + "__" + str(i)] = self.value_list[i]
+            self.bind_parameters(parameters)
         
         return sqlstring
 
+    def get_template_key(self) -> tuple[Any, ...]:
+        if self.array_type is not None:
+            return ('in_array', self.column_name, self.ignore_case, self.array_type)
+
+        return ('in_list', self.column_name, self.ignore_case, len(self.value_list))
+
+    def bind_parameters(
+        self,
+        parameters: dict[str,Any]
+    ) -> None:
+        if self.array_type is not None:
+            parameters[self.column_name] = convert_to_array_literal(
+                [str(value).lower() if self.ignore_case else value
+                 for value in self.value_list])
+            return
+
+        for i, value in enumerate(self.value_list):
+            parameters[self.column_name + "__" + str(i)] = self.value_list[i]
+
 
 class RangeSearchTerm(SearchTerm, Generic[TRangeSearchable]):
 
@@ -211,10 +373,24 @@ class RangeSearchTerm(SearchTerm, Generic[TRangeSearchable]):
         elif value_max_sql is not None:
             sqlstring += f'{column_sql} <= {value_max_sql}'
 
-        # parameters
-        if(value_min_sql is not None):
-            parameters[self.column_name + "__min"] = self.value_min
-        if(value_max_sql is not None):
-            parameters[self.column_name + "__max"] = self.value_max
+        self.bind_parameters(parameters)
             
         return sqlstring
+
+    def get_template_key(self) -> tuple[Any, ...]:
+        return (
+            'range',
+            self.column_name,
+            self.ignore_case,
+            self.value_min is None,
+            self.value_max is None,
+        )
+
+    def bind_parameters(
+        self,
+        parameters: dict[str,Any]
+    ) -> None:
+        if(self.value_min is not None):
+            parameters[self.column_name + "__min"] = self.value_min
+        if(self.value_max is not None):
+            parameters[self.column_name + "__max"] = self.value_max
@@ -1,9 +1,12 @@
 from typing import Any, LiteralString
 from util.database import (
+    CountModes,
     ExactMatchSearchTerm,
     InListSearchTerm,
     LikeComparatorModes,
     LikeSearchTerm,
+    PagingCursor,
+    PagingModel,
     RangeSearchTerm,
 )
 from util.db_connection import PGConnection
@@ -172,3 +175,244 @@ def test_range_search_term_generates_sql_both_min_max_ignore_case():
     result_sqlstring = search_term.generate_sql()
 
     assert expected_sqlstring == result_sqlstring
+
+
+def test_paging_cursor_round_trips():
+    cursor = PagingCursor(
+        "created_at",
+        True,
+        "2024-10-31 01:30:00.123000+00:00",
+        "8b5f1c8e-3c55-4b2e-9f3a-2d9b0c1e7a10",
+    )
+
+    result = PagingCursor.decode(cursor.encode())
+
+    assert result.sort_by == "created_at"
+    assert result.is_sort_descending == True
+    assert result.last_value == "2024-10-31 01:30:00.123000+00:00"
+    assert result.last_id == "8b5f1c8e-3c55-4b2e-9f3a-2d9b0c1e7a10"
+
+
+def test_paging_cursor_rejects_malformed_values():
+    unsafe_sort = PagingCursor(
+        "created_at; DROP TABLE users", False, 1, "8b5f1c8e-3c55-4b2e-9f3a-2d9b0c1e7a10"
+    )
+
+    not_a_date = PagingCursor(
+        "created_at", False, "notadate", "8b5f1c8e-3c55-4b2e-9f3a-2d9b0c1e7a10"
+    )
+    not_a_scalar = PagingCursor(
+        "name", False, ["Alice"], "8b5f1c8e-3c55-4b2e-9f3a-2d9b0c1e7a10"
+    )
+
+    for value in [
+        "not a cursor",
+        "",
+        unsafe_sort.encode(),
+        not_a_date.encode(),
+        not_a_scalar.encode(),
+    ]:
+        try:
+            PagingCursor.decode(value)
+            assert False
+        except ValueError:
+            pass
+
+
+def test_build_select_query_seeks_past_cursor():
+    connection = PGConnection()
+
+    cursor = PagingCursor(
+        "name", False, "Alice", "8b5f1c8e-3c55-4b2e-9f3a-2d9b0c1e7a10"
+    )
+
+    results = connection.build_select_query(
+        "league_players",
+        [],
+        PagingModel(page_length=10, cursor=cursor),
+    )
+
+    assert results.sql_string_and_parameters.sql_string == (
+        "SELECT * FROM league_players\n"
+        "WHERE\n"
+        "((name, id) > (%(_cursor_value_)s, %(_cursor_id_)s) OR name IS NULL)\n"
+        "ORDER BY name, id\n"
+        "LIMIT %(_limit_)s;"
+    )
+    assert results.sql_string_and_parameters.parameters == {
+        "_cursor_value_": "Alice",
+        "_cursor_id_": "8b5f1c8e-3c55-4b2e-9f3a-2d9b0c1e7a10",
+        "_limit_": 11,
+    }
+    assert results.paging.page is None
+    assert results.use_cursor == True
+
+
+def test_build_select_query_estimates_count_with_explain():
+    connection = PGConnection()
+
+    results = connection.build_select_query(
+        "league_players",
+        [],
+        PagingModel(page=2, page_length=10, count_mode=CountModes.Estimate),
+    )
+
+    assert results.sql_string_and_parameters.sql_string == (
+        "SELECT * FROM league_players\n"
+        "ORDER BY created_at\n"
+        "OFFSET %(_offset_)s LIMIT %(_limit_)s;"
+    )
+    assert results.sql_string_and_parameters.parameters == {
+        "_offset_": 10,
+        "_limit_": 10,
+    }
+    assert results.estimate_count_sql_string_and_parameters is not None
+    assert results.estimate_count_sql_string_and_parameters.sql_string == (
+        "EXPLAIN (FORMAT JSON) SELECT 1 FROM league_players\n;"
+    )
+    assert connection.map_estimated_count([([{"Plan": {"Plan Rows": 42}}],)]) == 42
+
+
+def test_fits_in_one_batch_only_for_small_id_filters():
+    connection = PGConnection()
+
+    ids = [
+        "8b5f1c8e-3c55-4b2e-9f3a-2d9b0c1e7a10",
+        "0c8a4b51-63f0-4d4b-8e4f-1c9a2f3d4e5b",
+    ]
+
+    assert connection.fits_in_one_batch([InListSearchTerm("id", ids)], 2) == True
+    assert connection.fits_in_one_batch([InListSearchTerm("id", ids)], 1) == False
+    assert (
+        connection.fits_in_one_batch([InListSearchTerm("league_team_id", ids)], 2)
+        == False
+    )
+    assert connection.fits_in_one_batch([], 2000) == False
+
+
+def test_build_insert_many_queries_batches_and_defaults_missing_values():
+    connection = PGConnection()
+    connection.max_parameters_per_statement = 4
+
+    results = connection.build_insert_many_queries(
+        "league_players",
+        [
+            {"name": "one", "league_team_id": None},
+            {"name": "two", "league_team_id": "team"},
+            {"name": "three", "league_team_id": None},
+        ],
+    )
+
+    assert len(results) == 2
+    assert results[0].sql_string == (
+        "INSERT INTO league_players\n"
+        "(\n"
+        "\tname,\n"
+        "\tleague_team_id\n"
+        ")\n"
+        "VALUES\n"
+        "(%(name__0)s, DEFAULT),\n"
+        "(%(name__1)s, %(league_team_id__1)s)\n"
+        "RETURNING *;"
+    )
+    assert results[0].parameters == {
+        "name__0": "one",
+        "name__1": "two",
+        "league_team_id__1": "team",
+    }
+    assert results[1].parameters == {"name__0": "three"}
+
+
+def test_build_upsert_many_queries_updates_from_excluded_and_keeps_last_duplicate():
+    connection = PGConnection()
+
+    results = connection.build_upsert_many_queries(
+        "league_players",
+        [
+            {"name": "first", "global_mnp_id": "mnp"},
+            {"name": "second", "global_mnp_id": "mnp"},
+        ],
+        ["global_mnp_id"],
+    )
+
+    assert len(results) == 1
+    assert results[0].sql_string == (
+        "INSERT INTO league_players\n"
+        "(\n"
+        "\tname,\n"
+        "\tglobal_mnp_id\n"
+        ")\n"
+        "VALUES\n"
+        "(%(name__0)s, %(global_mnp_id__0)s)\n"
+        "ON CONFLICT (global_mnp_id)\n"
+        "DO UPDATE SET\n"
+        "\tname = EXCLUDED.name,\n"
+        "\tupdated_at = now()\n"
+        "RETURNING *;"
+    )
+    assert results[0].parameters == {"name__0": "second", "global_mnp_id__0": "mnp"}
+
+
+def test_build_upsert_many_queries_sets_updated_at_once():
+    connection = PGConnection()
+
+    for update_columns in [None, ["name", "updated_at"]]:
+        results = connection.build_upsert_many_queries(
+            "league_players",
+            [
+                {
+                    "name": "first",
+                    "global_mnp_id": "mnp",
+                    "updated_at": "2024-09-02T01:30:00.000Z",
+                }
+            ],
+            ["global_mnp_id"],
+            update_columns,
+        )
+
+        assert results[0].sql_string.endswith(
+            "DO UPDATE SET\n"
+            "\tname = EXCLUDED.name,\n"
+            "\tupdated_at = now()\n"
+            "RETURNING *;"
+        )
+
+    results = connection.build_upsert_many_queries(
+        "league_players", [{"global_mnp_id": "mnp"}], ["global_mnp_id"]
+    )
+
+    assert results[0].sql_string.endswith("DO NOTHING\nRETURNING *;")
+
+
+def test_in_list_search_term_binds_one_array_parameter():
+    parameters: dict[str, Any] = {}
+
+    search_term = InListSearchTerm(
+        "id",
+        [
+            "8b5f1c8e-3c55-4b2e-9f3a-2d9b0c1e7a10",
+            "0c8a4b51-63f0-4d4b-8e4f-1c9a2f3d4e5b",
+        ],
+        array_type="uuid",
+    )
+
+    assert search_term.generate_sql(parameters) == "id = ANY(%(id)s::uuid[])"
+    assert parameters == {
+        "id": '{"8b5f1c8e-3c55-4b2e-9f3a-2d9b0c1e7a10",'
+        '"0c8a4b51-63f0-4d4b-8e4f-1c9a2f3d4e5b"}'
+    }
+    assert (
+        search_term.get_template_key()
+        == InListSearchTerm("id", [], array_type="uuid").get_template_key()
+    )
+
+
+def test_in_list_search_term_array_ignore_case_lowers_values():
+    parameters: dict[str, Any] = {}
+
+    search_term = InListSearchTerm(
+        "name", ["Alice", 'Bob "B"'], ignore_case=True, array_type="text"
+    )
+
+    assert search_term.generate_sql(parameters) == "LOWER(name) = ANY(%(name)s::text[])"
+    assert parameters == {"name": '{"alice","bob \\"b\\""}'}
@@ -1,17 +1,42 @@
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
 from datetime import datetime
-from typing import Any, cast
-from uuid import UUID
+from itertools import islice
+from typing import Any, AsyncIterator, Callable, Iterator, TypeVar, cast
+from uuid import UUID, uuid4
 import psycopg2
-import psycopg2.pool
+import psycopg2.extensions
+from starlette.concurrency import run_in_threadpool
 
 from util.common import RequestOperators
-from util.database import PagingModel, ResultantPagingModel, SearchTerm
+from util.connection_pool import InstrumentedConnectionPool, PoolTimeoutError
+from util.hydration_planner import HydrationPlanNode, HydrationPlanner
+from util.sql_template_cache import SqlTemplateCache, convert_to_positional_parameters
+
+T = TypeVar("T")
+from util.database import (
+    CountModes,
+    ExactMatchSearchTerm,
+    InListSearchTerm,
+    PagingCursor,
+    PagingModel,
+    ResultantPagingModel,
+    SearchTerm,
+)
 
 
 class SqlStringAndParameters:
-    def __init__(self, sql_string: str, parameters: dict[str, Any]) -> None:
+    def __init__(
+        self, sql_string: str, parameters: dict[str, Any], prepare: bool = False
+    ) -> None:
         self.sql_string = sql_string
         self.parameters = parameters or {}
+        # Set for SQL from the template cache, whose text repeats across requests.
+        self.prepare = prepare
 
 
 class BuildSelectQueryResults:
@@ -19,9 +44,17 @@ class BuildSelectQueryResults:
         self,
         sql_string_and_parameters: SqlStringAndParameters,
         paging: ResultantPagingModel,
+        use_cursor: bool = False,
+        offset: int = 0,
+        estimate_count_sql_string_and_parameters: SqlStringAndParameters | None = None,
     ) -> None:
         self.sql_string_and_parameters = sql_string_and_parameters
         self.paging = paging
+        self.use_cursor = use_cursor
+        self.offset = offset
+        self.estimate_count_sql_string_and_parameters = (
+            estimate_count_sql_string_and_parameters
+        )
 
 
 class SelectQueryResults:
@@ -34,321 +67,242 @@ class SelectQueryResults:
         self.items = items or []
 
 
-class PGConnection:
-    pool: psycopg2.pool.SimpleConnectionPool
-
-    def create_connection_pool(
-        self, host: str, port: str, database: str, username: str, password: str
-    ) -> None:
-        self.pool = psycopg2.pool.SimpleConnectionPool(
-            minconn=2,
-            maxconn=50,
-            user=username,
-            password=password,
-            host=host,
-            port=port,
-            database=database,
-        )
+class UnitOfWork:
+    """
+    Holds a single pooled connection and transaction for the lifetime of a request.
 
-    def map_result_columns_to_values(
-        self, column_names: list[str], record: tuple[Any, ...]
-    ) -> dict[str, Any]:
-        returndict: dict[str, Any] = {}
+    The connection is checked out lazily on first use, so requests that never touch
+    the database never touch the pool either. Set rollback_only to discard the
+    transaction when the unit of work completes.
+    """
 
-        for i, column_name in enumerate(column_names):
-            returndict[column_name] = record[i]
+    def __init__(self, pool: InstrumentedConnectionPool) -> None:
+        self.pool = pool
+        self.connection: psycopg2.extensions.connection | None = None
+        self.rollback_only = False
+        # Used by ThreadedPGConnection to bound checkouts from the event loop.
+        self.holds_connection_slot = False
 
-        return returndict
+    def get_connection(self) -> psycopg2.extensions.connection:
+        if self.connection is None:
+            self.connection = self.pool.getconn()
 
-    def execute_command(self, sqlstring: str) -> None:
-        conn = self.pool.getconn()
-        cursor = conn.cursor()
+        return self.connection
 
-        try:
-            cursor.execute(sqlstring)
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
-            raise e
-        finally:
-            conn.close()
-            self.pool.putconn(conn)
+    def complete(self, commit: bool = True) -> None:
+        if self.connection is None:
+            return
 
-    def execute_command_with_results(self, sqlstring: str) -> list[tuple[Any, ...]]:
-        conn = self.pool.getconn()
-        cursor = conn.cursor()
+        conn = self.connection
+        self.connection = None
 
         try:
-            cursor.execute(sqlstring)
-
-            conn.commit()
-
-            records = cursor.fetchall()
-
-            return records
+            if commit:
+                conn.commit()
+            else:
+                conn.rollback()
         except Exception as e:
             conn.rollback()
             raise e
         finally:
-            conn.close()
             self.pool.putconn(conn)
 
-    def insert(
-        self,
-        table_name: str,
-        model: dict[str, Any],
-        request_operators: RequestOperators | None = None,
-    ) -> dict[str, Any]:
-        conn = self.pool.getconn()
-        cursor = conn.cursor()
-
-        try:
-            sql_string_and_parameters = self.build_insert_query(
-                table_name=table_name, model=model, request_operators=request_operators
-            )
-
-            cursor.execute(
-                sql_string_and_parameters.sql_string,
-                sql_string_and_parameters.parameters,
-            )
 
-            conn.commit()
+current_unit_of_work: ContextVar[UnitOfWork | None] = ContextVar(
+    "current_unit_of_work", default=None
+)
 
-            rows = cursor.fetchall()
 
-            columns = cursor.description
+class PGQueryBuilder:
+    """
+    Builds SQL and maps result rows. Shared by the sync and async connection engines,
+    which only differ in how statements are executed.
+    """
 
-            if columns is None or rows is None or len(rows) != 1:
-                raise
+    # Rows fetched per round trip by select_stream.
+    stream_itersize: int = 2000
 
-            colnames: list[str] = [desc[0] for desc in columns]
+    # The extended query protocol caps bind parameters at 65535 per statement.
+    max_parameters_per_statement: int = 65535
 
-            returndict = self.map_result_columns_to_values(colnames, rows[0])
+    # Compiled insert, select and update SQL keyed on statement shape.
+    sql_template_cache: SqlTemplateCache = SqlTemplateCache()
 
-            return returndict
+    # Prepared statements kept per connection, 0 disables preparing.
+    prepared_statements_max: int = 256
 
-        except Exception as e:
-            conn.rollback()
-            raise e
+    # Folds MNFP-Hydration targets into the select as joins.
+    hydration_planner: HydrationPlanner = HydrationPlanner()
 
-        finally:
-            conn.close()
-            self.pool.putconn(conn)
+    def get_sql_cache_stats(self) -> dict[str, Any]:
+        stats = self.sql_template_cache.get_stats()
+        stats["prepared_statements_max"] = self.prepared_statements_max
 
-    def select_by_id(
-        self,
-        table_name: str,
-        id: UUID,
-        request_operators: RequestOperators | None = None,
-    ) -> dict[str, Any] | None:
-        conn = self.pool.getconn()
-        cursor = conn.cursor()
+        return stats
 
-        try:
-            sqlstring = self.build_select_by_id_query(
-                table_name=table_name, id=id, request_operators=request_operators
-            )
+    def map_result_columns_to_values(
+        self, column_names: list[str], record: tuple[Any, ...]
+    ) -> dict[str, Any]:
+        returndict: dict[str, Any] = {}
 
-            cursor.execute(sqlstring)
+        for i, column_name in enumerate(column_names):
+            returndict[column_name] = record[i]
 
-            rows = cursor.fetchall()
+        return returndict
 
-            columns = cursor.description
+    def map_first_row(
+        self, columns: Any, rows: list[tuple[Any, ...]] | None
+    ) -> dict[str, Any] | None:
+        if columns is None:
+            raise
 
-            if columns is None:
-                raise
+        if rows is None or len(rows) == 0:
+            return None
 
-            if len(rows) == 0:
-                return None
+        colnames: list[str] = [desc[0] for desc in columns]
 
-            colnames: list[str] = [desc[0] for desc in columns]
+        returndict = self.map_result_columns_to_values(colnames, rows[0])
 
-            returndict = self.map_result_columns_to_values(colnames, rows[0])
+        return returndict
 
-            return returndict
+    def map_rows(
+        self, columns: Any, rows: list[tuple[Any, ...]] | None
+    ) -> list[dict[str, Any]]:
+        if columns is None:
+            raise
 
-        except Exception as e:
-            conn.rollback()
-            raise e
+        colnames: list[str] = [desc[0] for desc in columns]
 
-        finally:
-            conn.close()
-            self.pool.putconn(conn)
+        return [self.map_result_columns_to_values(colnames, row) for row in rows or []]
 
-    def select(
+    def map_select_results(
         self,
         table_name: str,
-        search_terms: list[SearchTerm],
-        paging_model: PagingModel | None = None,
-        request_operators: RequestOperators | None = None,
-    ):
-        conn = self.pool.getconn()
-        cursor = conn.cursor()
-
-        try:
-            build_query_results = self.build_select_query(
-                table_name=table_name,
-                search_terms=search_terms,
-                paging_model=paging_model,
-                request_operators=request_operators,
-            )
+        build_query_results: BuildSelectQueryResults,
+        columns: Any,
+        rows: list[tuple[Any, ...]] | None,
+    ) -> SelectQueryResults:
+        if columns is None:
+            raise
 
-            print(
-                f"Executing SQL: {build_query_results.sql_string_and_parameters.sql_string}"
-            )
+        colnames: list[str] = [desc[0] for desc in columns]
 
-            cursor.execute(
-                build_query_results.sql_string_and_parameters.sql_string,
-                build_query_results.sql_string_and_parameters.parameters,
-            )
+        print(f"Column names for {table_name}: {colnames}")
 
-            rows = cursor.fetchall()
+        rows = rows or []
+        paging = build_query_results.paging
 
-            columns = cursor.description
+        returnitemlist: SelectQueryResults = SelectQueryResults(paging)
 
-            if columns is None:
-                raise
+        if build_query_results.use_cursor:
+            has_next_page = len(rows) > paging.page_length
+            rows = rows[: paging.page_length]
 
-            colnames: list[str] = [desc[0] for desc in columns]
+            if has_next_page:
+                last_row = self.map_result_columns_to_values(colnames, rows[-1])
 
-            print(f"Column names for {table_name}: {colnames}")
+                paging.next_cursor = PagingCursor(
+                    sort_by=paging.sort_by,
+                    is_sort_descending=paging.is_sort_descending,
+                    last_value=last_row[paging.sort_by],
+                    last_id=str(last_row["id"]),
+                ).encode()
 
+        if "_count_" in colnames:
             total_count_index = colnames.index("_count_")
 
-            returnitemlist: SelectQueryResults = SelectQueryResults(
-                build_query_results.paging
+            if len(rows) > 0:
+                paging.total_record_count = rows[0][total_count_index]
+            elif not build_query_results.use_cursor:
+                paging.total_record_count = 0
+        elif (
+            paging.count_mode == CountModes.Estimate
+            and not build_query_results.use_cursor
+            and len(rows) < paging.page_length
+            and (len(rows) > 0 or build_query_results.offset == 0)
+        ):
+            # A short offset page already tells us the exact total.
+            paging.total_record_count = build_query_results.offset + len(rows)
+            paging.count_mode = CountModes.Exact
+
+        for row in rows:
+            returnitemlist.items.append(
+                self.map_result_columns_to_values(colnames, row)
             )
 
-            if rows is None or len(rows) == 0:
-                returnitemlist.paging.total_record_count = 0
-            else:
-                returnitemlist.paging.total_record_count = rows[0][total_count_index]
-
-            for row in rows:
-                returnitemlist.items.append(
-                    self.map_result_columns_to_values(colnames, row)
-                )
-
-            return returnitemlist
-        except Exception as e:
-            conn.rollback()
-            raise e
-        finally:
-            conn.close()
-            self.pool.putconn(conn)
-
-    def update(
-        self,
-        table_name: str,
-        id: UUID,
-        model: dict[str, Any],
-        request_operators: RequestOperators | None = None,
-    ) -> dict[str, Any] | None:
-        # Eliminate nulls
-
-        conn = self.pool.getconn()
-        cursor = conn.cursor()
-
-        try:
-            refined_model = dict[str, Any]()
-
-            for x in model.keys():
-                if model[x] is not None:
-                    refined_model[x] = model[x]
+        return returnitemlist
 
-            # if nothing to update, just select by id
-            if len(refined_model) == 0:
-                returndict = self.select_by_id(table_name, id)
-                return returndict
-
-            else:
-                refined_model["updated_at"] = datetime.utcnow()
+    def map_estimated_count(self, rows: list[tuple[Any, ...]] | None) -> int | None:
+        if rows is None or len(rows) == 0:
+            return None
 
-            results = self.build_update_query(
-                table_name=table_name,
-                id=id,
-                model=refined_model,
-                request_operators=request_operators,
-            )
+        plan = rows[0][0]
 
-            cursor.execute(results.sql_string, results.parameters)
+        if isinstance(plan, str):
+            plan = json.loads(plan)
 
-            conn.commit()
+        return int(plan[0]["Plan"]["Plan Rows"])
 
-            rows = cursor.fetchall()
+    def fits_in_one_batch(self, search_terms: list[SearchTerm], itersize: int) -> bool:
+        # An id filter caps the row count. Reads that cannot outgrow one batch skip
+        # the server-side cursor and the DECLARE/FETCH round trips it costs.
+        for search_term in search_terms:
+            if (
+                isinstance(search_term, InListSearchTerm)
+                and search_term.column_name == "id"
+                and len(search_term.value_list) <= itersize
+            ):
+                return True
 
-            columns = cursor.description
+        return False
 
-            if columns is None:
-                raise
+    def generate_stream_cursor_name(self) -> str:
+        return f"stream_{uuid4().hex}"
 
-            if len(rows) == 0:
-                return None
+    def refine_update_model(self, model: dict[str, Any]) -> dict[str, Any] | None:
+        # Eliminate nulls
+        refined_model = dict[str, Any]()
 
-            colnames: list[str] = [desc[0] for desc in columns]
+        for x in model.keys():
+            if model[x] is not None:
+                refined_model[x] = model[x]
 
-            returndict = self.map_result_columns_to_values(colnames, rows[0])
+        # if nothing to update, the caller should just select by id
+        if len(refined_model) == 0:
+            return None
 
-            return returndict
+        refined_model["updated_at"] = datetime.utcnow()
 
-        except Exception as e:
-            conn.rollback()
-            raise e
-        finally:
-            conn.close()
-            self.pool.putconn(conn)
+        return refined_model
 
-    def delete(
+    def build_insert_query(
         self,
         table_name: str,
-        id: UUID,
+        model: dict[str, Any],
         request_operators: RequestOperators | None = None,
-    ) -> dict[str, Any] | None:
-        conn = self.pool.getconn()
-        cursor = conn.cursor()
-
-        try:
-            sqlstring = self.build_delete_query(
-                table_name=table_name, id=id, request_operators=request_operators
-            )
-
-            cursor.execute(sqlstring)
-
-            conn.commit()
-
-            rows = cursor.fetchall()
-
-            columns = cursor.description
-
-            if columns is None:
-                raise
+    ) -> SqlStringAndParameters:
+        keys = [key for key in model.keys() if model[key] is not None]
 
-            if len(rows) == 0:
-                return None
+        sqlstring: str = self.sql_template_cache.get_or_build(
+            ("insert", table_name, tuple(keys)),
+            lambda: self.compile_insert_query(table_name, keys),
+        )
 
-            colnames: list[str] = [desc[0] for desc in columns]
+        # Parameters
+        parameters: dict[str, any] = {}
 
-            returndict = self.map_result_columns_to_values(colnames, rows[0])
+        for i, key in enumerate(keys):
+            parameters[key] = model[key]
 
-            return returndict
+        result = SqlStringAndParameters(
+            sql_string=sqlstring, parameters=parameters, prepare=True
+        )
 
-        except Exception as e:
-            conn.rollback()
-            raise e
-        finally:
-            conn.close()
-            self.pool.putconn(conn)
+        return result
 
-    def build_insert_query(
-        self,
-        table_name: str,
-        model: dict[str, Any],
-        request_operators: RequestOperators | None = None,
-    ) -> SqlStringAndParameters:
+    def compile_insert_query(self, table_name: str, keys: list[str]) -> str:
         sqlstring: str = f"INSERT INTO {table_name}\n(\n"
 
-        keys = [key for key in model.keys() if model[key] is not None]
-
         # Columns
 
         for i, key in enumerate(keys):
@@ -375,15 +329,142 @@ class PGConnection:
 
         sqlstring += f")\nRETURNING *;"
 
-        # Parameters
-        parameters: dict[str, any] = {}
+        return sqlstring
 
-        for i, key in enumerate(keys):
-            parameters[key] = model[key]
+    def build_insert_many_queries(
+        self,
+        table_name: str,
+        models: list[dict[str, Any]],
+        request_operators: RequestOperators | None = None,
+    ) -> list[SqlStringAndParameters]:
+        """
+        Multi-row INSERT ... RETURNING * statements, batched so no statement binds more
+        than max_parameters_per_statement values. Postgres returns the rows in VALUES
+        order. Columns a model leaves as None fall back to their DEFAULT, the same as
+        build_insert_query leaving them out.
+        """
+        return self.build_multi_row_insert_queries(table_name, models)
+
+    def build_upsert_many_queries(
+        self,
+        table_name: str,
+        models: list[dict[str, Any]],
+        conflict_columns: list[str],
+        update_columns: list[str] | None = None,
+        request_operators: RequestOperators | None = None,
+    ) -> list[SqlStringAndParameters]:
+        """
+        Multi-row INSERT ... ON CONFLICT (conflict_columns) DO UPDATE statements.
+
+        update_columns defaults to every supplied column outside the conflict target.
+        updated_at is always set to now() and never taken from EXCLUDED, Postgres
+        rejects a second assignment to it. With no columns left to update the
+        statement is ON CONFLICT DO NOTHING, and RETURNING * leaves the conflicting
+        rows out of the results.
+        Rows that conflict are overwritten from EXCLUDED, so a column a model leaves as
+        None is written as its DEFAULT rather than left alone. Postgres refuses to touch
+        the same row twice in one statement, so only the last model per conflict key
+        is kept.
+        """
+        models_by_conflict_key: dict[tuple[Any, ...], dict[str, Any]] = {}
+
+        for model in models:
+            conflict_key = tuple(model.get(column) for column in conflict_columns)
+
+            models_by_conflict_key.pop(conflict_key, None)
+            models_by_conflict_key[conflict_key] = model
+
+        return self.build_multi_row_insert_queries(
+            table_name,
+            list(models_by_conflict_key.values()),
+            conflict_columns,
+            update_columns,
+        )
+
+    def build_multi_row_insert_queries(
+        self,
+        table_name: str,
+        models: list[dict[str, Any]],
+        conflict_columns: list[str] | None = None,
+        update_columns: list[str] | None = None,
+    ) -> list[SqlStringAndParameters]:
+        keys: list[str] = []
+
+        for model in models:
+            for key in model.keys():
+                if model[key] is not None and key not in keys:
+                    keys.append(key)
+
+        if len(keys) == 0:
+            return [
+                SqlStringAndParameters(
+                    sql_string=f"INSERT INTO {table_name}\nDEFAULT VALUES\nRETURNING *;",
+                    parameters={},
+                )
+                for _ in models
+            ]
 
-        result = SqlStringAndParameters(sql_string=sqlstring, parameters=parameters)
+        on_conflict: str = ""
 
-        return result
+        if conflict_columns is not None:
+            if update_columns is None:
+                update_columns = [
+                    key
+                    for key in keys
+                    if key not in conflict_columns and key not in ["id", "created_at"]
+                ]
+
+            # Set from now() below.
+            update_columns = [
+                column for column in update_columns if column != "updated_at"
+            ]
+
+            on_conflict = f"ON CONFLICT ({', '.join(conflict_columns)})\n"
+
+            if len(update_columns) == 0:
+                on_conflict += "DO NOTHING\n"
+            else:
+                on_conflict += "DO UPDATE SET\n"
+                on_conflict += ",\n".join(
+                    [f"\t{column} = EXCLUDED.{column}" for column in update_columns]
+                    + ["\tupdated_at = now()"]
+                )
+                on_conflict += "\n"
+
+        batch_size = max(1, min(1000, self.max_parameters_per_statement // len(keys)))
+
+        results: list[SqlStringAndParameters] = []
+
+        for batch_start in range(0, len(models), batch_size):
+            batch = models[batch_start : batch_start + batch_size]
+
+            sqlstring: str = f"INSERT INTO {table_name}\n(\n"
+            sqlstring += ",\n".join([f"\t{key}" for key in keys])
+            sqlstring += f"\n)\nVALUES\n"
+
+            parameters: dict[str, Any] = {}
+            value_rows: list[str] = []
+
+            for i, model in enumerate(batch):
+                values: list[str] = []
+
+                for key in keys:
+                    if model.get(key) is None:
+                        values.append("DEFAULT")
+                    else:
+                        parameters[f"{key}__{i}"] = model[key]
+                        values.append(f"%({key}__{i})s")
+
+                value_rows.append(f"({', '.join(values)})")
+
+            sqlstring += ",\n".join(value_rows)
+            sqlstring += f"\n{on_conflict}RETURNING *;"
+
+            results.append(
+                SqlStringAndParameters(sql_string=sqlstring, parameters=parameters)
+            )
+
+        return results
 
     def build_select_query(
         self,
@@ -427,48 +508,305 @@ class PGConnection:
         sort_by = paging_model.sort_by or "created_at"
         is_sort_descending = True if paging_model.is_sort_descending == True else False
 
+        use_cursor = paging_model.use_cursor and not skip_paging
+        cursor = paging_model.cursor if use_cursor else None
+
+        # A cursor carries the sort it was issued for, so later pages cannot drift.
+        if cursor is not None:
+            sort_by = cursor.sort_by
+            is_sort_descending = cursor.is_sort_descending
+
+        # The query parameter wins over the MNFP-Count-Mode header. Hydration reads
+        # every row and never looks at the total, so it skips the count.
+        count_mode = paging_model.count_mode or (
+            request_operators.count_mode if request_operators is not None else None
+        )
+
+        if skip_paging:
+            count_mode = CountModes.NoCount
+        elif count_mode is None:
+            count_mode = CountModes.NoCount if use_cursor else CountModes.Exact
+
         resultant_paging_model = ResultantPagingModel(
-            page=page,
+            page=None if use_cursor else page,
             page_length=page_length,
             sort_by=sort_by,
             is_sort_descending=is_sort_descending,
+            count_mode=count_mode,
+        )
+
+        hydration_plan = self.hydration_planner.plan(
+            table_name,
+            request_operators.hydration if request_operators is not None else None,
         )
 
-        sqlstring: str = f"SELECT *, count(*) over() as _count_ FROM {table_name}\n"
+        # Sparse fieldsets still need the sort column for cursors and the foreign keys
+        # hydration joins or looks up through.
+        columns = (
+            request_operators.fields.get_columns(
+                table_name,
+                [sort_by] + [node.relation.foreign_key for node in hydration_plan],
+            )
+            if request_operators is not None and request_operators.fields is not None
+            else None
+        )
 
-        if len(search_terms) > 0:
-            sqlstring += f"WHERE\n(\n"
+        template_key = (
+            "select",
+            table_name,
+            None if columns is None else tuple(columns),
+            tuple(search_term.get_template_key() for search_term in search_terms),
+            sort_by,
+            is_sort_descending,
+            use_cursor,
+            None if cursor is None else cursor.last_value is None,
+            skip_paging,
+            count_mode,
+            self.hydration_planner.get_template_key(hydration_plan),
+        )
 
-            for i, search_term in enumerate(search_terms):
-                sqlstring += f"\t({search_term.generate_sql(parameters)})\n"
-                sqlstring += "\tAND\n" if (i < len(search_terms) - 1) else ""
+        sqlstring, estimate_count_sqlstring = self.sql_template_cache.get_or_build(
+            template_key,
+            lambda: self.compile_select_query(
+                table_name,
+                search_terms,
+                sort_by,
+                is_sort_descending,
+                use_cursor,
+                cursor,
+                skip_paging,
+                count_mode,
+                hydration_plan,
+                columns,
+            ),
+        )
 
-            sqlstring += f")\n"
+        for search_term in search_terms:
+            search_term.bind_parameters(parameters)
 
-        sqlstring += f"ORDER BY {sort_by}"
+        estimate_count_sql_string_and_parameters: SqlStringAndParameters | None = None
 
-        if is_sort_descending:
-            sqlstring += " DESC"
+        if estimate_count_sqlstring is not None:
+            estimate_count_sql_string_and_parameters = SqlStringAndParameters(
+                sql_string=estimate_count_sqlstring,
+                parameters=dict(parameters),
+            )
 
-        if not skip_paging:
-            sqlstring += f"\nOFFSET {offset} LIMIT {page_length}"
+        if cursor is not None:
+            self.bind_cursor_parameters(cursor, parameters)
 
-        sqlstring += ";"
+        if use_cursor:
+            parameters["_limit_"] = page_length + 1
+        elif not skip_paging:
+            parameters["_offset_"] = offset
+            parameters["_limit_"] = page_length
 
         return_object = BuildSelectQueryResults(
-            SqlStringAndParameters(sql_string=sqlstring, parameters=parameters),
+            SqlStringAndParameters(
+                sql_string=sqlstring, parameters=parameters, prepare=True
+            ),
             paging=resultant_paging_model,
+            use_cursor=use_cursor,
+            offset=0 if use_cursor else offset,
+            estimate_count_sql_string_and_parameters=estimate_count_sql_string_and_parameters,
         )
 
         return return_object
 
-    def build_select_by_id_query(
+    def compile_select_query(
         self,
         table_name: str,
-        id: UUID,
-        request_operators: RequestOperators | None = None,
-    ) -> str:
-        sqlstring: str = f"SELECT * FROM {table_name}\nWHERE id = '{id}';"
+        search_terms: list[SearchTerm],
+        sort_by: str,
+        is_sort_descending: bool,
+        use_cursor: bool,
+        cursor: PagingCursor | None,
+        skip_paging: bool,
+        count_mode: CountModes,
+        hydration_plan: list[HydrationPlanNode] | None = None,
+        columns: list[str] | None = None,
+    ) -> tuple[str, str | None]:
+        """
+        SQL text for build_select_query and, for estimated counts, the EXPLAIN that
+        goes with it. Values are bound separately so the text can be cached.
+        """
+        # Only the placeholders generate_sql writes are kept, values are bound later.
+        parameters: dict[str, Any] = {}
+
+        where_sqlstring = self.compile_where_sql(search_terms, parameters)
+
+        select_columns = "*" if columns is None else ", ".join(columns)
+        estimate_count_sqlstring: str | None = None
+
+        if count_mode == CountModes.Exact and use_cursor:
+            # The window count would only see rows past the cursor.
+            select_columns += (
+                f", (SELECT count(*) FROM {table_name}\n{where_sqlstring}) as _count_"
+            )
+        elif count_mode == CountModes.Exact:
+            select_columns += ", count(*) over() as _count_"
+        elif count_mode == CountModes.Estimate:
+            estimate_count_sqlstring = (
+                f"EXPLAIN (FORMAT JSON) SELECT 1 FROM {table_name}\n"
+                f"{where_sqlstring};"
+            )
+
+        sqlstring: str = f"SELECT {select_columns} FROM {table_name}\n"
+        sqlstring += where_sqlstring
+
+        if cursor is not None:
+            sqlstring += "AND\n" if len(search_terms) > 0 else "WHERE\n"
+            sqlstring += f"({self.build_cursor_seek_sql(cursor, parameters)})\n"
+
+        order_by = [f"{sort_by} DESC" if is_sort_descending else sort_by]
+
+        if use_cursor:
+            # id breaks ties so the seek never skips or repeats rows.
+            order_by.append("id DESC" if is_sort_descending else "id")
+
+        sqlstring += f"ORDER BY {', '.join(order_by)}"
+
+        if use_cursor:
+            # One extra row tells us whether there is a next page.
+            sqlstring += f"\nLIMIT %(_limit_)s"
+        elif not skip_paging:
+            sqlstring += f"\nOFFSET %(_offset_)s LIMIT %(_limit_)s"
+
+        sqlstring += ";"
+
+        if hydration_plan:
+            sqlstring = self.hydration_planner.build_hydrated_select_query(
+                sqlstring, hydration_plan, order_by
+            )
+
+        return sqlstring, estimate_count_sqlstring
+
+    def compile_where_sql(
+        self, search_terms: list[SearchTerm], parameters: dict[str, Any]
+    ) -> str:
+        where_sqlstring: str = ""
+
+        if len(search_terms) > 0:
+            where_sqlstring += f"WHERE\n(\n"
+
+            for i, search_term in enumerate(search_terms):
+                where_sqlstring += f"\t({search_term.generate_sql(parameters)})\n"
+                where_sqlstring += "\tAND\n" if (i < len(search_terms) - 1) else ""
+
+            where_sqlstring += f")\n"
+
+        return where_sqlstring
+
+    def build_version_query(
+        self,
+        table_name: str,
+        search_terms: list[SearchTerm],
+        request_operators: RequestOperators | None = None,
+    ) -> SqlStringAndParameters:
+        """
+        A cheap stand-in for the rows a search returns: their count and latest write,
+        plus the count and latest write of the rows hydration reads for them, joined
+        from the filtered rows only. Any insert, update or delete the response would
+        show changes the result.
+        """
+        read_joins = self.hydration_planner.get_read_joins(
+            table_name,
+            request_operators.hydration if request_operators is not None else None,
+        )
+
+        template_key = (
+            "version",
+            table_name,
+            tuple(search_term.get_template_key() for search_term in search_terms),
+            tuple(join_sql for _, _, join_sql in read_joins),
+        )
+
+        sqlstring: str = self.sql_template_cache.get_or_build(
+            template_key,
+            lambda: self.compile_version_query(table_name, search_terms, read_joins),
+        )
+
+        parameters: dict[str, Any] = {}
+
+        for search_term in search_terms:
+            search_term.bind_parameters(parameters)
+
+        return SqlStringAndParameters(
+            sql_string=sqlstring, parameters=parameters, prepare=True
+        )
+
+    def compile_version_query(
+        self,
+        table_name: str,
+        search_terms: list[SearchTerm],
+        read_joins: list[tuple[str, Any, str]],
+    ) -> str:
+        parameters: dict[str, Any] = {}
+
+        if len(read_joins) == 0:
+            sqlstring: str = (
+                f"SELECT {self.compile_version_sql(None)} FROM {table_name}\n"
+            )
+            sqlstring += self.compile_where_sql(search_terms, parameters)
+            sqlstring += ";"
+
+            return sqlstring
+
+        # The filtered rows are read once, every hydrated table only through them.
+        sqlstring = f"WITH _base_ AS (\nSELECT * FROM {table_name}\n"
+        sqlstring += self.compile_where_sql(search_terms, parameters)
+        sqlstring += ")\n"
+
+        select_columns = [self.compile_version_sql(None)] + [
+            f"(SELECT row({self.compile_version_sql(alias)})::text FROM _base_\n"
+            f"{join_sql})"
+            for alias, _, join_sql in read_joins
+        ]
+
+        sqlstring += "SELECT " + ",\n".join(select_columns) + "\nFROM _base_;"
+
+        return sqlstring
+
+    def compile_version_sql(self, alias: str | None) -> str:
+        prefix = "" if alias is None else f"{alias}."
+
+        return f"count(*), max(coalesce({prefix}updated_at, {prefix}created_at))"
+
+    def build_cursor_seek_sql(
+        self, cursor: PagingCursor, parameters: dict[str, Any]
+    ) -> str:
+        # Postgres sorts nulls last ascending and first descending, rows with a null
+        # sort value are sought by id alone.
+        column = cursor.sort_by
+
+        self.bind_cursor_parameters(cursor, parameters)
+
+        if cursor.last_value is None:
+            if cursor.is_sort_descending:
+                return f"({column} IS NULL AND id < %(_cursor_id_)s) OR {column} IS NOT NULL"
+
+            return f"{column} IS NULL AND id > %(_cursor_id_)s"
+
+        if cursor.is_sort_descending:
+            return f"({column}, id) < (%(_cursor_value_)s, %(_cursor_id_)s)"
+
+        return f"({column}, id) > (%(_cursor_value_)s, %(_cursor_id_)s) OR {column} IS NULL"
+
+    def bind_cursor_parameters(
+        self, cursor: PagingCursor, parameters: dict[str, Any]
+    ) -> None:
+        parameters["_cursor_id_"] = cursor.last_id
+
+        if cursor.last_value is not None:
+            parameters["_cursor_value_"] = cursor.last_value
+
+    def build_select_by_id_query(
+        self,
+        table_name: str,
+        id: UUID,
+        request_operators: RequestOperators | None = None,
+    ) -> str:
+        sqlstring: str = f"SELECT * FROM {table_name}\nWHERE id = '{id}';"
 
         return sqlstring
 
@@ -479,16 +817,12 @@ class PGConnection:
         model: dict[str, Any],
         request_operators: RequestOperators | None = None,
     ) -> SqlStringAndParameters:
-        sqlstring: str = f"UPDATE {table_name}\nSET\n"
-        keys = model.keys()
-
-        for i, key in enumerate(keys):
-            sqlstring += f"\t{key} = %({key})s"
-            if i < len(keys) - 1:
-                sqlstring += ","
-            sqlstring += "\n"
+        keys = list(model.keys())
 
-        sqlstring += f"WHERE id = '{id}'\nRETURNING *;"
+        sqlstring: str = self.sql_template_cache.get_or_build(
+            ("update", table_name, tuple(keys)),
+            lambda: self.compile_update_query(table_name, keys),
+        )
 
         # Parameters
         parameters: dict[str, Any] = {}
@@ -496,10 +830,27 @@ class PGConnection:
         for i, key in enumerate(keys):
             parameters[key] = model[key]
 
-        results = SqlStringAndParameters(sql_string=sqlstring, parameters=parameters)
+        parameters["_id_"] = str(id)
+
+        results = SqlStringAndParameters(
+            sql_string=sqlstring, parameters=parameters, prepare=True
+        )
 
         return results
 
+    def compile_update_query(self, table_name: str, keys: list[str]) -> str:
+        sqlstring: str = f"UPDATE {table_name}\nSET\n"
+
+        for i, key in enumerate(keys):
+            sqlstring += f"\t{key} = %({key})s"
+            if i < len(keys) - 1:
+                sqlstring += ","
+            sqlstring += "\n"
+
+        sqlstring += f"WHERE id = %(_id_)s\nRETURNING *;"
+
+        return sqlstring
+
     def build_delete_query(
         self,
         table_name: str,
@@ -509,3 +860,785 @@ class PGConnection:
         sqlstring: str = f"DELETE FROM {table_name}\nWHERE id = '{id}'\nRETURNING *;"
 
         return sqlstring
+
+
+class PreparingConnection(psycopg2.extensions.connection):
+    """
+    psycopg2 connection that remembers which SQL it has PREPAREd. psycopg2 has no
+    prepared statement support of its own, so statements are prepared with PREPARE
+    and run with EXECUTE. Prepared statements outlive transactions, including rolled
+    back ones, and go away with the connection.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+
+        self.prepared_statements: OrderedDict[str, tuple[str, list[str]]] = (
+            OrderedDict()
+        )
+        self.prepared_statement_count = 0
+
+    def prepare(
+        self,
+        cursor: psycopg2.extensions.cursor,
+        sql_string: str,
+        max_prepared: int,
+    ) -> tuple[str, list[str]]:
+        prepared = self.prepared_statements.get(sql_string)
+
+        if prepared is not None:
+            self.prepared_statements.move_to_end(sql_string)
+
+            return prepared
+
+        positional_sql_string, parameter_names = convert_to_positional_parameters(
+            sql_string
+        )
+
+        self.prepared_statement_count += 1
+        name = f"mnfp_{self.prepared_statement_count}"
+
+        cursor.execute(f"PREPARE {name} AS {positional_sql_string}")
+
+        prepared = (name, parameter_names)
+        self.prepared_statements[sql_string] = prepared
+
+        while len(self.prepared_statements) > max_prepared:
+            _, (evicted_name, _) = self.prepared_statements.popitem(last=False)
+            cursor.execute(f"DEALLOCATE {evicted_name};")
+
+        return prepared
+
+
+class PGConnection(PGQueryBuilder):
+    pool: InstrumentedConnectionPool
+
+    def create_connection_pool(
+        self,
+        host: str,
+        port: str,
+        database: str,
+        username: str,
+        password: str,
+        min_size: int = 2,
+        max_size: int = 50,
+        timeout_seconds: float = 30.0,
+    ) -> None:
+        self.pool = InstrumentedConnectionPool(
+            connection_factory=lambda: psycopg2.connect(
+                user=username,
+                password=password,
+                host=host,
+                port=port,
+                database=database,
+                connection_factory=PreparingConnection,
+            ),
+            min_size=min_size,
+            max_size=max_size,
+            timeout_seconds=timeout_seconds,
+        )
+
+    def get_pool_stats(self) -> dict[str, Any]:
+        return self.pool.get_stats()
+
+    @contextmanager
+    def unit_of_work(self) -> Iterator[UnitOfWork]:
+        """
+        Scopes every statement executed inside the block to one connection and one
+        transaction. Commits when the block exits cleanly, rolls back otherwise.
+        """
+        unit_of_work = UnitOfWork(self.pool)
+        token = current_unit_of_work.set(unit_of_work)
+
+        try:
+            yield unit_of_work
+        except Exception as e:
+            unit_of_work.complete(commit=False)
+            raise e
+        else:
+            unit_of_work.complete(commit=not unit_of_work.rollback_only)
+        finally:
+            current_unit_of_work.reset(token)
+
+    @contextmanager
+    def acquire_connection(self) -> Iterator[psycopg2.extensions.connection]:
+        """
+        Yields the request's unit of work connection when one is open, otherwise checks
+        out a connection for a single statement and commits it on success.
+        """
+        unit_of_work = current_unit_of_work.get()
+
+        if unit_of_work is not None:
+            yield unit_of_work.get_connection()
+            return
+
+        conn = self.pool.getconn()
+
+        try:
+            yield conn
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            raise e
+        finally:
+            self.pool.putconn(conn)
+
+    def execute_statement(
+        self,
+        cursor: psycopg2.extensions.cursor,
+        sql_string_and_parameters: SqlStringAndParameters,
+    ) -> None:
+        conn = cursor.connection
+
+        if (
+            not sql_string_and_parameters.prepare
+            or self.prepared_statements_max <= 0
+            or not isinstance(conn, PreparingConnection)
+        ):
+            cursor.execute(
+                sql_string_and_parameters.sql_string,
+                sql_string_and_parameters.parameters,
+            )
+            return
+
+        name, parameter_names = conn.prepare(
+            cursor, sql_string_and_parameters.sql_string, self.prepared_statements_max
+        )
+
+        sqlstring = f"EXECUTE {name}"
+
+        if len(parameter_names) > 0:
+            sqlstring += f" ({', '.join([f'%({key})s' for key in parameter_names])})"
+
+        cursor.execute(sqlstring + ";", sql_string_and_parameters.parameters)
+
+    def execute_command(self, sqlstring: str) -> None:
+        with self.acquire_connection() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute(sqlstring)
+
+    def execute_command_with_results(self, sqlstring: str) -> list[tuple[Any, ...]]:
+        with self.acquire_connection() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute(sqlstring)
+
+            records = cursor.fetchall()
+
+            return records
+
+    def insert(
+        self,
+        table_name: str,
+        model: dict[str, Any],
+        request_operators: RequestOperators | None = None,
+    ) -> dict[str, Any]:
+        with self.acquire_connection() as conn:
+            cursor = conn.cursor()
+
+            sql_string_and_parameters = self.build_insert_query(
+                table_name=table_name, model=model, request_operators=request_operators
+            )
+
+            self.execute_statement(cursor, sql_string_and_parameters)
+
+            rows = cursor.fetchall()
+
+            if rows is None or len(rows) != 1:
+                raise
+
+            return self.map_first_row(cursor.description, rows)
+
+    def insert_many(
+        self,
+        table_name: str,
+        models: list[dict[str, Any]],
+        request_operators: RequestOperators | None = None,
+    ) -> list[dict[str, Any]]:
+        if len(models) == 0:
+            return []
+
+        with self.acquire_connection() as conn:
+            cursor = conn.cursor()
+
+            results: list[dict[str, Any]] = []
+
+            for sql_string_and_parameters in self.build_insert_many_queries(
+                table_name=table_name,
+                models=models,
+                request_operators=request_operators,
+            ):
+                cursor.execute(
+                    sql_string_and_parameters.sql_string,
+                    sql_string_and_parameters.parameters,
+                )
+
+                results.extend(self.map_rows(cursor.description, cursor.fetchall()))
+
+            return results
+
+    def upsert(
+        self,
+        table_name: str,
+        model: dict[str, Any],
+        conflict_columns: list[str],
+        update_columns: list[str] | None = None,
+        request_operators: RequestOperators | None = None,
+    ) -> dict[str, Any] | None:
+        results = self.upsert_many(
+            table_name, [model], conflict_columns, update_columns, request_operators
+        )
+
+        return results[0] if len(results) > 0 else None
+
+    def upsert_many(
+        self,
+        table_name: str,
+        models: list[dict[str, Any]],
+        conflict_columns: list[str],
+        update_columns: list[str] | None = None,
+        request_operators: RequestOperators | None = None,
+    ) -> list[dict[str, Any]]:
+        if len(models) == 0:
+            return []
+
+        with self.acquire_connection() as conn:
+            cursor = conn.cursor()
+
+            results: list[dict[str, Any]] = []
+
+            for sql_string_and_parameters in self.build_upsert_many_queries(
+                table_name=table_name,
+                models=models,
+                conflict_columns=conflict_columns,
+                update_columns=update_columns,
+                request_operators=request_operators,
+            ):
+                cursor.execute(
+                    sql_string_and_parameters.sql_string,
+                    sql_string_and_parameters.parameters,
+                )
+
+                results.extend(self.map_rows(cursor.description, cursor.fetchall()))
+
+            return results
+
+    def select_by_id(
+        self,
+        table_name: str,
+        id: UUID,
+        request_operators: RequestOperators | None = None,
+    ) -> dict[str, Any] | None:
+        with self.acquire_connection() as conn:
+            cursor = conn.cursor()
+
+            sqlstring = self.build_select_by_id_query(
+                table_name=table_name, id=id, request_operators=request_operators
+            )
+
+            cursor.execute(sqlstring)
+
+            rows = cursor.fetchall()
+
+            return self.map_first_row(cursor.description, rows)
+
+    def select(
+        self,
+        table_name: str,
+        search_terms: list[SearchTerm],
+        paging_model: PagingModel | None = None,
+        request_operators: RequestOperators | None = None,
+    ) -> SelectQueryResults:
+        with self.acquire_connection() as conn:
+            cursor = conn.cursor()
+
+            build_query_results = self.build_select_query(
+                table_name=table_name,
+                search_terms=search_terms,
+                paging_model=paging_model,
+                request_operators=request_operators,
+            )
+
+            print(
+                f"Executing SQL: {build_query_results.sql_string_and_parameters.sql_string}"
+            )
+
+            self.execute_statement(
+                cursor, build_query_results.sql_string_and_parameters
+            )
+
+            rows = cursor.fetchall()
+
+            results = self.map_select_results(
+                table_name, build_query_results, cursor.description, rows
+            )
+
+            estimate_count_query = (
+                build_query_results.estimate_count_sql_string_and_parameters
+            )
+
+            if (
+                estimate_count_query is not None
+                and results.paging.total_record_count is None
+            ):
+                cursor.execute(
+                    estimate_count_query.sql_string, estimate_count_query.parameters
+                )
+
+                results.paging.total_record_count = self.map_estimated_count(
+                    cursor.fetchall()
+                )
+
+            return results
+
+    def select_stream(
+        self,
+        table_name: str,
+        search_terms: list[SearchTerm],
+        paging_model: PagingModel | None = None,
+        request_operators: RequestOperators | None = None,
+        itersize: int | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Yields rows one at a time, fetching itersize rows per round trip through a
+        named server-side cursor, so large unpaged reads run in bounded memory.
+        """
+        itersize = itersize or self.stream_itersize
+
+        build_query_results = self.build_select_query(
+            table_name=table_name,
+            search_terms=search_terms,
+            paging_model=paging_model,
+            request_operators=request_operators,
+        )
+
+        with self.acquire_connection() as conn:
+            if self.fits_in_one_batch(search_terms, itersize):
+                cursor = conn.cursor()
+            else:
+                cursor = conn.cursor(name=self.generate_stream_cursor_name())
+
+            cursor.execute(
+                build_query_results.sql_string_and_parameters.sql_string,
+                build_query_results.sql_string_and_parameters.parameters,
+            )
+
+            try:
+                while True:
+                    rows = cursor.fetchmany(itersize)
+
+                    colnames: list[str] = [desc[0] for desc in cursor.description]
+
+                    for row in rows:
+                        yield self.map_result_columns_to_values(colnames, row)
+
+                    if len(rows) < itersize:
+                        break
+            finally:
+                cursor.close()
+
+    def select_version(
+        self,
+        table_name: str,
+        search_terms: list[SearchTerm],
+        request_operators: RequestOperators | None = None,
+    ) -> tuple[Any, ...]:
+        with self.acquire_connection() as conn:
+            cursor = conn.cursor()
+
+            self.execute_statement(
+                cursor,
+                self.build_version_query(table_name, search_terms, request_operators),
+            )
+
+            return tuple(cursor.fetchone())
+
+    def select_version_by_id(
+        self,
+        table_name: str,
+        id: UUID,
+        request_operators: RequestOperators | None = None,
+    ) -> tuple[Any, ...]:
+        return self.select_version(
+            table_name, [ExactMatchSearchTerm("id", str(id))], request_operators
+        )
+
+    def update(
+        self,
+        table_name: str,
+        id: UUID,
+        model: dict[str, Any],
+        request_operators: RequestOperators | None = None,
+    ) -> dict[str, Any] | None:
+        refined_model = self.refine_update_model(model)
+
+        # if nothing to update, just select by id
+        if refined_model is None:
+            returndict = self.select_by_id(table_name, id)
+            return returndict
+
+        with self.acquire_connection() as conn:
+            cursor = conn.cursor()
+
+            results = self.build_update_query(
+                table_name=table_name,
+                id=id,
+                model=refined_model,
+                request_operators=request_operators,
+            )
+
+            self.execute_statement(cursor, results)
+
+            rows = cursor.fetchall()
+
+            return self.map_first_row(cursor.description, rows)
+
+    def delete(
+        self,
+        table_name: str,
+        id: UUID,
+        request_operators: RequestOperators | None = None,
+    ) -> dict[str, Any] | None:
+        with self.acquire_connection() as conn:
+            cursor = conn.cursor()
+
+            sqlstring = self.build_delete_query(
+                table_name=table_name, id=id, request_operators=request_operators
+            )
+
+            cursor.execute(sqlstring)
+
+            rows = cursor.fetchall()
+
+            return self.map_first_row(cursor.description, rows)
+
+
+def take_rows(rows: Iterator[dict[str, Any]], count: int) -> list[dict[str, Any]]:
+    return list(islice(rows, count))
+
+
+class ThreadedPGConnection:
+    """
+    Awaitable facade over the blocking psycopg2 PGConnection, used when the service runs
+    on the sync engine. Every statement is dispatched to the threadpool so the async
+    accessor layer can stay engine agnostic.
+    """
+
+    connection_slots: asyncio.Semaphore
+    timeout_seconds: float
+
+    def __init__(self, connection: PGConnection | None = None) -> None:
+        self.connection = connection or PGConnection()
+
+    @property
+    def pool(self) -> InstrumentedConnectionPool:
+        return self.connection.pool
+
+    @property
+    def stream_itersize(self) -> int:
+        return self.connection.stream_itersize
+
+    @stream_itersize.setter
+    def stream_itersize(self, value: int) -> None:
+        self.connection.stream_itersize = value
+
+    @property
+    def sql_template_cache(self) -> SqlTemplateCache:
+        return self.connection.sql_template_cache
+
+    @sql_template_cache.setter
+    def sql_template_cache(self, value: SqlTemplateCache) -> None:
+        self.connection.sql_template_cache = value
+
+    @property
+    def prepared_statements_max(self) -> int:
+        return self.connection.prepared_statements_max
+
+    @prepared_statements_max.setter
+    def prepared_statements_max(self, value: int) -> None:
+        self.connection.prepared_statements_max = value
+
+    def create_connection_pool(
+        self,
+        host: str,
+        port: str,
+        database: str,
+        username: str,
+        password: str,
+        min_size: int = 2,
+        max_size: int = 50,
+        timeout_seconds: float = 30.0,
+    ) -> None:
+        self.connection.create_connection_pool(
+            host=host,
+            port=port,
+            database=database,
+            username=username,
+            password=password,
+            min_size=min_size,
+            max_size=max_size,
+            timeout_seconds=timeout_seconds,
+        )
+
+        # Requests queue for a connection here, on the event loop, instead of inside
+        # getconn. A threadpool worker parked in getconn would otherwise starve the
+        # requests holding connections of the workers they need to give them back.
+        self.connection_slots = asyncio.Semaphore(max_size)
+        self.timeout_seconds = timeout_seconds
+
+    def get_pool_stats(self) -> dict[str, Any]:
+        return self.connection.get_pool_stats()
+
+    def get_sql_cache_stats(self) -> dict[str, Any]:
+        return self.connection.get_sql_cache_stats()
+
+    async def acquire_connection_slot(self) -> None:
+        started = time.monotonic()
+
+        try:
+            await asyncio.wait_for(
+                self.connection_slots.acquire(), timeout=self.timeout_seconds
+            )
+        except TimeoutError:
+            self.pool.record_wait(time.monotonic() - started, timed_out=True)
+            raise PoolTimeoutError(
+                f"Could not get a connection within {self.timeout_seconds}s, "
+                f"all {self.pool.max_size} connections are in use."
+            )
+
+        self.pool.record_wait(time.monotonic() - started)
+
+    async def reserve_connection_slot(self) -> bool:
+        # Returns True when the slot belongs to the caller rather than to the request's
+        # unit of work, the caller then releases it once its statement is done.
+        unit_of_work = current_unit_of_work.get()
+
+        if unit_of_work is None:
+            await self.acquire_connection_slot()
+            return True
+
+        if not unit_of_work.holds_connection_slot:
+            await self.acquire_connection_slot()
+            unit_of_work.holds_connection_slot = True
+
+        return False
+
+    async def run_statement(self, function: Callable[..., T], *args: Any) -> T:
+        release_slot = await self.reserve_connection_slot()
+
+        try:
+            return await run_in_threadpool(function, *args)
+        finally:
+            if release_slot:
+                self.connection_slots.release()
+
+    @asynccontextmanager
+    async def unit_of_work(self) -> AsyncIterator[UnitOfWork]:
+        unit_of_work = UnitOfWork(self.connection.pool)
+        token = current_unit_of_work.set(unit_of_work)
+
+        try:
+            yield unit_of_work
+        except Exception as e:
+            await run_in_threadpool(unit_of_work.complete, False)
+            raise e
+        else:
+            await run_in_threadpool(
+                unit_of_work.complete, not unit_of_work.rollback_only
+            )
+        finally:
+            current_unit_of_work.reset(token)
+
+            if unit_of_work.holds_connection_slot:
+                unit_of_work.holds_connection_slot = False
+                self.connection_slots.release()
+
+    @asynccontextmanager
+    async def borrow_unit_of_work(self) -> AsyncIterator[UnitOfWork | None]:
+        """
+        A unit of work holding a connection that was free in the pool right now, None
+        when every connection is in use. Never waits for a connection.
+        """
+        conn: psycopg2.extensions.connection | None = None
+
+        if not self.connection_slots.locked():
+            # Does not wait, the semaphore is known to be free.
+            await self.connection_slots.acquire()
+
+            try:
+                conn = await run_in_threadpool(self.pool.getconn, 0)
+            except PoolTimeoutError:
+                self.connection_slots.release()
+
+        if conn is None:
+            yield None
+            return
+
+        async with self.unit_of_work() as unit_of_work:
+            unit_of_work.connection = conn
+            unit_of_work.holds_connection_slot = True
+
+            yield unit_of_work
+
+    async def execute_command(self, sqlstring: str) -> None:
+        await self.run_statement(self.connection.execute_command, sqlstring)
+
+    async def execute_command_with_results(
+        self, sqlstring: str
+    ) -> list[tuple[Any, ...]]:
+        return await self.run_statement(
+            self.connection.execute_command_with_results, sqlstring
+        )
+
+    async def insert(
+        self,
+        table_name: str,
+        model: dict[str, Any],
+        request_operators: RequestOperators | None = None,
+    ) -> dict[str, Any]:
+        return await self.run_statement(
+            self.connection.insert, table_name, model, request_operators
+        )
+
+    async def insert_many(
+        self,
+        table_name: str,
+        models: list[dict[str, Any]],
+        request_operators: RequestOperators | None = None,
+    ) -> list[dict[str, Any]]:
+        return await self.run_statement(
+            self.connection.insert_many, table_name, models, request_operators
+        )
+
+    async def upsert(
+        self,
+        table_name: str,
+        model: dict[str, Any],
+        conflict_columns: list[str],
+        update_columns: list[str] | None = None,
+        request_operators: RequestOperators | None = None,
+    ) -> dict[str, Any] | None:
+        return await self.run_statement(
+            self.connection.upsert,
+            table_name,
+            model,
+            conflict_columns,
+            update_columns,
+            request_operators,
+        )
+
+    async def upsert_many(
+        self,
+        table_name: str,
+        models: list[dict[str, Any]],
+        conflict_columns: list[str],
+        update_columns: list[str] | None = None,
+        request_operators: RequestOperators | None = None,
+    ) -> list[dict[str, Any]]:
+        return await self.run_statement(
+            self.connection.upsert_many,
+            table_name,
+            models,
+            conflict_columns,
+            update_columns,
+            request_operators,
+        )
+
+    async def select_by_id(
+        self,
+        table_name: str,
+        id: UUID,
+        request_operators: RequestOperators | None = None,
+    ) -> dict[str, Any] | None:
+        return await self.run_statement(
+            self.connection.select_by_id, table_name, id, request_operators
+        )
+
+    async def select(
+        self,
+        table_name: str,
+        search_terms: list[SearchTerm],
+        paging_model: PagingModel | None = None,
+        request_operators: RequestOperators | None = None,
+    ) -> SelectQueryResults:
+        return await self.run_statement(
+            self.connection.select,
+            table_name,
+            search_terms,
+            paging_model,
+            request_operators,
+        )
+
+    async def select_stream(
+        self,
+        table_name: str,
+        search_terms: list[SearchTerm],
+        paging_model: PagingModel | None = None,
+        request_operators: RequestOperators | None = None,
+        itersize: int | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        itersize = itersize or self.connection.stream_itersize
+
+        rows = self.connection.select_stream(
+            table_name, search_terms, paging_model, request_operators, itersize
+        )
+
+        release_slot = await self.reserve_connection_slot()
+
+        try:
+            # One threadpool hop per batch rather than per row.
+            while True:
+                batch = await run_in_threadpool(take_rows, rows, itersize)
+
+                for row in batch:
+                    yield row
+
+                if len(batch) < itersize:
+                    break
+        finally:
+            await run_in_threadpool(rows.close)
+
+            if release_slot:
+                self.connection_slots.release()
+
+    async def select_version(
+        self,
+        table_name: str,
+        search_terms: list[SearchTerm],
+        request_operators: RequestOperators | None = None,
+    ) -> tuple[Any, ...]:
+        return await self.run_statement(
+            self.connection.select_version, table_name, search_terms, request_operators
+        )
+
+    async def select_version_by_id(
+        self,
+        table_name: str,
+        id: UUID,
+        request_operators: RequestOperators | None = None,
+    ) -> tuple[Any, ...]:
+        return await self.run_statement(
+            self.connection.select_version_by_id, table_name, id, request_operators
+        )
+
+    async def update(
+        self,
+        table_name: str,
+        id: UUID,
+        model: dict[str, Any],
+        request_operators: RequestOperators | None = None,
+    ) -> dict[str, Any] | None:
+        return await self.run_statement(
+            self.connection.update, table_name, id, model, request_operators
+        )
+
+    async def delete(
+        self,
+        table_name: str,
+        id: UUID,
+        request_operators: RequestOperators | None = None,
+    ) -> dict[str, Any] | None:
+        return await self.run_statement(
+            self.connection.delete, table_name, id, request_operators
+        )
@@ -0,0 +1,302 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Callable, Iterator
+from uuid import UUID
+
+from util.common import RequestOperators
+from util.database import PagingModel
+
+# Entities written by the current request, invalidated again once its transaction
+# commits.
+pending_entity_invalidations: ContextVar[set[tuple[str, UUID]] | None] = ContextVar(
+    "pending_entity_invalidations", default=None
+)
+
+
+class EntityCache:
+    """
+    Bounded, thread-safe LRU of entities keyed by id, each kept for ttl_seconds.
+
+    Meant for reference entities that change a few times a season but are read, by id
+    and through hydration, on nearly every request. Entries are stored and returned
+    as copies with no targets hydrated, so hydrating a result never leaks into the
+    cache or into another request. Writes through the owning manager invalidate
+    their entity, writes from other instances arrive through TableChangeListener and
+    the TTL bounds how stale a row changed any other way can get. While
+    entries_current says writes from other instances may have been missed, every
+    read is a miss.
+    """
+
+    def __init__(
+        self,
+        entity_type: str,
+        max_size: int = 1024,
+        ttl_seconds: float = 300.0,
+        entries_current: Callable[[], bool] = lambda: True,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.entity_type = entity_type
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.entries_current = entries_current
+        self.clock = clock
+        self.lock = threading.Lock()
+        self.entries: OrderedDict[UUID, tuple[float, Any]] = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def configure(
+        self,
+        max_size: int,
+        ttl_seconds: float,
+        entries_current: Callable[[], bool],
+    ) -> None:
+        with self.lock:
+            self.max_size = max_size
+            self.ttl_seconds = ttl_seconds
+            self.entries_current = entries_current
+            self.entries.clear()
+
+    def copy_entity(self, entity: Any) -> Any:
+        entity_copy = copy.copy(entity)
+
+        for target_name in getattr(entity, "hydrated_targets", ()):
+            entity_copy.__dict__[target_name] = None
+
+        if hasattr(entity, "hydrated_targets"):
+            entity_copy.__dict__["hydrated_targets"] = set()
+
+        return entity_copy
+
+    def get(self, id: UUID) -> Any | None:
+        return self.get_many([id]).get(id)
+
+    def get_many(self, ids: list[UUID]) -> dict[UUID, Any]:
+        results: dict[UUID, Any] = {}
+        now = self.clock()
+
+        if not self.entries_current():
+            with self.lock:
+                self.misses += len(ids)
+
+            return results
+
+        with self.lock:
+            for id in ids:
+                entry = self.entries.get(id)
+
+                if entry is not None and entry[0] <= now:
+                    del self.entries[id]
+                    self.expirations += 1
+                    entry = None
+
+                if entry is None:
+                    self.misses += 1
+                    continue
+
+                self.entries.move_to_end(id)
+                self.hits += 1
+                results[id] = entry[1]
+
+        # Callers hang hydrated targets off what they get back.
+        return {id: self.copy_entity(entity) for id, entity in results.items()}
+
+    def get_version(self, id: UUID) -> tuple[Any, ...] | None:
+        """
+        The version select_version_by_id returns for the entity unhydrated, its
+        count and latest write, when it is cached.
+        """
+        entity = self.get(id)
+
+        if entity is None:
+            return None
+
+        return (1, entity.updated_at or entity.created_at)
+
+    def fill(self, entity: Any, request_operators: RequestOperators | None) -> None:
+        # A sparse select is missing columns, it is never cached.
+        if (
+            entity is None
+            or self.max_size <= 0
+            or (request_operators is not None and request_operators.fields is not None)
+        ):
+            return
+
+        entity_copy = self.copy_entity(entity)
+        expires_at = self.clock() + self.ttl_seconds
+
+        with self.lock:
+            self.entries[entity_copy.id] = (expires_at, entity_copy)
+            self.entries.move_to_end(entity_copy.id)
+
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, id: UUID) -> None:
+        pending = pending_entity_invalidations.get()
+
+        if pending is not None:
+            pending.add((self.entity_type, id))
+
+        with self.lock:
+            if self.entries.pop(id, None) is not None:
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+
+    def get_search_ids(
+        self, model: Any, paging_model: PagingModel | None
+    ) -> list[UUID] | None:
+        """
+        The ids of a search the cache can answer, an unpaged search filtered on ids
+        alone. None for any other search.
+        """
+        if paging_model is not None or getattr(model, "ids", None) is None:
+            return None
+
+        if any(
+            value is not None for name, value in model.__dict__.items() if name != "ids"
+        ):
+            return None
+
+        return list(model.ids)
+
+    async def stream_through(
+        self,
+        model: Any,
+        paging_model: PagingModel | None,
+        request_operators: RequestOperators | None,
+        select_stream: Callable[..., AsyncIterator[Any]],
+    ) -> AsyncIterator[Any]:
+        """
+        Streams a search, answering the ids it holds itself and sending only the rest
+        to select_stream. Cached entities come first, searches the cache can not
+        answer go through unchanged.
+        """
+        ids = self.get_search_ids(model, paging_model)
+
+        if ids is None:
+            async for entity in select_stream(
+                model=model,
+                paging_model=paging_model,
+                request_operators=request_operators,
+            ):
+                yield entity
+
+            return
+
+        cached_entities = self.get_many(ids)
+
+        for entity in cached_entities.values():
+            yield entity
+
+        missing_ids = [id for id in ids if id not in cached_entities]
+
+        if len(missing_ids) == 0:
+            return
+
+        missing_model = copy.copy(model)
+        missing_model.ids = missing_ids
+
+        async for entity in select_stream(
+            model=missing_model,
+            paging_model=paging_model,
+            request_operators=request_operators,
+        ):
+            self.fill(entity, request_operators)
+
+            yield entity
+
+    def get_stats(self) -> dict[str, Any]:
+        with self.lock:
+            return {
+                "entity_cache_max": self.max_size,
+                "entity_cache_ttl_seconds": self.ttl_seconds,
+                "entity_cache_size": len(self.entries),
+                "entity_cache_hits": self.hits,
+                "entity_cache_misses": self.misses,
+                "entity_cache_evictions": self.evictions,
+                "entity_cache_expirations": self.expirations,
+                "entity_cache_invalidations": self.invalidations,
+            }
+
+
+# One cache per entity type, shared by every manager instance.
+entity_caches: dict[str, EntityCache] = {}
+
+entity_cache_settings: dict[str, Any] = {
+    "max_size": 1024,
+    "ttl_seconds": 300.0,
+    "entries_current": lambda: True,
+}
+
+
+def get_entity_cache(entity_type: str) -> EntityCache:
+    entity_cache = entity_caches.get(entity_type)
+
+    if entity_cache is None:
+        entity_cache = EntityCache(entity_type, **entity_cache_settings)
+        entity_caches[entity_type] = entity_cache
+
+    return entity_cache
+
+
+def configure_entity_caches(
+    max_size: int, ttl_seconds: float, entries_current: Callable[[], bool]
+) -> None:
+    # Caches created before configuration is read are reset to the new settings.
+    entity_cache_settings.update(
+        max_size=max_size, ttl_seconds=ttl_seconds, entries_current=entries_current
+    )
+
+    for entity_cache in entity_caches.values():
+        entity_cache.configure(max_size, ttl_seconds, entries_current)
+
+
+def invalidate_entity(entity_type: str, id: UUID) -> None:
+    entity_cache = entity_caches.get(entity_type)
+
+    if entity_cache is not None:
+        entity_cache.invalidate(id)
+
+
+@contextmanager
+def entity_invalidation_scope() -> Iterator[None]:
+    """
+    Invalidates the request's entities again after the block, once its transaction
+    has committed. A read running between the write and the commit still sees the
+    old row and may have cached it again.
+    """
+    token = pending_entity_invalidations.set(set())
+
+    try:
+        yield
+    finally:
+        pending = pending_entity_invalidations.get() or set()
+        pending_entity_invalidations.reset(token)
+
+        for entity_type, id in pending:
+            invalidate_entity(entity_type, id)
+
+
+def clear_entity_caches() -> None:
+    for entity_cache in entity_caches.values():
+        entity_cache.clear()
+
+
+def get_entity_cache_stats() -> dict[str, dict[str, Any]]:
+    return {
+        entity_type: entity_cache.get_stats()
+        for entity_type, entity_cache in entity_caches.items()
+    }
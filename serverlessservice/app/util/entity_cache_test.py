@@ -0,0 +1,159 @@
+import asyncio
+from typing import Any, AsyncIterator
+from uuid import UUID, uuid4
+
+from util.common import RequestOperators
+from util.database import PagingModel
+from util.entity_cache import (
+    EntityCache,
+    entity_invalidation_scope,
+    get_entity_cache,
+)
+from util.field_selection import FieldSelection
+
+
+class Entity:
+    def __init__(self) -> None:
+        self.id = uuid4()
+        self.child: Any = None
+        self.hydrated_targets: set[str] = set()
+
+
+class SearchModel:
+    def __init__(self, ids: list[UUID] | None = None, name: str | None = None) -> None:
+        self.ids = ids
+        self.name = name
+
+
+def test_evicts_least_recently_used_and_expires_entries():
+    now = [0.0]
+    cache = EntityCache("entities", max_size=2, ttl_seconds=10, clock=lambda: now[0])
+    entities = [Entity(), Entity(), Entity()]
+
+    cache.fill(entities[0], None)
+    cache.fill(entities[1], None)
+    cache.get(entities[0].id)
+    cache.fill(entities[2], None)
+
+    assert cache.get(entities[1].id) is None
+    assert cache.get(entities[0].id).id == entities[0].id
+
+    now[0] = 10.0
+
+    assert cache.get(entities[0].id) is None
+
+    stats = cache.get_stats()
+
+    assert stats["entity_cache_evictions"] == 1
+    assert stats["entity_cache_expirations"] == 1
+    assert stats["entity_cache_hits"] == 2
+
+
+def test_keeps_hydration_out_of_the_cache():
+    cache = EntityCache("entities")
+    entity = Entity()
+    entity.child = Entity()
+    entity.hydrated_targets.add("child")
+
+    cache.fill(entity, None)
+
+    result = cache.get(entity.id)
+    result.child = Entity()
+    result.hydrated_targets.add("child")
+
+    assert cache.get(entity.id).child is None
+    assert cache.get(entity.id).hydrated_targets == set()
+
+
+def test_skips_sparse_selects_and_invalidates():
+    cache = EntityCache("entities")
+    entity = Entity()
+
+    cache.fill(entity, RequestOperators(fields=FieldSelection.parse("id")))
+
+    assert cache.get(entity.id) is None
+
+    cache.fill(entity, None)
+    cache.invalidate(entity.id)
+
+    assert cache.get(entity.id) is None
+    assert cache.get_stats()["entity_cache_invalidations"] == 1
+
+
+def test_streams_only_missing_ids_from_the_database():
+    cache = EntityCache("entities")
+    entities = [Entity(), Entity()]
+    searches: list[list[UUID] | None] = []
+
+    cache.fill(entities[0], None)
+
+    async def select_stream(
+        model: SearchModel,
+        paging_model: PagingModel | None,
+        request_operators: RequestOperators | None,
+    ) -> AsyncIterator[Entity]:
+        searches.append(model.ids)
+
+        for entity in entities:
+            if model.ids is None or entity.id in model.ids:
+                yield entity
+
+    async def collect(model: SearchModel) -> list[UUID]:
+        return [
+            entity.id
+            async for entity in cache.stream_through(model, None, None, select_stream)
+        ]
+
+    ids = [entities[0].id, entities[1].id]
+
+    assert asyncio.run(collect(SearchModel(ids=ids))) == ids
+    assert asyncio.run(collect(SearchModel(ids=ids))) == ids
+    assert asyncio.run(collect(SearchModel(ids=ids, name="a"))) == ids
+    assert searches == [[entities[1].id], ids]
+
+
+def test_invalidates_written_entities_again_after_the_scope():
+    cache = get_entity_cache("scoped_entities")
+    entity = Entity()
+
+    with entity_invalidation_scope():
+        cache.invalidate(entity.id)
+        # A concurrent read refills the row its transaction has not replaced yet.
+        cache.fill(entity, None)
+
+        assert cache.get(entity.id) is not None
+
+    assert cache.get(entity.id) is None
+
+
+def test_misses_while_entries_may_be_stale():
+    current = [False]
+    cache = EntityCache("entities", entries_current=lambda: current[0])
+    entity = Entity()
+
+    cache.fill(entity, None)
+
+    assert cache.get(entity.id) is None
+
+    current[0] = True
+
+    assert cache.get(entity.id).id == entity.id
+    assert cache.get_stats()["entity_cache_misses"] == 1
+
+
+def test_versions_cached_entities_by_their_latest_write():
+    cache = EntityCache("entities")
+    entity = Entity()
+    entity.created_at = "created"
+    entity.updated_at = None
+
+    assert cache.get_version(entity.id) is None
+
+    cache.fill(entity, None)
+
+    assert cache.get_version(entity.id) == (1, "created")
+
+    entity.updated_at = "updated"
+    cache.fill(entity, None)
+
+    assert cache.get_version(entity.id) == (1, "updated")
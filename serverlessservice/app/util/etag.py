@@ -0,0 +1,63 @@
+import hashlib
+from typing import Any
+
+from fastapi import Response
+from fastapi.datastructures import Headers
+
+from util.responses import respond
+
+# Request headers that change the body of a GET besides its path and query.
+representation_headers = ["Accept", "MNFP-Hydration", "MNFP-Fields", "MNFP-Count-Mode"]
+
+
+def build_etag(version: tuple[Any, ...], headers: Headers, *variant: Any) -> str:
+    """
+    Strong ETag for a GET response, from the version of the rows it shows and
+    everything else its body depends on, the route's own arguments in variant.
+    """
+    parts = (
+        version,
+        variant,
+        # An empty header asks for the same body as a missing one.
+        tuple(headers.get(name) or None for name in representation_headers),
+    )
+
+    return f'"{hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()}"'
+
+
+def etag_matches(headers: Headers, etag: str | None) -> bool:
+    if_none_match = headers.get("If-None-Match")
+
+    if etag is None or if_none_match is None:
+        return False
+
+    # If-None-Match compares weakly, W/"x" matches "x".
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+
+    return False
+
+
+def set_etag_headers(response: Response, etag: str | None) -> None:
+    if etag is None:
+        return
+
+    response.headers["ETag"] = etag
+    response.headers["Vary"] = ", ".join(representation_headers)
+
+
+def build_not_modified_response(etag: str) -> Response:
+    response = Response(status_code=304)
+    set_etag_headers(response, etag)
+
+    return response
+
+
+def respond_with_etag(result: Any, headers: Headers, etag: str | None) -> Response:
+    response = respond(result, headers)
+    set_etag_headers(response, etag)
+
+    return response
@@ -0,0 +1,78 @@
+from uuid import uuid4
+
+from fastapi.datastructures import Headers
+
+from util.common import RequestOperators
+from util.database import ExactMatchSearchTerm
+from util.db_connection import PGConnection
+from util.etag import build_etag, etag_matches
+from util.hydration_planner import HydrationPlanner
+
+
+def test_version_query_covers_hydrated_rows_of_the_filtered_set():
+    connection = PGConnection()
+
+    results = connection.build_version_query(
+        "league_teams",
+        [ExactMatchSearchTerm("name", "team")],
+        RequestOperators(hydration=["home_venue", "league_players.league_team"]),
+    )
+
+    assert results.sql_string == (
+        "WITH _base_ AS (\n"
+        "SELECT * FROM league_teams\n"
+        "WHERE\n(\n\t(name = %(name)s)\n)\n"
+        ")\n"
+        "SELECT count(*), max(coalesce(updated_at, created_at)),\n"
+        "(SELECT row(count(*), max(coalesce(_r0_.updated_at, _r0_.created_at)))::text "
+        "FROM _base_\n"
+        "JOIN venues AS _r0_ ON _r0_.id = _base_.home_venue_id\n"
+        "),\n"
+        "(SELECT row(count(*), max(coalesce(_r1_.updated_at, _r1_.created_at)))::text "
+        "FROM _base_\n"
+        "JOIN league_players AS _r1_ ON _r1_.league_team_id = _base_.id\n"
+        "),\n"
+        "(SELECT row(count(*), max(coalesce(_r2_.updated_at, _r2_.created_at)))::text "
+        "FROM _base_\n"
+        "JOIN league_players AS _r1_ ON _r1_.league_team_id = _base_.id\n"
+        "JOIN league_teams AS _r2_ ON _r2_.id = _r1_.league_team_id\n"
+        ")\n"
+        "FROM _base_;"
+    )
+    assert results.parameters == {"name": "team"}
+
+    results = connection.build_version_query(
+        "league_teams", [ExactMatchSearchTerm("name", "team")]
+    )
+
+    assert results.sql_string == (
+        "SELECT count(*), max(coalesce(updated_at, created_at)) FROM league_teams\n"
+        "WHERE\n(\n\t(name = %(name)s)\n)\n;"
+    )
+
+
+def test_collects_tables_through_collections():
+    planner = HydrationPlanner()
+
+    assert planner.get_table_names(
+        "fantasy_team_season_links", ["league_players.league_team", "unknown"]
+    ) == [
+        "league_player_fantasy_team_season_links",
+        "league_players",
+        "league_teams",
+    ]
+    assert planner.get_table_names("fantasy_team_season_links", None) == []
+
+
+def test_matches_etags_for_the_same_version_and_representation():
+    id = uuid4()
+    version = (1, "2024-01-01")
+    etag = build_etag(version, Headers({"MNFP-Hydration": "league_team"}), id)
+
+    assert etag != build_etag(version, Headers({}), id)
+    assert etag != build_etag((1, "2024-01-02"), Headers({}), id)
+    assert etag_matches(Headers({"If-None-Match": f'"other", W/{etag}'}), etag)
+    assert etag_matches(Headers({"If-None-Match": "*"}), etag)
+    assert not etag_matches(Headers({"If-None-Match": '"other"'}), etag)
+    assert not etag_matches(Headers({}), etag)
+    assert not etag_matches(Headers({"If-None-Match": "*"}), None)
@@ -0,0 +1,151 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable
+from uuid import UUID
+
+
+class ExistenceCache:
+    """
+    Remembers parent ids found missing while validating a create, so requests naming
+    them again skip the by-id lookup. Entries last ttl_seconds in a bounded LRU and
+    are dropped as soon as the id is inserted here or another instance's insert is
+    notified through TableChangeListener. Only an id the database reported missing
+    within ttl_seconds is ever reported missing, every other id is looked up. One
+    another instance inserts since can still be reported missing until its
+    notification is handled or the entry expires.
+    """
+
+    def __init__(
+        self,
+        table_name: str,
+        max_size: int = 4096,
+        ttl_seconds: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.table_name = table_name
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self.lock = threading.Lock()
+        self.missing_ids: OrderedDict[UUID, float] = OrderedDict()
+
+        self.missing_hits = 0
+        self.lookups = 0
+
+    def configure(self, max_size: int, ttl_seconds: float) -> None:
+        with self.lock:
+            self.max_size = max_size
+            self.ttl_seconds = ttl_seconds
+            self.missing_ids.clear()
+
+    def clear(self) -> None:
+        with self.lock:
+            self.missing_ids.clear()
+
+    def is_known_missing(self, id: UUID) -> bool:
+        now = self.clock()
+
+        with self.lock:
+            expires_at = self.missing_ids.get(id)
+
+            if expires_at is not None:
+                if expires_at > now:
+                    self.missing_ids.move_to_end(id)
+                    self.missing_hits += 1
+                    return True
+
+                del self.missing_ids[id]
+
+        return False
+
+    def record_missing(self, id: UUID) -> None:
+        if self.max_size <= 0:
+            return
+
+        with self.lock:
+            self.missing_ids[id] = self.clock() + self.ttl_seconds
+            self.missing_ids.move_to_end(id)
+
+            while len(self.missing_ids) > self.max_size:
+                self.missing_ids.popitem(last=False)
+
+    def record_present(self, id: UUID) -> None:
+        with self.lock:
+            self.missing_ids.pop(id, None)
+
+    async def select_by_id(
+        self, id: UUID, select_by_id: Callable[[UUID], Awaitable[Any]]
+    ) -> Any | None:
+        """
+        select_by_id's result for id, or None without calling it when id is known to
+        be missing.
+        """
+        if self.is_known_missing(id):
+            return None
+
+        self.lookups += 1
+
+        result = await select_by_id(id)
+
+        if result is None:
+            self.record_missing(id)
+
+        return result
+
+    def get_stats(self) -> dict[str, Any]:
+        with self.lock:
+            return {
+                "existence_cache_max": self.max_size,
+                "existence_cache_ttl_seconds": self.ttl_seconds,
+                "existence_cache_size": len(self.missing_ids),
+                "existence_cache_missing_hits": self.missing_hits,
+                "existence_cache_lookups": self.lookups,
+            }
+
+
+# One cache per parent table, shared by every manager instance.
+existence_caches: dict[str, ExistenceCache] = {}
+
+existence_cache_settings: dict[str, Any] = {
+    "max_size": 4096,
+    "ttl_seconds": 10.0,
+}
+
+
+def get_existence_cache(table_name: str) -> ExistenceCache:
+    existence_cache = existence_caches.get(table_name)
+
+    if existence_cache is None:
+        existence_cache = ExistenceCache(table_name, **existence_cache_settings)
+        existence_caches[table_name] = existence_cache
+
+    return existence_cache
+
+
+def configure_existence_caches(max_size: int, ttl_seconds: float) -> None:
+    # Caches created before configuration is read are reset to the new settings.
+    existence_cache_settings.update(max_size=max_size, ttl_seconds=ttl_seconds)
+
+    for existence_cache in existence_caches.values():
+        existence_cache.configure(max_size, ttl_seconds)
+
+
+def record_existing_id(table_name: str, id: UUID) -> None:
+    existence_cache = existence_caches.get(table_name)
+
+    if existence_cache is not None:
+        existence_cache.record_present(id)
+
+
+def clear_existence_caches() -> None:
+    # Inserts notified while the listener was disconnected are lost.
+    for existence_cache in existence_caches.values():
+        existence_cache.clear()
+
+
+def get_existence_cache_stats() -> dict[str, dict[str, Any]]:
+    return {
+        table_name: existence_cache.get_stats()
+        for table_name, existence_cache in existence_caches.items()
+    }
@@ -0,0 +1,72 @@
+import asyncio
+from uuid import UUID, uuid4
+
+from util.existence_cache import (
+    ExistenceCache,
+    clear_existence_caches,
+    get_existence_cache,
+    record_existing_id,
+)
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_remembers_missing_ids_until_they_expire_or_appear():
+    clock = Clock()
+    cache = ExistenceCache("existence_cache_test", ttl_seconds=10, clock=clock)
+    missing_id = uuid4()
+    lookups: list[UUID] = []
+
+    async def select_by_id(id: UUID) -> UUID | None:
+        lookups.append(id)
+        return None
+
+    def run() -> UUID | None:
+        return asyncio.run(cache.select_by_id(missing_id, select_by_id))
+
+    assert run() is None
+    assert run() is None
+    assert lookups == [missing_id]
+
+    clock.now = 11
+    assert run() is None
+    assert lookups == [missing_id] * 2
+
+    cache.record_present(missing_id)
+    assert run() is None
+    assert lookups == [missing_id] * 3
+    assert cache.get_stats()["existence_cache_missing_hits"] == 1
+
+
+def test_forgets_missing_ids_written_elsewhere():
+    cache = get_existence_cache("existence_cache_test_notified")
+    missing_ids = [uuid4(), uuid4()]
+    lookups: list[UUID] = []
+
+    async def select_by_id(id: UUID) -> UUID | None:
+        lookups.append(id)
+        return None
+
+    def run(id: UUID) -> UUID | None:
+        return asyncio.run(cache.select_by_id(id, select_by_id))
+
+    assert [run(id) for id in missing_ids] == [None, None]
+    assert [run(id) for id in missing_ids] == [None, None]
+    assert lookups == missing_ids
+
+    # Another instance's insert, notified through the listener.
+    record_existing_id("existence_cache_test_notified", missing_ids[0])
+    assert run(missing_ids[0]) is None
+    assert run(missing_ids[1]) is None
+    assert lookups == missing_ids + [missing_ids[0]]
+
+    # The listener reconnected, inserts notified meanwhile are lost.
+    clear_existence_caches()
+    assert run(missing_ids[1]) is None
+    assert lookups == missing_ids + missing_ids
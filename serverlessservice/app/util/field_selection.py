@@ -0,0 +1,153 @@
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+# The column behind each outbound field, per table. id, created_at and updated_at are
+# always selected.
+table_field_columns: dict[str, dict[str, str]] = {
+    "venues": {"name": "name"},
+    "seasons": {"name": "name", "season_number": "season_number"},
+    "fantasy_leagues": {"name": "name"},
+    "league_teams": {
+        "name": "name",
+        "short_name": "short_name",
+        "home_venue_id": "home_venue_id",
+        "global_mnp_id": "global_mnp_id",
+    },
+    "league_players": {
+        "name": "name",
+        "global_mnp_id": "global_mnp_id",
+        "league_team_id": "league_team_id",
+    },
+    "users": {
+        "name": "name",
+        "username": "username",
+        "league_player_id": "league_player_id",
+    },
+    "fantasy_teams": {
+        "name": "name",
+        "owner_id": "owner_id",
+        "fantasy_league_id": "fantasy_league_id",
+    },
+    "fantasy_team_season_links": {
+        "season_id": "season_id",
+        "fantasy_team_id": "fantasy_team_id",
+        "fantasy_team_owner_id": "fantasy_team_owner_id_dn",
+        "fantasy_league_id": "fantasy_league_id_dn",
+    },
+    "league_player_fantasy_team_season_links": {
+        "league_player_id": "league_player_id",
+        "league_team_id": "league_team_id_dn",
+        "fantasy_team_season_link_id": "fantasy_team_season_link_id",
+        "season_id": "season_id_dn",
+        "fantasy_team_id": "fantasy_team_id_dn",
+        "fantasy_team_owner_id": "fantasy_team_owner_id_dn",
+        "fantasy_league_id": "fantasy_league_id_dn",
+    },
+}
+
+always_selected_columns = ["id", "created_at", "updated_at"]
+
+
+class FieldSelection:
+    """
+    Fields asked for through the fields query parameter or the MNFP-Fields header.
+    Dotted paths pick fields of a hydrated child, "id,name,league_team.short_name"
+    keeps id and name and only short_name of league_team. A field named without a dot
+    is kept whole. Unknown fields are ignored.
+    """
+
+    def __init__(
+        self, fields: dict[str, "FieldSelection | None"] | None = None
+    ) -> None:
+        self.fields: dict[str, FieldSelection | None] = fields or {}
+
+    @staticmethod
+    def parse(value: str) -> "FieldSelection":
+        selection = FieldSelection()
+
+        for path in value.split(","):
+            path = path.strip()
+
+            if path != "":
+                selection.add_path(path.split("."))
+
+        return selection
+
+    def add_path(self, tokens: list[str]) -> None:
+        name = tokens[0]
+
+        if len(tokens) == 1:
+            self.fields[name] = None
+            return
+
+        if name in self.fields and self.fields[name] is None:
+            return
+
+        child = self.fields.get(name) or FieldSelection()
+        child.add_path(tokens[1:])
+
+        self.fields[name] = child
+
+    def get_hydration(self, prefix: str = "") -> list[str]:
+        # A dotted path can only be answered from a hydrated child.
+        hydration: list[str] = []
+
+        for name, child in self.fields.items():
+            if child is not None:
+                hydration.append(prefix + name)
+                hydration.extend(child.get_hydration(f"{prefix}{name}."))
+
+        return hydration
+
+    def get_template_key(self) -> tuple[Any, ...]:
+        return tuple(
+            (name, None if child is None else child.get_template_key())
+            for name, child in sorted(self.fields.items())
+        )
+
+    def get_columns(
+        self, table_name: str, required_columns: list[str]
+    ) -> list[str] | None:
+        """
+        Columns to select from table_name, None selects them all. required_columns are
+        added for the query's own use, sort and hydration foreign keys.
+        """
+        field_columns = table_field_columns.get(table_name)
+
+        if field_columns is None:
+            return None
+
+        columns = list(always_selected_columns)
+
+        for column in [
+            field_columns[name] for name in self.fields if name in field_columns
+        ] + required_columns:
+            if column not in columns:
+                columns.append(column)
+
+        return columns
+
+    def project(self, model: Any) -> dict[str, Any]:
+        return {
+            name: self.project_value(model.__dict__[name], child)
+            for name, child in self.fields.items()
+            if name in model.__dict__ and name != "hydrated_targets"
+        }
+
+    def project_value(self, value: Any, child: "FieldSelection | None") -> Any:
+        # UUIDs and datetimes stay as they are, each response format writes its own.
+        if isinstance(value, (datetime, UUID)):
+            return value
+
+        # Hydrated collections are lists of models, each projected the same way.
+        if isinstance(value, list):
+            return [self.project_value(item, child) for item in value]
+
+        if hasattr(value, "__dict__"):
+            if child is None:
+                child = FieldSelection({name: None for name in value.__dict__})
+
+            return child.project(value)
+
+        return value
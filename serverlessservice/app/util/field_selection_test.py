@@ -0,0 +1,101 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import orjson
+
+from util.common import RequestOperators
+from util.database import PagingModel
+from util.db_connection import PGConnection
+from util.field_selection import FieldSelection
+from util.responses import render_outbound_json
+
+
+class Child:
+    def __init__(self) -> None:
+        self.id = uuid4()
+        self.name = "child"
+        self.short_name = "CHD"
+
+
+class Parent:
+    def __init__(self) -> None:
+        self.id = uuid4()
+        self.name = "parent"
+        self.created_at = datetime(2024, 1, 2, 3, 4, 5, 678000, tzinfo=timezone.utc)
+        self.league_team = Child()
+        self.league_players = [Child(), Child()]
+        self.hydrated_targets = {"league_team", "league_players"}
+
+
+def test_parses_dotted_paths_into_hydration():
+    selection = FieldSelection.parse(
+        "id, name,league_team.short_name,league_team.home_venue.name"
+    )
+
+    assert list(selection.fields) == ["id", "name", "league_team"]
+    assert selection.get_hydration() == ["league_team", "league_team.home_venue"]
+
+
+def test_whole_field_wins_over_dotted_path():
+    selection = FieldSelection.parse("league_team.short_name,league_team")
+
+    assert selection.fields == {"league_team": None}
+    assert selection.get_hydration() == []
+
+
+def test_projects_selected_fields():
+    parent = Parent()
+
+    projected = FieldSelection.parse(
+        "id,created_at,league_team.short_name,hydrated_targets,unknown"
+    ).project(parent)
+
+    assert projected == {
+        "id": parent.id,
+        "created_at": parent.created_at,
+        "league_team": {"short_name": "CHD"},
+    }
+    assert orjson.loads(render_outbound_json(projected)) == {
+        "id": str(parent.id),
+        "created_at": "2024-01-02T03:04:05.678Z",
+        "league_team": {"short_name": "CHD"},
+    }
+
+
+def test_projects_each_item_of_a_collection():
+    parent = Parent()
+
+    assert FieldSelection.parse("id,league_players.name").project(parent) == {
+        "id": parent.id,
+        "league_players": [{"name": "child"}, {"name": "child"}],
+    }
+
+    projected = FieldSelection.parse("league_players").project(parent)
+
+    assert projected == {
+        "league_players": [
+            {"id": child.id, "name": "child", "short_name": "CHD"}
+            for child in parent.league_players
+        ]
+    }
+    assert orjson.loads(render_outbound_json(projected)) == {
+        "league_players": [
+            {"id": str(child.id), "name": "child", "short_name": "CHD"}
+            for child in parent.league_players
+        ]
+    }
+
+
+def test_selects_only_requested_columns():
+    connection = PGConnection()
+
+    results = connection.build_select_query(
+        "league_players",
+        [],
+        PagingModel(page_length=10, page=1),
+        RequestOperators(fields=FieldSelection.parse("name,unknown")),
+    )
+
+    assert results.sql_string_and_parameters.sql_string.startswith(
+        "SELECT id, created_at, updated_at, name, count(*) over() as _count_ FROM"
+    )
@@ -1,70 +1,500 @@
-from typing import Any
+import asyncio
+import copy
+import functools
+import operator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from types import MappingProxyType
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Iterator,
+    Mapping,
+    TypeVar,
+)
 from uuid import UUID
 from util.common import RequestOperators
 
+T = TypeVar("T")
 
-class HydrationUtil:
-    def reduce_hydration_tokens(self, string: str, target: str) -> str:
-        if string == target:
-            return ""
-        else:
-            tokens = string.split(".")
-            reduced_tokens = [x for i, x in enumerate(tokens) if i > 0]
-            reduced_string = ".".join(reduced_tokens)
-            return reduced_string
-
-    def seek_hydration_and_reduce(self, target: str, hydration: list[str]):
-        list_of_reduced_strings = [
-            self.reduce_hydration_tokens(x, target)
-            for x in hydration
-            if x.startswith(f"{target}.") or x == target
-        ]
 
-        return list_of_reduced_strings
+class HydrationPlan:
+    """
+    MNFP-Hydration compiled into a tree, one node per target with the targets
+    hydrated under it as children. Plans are shared between requests sending the
+    same header and must not be changed.
+    """
+
+    def __init__(self, targets: dict[str, "HydrationPlan"] | None = None) -> None:
+        self.targets: Mapping[str, HydrationPlan] = MappingProxyType(targets or {})
+
+    def get(self, target_name: str) -> "HydrationPlan | None":
+        return self.targets.get(target_name)
+
+    def is_empty(self) -> bool:
+        return len(self.targets) == 0
+
+    def get_paths(self, prefix: str = "") -> list[str]:
+        # Back to MNFP-Hydration paths, for searches that hydrate while they stream.
+        paths: list[str] = []
+
+        for target_name, target_plan in self.targets.items():
+            paths.append(prefix + target_name)
+            paths.extend(target_plan.get_paths(f"{prefix}{target_name}."))
+
+        return paths
+
+
+empty_hydration_plan = HydrationPlan()
+
+
+def build_hydration_plan(paths: list[list[str]]) -> HydrationPlan:
+    targets: dict[str, list[list[str]]] = {}
+
+    for path in paths:
+        targets.setdefault(path[0], [])
+
+        if len(path) > 1:
+            targets[path[0]].append(path[1:])
+
+    return HydrationPlan(
+        {
+            target_name: build_hydration_plan(sub_paths)
+            for target_name, sub_paths in targets.items()
+        }
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def compile_hydration_plan(hydration_header: str) -> HydrationPlan:
+    # "league_team.home_venue" hydrates league_team and home_venue under it.
+    paths = [path.split(".") for path in hydration_header.split(",") if path != ""]
+
+    return build_hydration_plan(paths)
+
+
+def get_hydration_plan(request_operators: RequestOperators | None) -> HydrationPlan:
+    if request_operators is None or request_operators.hydration is None:
+        return empty_hydration_plan
+
+    return compile_hydration_plan(",".join(request_operators.hydration))
+
+
+# Children are always streamed whole, one shared instance, never modified.
+unpaged_request_operators = RequestOperators(skip_paging=True)
+
+
+class EntityLoader:
+    """
+    DataLoader style batching for one entity type. Ids asked for while a batch is
+    pending, by any target anywhere in the hydration tree, are fetched together on
+    the next turn of the event loop. Ids the identity map already holds are never
+    fetched again.
+    """
+
+    def __init__(
+        self,
+        entity_type: str,
+        identity_map: "HydrationIdentityMap",
+        load_function: Callable[[list[UUID]], AsyncIterator[Any]],
+    ) -> None:
+        self.entity_type = entity_type
+        self.identity_map = identity_map
+        self.load_function = load_function
+
+        self.pending_ids: list[UUID] = []
+        self.pending_batch: asyncio.Future[None] | None = None
+        self.in_flight: dict[UUID, asyncio.Future[None]] = {}
+
+        self.batches_num = 0
+
+    def enqueue(self, id: UUID) -> asyncio.Future[None]:
+        batch = self.in_flight.get(id)
+
+        if batch is not None:
+            return batch
 
-    def hydrate_target(
+        if self.pending_batch is None:
+            self.pending_batch = asyncio.get_running_loop().create_future()
+
+        self.pending_ids.append(id)
+        self.in_flight[id] = self.pending_batch
+
+        return self.pending_batch
+
+    async def dispatch(self) -> None:
+        ids = self.pending_ids
+        batch = self.pending_batch
+
+        self.pending_ids = []
+        self.pending_batch = None
+
+        if batch is None:
+            return
+
+        self.batches_num += 1
+
+        try:
+            async for entity in self.load_function(ids):
+                self.identity_map.set(self.entity_type, entity.id, entity)
+
+            # Misses are remembered too, a dangling id is looked up once.
+            for id in ids:
+                if not self.identity_map.contains(self.entity_type, id):
+                    self.identity_map.set(self.entity_type, id, None)
+
+            batch.set_result(None)
+        except Exception as e:
+            batch.set_exception(e)
+        finally:
+            for id in ids:
+                self.in_flight.pop(id, None)
+
+    async def load_many(self, ids: list[UUID]) -> dict[UUID, Any]:
+        batches = {
+            self.enqueue(id)
+            for id in ids
+            if not self.identity_map.contains(self.entity_type, id)
+        }
+
+        if len(batches) > 0:
+            # One turn of the loop lets concurrently running targets queue their ids.
+            await asyncio.sleep(0)
+
+            if self.pending_batch in batches:
+                await self.dispatch()
+
+            for batch in batches:
+                await batch
+
+        return {id: self.identity_map.get(self.entity_type, id) for id in ids}
+
+
+class HydrationIdentityMap:
+    """
+    Entities loaded for hydration during one request, keyed by (entity type, id).
+    """
+
+    def __init__(self) -> None:
+        self.entities: dict[tuple[str, UUID], Any] = {}
+        self.loaders: dict[str, EntityLoader] = {}
+
+    def contains(self, entity_type: str, id: UUID) -> bool:
+        return (entity_type, id) in self.entities
+
+    def get(self, entity_type: str, id: UUID) -> Any:
+        return self.entities.get((entity_type, id))
+
+    def set(self, entity_type: str, id: UUID, entity: Any) -> None:
+        self.entities[(entity_type, id)] = entity
+
+    def get_loader(
+        self,
+        entity_type: str,
+        load_function: Callable[[list[UUID]], AsyncIterator[Any]],
+    ) -> EntityLoader:
+        loader = self.loaders.get(entity_type)
+
+        if loader is None:
+            loader = EntityLoader(entity_type, self, load_function)
+            self.loaders[entity_type] = loader
+
+        return loader
+
+    def copy_entity(self, entity: T) -> T:
+        entity_copy = copy.copy(entity)
+
+        if hasattr(entity, "hydrated_targets"):
+            entity_copy.__dict__["hydrated_targets"] = set(entity.hydrated_targets)
+
+        return entity_copy
+
+
+class HydrationTargetAccessor:
+    """
+    Reads a target's foreign key off parent models and writes the hydrated child back.
+    Built once per target name, the getter is compiled instead of formatting the key
+    and going through __dict__ for every parent.
+    """
+
+    def __init__(self, target_name: str) -> None:
+        self.target_name = target_name
+        self.get_id: Callable[[Any], UUID | None] = operator.attrgetter(
+            f"{target_name}_id"
+        )
+
+    def collect_ids(self, parent_models: list[Any]) -> list[UUID]:
+        # Many parents share a target, a page of roster links points at a handful of
+        # seasons. Each id is asked for once, in the order first seen.
+        ids = dict.fromkeys(map(self.get_id, parent_models))
+        ids.pop(None, None)
+
+        return list(ids)
+
+    def assign(self, parent_models: list[Any], children: dict[UUID, Any]) -> None:
+        get_id = self.get_id
+        target_name = self.target_name
+
+        for parent_model in parent_models:
+            parent_model.__dict__[target_name] = children.get(get_id(parent_model))
+
+
+@functools.cache
+def get_target_accessor(target_name: str) -> HydrationTargetAccessor:
+    return HydrationTargetAccessor(target_name)
+
+
+current_hydration_identity_map: ContextVar[HydrationIdentityMap | None] = ContextVar(
+    "current_hydration_identity_map", default=None
+)
+
+
+# Set while hydrate_targets runs sibling targets, guards the caller's connection.
+current_shared_connection_lock: ContextVar[asyncio.Lock | None] = ContextVar(
+    "current_shared_connection_lock", default=None
+)
+
+
+@contextmanager
+def hydration_identity_map_scope() -> Iterator[HydrationIdentityMap]:
+    identity_map = HydrationIdentityMap()
+    token = current_hydration_identity_map.set(identity_map)
+
+    try:
+        yield identity_map
+    finally:
+        current_hydration_identity_map.reset(token)
+
+
+class HydrationUtil:
+    # Connections hydration may borrow from the pool at once, across all requests, to
+    # run independent targets side by side. Never waited on, a target that finds none
+    # free runs on the connection of the caller.
+    parallel_branches: asyncio.Semaphore = asyncio.Semaphore(4)
+
+    async def hydrate_target(
         self,
         target_name: str,
         parent_models: list[Any],
-        search_model: Any,
-        search_function: callable,
-        hydration: list[str],
+        search_model_type: Callable[[], Any],
+        stream_function: Callable[..., AsyncIterator[Any]],
+        hydration_plan: HydrationPlan,
+        entity_type: str,
+        hydrate_function: Callable[..., Awaitable[None]],
     ) -> None:
-        if hydration is None:
+        target_plan = hydration_plan.get(target_name)
+
+        if target_plan is None:
             return
 
-        sub_hydration_list = self.seek_hydration_and_reduce(target_name, hydration)
+        joined_children = [
+            parent_model.__dict__[target_name]
+            for parent_model in parent_models
+            if target_name in getattr(parent_model, "hydrated_targets", ())
+            and parent_model.__dict__[target_name] is not None
+        ]
+
+        if len(joined_children) > 0 and not target_plan.is_empty():
+            # A joined select filled in the target and its forward targets, the one to
+            # many targets under it still need their own searches.
+            await hydrate_function(joined_children, hydration_plan=target_plan)
 
-        if len(sub_hydration_list) > 0:
-            sub_hydration_list_with_root_removed = [
-                x for x in sub_hydration_list if x != target_name
-            ]
+        parent_models = [
+            parent_model
+            for parent_model in parent_models
+            if target_name not in getattr(parent_model, "hydrated_targets", ())
+        ]
+
+        if len(parent_models) == 0:
+            return
 
-            sub_operators: RequestOperators = RequestOperators(skip_paging=True)
+        accessor = get_target_accessor(target_name)
 
-            if len(sub_hydration_list_with_root_removed) > 0:
-                sub_operators.hydration = [
-                    x for x in sub_hydration_list_with_root_removed
-                ]
+        target_ids = accessor.collect_ids(parent_models)
 
-            target_ids = [
-                parent_model.__dict__[f"{target_name}_id"]
-                for parent_model in parent_models
-                if parent_model.__dict__[f"{target_name}_id"] is not None
-            ]
+        if len(target_ids) == 0:
+            # Nothing to fetch, and no connection to wait for.
+            accessor.assign(parent_models, {})
+            return
+
+        # Outside of a request scope every call gets a map of its own.
+        identity_map = current_hydration_identity_map.get() or HydrationIdentityMap()
+
+        async def load_function(ids: list[UUID]) -> AsyncIterator[Any]:
+            # Batches can be in flight at the same time, each gets its own model.
+            batch_search_model = search_model_type()
+            batch_search_model.ids = ids
+
+            async for child in stream_function(
+                batch_search_model, None, unpaged_request_operators
+            ):
+                yield child
 
-            search_model.ids = target_ids
+        async with self.enter_branch():
+            loader = identity_map.get_loader(entity_type, load_function)
 
-            existing_children = search_function(search_model, None, sub_operators)
+            entities = await loader.load_many(target_ids)
 
+            # Each target hydrates its own copies, sub targets asked for under one path
+            # must not show up under another path that shares the entity.
             existing_children_dict: dict[UUID, Any] = {
-                child.id: child for child in existing_children.items
+                id: identity_map.copy_entity(entity)
+                for id, entity in entities.items()
+                if entity is not None
             }
 
-            for parent_model in parent_models:
-                existing_child = (
-                    existing_children_dict[parent_model.__dict__[f"{target_name}_id"]]
-                    if parent_model.__dict__[f"{target_name}_id"] is not None
-                    else None
+            if not target_plan.is_empty() and len(existing_children_dict) > 0:
+                await hydrate_function(
+                    list(existing_children_dict.values()), hydration_plan=target_plan
                 )
-                parent_model.__dict__[target_name] = existing_child
+
+            accessor.assign(parent_models, existing_children_dict)
+
+    async def hydrate_collection(
+        self,
+        target_name: str,
+        parent_models: list[Any],
+        search_model_type: Callable[[], Any],
+        parent_ids_filter: str,
+        parent_id_field: str,
+        stream_function: Callable[..., AsyncIterator[Any]],
+        hydration_plan: HydrationPlan,
+        through: str | None = None,
+    ) -> None:
+        """
+        Hydrates a one to many target, the rows pointing back at each parent. One
+        search on parent_ids_filter covers every parent and its rows are grouped on
+        parent_id_field. With through set the search returns link rows and each parent
+        collects their through target. Targets under this one hydrate as the rows
+        stream.
+        """
+        target_plan = hydration_plan.get(target_name)
+
+        if target_plan is None or len(parent_models) == 0:
+            return
+
+        children_by_parent_id: dict[UUID, list[Any]] = {
+            parent_model.id: [] for parent_model in parent_models
+        }
+
+        child_hydration = target_plan.get_paths()
+
+        if through is not None:
+            child_hydration = [through] + [
+                f"{through}.{path}" for path in child_hydration
+            ]
+
+        search_model = search_model_type()
+        setattr(search_model, parent_ids_filter, list(children_by_parent_id))
+
+        get_parent_id = operator.attrgetter(parent_id_field)
+
+        async with self.enter_branch():
+            async for child in stream_function(
+                search_model,
+                None,
+                RequestOperators(
+                    skip_paging=True,
+                    hydration=child_hydration if len(child_hydration) > 0 else None,
+                ),
+            ):
+                item = child if through is None else child.__dict__[through]
+
+                if item is not None:
+                    children_by_parent_id[get_parent_id(child)].append(item)
+
+        for parent_model in parent_models:
+            parent_model.__dict__[target_name] = list(
+                children_by_parent_id[parent_model.id]
+            )
+
+    async def hydrate_targets(self, *hydrations: Coroutine[Any, Any, None]) -> None:
+        """
+        Runs sibling targets, which never depend on one another, as concurrent tasks.
+        Nested targets still wait for the target they hang off, so a tree of targets
+        takes as long as its deepest branch rather than the sum of all of them.
+        """
+        token = current_shared_connection_lock.set(asyncio.Lock())
+
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                for hydration in hydrations:
+                    task_group.create_task(hydration)
+        finally:
+            current_shared_connection_lock.reset(token)
+
+    @asynccontextmanager
+    async def enter_branch(self) -> AsyncIterator[None]:
+        """
+        Picks the connection a target started by hydrate_targets loads through. The
+        caller's connection when no sibling is using it, else a connection borrowed
+        from the pool into a unit of work of its own if one is free right now, else
+        the caller's connection once it frees up. No connection is used by two tasks
+        at once, and a task holding the request's connection never waits on the pool
+        for a second one. Borrowed connections only see committed rows, which every
+        target a parent points at already is.
+        """
+        shared_connection_lock = current_shared_connection_lock.get()
+
+        if shared_connection_lock is None:
+            yield
+            return
+
+        # Targets nested under this one form sibling groups of their own.
+        token = current_shared_connection_lock.set(None)
+
+        try:
+            if not shared_connection_lock.locked() or self.parallel_branches.locked():
+                async with shared_connection_lock:
+                    yield
+            else:
+                # Does not wait, the semaphore is known to be free.
+                await self.parallel_branches.acquire()
+
+                from util.configuration import get_global_configuration
+
+                pg_connection = get_global_configuration().pg_connection
+
+                try:
+                    async with pg_connection.borrow_unit_of_work() as unit_of_work:
+                        if unit_of_work is not None:
+                            yield
+                        else:
+                            # The pool has nothing free, wait for the caller's instead.
+                            async with shared_connection_lock:
+                                yield
+                finally:
+                    self.parallel_branches.release()
+        finally:
+            current_shared_connection_lock.reset(token)
+
+    async def hydrate_in_batches(
+        self,
+        items: AsyncIterator[T],
+        hydrate_function: Callable[[list[T], RequestOperators | None], Awaitable[None]],
+        request_operators: RequestOperators | None = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[T]:
+        # Streams stay bounded, nested hydration runs once per batch instead of once
+        # per item or once for everything.
+        batch: list[T] = []
+
+        async for item in items:
+            batch.append(item)
+
+            if len(batch) == batch_size:
+                await hydrate_function(batch, request_operators)
+
+                for hydrated_item in batch:
+                    yield hydrated_item
+
+                batch = []
+
+        if len(batch) > 0:
+            await hydrate_function(batch, request_operators)
+
+            for hydrated_item in batch:
+                yield hydrated_item
@@ -0,0 +1,115 @@
+"""
+Micro-benchmark for HydrationUtil.hydrate_target.
+
+Hydrates one target for growing numbers of parents pointing at a fixed number of
+distinct children, against an in-memory stream, so only the hydration path itself is
+measured. Run from serverlessservice/app:
+
+    python -m util.hydration_benchmark --parents 10 100 1000 10000 --distinct 10
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any, AsyncIterator
+from uuid import UUID, uuid4
+
+from util.common import RequestOperators
+from util.hydration import (
+    HydrationPlan,
+    HydrationUtil,
+    compile_hydration_plan,
+    hydration_identity_map_scope,
+)
+
+
+class BenchmarkChild:
+    def __init__(self) -> None:
+        self.id = uuid4()
+
+
+class BenchmarkParent:
+    def __init__(self, child_id: UUID) -> None:
+        self.child_id = child_id
+        self.child: Any = None
+
+
+class BenchmarkSearchModel:
+    def __init__(self) -> None:
+        self.ids: list[UUID] | None = None
+
+
+async def hydrate_nothing(
+    result_list: list[Any],
+    request_operators: RequestOperators | None = None,
+    hydration_plan: HydrationPlan | None = None,
+) -> None:
+    pass
+
+
+async def run_once(parent_count: int, distinct_count: int) -> tuple[float, int]:
+    children = {
+        child.id: child for child in [BenchmarkChild() for _ in range(distinct_count)]
+    }
+    child_ids = list(children)
+    parents = [
+        BenchmarkParent(child_ids[i % distinct_count]) for i in range(parent_count)
+    ]
+    requested_ids: list[int] = []
+
+    async def stream_function(
+        search_model: BenchmarkSearchModel,
+        paging: Any,
+        request_operators: RequestOperators,
+    ) -> AsyncIterator[BenchmarkChild]:
+        requested_ids.append(len(search_model.ids or []))
+
+        for id in search_model.ids or []:
+            if id in children:
+                yield children[id]
+
+    start = time.perf_counter()
+
+    with hydration_identity_map_scope():
+        await HydrationUtil().hydrate_target(
+            "child",
+            parents,
+            BenchmarkSearchModel,
+            stream_function,
+            compile_hydration_plan("child"),
+            entity_type="children",
+            hydrate_function=hydrate_nothing,
+        )
+
+    return time.perf_counter() - start, sum(requested_ids)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--parents", type=int, nargs="+", default=[10, 100, 1000, 10000]
+    )
+    parser.add_argument("--distinct", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'parents':>10} {'ids sent':>10} {'best ms':>10} {'us/parent':>10}")
+
+    for parent_count in args.parents:
+        timings: list[float] = []
+        ids_sent = 0
+
+        for _ in range(args.repeat):
+            elapsed, ids_sent = asyncio.run(run_once(parent_count, args.distinct))
+            timings.append(elapsed)
+
+        best = min(timings)
+
+        print(
+            f"{parent_count:>10} {ids_sent:>10} {best * 1000:>10.3f} "
+            f"{best * 1_000_000 / parent_count:>10.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
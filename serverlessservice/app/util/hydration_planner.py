@@ -0,0 +1,292 @@
+from typing import Any
+
+
+class HydrationRelation:
+    def __init__(self, target_name: str, table_name: str, foreign_key: str) -> None:
+        self.target_name = target_name
+        self.table_name = table_name
+        # Column on the parent table holding the target's id.
+        self.foreign_key = foreign_key
+
+
+class HydrationCollectionStep:
+    def __init__(self, table_name: str, column: str, parent_column: str) -> None:
+        self.table_name = table_name
+        # Rows whose column equals parent_column on the previous table's rows.
+        self.column = column
+        self.parent_column = parent_column
+
+
+class HydrationPlanNode:
+    def __init__(
+        self,
+        relation: HydrationRelation,
+        alias: str,
+        children: list["HydrationPlanNode"],
+    ) -> None:
+        self.relation = relation
+        self.alias = alias
+        self.children = children
+
+
+# The targets Hydrator knows about, by parent table.
+hydration_relations: dict[str, list[HydrationRelation]] = {
+    "league_teams": [
+        HydrationRelation("home_venue", "venues", "home_venue_id"),
+    ],
+    "league_players": [
+        HydrationRelation("league_team", "league_teams", "league_team_id"),
+    ],
+    "users": [
+        HydrationRelation("league_player", "league_players", "league_player_id"),
+    ],
+    "fantasy_teams": [
+        HydrationRelation("fantasy_league", "fantasy_leagues", "fantasy_league_id"),
+        HydrationRelation("owner", "users", "owner_id"),
+    ],
+    "fantasy_team_season_links": [
+        HydrationRelation("season", "seasons", "season_id"),
+        HydrationRelation("fantasy_team", "fantasy_teams", "fantasy_team_id"),
+        HydrationRelation("fantasy_league", "fantasy_leagues", "fantasy_league_id_dn"),
+        HydrationRelation("fantasy_team_owner", "users", "fantasy_team_owner_id_dn"),
+    ],
+    "league_player_fantasy_team_season_links": [
+        HydrationRelation("league_player", "league_players", "league_player_id"),
+        HydrationRelation("league_team", "league_teams", "league_team_id_dn"),
+        HydrationRelation(
+            "fantasy_team_season_link",
+            "fantasy_team_season_links",
+            "fantasy_team_season_link_id",
+        ),
+        HydrationRelation("fantasy_team", "fantasy_teams", "fantasy_team_id_dn"),
+        HydrationRelation("fantasy_league", "fantasy_leagues", "fantasy_league_id_dn"),
+        HydrationRelation("fantasy_team_owner", "users", "fantasy_team_owner_id_dn"),
+        HydrationRelation("season", "seasons", "season_id_dn"),
+    ],
+}
+
+
+# One-to-many targets Hydrator loads with a search of their own, by parent table, with
+# the tables each reads and how they join. Nested paths continue from the last table.
+hydration_collections: dict[str, dict[str, list[HydrationCollectionStep]]] = {
+    "league_teams": {
+        "league_players": [
+            HydrationCollectionStep("league_players", "league_team_id", "id")
+        ]
+    },
+    "fantasy_team_season_links": {
+        "league_players": [
+            HydrationCollectionStep(
+                "league_player_fantasy_team_season_links",
+                "fantasy_team_season_link_id",
+                "id",
+            ),
+            HydrationCollectionStep("league_players", "id", "league_player_id"),
+        ]
+    },
+}
+
+
+class HydrationPlanner:
+    """
+    Turns MNFP-Hydration paths into a single statement: the page query becomes a
+    subquery, every target is LEFT JOINed on its foreign key and returned as one jsonb
+    column per top level target, with nested targets folded into their parent's
+    object. A fully hydrated page then costs one round trip.
+    """
+
+    column_prefix = "_hydrated_"
+
+    def __init__(
+        self,
+        relations: dict[str, list[HydrationRelation]] = hydration_relations,
+        collections: dict[
+            str, dict[str, list[HydrationCollectionStep]]
+        ] = hydration_collections,
+    ) -> None:
+        self.relations = relations
+        self.collections = collections
+
+    def plan(
+        self, table_name: str, hydration: list[str] | None
+    ) -> list[HydrationPlanNode]:
+        if hydration is None:
+            return []
+
+        paths = [path.split(".") for path in hydration if path != ""]
+
+        return self.plan_level(table_name, paths, [0])
+
+    def plan_level(
+        self, table_name: str, paths: list[list[str]], alias_counter: list[int]
+    ) -> list[HydrationPlanNode]:
+        # Unknown targets are ignored, the same as Hydrator does.
+        nodes: list[HydrationPlanNode] = []
+
+        for relation in self.relations.get(table_name, []):
+            if not any(path[0] == relation.target_name for path in paths):
+                continue
+
+            sub_paths = [
+                path[1:]
+                for path in paths
+                if path[0] == relation.target_name and len(path) > 1
+            ]
+
+            alias = f"_h{alias_counter[0]}_"
+            alias_counter[0] += 1
+
+            nodes.append(
+                HydrationPlanNode(
+                    relation,
+                    alias,
+                    self.plan_level(relation.table_name, sub_paths, alias_counter),
+                )
+            )
+
+        return nodes
+
+    def get_template_key(self, plan: list[HydrationPlanNode]) -> tuple[Any, ...]:
+        return tuple(
+            (node.relation.target_name, self.get_template_key(node.children))
+            for node in plan
+        )
+
+    def build_json_sql(self, node: HydrationPlanNode) -> str:
+        json_sql = f"to_jsonb({node.alias})"
+
+        if len(node.children) > 0:
+            json_sql += " || jsonb_build_object("
+            json_sql += ", ".join(
+                [
+                    f"'{self.column_prefix}{child.relation.target_name}', "
+                    f"{self.build_json_sql(child)}"
+                    for child in node.children
+                ]
+            )
+            json_sql += ")"
+
+        return f"CASE WHEN {node.alias}.id IS NULL THEN NULL ELSE {json_sql} END"
+
+    def build_join_sql(self, node: HydrationPlanNode, parent_alias: str) -> str:
+        sqlstring = (
+            f"LEFT JOIN {node.relation.table_name} AS {node.alias} "
+            f"ON {node.alias}.id = {parent_alias}.{node.relation.foreign_key}\n"
+        )
+
+        for child in node.children:
+            sqlstring += self.build_join_sql(child, node.alias)
+
+        return sqlstring
+
+    def build_hydrated_select_query(
+        self,
+        sql_string: str,
+        plan: list[HydrationPlanNode],
+        order_by: list[str],
+    ) -> str:
+        """
+        Wraps a select built by build_select_query. Paging, counts and cursor seeks
+        stay inside the subquery, order_by (unqualified "column [DESC]" terms)
+        restores the page order the joins do not preserve.
+        """
+        sqlstring = "SELECT _base_.*"
+
+        for node in plan:
+            sqlstring += (
+                f",\n\t{self.build_json_sql(node)} "
+                f"AS {self.column_prefix}{node.relation.target_name}"
+            )
+
+        sqlstring += f"\nFROM (\n{sql_string.rstrip(';')}\n) AS _base_\n"
+
+        for node in plan:
+            sqlstring += self.build_join_sql(node, "_base_")
+
+        sqlstring += "ORDER BY " + ", ".join([f"_base_.{term}" for term in order_by])
+        sqlstring += ";"
+
+        return sqlstring
+
+    def get_table_names(
+        self, table_name: str, hydration: list[str] | None
+    ) -> list[str]:
+        """
+        Every table a response hydrated with these paths reads from, besides
+        table_name itself, joined targets and collections alike.
+        """
+        table_names: list[str] = []
+
+        for _, step, _ in self.get_read_joins(table_name, hydration):
+            if step.table_name not in table_names:
+                table_names.append(step.table_name)
+
+        return table_names
+
+    def get_read_joins(
+        self, table_name: str, hydration: list[str] | None
+    ) -> list[tuple[str, HydrationCollectionStep, str]]:
+        """
+        For every table a response hydrated with these paths reads from, the joins
+        from the rows of table_name, aliased _base_, to the rows it reads there. Each
+        entry is the alias of those rows, the step reaching them and the JOIN clauses
+        leading up to and including that step.
+        """
+        read_joins: list[tuple[str, HydrationCollectionStep, str]] = []
+
+        if hydration is not None:
+            self.collect_read_joins(
+                table_name,
+                "_base_",
+                "",
+                [path.split(".") for path in hydration if path != ""],
+                read_joins,
+            )
+
+        return read_joins
+
+    def collect_read_joins(
+        self,
+        table_name: str,
+        parent_alias: str,
+        parent_join_sql: str,
+        paths: list[list[str]],
+        read_joins: list[tuple[str, HydrationCollectionStep, str]],
+    ) -> None:
+        # A joined target is a collection of one step, matched on its id.
+        targets: dict[str, list[HydrationCollectionStep]] = {
+            relation.target_name: [
+                HydrationCollectionStep(relation.table_name, "id", relation.foreign_key)
+            ]
+            for relation in self.relations.get(table_name, [])
+        }
+        targets.update(self.collections.get(table_name, {}))
+
+        for target_name, steps in targets.items():
+            if not any(path[0] == target_name for path in paths):
+                continue
+
+            alias = parent_alias
+            join_sql = parent_join_sql
+
+            for step in steps:
+                step_alias = f"_r{len(read_joins)}_"
+                join_sql += (
+                    f"JOIN {step.table_name} AS {step_alias} "
+                    f"ON {step_alias}.{step.column} = {alias}.{step.parent_column}\n"
+                )
+                alias = step_alias
+
+                read_joins.append((alias, step, join_sql))
+
+            self.collect_read_joins(
+                steps[-1].table_name,
+                alias,
+                join_sql,
+                [
+                    path[1:]
+                    for path in paths
+                    if path[0] == target_name and len(path) > 1
+                ],
+                read_joins,
+            )
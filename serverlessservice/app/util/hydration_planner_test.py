@@ -0,0 +1,55 @@
+from util.common import RequestOperators
+from util.database import PagingModel
+from util.db_connection import PGConnection
+from util.hydration_planner import HydrationPlanner
+
+
+def test_plans_nested_targets_and_ignores_unknown_ones():
+    planner = HydrationPlanner()
+
+    plan = planner.plan(
+        "league_players", ["league_team", "league_team.home_venue", "not_a_target"]
+    )
+
+    assert len(plan) == 1
+    assert plan[0].relation.target_name == "league_team"
+    assert plan[0].alias == "_h0_"
+    assert len(plan[0].children) == 1
+    assert plan[0].children[0].relation.target_name == "home_venue"
+    assert plan[0].children[0].alias == "_h1_"
+
+
+def test_builds_joined_select_for_hydration():
+    connection = PGConnection()
+
+    results = connection.build_select_query(
+        "league_players",
+        [],
+        PagingModel(page_length=10, page=1),
+        RequestOperators(hydration=["league_team.home_venue"]),
+    )
+
+    sqlstring = results.sql_string_and_parameters.sql_string
+
+    assert sqlstring.startswith("SELECT _base_.*,\n")
+    assert (
+        "CASE WHEN _h0_.id IS NULL THEN NULL ELSE to_jsonb(_h0_) || "
+        "jsonb_build_object('_hydrated_home_venue', "
+        "CASE WHEN _h1_.id IS NULL THEN NULL ELSE to_jsonb(_h1_) END) END "
+        "AS _hydrated_league_team" in sqlstring
+    )
+    assert "LEFT JOIN league_teams AS _h0_ ON _h0_.id = _base_.league_team_id\n" in (
+        sqlstring
+    )
+    assert "LEFT JOIN venues AS _h1_ ON _h1_.id = _h0_.home_venue_id\n" in sqlstring
+    assert sqlstring.endswith("ORDER BY _base_.created_at;")
+
+
+def test_keeps_plain_select_without_hydration():
+    connection = PGConnection()
+
+    results = connection.build_select_query(
+        "league_players", [], PagingModel(page_length=10, page=1), RequestOperators()
+    )
+
+    assert "_base_" not in results.sql_string_and_parameters.sql_string
@@ -0,0 +1,301 @@
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from typing import Any, AsyncIterator
+from uuid import UUID, uuid4
+
+from util.common import RequestOperators
+from util.configuration import set_global_configuration
+from util.hydration import (
+    HydrationPlan,
+    HydrationUtil,
+    compile_hydration_plan,
+    get_hydration_plan,
+    hydration_identity_map_scope,
+)
+
+
+class Child:
+    def __init__(self, id: UUID) -> None:
+        self.id = id
+
+
+class Parent:
+    def __init__(self, child_id: UUID | None) -> None:
+        self.child_id = child_id
+        self.child: Any = None
+        self.other_child_id = child_id
+        self.other_child: Any = None
+
+
+class SearchModel:
+    def __init__(self) -> None:
+        self.ids: list[UUID] | None = None
+
+
+def build_stream_function(children: list[Child], fetched_ids: list[list[UUID]]):
+    async def stream_function(
+        search_model: SearchModel, paging: Any, request_operators: RequestOperators
+    ) -> AsyncIterator[Child]:
+        fetched_ids.append(list(search_model.ids or []))
+
+        for child in children:
+            if child.id in (search_model.ids or []):
+                yield child
+
+    return stream_function
+
+
+async def hydrate_nothing(
+    result_list: list[Any],
+    request_operators: RequestOperators | None = None,
+    hydration_plan: HydrationPlan | None = None,
+) -> None:
+    pass
+
+
+def test_fetches_each_entity_once_per_scope():
+    children = [Child(uuid4()), Child(uuid4())]
+    fetched_ids: list[list[UUID]] = []
+    stream_function = build_stream_function(children, fetched_ids)
+    parents = [Parent(children[0].id), Parent(children[1].id), Parent(None)]
+
+    async def run() -> None:
+        with hydration_identity_map_scope():
+            for target_name in ["child", "other_child"]:
+                await HydrationUtil().hydrate_target(
+                    target_name,
+                    parents,
+                    SearchModel,
+                    stream_function,
+                    compile_hydration_plan("child,other_child"),
+                    entity_type="children",
+                    hydrate_function=hydrate_nothing,
+                )
+
+    asyncio.run(run())
+
+    assert fetched_ids == [[children[0].id, children[1].id]]
+    assert parents[0].child.id == children[0].id
+    assert parents[1].other_child.id == children[1].id
+    assert parents[0].child is not parents[0].other_child
+    assert parents[2].child is None
+
+
+def test_batches_concurrent_targets_into_one_fetch():
+    children = [Child(uuid4()), Child(uuid4())]
+    fetched_ids: list[list[UUID]] = []
+    stream_function = build_stream_function(children, fetched_ids)
+    first_parents = [Parent(children[0].id)]
+    second_parents = [Parent(children[1].id), Parent(uuid4())]
+
+    async def run() -> None:
+        with hydration_identity_map_scope():
+            await asyncio.gather(
+                *[
+                    HydrationUtil().hydrate_target(
+                        "child",
+                        parents,
+                        SearchModel,
+                        stream_function,
+                        compile_hydration_plan("child"),
+                        entity_type="children",
+                        hydrate_function=hydrate_nothing,
+                    )
+                    for parents in [first_parents, second_parents]
+                ]
+            )
+
+    asyncio.run(run())
+
+    assert len(fetched_ids) == 1
+    assert set(fetched_ids[0]) == {
+        children[0].id,
+        children[1].id,
+        second_parents[1].child_id,
+    }
+    assert first_parents[0].child.id == children[0].id
+    assert second_parents[1].child is None
+
+
+def test_fetches_each_shared_target_id_once():
+    children = [Child(uuid4()) for _ in range(10)]
+    fetched_ids: list[list[UUID]] = []
+    stream_function = build_stream_function(children, fetched_ids)
+    parents = [Parent(children[i % 10].id) for i in range(500)]
+
+    async def run() -> None:
+        await HydrationUtil().hydrate_target(
+            "child",
+            parents,
+            SearchModel,
+            stream_function,
+            compile_hydration_plan("child"),
+            entity_type="children",
+            hydrate_function=hydrate_nothing,
+        )
+
+    asyncio.run(run())
+
+    assert fetched_ids == [[child.id for child in children]]
+    assert all(parent.child.id == parent.child_id for parent in parents)
+
+
+def test_skips_fetch_without_target_ids():
+    fetched_ids: list[list[UUID]] = []
+    stream_function = build_stream_function([], fetched_ids)
+    parents = [Parent(None), Parent(None)]
+
+    async def run() -> None:
+        await HydrationUtil().hydrate_target(
+            "child",
+            parents,
+            SearchModel,
+            stream_function,
+            compile_hydration_plan("child"),
+            entity_type="children",
+            hydrate_function=hydrate_nothing,
+        )
+
+    asyncio.run(run())
+
+    assert fetched_ids == []
+    assert parents[0].__dict__["child"] is None
+
+
+class FakeConnection:
+    def __init__(self, pool_has_free_connections: bool) -> None:
+        self.pool_has_free_connections = pool_has_free_connections
+        self.units_of_work = 0
+
+    @asynccontextmanager
+    async def borrow_unit_of_work(self) -> AsyncIterator[object | None]:
+        if not self.pool_has_free_connections:
+            yield None
+            return
+
+        self.units_of_work += 1
+        yield object()
+
+
+def run_sibling_targets(
+    parallel_connections: int, pool_has_free_connections: bool = True
+) -> tuple[int, int]:
+    connection = FakeConnection(pool_has_free_connections)
+    set_global_configuration(SimpleNamespace(pg_connection=connection))
+    HydrationUtil.parallel_branches = asyncio.Semaphore(parallel_connections)
+
+    children = [Child(uuid4()), Child(uuid4())]
+    parents = [Parent(children[0].id)]
+    parents[0].other_child_id = children[1].id
+    running = [0, 0]
+
+    async def stream_function(
+        search_model: SearchModel, paging: Any, request_operators: RequestOperators
+    ) -> AsyncIterator[Child]:
+        running[0] += 1
+        running[1] = max(running[1], running[0])
+        await asyncio.sleep(0.01)
+        running[0] -= 1
+
+        for child in children:
+            if child.id in (search_model.ids or []):
+                yield child
+
+    async def run() -> None:
+        util = HydrationUtil()
+
+        with hydration_identity_map_scope():
+            await util.hydrate_targets(
+                *[
+                    util.hydrate_target(
+                        target_name,
+                        parents,
+                        SearchModel,
+                        stream_function,
+                        compile_hydration_plan("child,other_child"),
+                        entity_type=target_name,
+                        hydrate_function=hydrate_nothing,
+                    )
+                    for target_name in ["child", "other_child"]
+                ]
+            )
+
+    asyncio.run(run())
+
+    assert parents[0].child.id == children[0].id
+    assert parents[0].other_child.id == children[1].id
+
+    return running[1], connection.units_of_work
+
+
+def test_runs_sibling_targets_on_borrowed_connections():
+    assert run_sibling_targets(parallel_connections=4) == (2, 1)
+
+
+def test_runs_sibling_targets_one_at_a_time_without_spare_connections():
+    assert run_sibling_targets(parallel_connections=0) == (1, 0)
+    assert run_sibling_targets(4, pool_has_free_connections=False) == (1, 0)
+
+
+def test_compiles_hydration_header_once_into_a_plan_tree():
+    plan = compile_hydration_plan("league_team.home_venue,league_team,owner")
+
+    assert compile_hydration_plan("league_team.home_venue,league_team,owner") is plan
+    assert list(plan.targets) == ["league_team", "owner"]
+    assert list(plan.get("league_team").targets) == ["home_venue"]
+    assert plan.get("league_team").get("home_venue").is_empty()
+    assert plan.get("owner").is_empty()
+    assert get_hydration_plan(RequestOperators()).is_empty()
+
+
+class Team:
+    def __init__(self) -> None:
+        self.id = uuid4()
+
+
+class Player:
+    def __init__(self, team_id: UUID) -> None:
+        self.id = uuid4()
+        self.team_id = team_id
+
+
+class PlayerSearchModel:
+    def __init__(self) -> None:
+        self.team_ids: list[UUID] | None = None
+
+
+def test_hydrates_collections_with_one_search():
+    teams = [Team(), Team()]
+    players = [Player(teams[0].id), Player(teams[0].id), Player(uuid4())]
+    searches: list[list[UUID]] = []
+    hydration: list[list[str] | None] = []
+
+    async def stream_function(
+        search_model: PlayerSearchModel,
+        paging: Any,
+        request_operators: RequestOperators,
+    ) -> AsyncIterator[Player]:
+        searches.append(list(search_model.team_ids or []))
+        hydration.append(request_operators.hydration)
+
+        for player in players:
+            if player.team_id in (search_model.team_ids or []):
+                yield player
+
+    asyncio.run(
+        HydrationUtil().hydrate_collection(
+            "players",
+            teams,
+            PlayerSearchModel,
+            "team_ids",
+            "team_id",
+            stream_function,
+            compile_hydration_plan("players.team"),
+        )
+    )
+
+    assert searches == [[teams[0].id, teams[1].id]]
+    assert hydration == [["team"]]
+    assert teams[0].__dict__["players"] == players[:2]
+    assert teams[1].__dict__["players"] == []
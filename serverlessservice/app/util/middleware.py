@@ -0,0 +1,28 @@
+from fastapi import FastAPI, Request
+
+from util.configuration import get_global_configuration
+from util.entity_cache import entity_invalidation_scope
+from util.hydration import hydration_identity_map_scope
+from util.response_cache import response_cache
+
+
+def set_unit_of_work_middleware(app: FastAPI):
+    @app.middleware("http")
+    async def unit_of_work_middleware(request: Request, call_next):
+        # One connection and one transaction per request. Accessors pick it up through
+        # a context variable, the connection itself is only checked out on first use.
+        connection = get_global_configuration().pg_connection
+
+        # Entities loaded for hydration are shared by every target in the request.
+        # Cached searches and entities the request wrote to are dropped again after
+        # the commit.
+        async with response_cache.invalidation_scope():
+            with entity_invalidation_scope():
+                async with connection.unit_of_work() as unit_of_work:
+                    with hydration_identity_map_scope():
+                        response = await call_next(request)
+
+                    if response.status_code >= 400:
+                        unit_of_work.rollback_only = True
+
+        return response
@@ -0,0 +1,286 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+from fastapi import Response
+from fastapi.datastructures import Headers
+from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
+
+from util.etag import representation_headers
+from util.field_selection import FieldSelection
+from util.hydration_planner import HydrationPlanner
+from util.responses import render_outbound, select_media_type
+
+
+class InProcessCacheBackend:
+    """
+    Bounded LRU with per entry expiry, answering the subset of the Redis client API
+    ResponseCache uses: get, mget, set with ex, and incr. A redis.Redis client can be
+    swapped in for it unchanged.
+
+    Counters live apart from the LRU and never expire. Losing a tag's counter would
+    bring entries stored under its earlier values back to life.
+    """
+
+    def __init__(
+        self, max_size: int = 1024, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.max_size = max_size
+        self.clock = clock
+        self.lock = threading.Lock()
+        self.entries: OrderedDict[str, tuple[float | None, bytes]] = OrderedDict()
+        self.counters: dict[str, int] = {}
+
+    def get(self, name: str) -> bytes | None:
+        with self.lock:
+            counter = self.counters.get(name)
+
+            if counter is not None:
+                return str(counter).encode()
+
+            entry = self.entries.get(name)
+
+            if entry is None:
+                return None
+
+            if entry[0] is not None and entry[0] <= self.clock():
+                del self.entries[name]
+                return None
+
+            self.entries.move_to_end(name)
+
+            return entry[1]
+
+    def mget(self, keys: list[str]) -> list[bytes | None]:
+        return [self.get(key) for key in keys]
+
+    def set(self, name: str, value: bytes, ex: int | None = None) -> None:
+        expires_at = None if ex is None else self.clock() + ex
+
+        with self.lock:
+            self.entries[name] = (expires_at, value)
+            self.entries.move_to_end(name)
+
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def incr(self, name: str) -> int:
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + 1
+
+            return self.counters[name]
+
+
+# Tags written by the current request, invalidated again once its transaction commits.
+pending_invalidations: ContextVar[set[str] | None] = ContextVar(
+    "pending_invalidations", default=None
+)
+
+
+class ResponseCache:
+    """
+    Caches rendered search responses, keyed on the route's table, its normalized
+    query parameters and the headers that shape the body.
+
+    Every entry is tagged with the tables it reads, its own and every table its
+    hydration reaches. Each tag has a counter in the backend and the counters are
+    part of the key, so invalidating a table is a single incr and entries stored
+    under older counters are never read again and age out.
+    """
+
+    key_prefix = "mnfp:response:"
+    tag_prefix = "mnfp:tag:"
+
+    def __init__(
+        self,
+        backend: Any | None = None,
+        ttl_seconds: int = 30,
+        offload: bool = False,
+        hydration_planner: HydrationPlanner = HydrationPlanner(),
+    ) -> None:
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        # Backends that talk to a server are called from the threadpool.
+        self.offload = offload
+        self.hydration_planner = hydration_planner
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def configure(
+        self, backend: Any | None, ttl_seconds: int, offload: bool = False
+    ) -> None:
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.offload = offload
+
+    async def call(self, function: Callable[..., Any], *args: Any) -> Any:
+        if self.offload:
+            return await run_in_threadpool(function, *args)
+
+        return function(*args)
+
+    def get_hydration(self, inbound_model: BaseModel, headers: Headers) -> list[str]:
+        hydration = (headers.get("MNFP-Hydration") or "").split(",")
+        fields = getattr(inbound_model, "fields", None) or headers.get("MNFP-Fields")
+
+        if fields is not None:
+            hydration += FieldSelection.parse(fields).get_hydration()
+
+        return sorted(set(path.strip() for path in hydration if path.strip() != ""))
+
+    def get_tags(self, table_name: str, hydration: list[str]) -> list[str]:
+        return [table_name] + [
+            hydrated_table_name
+            for hydrated_table_name in self.hydration_planner.get_table_names(
+                table_name, hydration
+            )
+            if hydrated_table_name != table_name
+        ]
+
+    def build_key(
+        self, table_name: str, inbound_model: BaseModel, headers: Headers
+    ) -> str:
+        # Id filters match the same rows in any order.
+        query_params = {
+            name: (
+                ",".join(sorted(value.split(",")))
+                if name.endswith("ids") and isinstance(value, str)
+                else value
+            )
+            for name, value in sorted(
+                inbound_model.model_dump(exclude_none=True).items()
+            )
+        }
+
+        representation = {
+            name: headers.get(name) or None for name in representation_headers
+        }
+        representation["MNFP-Hydration"] = self.get_hydration(inbound_model, headers)
+        # JSON and MessagePack bodies of the same search are stored apart.
+        representation["Accept"] = select_media_type(headers)
+
+        return repr((table_name, query_params, sorted(representation.items())))
+
+    async def get_or_build(
+        self,
+        table_name: str,
+        inbound_model: BaseModel,
+        headers: Headers,
+        build: Callable[[], Awaitable[Any]],
+        etag: str | None = None,
+    ) -> Any:
+        """
+        The cached response for a search, or build's result, rendered and stored.
+        Without a backend build's result is returned as is. etag, the version the
+        route answers with, is part of the key, so a body is never served with the
+        version of rows it was not rendered from.
+        """
+        if self.backend is None:
+            return await build()
+
+        tags = self.get_tags(table_name, self.get_hydration(inbound_model, headers))
+        media_type = select_media_type(headers)
+
+        tag_versions = await self.call(
+            self.backend.mget, [self.tag_prefix + tag for tag in tags]
+        )
+
+        key = (
+            self.key_prefix
+            + hashlib.blake2b(
+                repr(
+                    (
+                        self.build_key(table_name, inbound_model, headers),
+                        etag,
+                        tag_versions,
+                    )
+                ).encode(),
+                digest_size=16,
+            ).hexdigest()
+        )
+
+        body = await self.call(self.backend.get, key)
+
+        if body is not None:
+            self.hits += 1
+
+            return Response(content=body, media_type=media_type)
+
+        self.misses += 1
+
+        result = await build()
+
+        if isinstance(result, Response):
+            body = result.body
+        else:
+            body = render_outbound(result, media_type)
+
+        await self.call(self.backend.set, key, body, self.ttl_seconds)
+
+        return Response(content=body, media_type=media_type)
+
+    async def invalidate(self, *tags: str) -> None:
+        if self.backend is None:
+            return
+
+        pending = pending_invalidations.get()
+
+        if pending is not None:
+            pending.update(tags)
+
+        for tag in tags:
+            await self.call(self.backend.incr, self.tag_prefix + tag)
+
+        self.invalidations += len(tags)
+
+    def invalidate_table_change(self, table_name: str) -> None:
+        """
+        Invalidates a table written by any instance, from TableChangeListener's
+        thread. Every backend ResponseCache supports is synchronous underneath, it is
+        called directly.
+        """
+        if self.backend is None:
+            return
+
+        self.backend.incr(self.tag_prefix + table_name)
+        self.invalidations += 1
+
+    @asynccontextmanager
+    async def invalidation_scope(self) -> AsyncIterator[None]:
+        """
+        Invalidates the request's tags again after the block, once its transaction has
+        committed. A search running between the write and the commit still sees the
+        old rows and may have stored them under the new counters.
+        """
+        token = pending_invalidations.set(set())
+
+        try:
+            yield
+        finally:
+            pending = pending_invalidations.get() or set()
+            pending_invalidations.reset(token)
+
+            if len(pending) > 0:
+                await self.invalidate(*pending)
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "response_cache_backend": (
+                None if self.backend is None else type(self.backend).__name__
+            ),
+            "response_cache_ttl_seconds": self.ttl_seconds,
+            "response_cache_hits": self.hits,
+            "response_cache_misses": self.misses,
+            "response_cache_invalidations": self.invalidations,
+        }
+
+
+# Shared by every route and manager, configured from RESPONSE_CACHE_* settings.
+response_cache = ResponseCache()
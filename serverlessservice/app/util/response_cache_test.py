@@ -0,0 +1,147 @@
+import asyncio
+from typing import Optional
+
+from fastapi.datastructures import Headers
+from pydantic import BaseModel
+
+from util.response_cache import InProcessCacheBackend, ResponseCache
+
+
+class InboundSearchModel(BaseModel):
+    ids: Optional[str] = None
+    name: Optional[str] = None
+    fields: Optional[str] = None
+
+
+class OutboundModel(BaseModel):
+    name: str
+
+
+def test_serves_equivalent_searches_from_one_entry():
+    cache = ResponseCache(InProcessCacheBackend())
+    builds: list[str] = []
+
+    async def search(inbound_model: InboundSearchModel, headers: Headers) -> bytes:
+        async def build() -> OutboundModel:
+            builds.append(inbound_model.ids or "")
+            return OutboundModel(name="team")
+
+        response = await cache.get_or_build(
+            "league_teams", inbound_model, headers, build
+        )
+
+        return response.body
+
+    async def run() -> list[bytes]:
+        return [
+            await search(
+                InboundSearchModel(ids="a,b"),
+                Headers({"MNFP-Hydration": "home_venue,league_players"}),
+            ),
+            await search(
+                InboundSearchModel(ids="b,a"),
+                Headers({"MNFP-Hydration": "league_players, home_venue"}),
+            ),
+            await search(InboundSearchModel(ids="a,b"), Headers({})),
+            await search(
+                InboundSearchModel(ids="a,b"),
+                Headers({"Accept": "application/msgpack"}),
+            ),
+        ]
+
+    assert asyncio.run(run()) == [b'{"name":"team"}'] * 3 + [b"\x81\xa4name\xa4team"]
+    assert builds == ["a,b", "a,b", "a,b"]
+    assert cache.get_stats()["response_cache_hits"] == 1
+
+
+def test_invalidates_entries_tagged_with_hydrated_tables():
+    cache = ResponseCache(InProcessCacheBackend())
+    builds: list[str] = []
+
+    async def search(hydration: str) -> None:
+        async def build() -> OutboundModel:
+            builds.append(hydration)
+            return OutboundModel(name="team")
+
+        await cache.get_or_build(
+            "league_teams",
+            InboundSearchModel(),
+            Headers({"MNFP-Hydration": hydration}),
+            build,
+        )
+
+    async def run() -> None:
+        await search("home_venue")
+        await search("league_players")
+
+        await cache.invalidate("venues")
+
+        await search("home_venue")
+        await search("league_players")
+
+        async with cache.invalidation_scope():
+            await cache.invalidate("league_players")
+            await search("league_players")
+
+        await search("league_players")
+
+    asyncio.run(run())
+
+    # The search cached inside the scope ran before its write committed.
+    assert builds == [
+        "home_venue",
+        "league_players",
+        "home_venue",
+        "league_players",
+        "league_players",
+    ]
+    assert cache.get_tags("league_teams", ["league_players.league_team"]) == [
+        "league_teams",
+        "league_players",
+    ]
+
+
+def test_never_serves_a_body_under_another_version():
+    cache = ResponseCache(InProcessCacheBackend())
+    names = ["old", "new", "newer"]
+
+    async def search(etag: str) -> bytes:
+        async def build() -> OutboundModel:
+            return OutboundModel(name=names.pop(0))
+
+        response = await cache.get_or_build(
+            "venues", InboundSearchModel(), Headers({}), build, etag
+        )
+
+        return response.body
+
+    async def run() -> list[bytes]:
+        bodies = [await search('"1"'), await search('"2"'), await search('"2"')]
+
+        # Written by another instance, the version has not moved yet.
+        cache.invalidate_table_change("venues")
+        bodies.append(await search('"2"'))
+
+        return bodies
+
+    assert asyncio.run(run()) == [
+        b'{"name":"old"}',
+        b'{"name":"new"}',
+        b'{"name":"new"}',
+        b'{"name":"newer"}',
+    ]
+
+
+def test_passes_results_through_without_a_backend():
+    cache = ResponseCache()
+    result = OutboundModel(name="team")
+
+    async def build() -> OutboundModel:
+        return result
+
+    assert (
+        asyncio.run(
+            cache.get_or_build("league_teams", InboundSearchModel(), Headers({}), build)
+        )
+        is result
+    )
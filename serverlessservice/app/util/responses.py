@@ -0,0 +1,157 @@
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+import msgpack
+import orjson
+from fastapi import Response
+from fastapi.datastructures import Headers
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+json_media_type = "application/json"
+msgpack_media_type = "application/msgpack"
+
+# Ext type UUIDs are packed as, their 16 bytes. Timestamps use msgpack's own -1.
+msgpack_uuid_ext_code = 1
+
+# Outbound models carry their timestamps as strings in the adapters' format.
+timestamp_fields = ["created_at", "updated_at"]
+
+
+def parse_quality_values(header: str | None) -> dict[str, float]:
+    """
+    The q value of every entry in an Accept style header, keyed by its lower cased
+    value. Entries without a q value get 1.
+    """
+    qualities: dict[str, float] = {}
+
+    for part in (header or "").split(","):
+        value, _, parameters = part.strip().partition(";")
+        quality = 1.0
+
+        for parameter in parameters.split(";"):
+            name, _, parameter_value = parameter.strip().partition("=")
+
+            if name.lower() == "q":
+                try:
+                    quality = float(parameter_value)
+                except ValueError:
+                    quality = 0.0
+
+        if value.strip() != "":
+            qualities[value.strip().lower()] = quality
+
+    return qualities
+
+
+def select_media_type(headers: Headers | None) -> str:
+    """
+    MessagePack when Accept names it at least as highly as JSON, JSON otherwise.
+    Wildcards only ever stand for JSON.
+    """
+    qualities = parse_quality_values(None if headers is None else headers.get("Accept"))
+
+    msgpack_quality = max(
+        qualities.get(msgpack_media_type, 0.0),
+        qualities.get("application/x-msgpack", 0.0),
+    )
+    json_quality = max(
+        qualities.get(json_media_type, 0.0),
+        qualities.get("application/*", 0.0),
+        qualities.get("*/*", 0.0),
+    )
+
+    if msgpack_quality > 0 and msgpack_quality >= json_quality:
+        return msgpack_media_type
+
+    return json_media_type
+
+
+def format_timestamp(value: datetime) -> str:
+    # Same format the adapters write.
+    return value.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def encode_outbound_value(value: Any) -> Any:
+    # Outbound models are built and validated by the adapters, their fields are
+    # written as they are. orjson calls back here for every nested model.
+    if isinstance(value, BaseModel):
+        return value.__dict__
+
+    if isinstance(value, datetime):
+        return format_timestamp(value)
+
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def render_outbound_json(content: Any) -> bytes:
+    return orjson.dumps(
+        content,
+        default=encode_outbound_value,
+        option=orjson.OPT_PASSTHROUGH_DATETIME,
+    )
+
+
+def encode_outbound_msgpack_value(value: Any) -> Any:
+    if isinstance(value, UUID):
+        return msgpack.ExtType(msgpack_uuid_ext_code, value.bytes)
+
+    if isinstance(value, BaseModel):
+        fields = dict(value.__dict__)
+
+        for name in timestamp_fields:
+            if isinstance(fields.get(name), str):
+                fields[name] = datetime.fromisoformat(fields[name])
+
+        return fields
+
+    raise TypeError(f"Type is not MessagePack serializable: {type(value).__name__}")
+
+
+def render_outbound_msgpack(content: Any) -> bytes:
+    return msgpack.packb(content, default=encode_outbound_msgpack_value, datetime=True)
+
+
+def render_outbound(content: Any, media_type: str) -> bytes:
+    if media_type == msgpack_media_type:
+        return render_outbound_msgpack(content)
+
+    return render_outbound_json(content)
+
+
+class OutboundJSONResponse(ORJSONResponse):
+    """
+    Renders adapter output straight to JSON. Returning a Response from a route skips
+    FastAPI's response_model validation and jsonable_encoder pass, which would only
+    rebuild models the adapters just built. response_model still documents the route.
+    UUIDs are written natively by orjson.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return render_outbound_json(content)
+
+
+class OutboundMsgpackResponse(Response):
+    """
+    The same body as OutboundJSONResponse packed as MessagePack, for clients whose
+    Accept asks for it. UUIDs go out as 16 byte ext values and timestamps as msgpack
+    timestamps.
+    """
+
+    media_type = msgpack_media_type
+
+    def render(self, content: Any) -> bytes:
+        return render_outbound_msgpack(content)
+
+
+def respond(
+    result: Any, headers: Headers | None = None, status_code: int = 200
+) -> Response:
+    if isinstance(result, Response):
+        return result
+
+    if select_media_type(headers) == msgpack_media_type:
+        return OutboundMsgpackResponse(result, status_code=status_code)
+
+    return OutboundJSONResponse(result, status_code=status_code)
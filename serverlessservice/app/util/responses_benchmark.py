@@ -0,0 +1,133 @@
+"""
+Micro-benchmark for OutboundJSONResponse.
+
+Renders a hydrated page of league player fantasy team season links, each with its
+league player, league team and season, once through FastAPI's response_model path
+(validate, then JSONResponse) and once through OutboundJSONResponse. Run from
+serverlessservice/app:
+
+    python -m util.responses_benchmark --items 10 100 1000
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any, Callable
+from uuid import uuid4
+
+import orjson
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from models.common_model import OutboundItemListResponse
+from models.league_player_fantasy_team_season_link_model import (
+    LeaguePlayerFantasyTeamSeasonLinkOutboundModel,
+)
+from util.responses import OutboundJSONResponse
+
+ResponseModel = OutboundItemListResponse[LeaguePlayerFantasyTeamSeasonLinkOutboundModel]
+
+
+def build_common() -> dict[str, Any]:
+    return {"id": uuid4(), "created_at": "2024-09-02T01:30:00.000Z", "updated_at": None}
+
+
+def build_page(item_count: int) -> Any:
+    items: list[dict[str, Any]] = []
+
+    for _ in range(item_count):
+        league_team = {
+            **build_common(),
+            "name": "Benchmark Team",
+            "short_name": "BMT",
+            "home_venue_id": uuid4(),
+            "global_mnp_id": uuid4(),
+        }
+        league_player = {
+            **build_common(),
+            "name": "Benchmark Player",
+            "global_mnp_id": uuid4(),
+            "league_team_id": league_team["id"],
+            "league_team": league_team,
+        }
+        items.append(
+            {
+                **build_common(),
+                "league_player_id": league_player["id"],
+                "league_player": league_player,
+                "league_team_id": league_team["id"],
+                "league_team": league_team,
+                "fantasy_team_season_link_id": uuid4(),
+                "season_id": uuid4(),
+                "season": {**build_common(), "name": "Season 20", "season_number": 20},
+                "fantasy_team_id": uuid4(),
+                "fantasy_team_owner_id": uuid4(),
+                "fantasy_league_id": uuid4(),
+            }
+        )
+
+    # Validated once, as the adapters do.
+    return ResponseModel.model_validate(
+        {"items": items, "paging": {"page": 1, "page_length": item_count}}
+    )
+
+
+response_field = create_model_field(
+    name="benchmark", type_=ResponseModel, mode="serialization"
+)
+
+
+def render_response_model(page: Any) -> bytes:
+    content = asyncio.run(
+        serialize_response(field=response_field, response_content=page)
+    )
+
+    return bytes(JSONResponse(content).body)
+
+
+def render_outbound(page: Any) -> bytes:
+    return bytes(OutboundJSONResponse(page).body)
+
+
+def time_render(render: Callable[[Any], bytes], page: Any, repeat: int) -> float:
+    timings: list[float] = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        render(page)
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--items", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(
+        f"{'items':>10} {'kb':>10} {'model ms':>10} {'orjson ms':>10} {'speedup':>10}"
+    )
+
+    for item_count in args.items:
+        page = build_page(item_count)
+
+        if orjson.loads(render_outbound(page)) != orjson.loads(
+            render_response_model(page)
+        ):
+            raise Exception("OutboundJSONResponse rendered a different body.")
+
+        response_model_best = time_render(render_response_model, page, args.repeat)
+        outbound_best = time_render(render_outbound, page, args.repeat)
+
+        print(
+            f"{item_count:>10} {len(render_outbound(page)) / 1024:>10.1f} "
+            f"{response_model_best * 1000:>10.3f} {outbound_best * 1000:>10.3f} "
+            f"{response_model_best / outbound_best:>10.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
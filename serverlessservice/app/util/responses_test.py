@@ -0,0 +1,96 @@
+import json
+from datetime import datetime, timezone
+from typing import Optional
+from uuid import UUID, uuid4
+
+import msgpack
+
+from fastapi.datastructures import Headers
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from util.responses import OutboundJSONResponse, respond, select_media_type
+
+
+class ChildOutboundModel(BaseModel):
+    id: UUID
+    name: str
+
+
+class ParentOutboundModel(BaseModel):
+    id: UUID
+    created_at: str
+    updated_at: Optional[str]
+    child: ChildOutboundModel | None = None
+    children: list[ChildOutboundModel] | None = None
+
+
+def test_renders_nested_models_like_the_response_model_path():
+    child = ChildOutboundModel(id=uuid4(), name="child")
+    parents = [
+        ParentOutboundModel(
+            id=uuid4(),
+            created_at="2024-09-02T01:30:00.000Z",
+            updated_at=None,
+            child=child,
+            children=[child],
+        ),
+        ParentOutboundModel(
+            id=uuid4(), created_at="2024-09-02T01:30:00.000Z", updated_at=None
+        ),
+    ]
+
+    response = respond(parents, status_code=201)
+
+    assert isinstance(response, OutboundJSONResponse)
+    assert response.status_code == 201
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == jsonable_encoder(parents)
+    assert response.body == JSONResponse(jsonable_encoder(parents)).body
+
+
+def test_passes_responses_through():
+    response = JSONResponse({"id": str(uuid4())})
+
+    assert respond(response) is response
+
+
+def test_packs_msgpack_when_accepted():
+    parent = ParentOutboundModel(
+        id=uuid4(),
+        created_at="2024-09-02T01:30:00.123Z",
+        updated_at=None,
+        child=ChildOutboundModel(id=uuid4(), name="child"),
+    )
+
+    response = respond(
+        parent, Headers({"Accept": "application/msgpack, application/json;q=0.9"})
+    )
+
+    assert response.media_type == "application/msgpack"
+
+    unpacked = msgpack.unpackb(
+        response.body,
+        ext_hook=lambda code, data: UUID(bytes=data),
+        timestamp=3,
+    )
+
+    assert unpacked["id"] == parent.id
+    assert unpacked["child"] == {"id": parent.child.id, "name": "child"}
+    assert unpacked["created_at"] == datetime(
+        2024, 9, 2, 1, 30, 0, 123000, tzinfo=timezone.utc
+    )
+    assert unpacked["updated_at"] is None
+    # 16 bytes for every UUID instead of 36 characters.
+    assert len(response.body) < len(respond(parent).body) - 2 * 20
+
+    assert select_media_type(Headers({"Accept": "*/*"})) == "application/json"
+    assert (
+        select_media_type(Headers({"Accept": "application/json, application/msgpack"}))
+        == "application/msgpack"
+    )
+    assert (
+        select_media_type(Headers({"Accept": "application/msgpack;q=0.5, */*"}))
+        == "application/json"
+    )
@@ -0,0 +1,88 @@
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+named_parameter_pattern = re.compile(r"%\((\w+)\)s")
+
+
+class SqlTemplateCache:
+    """
+    Bounded, thread-safe LRU of compiled SQL text keyed on statement shape.
+
+    A shape is everything the SQL text depends on (table, column set, search term
+    kinds, sort, paging mode), never the bound values, so every request with the same
+    shape reuses one string and, through prepared statements, one server side plan.
+    """
+
+    def __init__(self, max_size: int = 512) -> None:
+        self.max_size = max_size
+        self.lock = threading.Lock()
+        self.templates: OrderedDict[Hashable, Any] = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_build(self, key: Hashable, build: Callable[[], T]) -> T:
+        with self.lock:
+            template = self.templates.get(key)
+
+            if template is not None:
+                self.templates.move_to_end(key)
+                self.hits += 1
+
+                return template
+
+            self.misses += 1
+
+        # Built outside the lock, two threads racing on a new shape build it twice.
+        template = build()
+
+        if self.max_size <= 0:
+            return template
+
+        with self.lock:
+            self.templates[key] = template
+            self.templates.move_to_end(key)
+
+            while len(self.templates) > self.max_size:
+                self.templates.popitem(last=False)
+                self.evictions += 1
+
+        return template
+
+    def clear(self) -> None:
+        with self.lock:
+            self.templates.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        with self.lock:
+            return {
+                "sql_cache_max": self.max_size,
+                "sql_cache_size": len(self.templates),
+                "sql_cache_hits": self.hits,
+                "sql_cache_misses": self.misses,
+                "sql_cache_evictions": self.evictions,
+            }
+
+
+def convert_to_positional_parameters(sql_string: str) -> tuple[str, list[str]]:
+    """
+    Rewrites %(name)s placeholders as $1, $2, ... for PREPARE. Returns the rewritten
+    SQL and the parameter names in position order, a name used twice keeps one
+    position.
+    """
+    names: list[str] = []
+
+    def replace(match: re.Match[str]) -> str:
+        name = match.group(1)
+
+        if name not in names:
+            names.append(name)
+
+        return f"${names.index(name) + 1}"
+
+    return named_parameter_pattern.sub(replace, sql_string), names
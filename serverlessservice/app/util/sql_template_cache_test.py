@@ -0,0 +1,77 @@
+from util.database import ExactMatchSearchTerm, InListSearchTerm, PagingModel
+from util.db_connection import PGConnection
+from util.sql_template_cache import SqlTemplateCache, convert_to_positional_parameters
+
+
+def test_counts_hits_and_misses():
+    cache = SqlTemplateCache(max_size=2)
+    builds: list[str] = []
+
+    def build() -> str:
+        builds.append("built")
+        return "SELECT 1;"
+
+    cache.get_or_build("a", build)
+    cache.get_or_build("a", build)
+
+    stats = cache.get_stats()
+
+    assert len(builds) == 1
+    assert stats["sql_cache_hits"] == 1
+    assert stats["sql_cache_misses"] == 1
+
+
+def test_evicts_least_recently_used_template():
+    cache = SqlTemplateCache(max_size=2)
+
+    cache.get_or_build("a", lambda: "a")
+    cache.get_or_build("b", lambda: "b")
+    cache.get_or_build("a", lambda: "a")
+    cache.get_or_build("c", lambda: "c")
+
+    assert cache.get_or_build("a", lambda: "rebuilt") == "a"
+    assert cache.get_or_build("b", lambda: "rebuilt") == "rebuilt"
+    assert cache.get_stats()["sql_cache_evictions"] == 2
+
+
+def test_converts_named_parameters_to_positional():
+    sqlstring, names = convert_to_positional_parameters(
+        "SELECT * FROM t WHERE a = %(a)s AND b > %(b)s AND c = %(a)s;"
+    )
+
+    assert sqlstring == "SELECT * FROM t WHERE a = $1 AND b > $2 AND c = $1;"
+    assert names == ["a", "b"]
+
+
+def test_select_query_reuses_template_for_same_shape():
+    connection = PGConnection()
+    connection.sql_template_cache = SqlTemplateCache()
+
+    first = connection.build_select_query(
+        "league_players",
+        [ExactMatchSearchTerm("name", "Alice")],
+        PagingModel(page=1, page_length=10),
+    )
+    second = connection.build_select_query(
+        "league_players",
+        [ExactMatchSearchTerm("name", "Bob")],
+        PagingModel(page=3, page_length=10),
+    )
+
+    assert first.sql_string_and_parameters.sql_string is (
+        second.sql_string_and_parameters.sql_string
+    )
+    assert second.sql_string_and_parameters.parameters == {
+        "name": "Bob",
+        "_offset_": 20,
+        "_limit_": 10,
+    }
+    assert connection.sql_template_cache.get_stats()["sql_cache_hits"] == 1
+
+    connection.build_select_query(
+        "league_players",
+        [InListSearchTerm("name", ["Alice"])],
+        PagingModel(page=1, page_length=10),
+    )
+
+    assert connection.sql_template_cache.get_stats()["sql_cache_misses"] == 2
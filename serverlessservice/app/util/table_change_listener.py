@@ -0,0 +1,119 @@
+import select
+import threading
+import time
+from typing import Any, Callable
+from uuid import UUID
+
+import psycopg2
+import psycopg2.extensions
+
+table_change_channel = "table_changes"
+
+
+class TableChangeListener:
+    """
+    Keeps the in-process entity caches in step with writes made by any instance. The
+    triggers in 011.do.create_table_change_notifications.sql NOTIFY table_changes with
+    "table:id" for every written row, Postgres delivers it once the write commits.
+
+    Listens on a connection of its own, outside the pool, from a daemon thread. Any
+    notification missed while not connected can not be recovered, so on_reset is
+    called each time the listener (re)connects. is_current tells whether everything
+    committed until a moment ago has been handled, it is not after a disconnect or
+    after the process was frozen between polls. Any error, one raised by on_change
+    included, drops the connection and the listener connects again.
+    """
+
+    def __init__(
+        self,
+        connection_factory: Callable[[], Any],
+        on_change: Callable[[str, UUID], None],
+        on_reset: Callable[[], None],
+        poll_seconds: float = 0.5,
+        retry_seconds: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.connection_factory = connection_factory
+        self.on_change = on_change
+        self.on_reset = on_reset
+        self.poll_seconds = poll_seconds
+        self.retry_seconds = retry_seconds
+        self.clock = clock
+        self.stopped = threading.Event()
+        self.thread: threading.Thread | None = None
+
+        self.notifications = 0
+        self.connects = 0
+        self.connected = False
+        self.polled_at: float | None = None
+
+    def start(self) -> None:
+        self.thread = threading.Thread(
+            target=self.run, name="table-change-listener", daemon=True
+        )
+        self.thread.start()
+
+    def stop(self) -> None:
+        self.stopped.set()
+
+    def run(self) -> None:
+        while not self.stopped.is_set():
+            try:
+                self.listen()
+            except Exception as error:
+                # The thread must outlive any error, caches only trust it while it runs.
+                print(f"Table change listener disconnected: {error}")
+
+            self.stopped.wait(self.retry_seconds)
+
+    def listen(self) -> None:
+        connection = self.connection_factory()
+
+        try:
+            connection.set_isolation_level(
+                psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT
+            )
+
+            with connection.cursor() as cursor:
+                cursor.execute(f"LISTEN {table_change_channel}")
+
+            self.connects += 1
+            self.on_reset()
+            self.connected = True
+
+            while not self.stopped.is_set():
+                poll_started_at = self.clock()
+
+                if select.select([connection], [], [], self.poll_seconds) != (
+                    [],
+                    [],
+                    [],
+                ):
+                    connection.poll()
+
+                    while connection.notifies:
+                        self.handle(connection.notifies.pop(0).payload)
+
+                # Only once notifications queued while frozen have been handled.
+                self.polled_at = poll_started_at
+        finally:
+            self.connected = False
+            connection.close()
+
+    def is_current(self) -> bool:
+        return (
+            self.connected
+            and self.polled_at is not None
+            and self.clock() - self.polled_at <= 3 * self.poll_seconds
+        )
+
+    def handle(self, payload: str) -> None:
+        table_name, _, id = payload.partition(":")
+
+        try:
+            entity_id = UUID(id)
+        except ValueError:
+            return
+
+        self.notifications += 1
+        self.on_change(table_name, entity_id)
@@ -0,0 +1,73 @@
+from uuid import UUID, uuid4
+
+from util.entity_cache import (
+    clear_entity_caches,
+    get_entity_cache,
+    invalidate_entity,
+)
+from util.table_change_listener import TableChangeListener
+
+
+class Entity:
+    def __init__(self) -> None:
+        self.id = uuid4()
+
+
+def test_evicts_notified_entities():
+    cache = get_entity_cache("table_change_listener_test")
+    entities = [Entity(), Entity()]
+
+    for entity in entities:
+        cache.fill(entity, None)
+
+    changes: list[tuple[str, UUID]] = []
+
+    def on_change(table_name: str, id: UUID) -> None:
+        changes.append((table_name, id))
+        invalidate_entity(table_name, id)
+
+    listener = TableChangeListener(
+        connection_factory=lambda: None,
+        on_change=on_change,
+        on_reset=clear_entity_caches,
+    )
+
+    listener.handle(f"table_change_listener_test:{entities[0].id}")
+    listener.handle("table_change_listener_test:not-an-id")
+    listener.handle(f"unknown_table:{entities[1].id}")
+
+    assert changes == [
+        ("table_change_listener_test", entities[0].id),
+        ("unknown_table", entities[1].id),
+    ]
+    assert listener.notifications == 2
+    assert cache.get(entities[0].id) is None
+    assert cache.get(entities[1].id) is not None
+
+    listener.on_reset()
+
+    assert cache.get(entities[1].id) is None
+
+
+def test_keeps_listening_after_any_error():
+    connects: list[int] = []
+
+    def connection_factory() -> None:
+        connects.append(1)
+
+        if len(connects) == 2:
+            listener.stop()
+
+        raise RuntimeError("on_change failed")
+
+    listener = TableChangeListener(
+        connection_factory=connection_factory,
+        on_change=lambda table_name, id: None,
+        on_reset=lambda: None,
+        retry_seconds=0,
+    )
+
+    listener.run()
+
+    assert len(connects) == 2
+    assert not listener.is_current()
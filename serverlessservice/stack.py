@@ -118,11 +118,21 @@ class MnfpCoreServiceStack(cdk.Stack):
             self,
             f"{cds_prefix}-api-gateway",
             handler=lambda_function,
+            # Mangum base64 encodes bodies that aren't UTF-8 text, compressed and
+            # MessagePack ones included. Only bodies of a binary media type are
+            # decoded by the gateway, anything else reaches clients as base64 text.
+            binary_media_types=["*/*"],
             default_cors_preflight_options=CorsOptions(
                 allow_origins=Cors.ALL_ORIGINS,
                 allow_methods=Cors.ALL_METHODS,
                 allow_headers=Cors.DEFAULT_HEADERS
-                + ["Authorization", "MNFP-Hydration"],
+                + [
+                    "Authorization",
+                    "If-None-Match",
+                    "MNFP-Hydration",
+                    "MNFP-Count-Mode",
+                    "MNFP-Fields",
+                ],
             ),
             proxy=True,
         )
@@ -0,0 +1,166 @@
+"""
+Throughput benchmark for the core data service.
+
+Fires a fixed number of GET requests at a running service from a pool of concurrent
+clients and reports requests/sec and latency percentiles. To compare database engines,
+run one instance with DATABASE_ENGINE=sync and one with DATABASE_ENGINE=async and pass
+both urls:
+
+    python -m tests.benchmarks.throughput_benchmark \
+        --api-url http://127.0.0.1:8001 --api-url http://127.0.0.1:8002 --clients 200
+
+With no --api-url the API_URL from the test configuration is used.
+"""
+
+import argparse
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from tests.qdk.operators.league_players import (
+    LeaguePlayerCreateModel,
+    create_league_player,
+)
+from tests.qdk.types import TestContext
+from util.configuration import (
+    get_global_configuration,
+    populate_configuration_if_not_exists,
+)
+
+
+class BenchmarkResult:
+    def __init__(
+        self,
+        api_url: str,
+        total_requests: int,
+        failed_requests: int,
+        elapsed_seconds: float,
+        latencies: list[float],
+    ) -> None:
+        self.api_url = api_url
+        self.total_requests = total_requests
+        self.failed_requests = failed_requests
+        self.elapsed_seconds = elapsed_seconds
+        self.latencies = latencies
+
+    def requests_per_second(self) -> float:
+        return self.total_requests / self.elapsed_seconds
+
+    def latency_percentile(self, percentile: int) -> float:
+        if len(self.latencies) < 2:
+            return self.latencies[0] if len(self.latencies) == 1 else 0.0
+
+        return statistics.quantiles(self.latencies, n=100)[percentile - 1]
+
+
+def seed_league_players(api_url: str, count: int) -> None:
+    context = TestContext(api_url=api_url)
+
+    for _ in range(count):
+        create_league_player(
+            context, LeaguePlayerCreateModel(create_league_team_if_null=True)
+        )
+
+
+def run_benchmark(
+    api_url: str,
+    path: str,
+    clients: int,
+    requests_per_client: int,
+    headers: dict[str, str],
+) -> BenchmarkResult:
+    latencies: list[float] = []
+    failures: list[int] = []
+    lock = threading.Lock()
+
+    def client() -> None:
+        session = requests.Session()
+        local_latencies: list[float] = []
+        local_failures = 0
+
+        for _ in range(requests_per_client):
+            start = time.perf_counter()
+            response = session.get(api_url + path, headers=headers)
+            local_latencies.append(time.perf_counter() - start)
+
+            if response.status_code != 200:
+                local_failures += 1
+
+        with lock:
+            latencies.extend(local_latencies)
+            failures.append(local_failures)
+
+    start = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=clients) as executor:
+        for _ in range(clients):
+            executor.submit(client)
+
+    elapsed = time.perf_counter() - start
+
+    return BenchmarkResult(
+        api_url=api_url,
+        total_requests=len(latencies),
+        failed_requests=sum(failures),
+        elapsed_seconds=elapsed,
+        latencies=latencies,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--api-url", action="append", dest="api_urls")
+    parser.add_argument("--path", default="/league_players?page_length=25")
+    parser.add_argument("--hydration", default="league_team.home_venue")
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--requests-per-client", type=int, default=25)
+    parser.add_argument("--seed", type=int, default=25)
+    args = parser.parse_args()
+
+    api_urls: list[str] = args.api_urls
+
+    if not api_urls:
+        populate_configuration_if_not_exists()
+        api_urls = [get_global_configuration().API_URL]
+
+    headers: dict[str, str] = {}
+
+    if args.hydration:
+        headers["MNFP-Hydration"] = args.hydration
+
+    # Instances may share a database, seeding through the first one is enough.
+    seed_league_players(api_urls[0], args.seed)
+
+    results: list[BenchmarkResult] = []
+
+    for api_url in api_urls:
+        # Warm up pools and code paths before measuring.
+        run_benchmark(api_url, args.path, min(args.clients, 10), 2, headers)
+
+        results.append(
+            run_benchmark(
+                api_url, args.path, args.clients, args.requests_per_client, headers
+            )
+        )
+
+    print(
+        f"\nGET {args.path} | {args.clients} concurrent clients x "
+        f"{args.requests_per_client} requests\n"
+    )
+    print(f"{'api url':<32}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'errors':>8}")
+
+    for result in results:
+        print(
+            f"{result.api_url:<32}"
+            f"{result.requests_per_second():>10.1f}"
+            f"{result.latency_percentile(50) * 1000:>10.1f}"
+            f"{result.latency_percentile(95) * 1000:>10.1f}"
+            f"{result.failed_requests:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ from tests.qdk.operators.fantasy_teams import (
     FantasyTeamModel,
     create_fantasy_team,
 )
+from tests.qdk.operators.league_players import LeaguePlayerModel
 from tests.qdk.operators.seasons import SeasonCreateModel, SeasonModel, create_season
 from tests.qdk.operators.users import UserModel
 
@@ -51,6 +52,7 @@ class FantasyTeamSeasonLinkModel:
         fantasy_team: FantasyTeamModel | None = None,
         fantasy_team_owner: UserModel | None = None,
         fantasy_league: FantasyLeagueModel | None = None,
+        league_players: list[LeaguePlayerModel] | None = None,
         updated_at: str | None = None,
     ) -> None:
         self.id = id
@@ -66,6 +68,11 @@ class FantasyTeamSeasonLinkModel:
         self.fantasy_team_owner = (
             UserModel(**fantasy_team_owner) if fantasy_team_owner else None
         )
+        self.league_players = (
+            [LeaguePlayerModel(**obj) for obj in league_players]
+            if league_players is not None
+            else None
+        )
         self.created_at = created_at
         self.updated_at = updated_at
 
@@ -155,6 +162,7 @@ def create_fantasy_team_season_link(
                 "fantasy_team_owner",
                 "fantasy_league_id",
                 "fantasy_league",
+                "league_players",
                 "created_at",
                 "updated_at",
             ],
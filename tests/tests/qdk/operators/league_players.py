@@ -8,7 +8,7 @@ from tests.qdk.operators.league_teams import (
     create_league_team,
 )
 
-from tests.qdk.qa_requests import qa_get, qa_patch, qa_post
+from tests.qdk.qa_requests import qa_get, qa_patch, qa_post, qa_put
 from tests.qdk.types import (
     PagedResponseItemList,
     PagingRequestModel,
@@ -75,12 +75,18 @@ class LeaguePlayerSearchModel(PagingRequestModel):
         page_length: int | None = None,
         is_sort_descending: bool | None = None,
         sort_by: str | None = None,
+        paging_mode: str | None = None,
+        cursor: str | None = None,
+        count_mode: str | None = None,
     ) -> None:
         super().__init__(
             page=page,
             page_length=page_length,
             is_sort_descending=is_sort_descending,
             sort_by=sort_by,
+            paging_mode=paging_mode,
+            cursor=cursor,
+            count_mode=count_mode,
         )
 
         self.ids = ids
@@ -167,6 +173,55 @@ def create_league_player(
     return return_object
 
 
+def upsert_league_players(
+    context: TestContext,
+    overrides: list[LeaguePlayerCreateModel],
+    request_operators: RequestOperators | None = None,
+    allow_failures: bool = False,
+) -> list[LeaguePlayerModel]:
+    put_objects = [
+        mint_default_league_player(
+            context=context, overrides=override, request_operators=request_operators
+        )
+        for override in overrides
+    ]
+
+    result = qa_put(context.api_url + "/league_players", put_objects, request_operators)
+
+    if allow_failures == False:
+        assert result.status_code == 200
+
+        result_list = result.json()
+
+        assert len(result_list) == len(
+            {put_object.global_mnp_id for put_object in put_objects}
+        )
+
+        put_objects_by_global_mnp_id = {
+            put_object.global_mnp_id: put_object for put_object in put_objects
+        }
+
+        for result_dict in result_list:
+            assert_objects_are_equal(
+                result_dict,
+                put_objects_by_global_mnp_id[result_dict["global_mnp_id"]].__dict__,
+                [
+                    "id",
+                    "league_team_id",
+                    "league_team",
+                    "created_at",
+                    "updated_at",
+                ],
+            )
+
+            assert result_dict["id"] is not None
+            assert result_dict["created_at"] is not None
+
+    return_objects = [LeaguePlayerModel(**obj) for obj in result.json()]
+
+    return return_objects
+
+
 def get_league_player_by_id(
     context: TestContext,
     id: str,
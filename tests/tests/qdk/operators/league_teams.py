@@ -1,6 +1,7 @@
 import datetime
 import string
 import uuid
+from typing import Any
 
 from requests import Response
 from tests.qdk.operators.venues import (
@@ -8,7 +9,7 @@ from tests.qdk.operators.venues import (
     VenueModel,
     create_venue,
 )
-from tests.qdk.qa_requests import qa_get, qa_patch, qa_post
+from tests.qdk.qa_requests import qa_get, qa_patch, qa_post, qa_put
 from tests.qdk.types import (
     PagedResponseItemList,
     PagingRequestModel,
@@ -50,14 +51,23 @@ class LeagueTeamModel:
         short_name: str,
         created_at: datetime.datetime,
         home_venue: VenueModel | None = None,
+        league_players: list[dict[str, Any]] | None = None,
         updated_at: datetime.datetime | None = None,
     ) -> None:
+        # League players hold their team, imported here to avoid the cycle.
+        from tests.qdk.operators.league_players import LeaguePlayerModel
+
         self.id = id
         self.created_at = created_at
         self.updated_at = updated_at
         self.home_venue_id = home_venue_id
         self.global_mnp_id = global_mnp_id
         self.home_venue = VenueModel(**home_venue) if home_venue is not None else None
+        self.league_players = (
+            [LeaguePlayerModel(**obj) for obj in league_players]
+            if league_players is not None
+            else None
+        )
 
         self.name = name
         self.short_name = short_name
@@ -151,7 +161,7 @@ def create_league_team(
         assert_objects_are_equal(
             result_dict,
             post_object.__dict__,
-            ["id", "home_venue", "created_at", "updated_at"],
+            ["id", "home_venue", "league_players", "created_at", "updated_at"],
         )
 
         assert result_dict["id"] is not None
@@ -163,6 +173,49 @@ def create_league_team(
     return return_object
 
 
+def upsert_league_teams(
+    context: TestContext,
+    overrides: list[LeagueTeamCreateModel],
+    request_operators: RequestOperators | None = None,
+    allow_failures: bool = False,
+) -> list[LeagueTeamModel]:
+    put_objects = [
+        mint_default_league_team(
+            context=context, overrides=override, request_operators=request_operators
+        )
+        for override in overrides
+    ]
+
+    result = qa_put(context.api_url + "/league_teams", put_objects, request_operators)
+
+    if allow_failures == False:
+        assert result.status_code == 200
+
+        result_list = result.json()
+
+        assert len(result_list) == len(
+            {put_object.global_mnp_id for put_object in put_objects}
+        )
+
+        put_objects_by_global_mnp_id = {
+            put_object.global_mnp_id: put_object for put_object in put_objects
+        }
+
+        for result_dict in result_list:
+            assert_objects_are_equal(
+                result_dict,
+                put_objects_by_global_mnp_id[result_dict["global_mnp_id"]].__dict__,
+                ["id", "home_venue", "league_players", "created_at", "updated_at"],
+            )
+
+            assert result_dict["id"] is not None
+            assert result_dict["created_at"] is not None
+
+    return_objects = [LeagueTeamModel(**obj) for obj in result.json()]
+
+    return return_objects
+
+
 def get_league_team_by_id(
     context: TestContext,
     id: str,
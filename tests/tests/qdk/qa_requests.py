@@ -1,9 +1,77 @@
+from datetime import datetime
 from urllib.parse import urlencode
+from uuid import UUID
+import msgpack
 import requests
 from typing import Any
 
 from tests.qdk.types import RequestOperators
 from tests.qdk.utils import transform_operators_to_headers
+from util.configuration import (
+    get_global_configuration,
+    populate_configuration_if_not_exists,
+)
+
+msgpack_media_type = "application/msgpack"
+
+# Ext type the API packs UUIDs as, their 16 bytes.
+msgpack_uuid_ext_code = 1
+
+
+def decode_msgpack_ext(code: int, data: bytes):
+    if code == msgpack_uuid_ext_code:
+        return str(UUID(bytes=data))
+
+    return msgpack.ExtType(code, data)
+
+
+def decode_msgpack_object(value: dict[str, Any]):
+    # Timestamps come back as the strings the JSON body would carry.
+    return {
+        key: (
+            item.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+            if isinstance(item, datetime)
+            else item
+        )
+        for key, item in value.items()
+    }
+
+
+class MsgpackResponse(requests.Response):
+    """
+    A response whose json() unpacks its MessagePack body into what the JSON body would
+    have held, so tests assert the same way in either format.
+    """
+
+    def json(self, **kwargs: Any):
+        return msgpack.unpackb(
+            self.content,
+            ext_hook=decode_msgpack_ext,
+            object_hook=decode_msgpack_object,
+            timestamp=3,
+        )
+
+
+def build_headers(request_operators: RequestOperators | None):
+    headers: dict[str, str] = {}
+
+    if request_operators is not None:
+        headers = transform_operators_to_headers(request_operators)
+
+    # API_ACCEPT picks the format every response is asked in.
+    populate_configuration_if_not_exists()
+    headers.setdefault("Accept", get_global_configuration().API_ACCEPT)
+
+    return headers
+
+
+def decode_response(response: requests.Response):
+    content_type = response.headers.get("Content-Type", "")
+
+    if content_type.split(";")[0].strip() == msgpack_media_type:
+        response.__class__ = MsgpackResponse
+
+    return response
 
 
 def qa_post(
@@ -18,15 +86,11 @@ def qa_post(
     else:
         request_body = body
 
-    response: requests.Response
+    response = requests.post(
+        url=url, json=request_body, headers=build_headers(request_operators)
+    )
 
-    if request_operators is not None:
-        headers: dict[str, str] = transform_operators_to_headers(request_operators)
-        response = requests.post(url=url, json=request_body, headers=headers)
-    else:
-        response = requests.post(url=url, json=request_body)
-
-    return response
+    return decode_response(response)
 
 
 def qa_patch(url: str, body: object, request_operators: RequestOperators | None = None):
@@ -37,15 +101,30 @@ def qa_patch(url: str, body: object, request_operators: RequestOperators | None
     else:
         request_body = body
 
-    response: requests.Response
+    response = requests.patch(
+        url=url, json=request_body, headers=build_headers(request_operators)
+    )
 
-    if request_operators is not None:
-        headers: dict[str, str] = transform_operators_to_headers(request_operators)
-        response = requests.patch(url=url, json=request_body, headers=headers)
+    return decode_response(response)
+
+
+def qa_put(url: str, body: object, request_operators: RequestOperators | None = None):
+    request_body: dict[str, Any] | list[dict[str, Any]]
+
+    if isinstance(body, list):
+        request_body = [
+            item.__dict__ if not isinstance(item, dict) else item for item in body
+        ]
+    elif not isinstance(body, dict):
+        request_body = body.__dict__
     else:
-        response = requests.patch(url=url, json=request_body)
+        request_body = body
 
-    return response
+    response = requests.put(
+        url=url, json=request_body, headers=build_headers(request_operators)
+    )
+
+    return decode_response(response)
 
 
 def qa_get(
@@ -68,12 +147,6 @@ def qa_get(
 
     full_url = url + f"?{param_string}" if len(param_string) > 0 else url
 
-    response: requests.Response
+    response = requests.get(url=full_url, headers=build_headers(request_operators))
 
-    if request_operators is not None:
-        headers: dict[str, str] = transform_operators_to_headers(request_operators)
-        response = requests.get(url=full_url, headers=headers)
-    else:
-        response = requests.get(url=full_url)
-
-    return response
+    return decode_response(response)
@@ -26,25 +26,35 @@ class PagingRequestModel:
                  page: int | None = None,
                  page_length: int | None = None,
                  is_sort_descending: bool | None = None,
-                 sort_by: str | None = None) -> None:
+                 sort_by: str | None = None,
+                 paging_mode: str | None = None,
+                 cursor: str | None = None,
+                 count_mode: str | None = None) -> None:
         
         self.page: int | None = page
         self.page_length: int | None = page_length
         self.is_sort_descending: bool | None = is_sort_descending
         self.sort_by: str | None = sort_by 
+        self.paging_mode: str | None = paging_mode
+        self.cursor: str | None = cursor
+        self.count_mode: str | None = count_mode
 
 class PagingResponseModel:
     def __init__(self,
-                 page: int,
+                 page: int | None,
                  page_length: int,
                  is_sort_descending: bool,
                  sort_by: str | None = None,
-                 total_record_count: int | None = None) -> None:
-        self.page: int = page
+                 total_record_count: int | None = None,
+                 next_cursor: str | None = None,
+                 count_mode: str | None = None) -> None:
+        self.page: int | None = page
         self.page_length: int = page_length
         self.is_sort_descending: bool = is_sort_descending
         self.sort_by: str | None = sort_by
         self.total_record_count: int | None = total_record_count
+        self.next_cursor: str | None = next_cursor
+        self.count_mode: str | None = count_mode
          
 class PagedResponseItemList(Generic[T]):
     def __init__(self,
@@ -13,6 +13,11 @@ from tests.qdk.operators.fantasy_team_season_links import (
     get_fantasy_team_season_link_by_id,
     get_fantasy_team_season_links,
 )
+from tests.qdk.operators.league_player_fantasy_team_season_links import (
+    LeaguePlayerFantasyTeamSeasonLinkCreateModel,
+    create_league_player_fantasy_team_season_link,
+)
+from tests.qdk.operators.league_players import LeaguePlayerCreateModel
 from tests.qdk.qa_requests import qa_get
 from tests.qdk.types import PagedResponseItemList, RequestOperators, TestContext
 from tests.qdk.utils import assert_objects_are_equal, generate_random_string
@@ -597,3 +602,49 @@ def test_gets_fantasy_team_season_links_with_fantasy_team_owner_ids_filter() ->
     ]
     assert len(result_item_4) == 1
     assert_objects_are_equal(result_item_4[0], posted_object_4)
+
+
+def test_gets_fantasy_team_season_link_by_id_with_league_players_hydration() -> None:
+    populate_configuration_if_not_exists()
+
+    context: TestContext = TestContext(api_url=get_global_configuration().API_URL)
+
+    posted_object = create_fantasy_team_season_link(context)
+    empty_posted_object = create_fantasy_team_season_link(context)
+
+    roster_links = [
+        create_league_player_fantasy_team_season_link(
+            context,
+            LeaguePlayerFantasyTeamSeasonLinkCreateModel(
+                fantasy_team_season_link_id=posted_object.id,
+                league_player=LeaguePlayerCreateModel(create_league_team_if_null=True),
+            ),
+        )
+        for _ in range(2)
+    ]
+
+    result = get_fantasy_team_season_link_by_id(
+        context,
+        posted_object.id,
+        request_operators=RequestOperators(
+            hydration_properties=["league_players.league_team", "season"]
+        ),
+    )
+
+    assert result.season is not None
+    assert result.league_players is not None
+    assert {player.id for player in result.league_players} == {
+        link.league_player_id for link in roster_links
+    }
+
+    for player in result.league_players:
+        assert player.league_team is not None
+        assert player.league_team.id == player.league_team_id
+
+    empty_result = get_fantasy_team_season_link_by_id(
+        context,
+        empty_posted_object.id,
+        request_operators=RequestOperators(hydration_properties=["league_players"]),
+    )
+
+    assert empty_result.league_players == []
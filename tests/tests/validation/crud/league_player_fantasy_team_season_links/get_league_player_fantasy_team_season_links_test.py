@@ -13,10 +13,14 @@ from tests.qdk.operators.league_player_fantasy_team_season_links import (
     get_league_player_fantasy_team_season_link_by_id,
     get_league_player_fantasy_team_season_links,
 )
-from tests.qdk.operators.league_players import LeaguePlayerCreateModel
+from tests.qdk.operators.league_players import (
+    LeaguePlayerCreateModel,
+    LeaguePlayerUpdateModel,
+    update_league_player,
+)
 from tests.qdk.qa_requests import qa_get
 from tests.qdk.types import PagedResponseItemList, RequestOperators, TestContext
-from tests.qdk.utils import assert_objects_are_equal
+from tests.qdk.utils import assert_objects_are_equal, generate_random_string
 from util.configuration import (
     get_global_configuration,
     populate_configuration_if_not_exists,
@@ -36,6 +40,53 @@ def test_gets_league_player_fantasy_team_season_link_by_id() -> None:
     assert result.id == posted_object.id
 
 
+def test_gets_league_player_fantasy_team_season_links_not_modified() -> None:
+    populate_configuration_if_not_exists()
+
+    context: TestContext = TestContext(api_url=get_global_configuration().API_URL)
+
+    posted_object = create_league_player_fantasy_team_season_link(context)
+
+    url = f"{context.api_url}/league_player_fantasy_team_season_links"
+    query_params = {"fantasy_team_ids": posted_object.fantasy_team_id}
+
+    result = qa_get(
+        url, query_params, RequestOperators(hydration_properties=["league_player"])
+    )
+
+    assert result.status_code == 200
+
+    etag = result.headers["ETag"]
+
+    conditional_request_operators = RequestOperators(
+        hydration_properties=["league_player"],
+        added_headers={"If-None-Match": etag},
+    )
+
+    result = qa_get(url, query_params, conditional_request_operators)
+
+    assert result.status_code == 304
+    assert result.content == b""
+
+    # Unhydrated, the same search is a different representation.
+    result = qa_get(
+        url, query_params, RequestOperators(added_headers={"If-None-Match": etag})
+    )
+
+    assert result.status_code == 200
+
+    update_league_player(
+        context,
+        posted_object.league_player_id,
+        LeaguePlayerUpdateModel(name=generate_random_string()),
+    )
+
+    result = qa_get(url, query_params, conditional_request_operators)
+
+    assert result.status_code == 200
+    assert result.headers["ETag"] != etag
+
+
 def test_gets_league_player_fantasy_team_season_links_invalid_inputs() -> None:
     populate_configuration_if_not_exists()
 
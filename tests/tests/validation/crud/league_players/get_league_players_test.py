@@ -1,5 +1,8 @@
+import base64
+import json
 from time import sleep
 from typing import Any
+from uuid import uuid4
 
 from tests.qdk.operators.league_players import (
     LeaguePlayerCreateModel,
@@ -352,6 +355,178 @@ def test_gets_league_players_with_paging() -> None:
     assert_objects_are_equal(result_item_page_2_item_2[0], posted_object_4)
 
 
+def test_gets_league_players_with_cursor_paging() -> None:
+    populate_configuration_if_not_exists()
+
+    context: TestContext = TestContext(api_url=get_global_configuration().API_URL)
+
+    posted_objects: list[LeaguePlayerModel] = [
+        create_league_player(context) for _ in range(5)
+    ]
+
+    ids = ",".join([posted_object.id for posted_object in posted_objects])
+
+    result_page_1: PagedResponseItemList[LeaguePlayerModel] = get_league_players(
+        context, LeaguePlayerSearchModel(ids=ids, page_length=2, paging_mode="cursor")
+    )
+
+    assert len(result_page_1.items) == 2
+    assert result_page_1.paging.page is None
+    assert result_page_1.paging.total_record_count is None
+    assert result_page_1.paging.next_cursor is not None
+
+    result_page_2: PagedResponseItemList[LeaguePlayerModel] = get_league_players(
+        context,
+        LeaguePlayerSearchModel(
+            ids=ids, page_length=2, cursor=result_page_1.paging.next_cursor
+        ),
+    )
+
+    assert len(result_page_2.items) == 2
+    assert result_page_2.paging.next_cursor is not None
+
+    result_page_3: PagedResponseItemList[LeaguePlayerModel] = get_league_players(
+        context,
+        LeaguePlayerSearchModel(
+            ids=ids,
+            page_length=2,
+            cursor=result_page_2.paging.next_cursor,
+            count_mode="exact",
+        ),
+    )
+
+    assert len(result_page_3.items) == 1
+    assert result_page_3.paging.next_cursor is None
+    assert result_page_3.paging.total_record_count == 5
+
+    result_items = result_page_1.items + result_page_2.items + result_page_3.items
+
+    assert [item.id for item in result_items] == [
+        item.id for item in sorted(result_items, key=lambda x: (x.created_at, x.id))
+    ]
+
+    for posted_object in posted_objects:
+        result_item: list[LeaguePlayerModel] = [
+            item for item in result_items if item.id == posted_object.id
+        ]
+        assert len(result_item) == 1
+        assert_objects_are_equal(result_item[0], posted_object)
+
+
+def test_gets_league_players_with_count_modes() -> None:
+    populate_configuration_if_not_exists()
+
+    context: TestContext = TestContext(api_url=get_global_configuration().API_URL)
+
+    posted_objects: list[LeaguePlayerModel] = [
+        create_league_player(context) for _ in range(3)
+    ]
+
+    ids = ",".join([posted_object.id for posted_object in posted_objects])
+
+    result_exact: PagedResponseItemList[LeaguePlayerModel] = get_league_players(
+        context, LeaguePlayerSearchModel(ids=ids, page_length=2)
+    )
+
+    assert result_exact.paging.count_mode == "exact"
+    assert result_exact.paging.total_record_count == 3
+
+    result_none: PagedResponseItemList[LeaguePlayerModel] = get_league_players(
+        context, LeaguePlayerSearchModel(ids=ids, page_length=2, count_mode="none")
+    )
+
+    assert len(result_none.items) == 2
+    assert result_none.paging.count_mode == "none"
+    assert result_none.paging.total_record_count is None
+
+    result_estimate: PagedResponseItemList[LeaguePlayerModel] = get_league_players(
+        context,
+        LeaguePlayerSearchModel(ids=ids, page_length=2),
+        RequestOperators(added_headers={"MNFP-Count-Mode": "estimate"}),
+    )
+
+    assert len(result_estimate.items) == 2
+    assert result_estimate.paging.count_mode == "estimate"
+    assert result_estimate.paging.total_record_count is not None
+
+    # A short page is counted exactly for free.
+    result_short_page: PagedResponseItemList[LeaguePlayerModel] = get_league_players(
+        context, LeaguePlayerSearchModel(ids=ids, page_length=5, count_mode="estimate")
+    )
+
+    assert result_short_page.paging.count_mode == "exact"
+    assert result_short_page.paging.total_record_count == 3
+
+    # The query parameter wins over the header.
+    result_override: PagedResponseItemList[LeaguePlayerModel] = get_league_players(
+        context,
+        LeaguePlayerSearchModel(ids=ids, page_length=2, count_mode="none"),
+        RequestOperators(added_headers={"MNFP-Count-Mode": "exact"}),
+    )
+
+    assert result_override.paging.count_mode == "none"
+    assert result_override.paging.total_record_count is None
+
+    result_invalid_header = qa_get(
+        f"{context.api_url}/league_players",
+        request_operators=RequestOperators(
+            added_headers={"MNFP-Count-Mode": "roughly"}
+        ),
+    )
+
+    assert result_invalid_header.status_code == 400
+
+
+def test_gets_league_players_with_invalid_cursor() -> None:
+    populate_configuration_if_not_exists()
+
+    context: TestContext = TestContext(api_url=get_global_configuration().API_URL)
+
+    result = qa_get(
+        f"{context.api_url}/league_players",
+        query_params={"cursor": "not a cursor"},
+    )
+
+    assert result.status_code == 422
+
+    errors = result.json()
+
+    error: list[Any] = [
+        error
+        for error in errors["detail"]
+        if "query" in error["loc"] and "cursor" in error["loc"]
+    ]
+    assert len(error) == 1
+    assert error[0]["type"] == "invalid_cursor"
+
+
+def test_gets_league_players_with_cursor_value_of_wrong_type() -> None:
+    populate_configuration_if_not_exists()
+
+    context: TestContext = TestContext(api_url=get_global_configuration().API_URL)
+
+    cursor = base64.urlsafe_b64encode(
+        json.dumps(["created_at", False, "notadate", str(uuid4())]).encode()
+    ).decode()
+
+    result = qa_get(
+        f"{context.api_url}/league_players",
+        query_params={"cursor": cursor},
+    )
+
+    assert result.status_code == 422
+
+    errors = result.json()
+
+    error: list[Any] = [
+        error
+        for error in errors["detail"]
+        if "query" in error["loc"] and "cursor" in error["loc"]
+    ]
+    assert len(error) == 1
+    assert error[0]["type"] == "invalid_cursor"
+
+
 def test_gets_league_players_with_name_exact_filter() -> None:
     populate_configuration_if_not_exists()
 
@@ -501,3 +676,52 @@ def test_gets_league_players_with_league_team_ids_filter() -> None:
     ]
     assert len(result_item_4) == 1
     assert_objects_are_equal(result_item_4[0], posted_object_4)
+
+
+def test_gets_league_players_with_sparse_fields() -> None:
+    populate_configuration_if_not_exists()
+
+    context: TestContext = TestContext(api_url=get_global_configuration().API_URL)
+
+    posted_object: LeaguePlayerModel = create_league_player(
+        context, LeaguePlayerCreateModel(create_league_team_if_null=True)
+    )
+
+    result = qa_get(
+        f"{context.api_url}/league_players",
+        query_params={
+            "ids": posted_object.id,
+            "fields": "id,name,league_team.short_name",
+        },
+    )
+
+    assert result.status_code == 200
+
+    body = result.json()
+
+    assert body["paging"]["total_record_count"] == 1
+    assert body["items"][0]["id"] == posted_object.id
+    assert body["items"][0]["name"] == posted_object.name
+    assert body["items"][0]["league_team"].keys() == {"short_name"}
+    assert body["items"][0].keys() == {"id", "name", "league_team"}
+
+
+def test_gets_league_player_by_id_with_sparse_fields_header() -> None:
+    populate_configuration_if_not_exists()
+
+    context: TestContext = TestContext(api_url=get_global_configuration().API_URL)
+
+    posted_object: LeaguePlayerModel = create_league_player(context)
+
+    result = qa_get(
+        f"{context.api_url}/league_players/{posted_object.id}",
+        request_operators=RequestOperators(
+            added_headers={"MNFP-Fields": "id,league_team_id"}
+        ),
+    )
+
+    assert result.status_code == 200
+    assert result.json() == {
+        "id": posted_object.id,
+        "league_team_id": posted_object.league_team_id,
+    }
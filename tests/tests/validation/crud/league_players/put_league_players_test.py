@@ -0,0 +1,107 @@
+from tests.qdk.operators.league_players import (
+    LeaguePlayerCreateModel,
+    create_league_player,
+    get_league_player_by_id,
+    league_player_hydration_check,
+    upsert_league_players,
+)
+from tests.qdk.qa_requests import qa_put
+from tests.qdk.types import RequestOperators, TestContext
+from tests.qdk.utils import generate_random_string
+from util.configuration import (
+    get_global_configuration,
+    populate_configuration_if_not_exists,
+)
+
+
+def test_puts_invalid_league_players_missing_fields() -> None:
+    populate_configuration_if_not_exists()
+
+    context: TestContext = TestContext(api_url=get_global_configuration().API_URL)
+
+    result = qa_put(context.api_url + "/league_players", [{}])
+
+    assert result.status_code == 422
+    assert len(result.json()["detail"]) == 2
+
+
+def test_puts_league_players_creating_and_updating_by_global_mnp_id() -> None:
+    populate_configuration_if_not_exists()
+
+    context: TestContext = TestContext(api_url=get_global_configuration().API_URL)
+
+    existing_league_player = create_league_player(context)
+
+    new_name = generate_random_string() + "_name"
+
+    results = upsert_league_players(
+        context,
+        [
+            LeaguePlayerCreateModel(
+                name=new_name, global_mnp_id=existing_league_player.global_mnp_id
+            ),
+            LeaguePlayerCreateModel(),
+        ],
+    )
+
+    assert len(results) == 2
+
+    updated_league_player = next(
+        result
+        for result in results
+        if result.global_mnp_id == existing_league_player.global_mnp_id
+    )
+
+    assert updated_league_player.id == existing_league_player.id
+    assert updated_league_player.name == new_name
+    assert updated_league_player.updated_at is not None
+
+    created_league_player = next(
+        result for result in results if result.id != existing_league_player.id
+    )
+
+    assert created_league_player.updated_at is None
+
+    fetched_league_player = get_league_player_by_id(context, existing_league_player.id)
+
+    assert fetched_league_player.name == new_name
+
+
+def test_puts_league_players_keeping_last_duplicate() -> None:
+    populate_configuration_if_not_exists()
+
+    context: TestContext = TestContext(api_url=get_global_configuration().API_URL)
+
+    existing_league_player = create_league_player(context)
+
+    last_name = generate_random_string() + "_name"
+
+    results = upsert_league_players(
+        context,
+        [
+            LeaguePlayerCreateModel(global_mnp_id=existing_league_player.global_mnp_id),
+            LeaguePlayerCreateModel(
+                name=last_name, global_mnp_id=existing_league_player.global_mnp_id
+            ),
+        ],
+    )
+
+    assert len(results) == 1
+    assert results[0].id == existing_league_player.id
+    assert results[0].name == last_name
+
+
+def test_puts_league_players_with_hydration() -> None:
+    populate_configuration_if_not_exists()
+
+    context: TestContext = TestContext(api_url=get_global_configuration().API_URL)
+
+    results = upsert_league_players(
+        context,
+        [LeaguePlayerCreateModel(create_league_team_if_null=True)],
+        request_operators=RequestOperators(hydration_properties=["league_team"]),
+    )
+
+    assert len(results) == 1
+
+    league_player_hydration_check(results[0])
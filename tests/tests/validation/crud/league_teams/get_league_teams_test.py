@@ -10,6 +10,10 @@ from tests.qdk.operators.league_teams import (
     get_league_teams,
     league_team_hydration_check,
 )
+from tests.qdk.operators.league_players import (
+    LeaguePlayerCreateModel,
+    create_league_player,
+)
 from tests.qdk.qa_requests import qa_get
 from tests.qdk.types import PagedResponseItemList, RequestOperators, TestContext
 from tests.qdk.utils import assert_objects_are_equal, generate_random_string
@@ -477,3 +481,102 @@ def test_gets_league_teams_with_home_venue_ids_filter() -> None:
     ]
     assert len(result_item_4) == 1
     assert_objects_are_equal(result_item_4[0], posted_object_4)
+
+
+def test_gets_league_teams_with_league_players_hydration() -> None:
+    populate_configuration_if_not_exists()
+
+    context: TestContext = TestContext(api_url=get_global_configuration().API_URL)
+
+    posted_object_1 = create_league_team(context)
+    posted_object_2 = create_league_team(context)
+
+    league_players = [
+        create_league_player(
+            context, LeaguePlayerCreateModel(league_team_id=posted_object_1.id)
+        )
+        for _ in range(3)
+    ]
+
+    result: PagedResponseItemList[LeagueTeamModel] = get_league_teams(
+        context,
+        LeagueTeamSearchModel(ids=f"{posted_object_1.id},{posted_object_2.id}"),
+        request_operators=RequestOperators(
+            hydration_properties=["league_players.league_team"]
+        ),
+    )
+
+    assert len(result.items) == 2
+
+    result_item_1 = [item for item in result.items if item.id == posted_object_1.id]
+    result_item_2 = [item for item in result.items if item.id == posted_object_2.id]
+
+    assert result_item_1[0].league_players is not None
+    assert {player.id for player in result_item_1[0].league_players} == {
+        player.id for player in league_players
+    }
+
+    for player in result_item_1[0].league_players:
+        assert player.league_team is not None
+        assert player.league_team.id == posted_object_1.id
+
+    assert result_item_2[0].league_players == []
+
+    by_id_result = get_league_team_by_id(
+        context,
+        posted_object_1.id,
+        request_operators=RequestOperators(hydration_properties=["league_players"]),
+    )
+
+    assert by_id_result.league_players is not None
+    assert len(by_id_result.league_players) == 3
+    assert by_id_result.league_players[0].league_team is None
+
+
+def test_gets_league_teams_with_sparse_fields_of_league_players() -> None:
+    populate_configuration_if_not_exists()
+
+    context: TestContext = TestContext(api_url=get_global_configuration().API_URL)
+
+    posted_object = create_league_team(context)
+
+    league_players = [
+        create_league_player(
+            context, LeaguePlayerCreateModel(league_team_id=posted_object.id)
+        )
+        for _ in range(2)
+    ]
+
+    result_dotted = qa_get(
+        f"{context.api_url}/league_teams",
+        query_params={"ids": posted_object.id, "fields": "id,league_players.name"},
+    )
+
+    assert result_dotted.status_code == 200
+
+    item = result_dotted.json()["items"][0]
+
+    assert item.keys() == {"id", "league_players"}
+    assert sorted(player["name"] for player in item["league_players"]) == sorted(
+        player.name for player in league_players
+    )
+    assert all(player.keys() == {"name"} for player in item["league_players"])
+
+    result_whole = qa_get(
+        f"{context.api_url}/league_teams",
+        query_params={"ids": posted_object.id, "fields": "id,league_players"},
+        request_operators=RequestOperators(hydration_properties=["league_players"]),
+    )
+
+    assert result_whole.status_code == 200
+
+    item = result_whole.json()["items"][0]
+
+    assert item.keys() == {"id", "league_players"}
+    assert {player["id"] for player in item["league_players"]} == {
+        player.id for player in league_players
+    }
+    assert all(
+        player["league_team_id"] == posted_object.id
+        for player in item["league_players"]
+    )
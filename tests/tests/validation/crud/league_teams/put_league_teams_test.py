@@ -0,0 +1,62 @@
+from tests.qdk.operators.league_teams import (
+    LeagueTeamCreateModel,
+    create_league_team,
+    get_league_team_by_id,
+    upsert_league_teams,
+)
+from tests.qdk.qa_requests import qa_put
+from tests.qdk.types import TestContext
+from tests.qdk.utils import generate_random_string
+from util.configuration import (
+    get_global_configuration,
+    populate_configuration_if_not_exists,
+)
+
+
+def test_puts_invalid_league_teams_missing_fields() -> None:
+    populate_configuration_if_not_exists()
+
+    context: TestContext = TestContext(api_url=get_global_configuration().API_URL)
+
+    result = qa_put(context.api_url + "/league_teams", [{}])
+
+    assert result.status_code == 422
+    assert len(result.json()["detail"]) == 4
+
+
+def test_puts_league_teams_creating_and_updating_by_global_mnp_id() -> None:
+    populate_configuration_if_not_exists()
+
+    context: TestContext = TestContext(api_url=get_global_configuration().API_URL)
+
+    existing_league_team = create_league_team(context)
+
+    new_name = generate_random_string() + "_league_team_name"
+
+    results = upsert_league_teams(
+        context,
+        [
+            LeagueTeamCreateModel(
+                name=new_name,
+                home_venue_id=existing_league_team.home_venue_id,
+                global_mnp_id=existing_league_team.global_mnp_id,
+            ),
+            LeagueTeamCreateModel(),
+        ],
+    )
+
+    assert len(results) == 2
+
+    updated_league_team = next(
+        result
+        for result in results
+        if result.global_mnp_id == existing_league_team.global_mnp_id
+    )
+
+    assert updated_league_team.id == existing_league_team.id
+    assert updated_league_team.name == new_name
+    assert updated_league_team.updated_at is not None
+
+    fetched_league_team = get_league_team_by_id(context, existing_league_team.id)
+
+    assert fetched_league_team.name == new_name
@@ -7,12 +7,14 @@ from tests.qdk.operators.seasons import (
     SeasonCreateModel,
     SeasonModel,
     SeasonSearchModel,
+    SeasonUpdateModel,
     create_season,
     get_season_by_id,
     get_seasons,
+    update_season,
 )
 from tests.qdk.qa_requests import qa_get
-from tests.qdk.types import PagedResponseItemList, TestContext
+from tests.qdk.types import PagedResponseItemList, RequestOperators, TestContext
 from tests.qdk.utils import assert_objects_are_equal, generate_random_string
 from util.configuration import (
     get_global_configuration,
@@ -33,6 +35,41 @@ def test_gets_season_by_id() -> None:
     assert result.id == posted_object.id
 
 
+def test_gets_season_by_id_not_modified() -> None:
+    populate_configuration_if_not_exists()
+
+    context: TestContext = TestContext(api_url=get_global_configuration().API_URL)
+
+    posted_object = create_season(context)
+
+    url = f"{context.api_url}/seasons/{posted_object.id}"
+
+    result = qa_get(url)
+
+    assert result.status_code == 200
+
+    etag = result.headers["ETag"]
+
+    result = qa_get(
+        url, request_operators=RequestOperators(added_headers={"If-None-Match": etag})
+    )
+
+    assert result.status_code == 304
+    assert result.headers["ETag"] == etag
+    assert result.content == b""
+
+    update_season(
+        context, posted_object.id, SeasonUpdateModel(name=generate_random_string())
+    )
+
+    result = qa_get(
+        url, request_operators=RequestOperators(added_headers={"If-None-Match": etag})
+    )
+
+    assert result.status_code == 200
+    assert result.headers["ETag"] != etag
+
+
 def test_gets_seasons_invalid_inputs() -> None:
     populate_configuration_if_not_exists()
 
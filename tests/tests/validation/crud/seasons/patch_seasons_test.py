@@ -4,6 +4,7 @@ from tests.qdk.operators.seasons import (
     SeasonModel,
     SeasonUpdateModel,
     create_season,
+    get_season_by_id,
     update_season,
 )
 from tests.qdk.qa_requests import qa_patch
@@ -59,3 +60,24 @@ def test_patches_valid_season() -> None:
     )
 
     update_season(context, posted_object.id or "", update_object)
+
+
+def test_gets_patched_season_by_id() -> None:
+    populate_configuration_if_not_exists()
+
+    context: TestContext = TestContext(api_url=get_global_configuration().API_URL)
+
+    posted_object: SeasonModel = create_season(context)
+
+    # Read once so the season is cached before the patch.
+    assert get_season_by_id(context, posted_object.id).name == posted_object.name
+
+    update_object: SeasonUpdateModel = SeasonUpdateModel(
+        name=generate_random_string(14) + "_season_name",
+    )
+
+    update_season(context, posted_object.id, update_object)
+
+    result = get_season_by_id(context, posted_object.id)
+
+    assert result.name == update_object.name
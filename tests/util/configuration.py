@@ -20,6 +20,7 @@ class ConfigurationIssue :
 class Configuration :
 
     API_URL: str 
+    API_ACCEPT: str
 
     def populate_configuration(self, config_path: str = env_path) -> None:
 
@@ -29,6 +30,7 @@ class Configuration :
             load_dotenv(config_path)
             # Debug: print environment variables
             print(f"API_URL={os.getenv('API_URL')}")
+            print(f"API_ACCEPT={os.getenv('API_ACCEPT')}")
  
         else:
             print(f"No configuration file found at {config_path}, using existing environment for config values.")
@@ -59,6 +61,9 @@ class Configuration :
         # Load
 
         self.API_URL = os.getenv('API_URL') or '' 
+        # Optional. Format the QDK asks every response in, application/json or
+        # application/msgpack.
+        self.API_ACCEPT = os.getenv('API_ACCEPT') or 'application/json'
  
 def get_global_configuration():
     return cast(Configuration,globals()['configuration'])